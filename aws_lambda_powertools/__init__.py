@@ -1,13 +1,19 @@
 """Top-level package for Lambda Python Powertools."""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from aws_lambda_powertools.logging import Logger
-from aws_lambda_powertools.metrics import Metrics, single_metric
 from aws_lambda_powertools.package_logger import set_package_logger_handler
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
 from aws_lambda_powertools.shared.user_agent import inject_user_agent
 from aws_lambda_powertools.shared.version import VERSION
-from aws_lambda_powertools.tracing import Tracer
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.logging import Logger
+    from aws_lambda_powertools.metrics import Metrics, single_metric
+    from aws_lambda_powertools.tracing import Tracer
 
 __version__ = VERSION
 __author__ = """Amazon Web Services"""
@@ -18,8 +24,21 @@ __all__ = [
     "Tracer",
 ]
 
+# Core utilities are only imported on first access to keep cold starts fast, e.g. Tracer imports the X-Ray SDK
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "Logger": "aws_lambda_powertools.logging",
+        "Metrics": "aws_lambda_powertools.metrics",
+        "single_metric": "aws_lambda_powertools.metrics",
+        "Tracer": "aws_lambda_powertools.tracing",
+    },
+)
+
 PACKAGE_PATH = Path(__file__).parent
 
 set_package_logger_handler()
 
+# Eagerly registered so every botocore session created afterwards gets the Powertools user agent
 inject_user_agent()
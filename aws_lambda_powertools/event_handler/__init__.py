@@ -12,9 +12,11 @@ from aws_lambda_powertools.event_handler.api_gateway import (
 )
 from aws_lambda_powertools.event_handler.appsync import AppSyncResolver
 from aws_lambda_powertools.event_handler.bedrock_agent import BedrockAgentResolver
+from aws_lambda_powertools.event_handler.compression import CompressionConfig
 from aws_lambda_powertools.event_handler.lambda_function_url import (
     LambdaFunctionUrlResolver,
 )
+from aws_lambda_powertools.event_handler.serializers import JSONSerializer
 from aws_lambda_powertools.event_handler.vpc_lattice import VPCLatticeResolver, VPCLatticeV2Resolver
 
 __all__ = [
@@ -24,7 +26,9 @@ __all__ = [
     "ALBResolver",
     "ApiGatewayResolver",
     "BedrockAgentResolver",
+    "CompressionConfig",
     "CORSConfig",
+    "JSONSerializer",
     "LambdaFunctionUrlResolver",
     "Response",
     "VPCLatticeResolver",
@@ -6,10 +6,9 @@ import logging
 import re
 import traceback
 import warnings
-import zlib
 from abc import ABC, abstractmethod
 from enum import Enum
-from functools import partial
+from functools import lru_cache, partial
 from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Mapping, Match, Pattern, Sequence, TypeVar, cast
@@ -17,6 +16,7 @@ from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Mapping, Matc
 from typing_extensions import override
 
 from aws_lambda_powertools.event_handler import content_types
+from aws_lambda_powertools.event_handler.compression import GZIP, CompressionConfig
 from aws_lambda_powertools.event_handler.exceptions import NotFoundError, ServiceError
 from aws_lambda_powertools.event_handler.openapi.constants import DEFAULT_API_VERSION, DEFAULT_OPENAPI_VERSION
 from aws_lambda_powertools.event_handler.openapi.exceptions import RequestValidationError, SchemaValidationError
@@ -29,6 +29,7 @@ from aws_lambda_powertools.event_handler.openapi.types import (
     validation_error_definition,
     validation_error_response_definition,
 )
+from aws_lambda_powertools.event_handler.serializers import JSONSerializer
 from aws_lambda_powertools.event_handler.util import (
     _FrozenDict,
     _FrozenListDict,
@@ -58,6 +59,10 @@ _UNSAFE_URI = r"%<> \[\]{}|^"
 _NAMED_GROUP_BOUNDARY_PATTERN = rf"(?P\1[{_SAFE_URI}{_UNSAFE_URI}\\w]+)"
 _DEFAULT_OPENAPI_RESPONSE_DESCRIPTION = "Successful Response"
 _ROUTE_REGEX = "^{}$"
+_ROUTE_REGEX_TRAILING_SLASHES = "^{}/*$"
+# Characters that turn a route rule segment into a regular expression instead of a literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_DEFAULT_COMPRESSION_CONFIG = CompressionConfig()
 
 ResponseEventT = TypeVar("ResponseEventT", bound=BaseProxyEvent)
 ResponseT = TypeVar("ResponseT")
@@ -379,8 +384,9 @@ class Route:
         self.operation_id = operation_id or self._generate_operation_id()
         self.deprecated = deprecated
 
-        # _middleware_stack_built is used to ensure the middleware stack is only built once.
-        self._middleware_stack_built = False
+        # _middleware_stack_router_middlewares holds the router middlewares the middleware stack was built with.
+        # `use()` and `include_router()` always assign a new list, so the stack is only rebuilt when they change.
+        self._middleware_stack_router_middlewares: list[Callable] | None = None
 
         # _dependant is used to cache the dependant model for the handler function
         self._dependant: Dependant | None = None
@@ -416,8 +422,8 @@ class Route:
             handler is called which may also return a dict, tuple, or Response.
         """
 
-        # Save CPU cycles by building middleware stack once
-        if not self._middleware_stack_built:
+        # Save CPU cycles by building middleware stack once, unless router middlewares changed since
+        if self._middleware_stack_router_middlewares is not router_middlewares:
             self._build_middleware_stack(router_middlewares=router_middlewares)
 
         # If debug is turned on then output the middleware stack to the console
@@ -473,10 +479,12 @@ class Route:
         # ensure middleware is applied in the order the user defined.
         #
         # Start with the route function and wrap from last to the first Middleware handler.
+        middleware_stack: Callable[..., Any] = self.func
         for handler in reversed(all_middlewares):
-            self._middleware_stack = MiddlewareFrame(current_middleware=handler, next_middleware=self._middleware_stack)
+            middleware_stack = MiddlewareFrame(current_middleware=handler, next_middleware=middleware_stack)
 
-        self._middleware_stack_built = True
+        self._middleware_stack = middleware_stack
+        self._middleware_stack_router_middlewares = router_middlewares
 
     @property
     def dependant(self) -> Dependant:
@@ -831,9 +839,10 @@ class ResponseBuilder(Generic[ResponseEventT]):
         route_compression: bool,
         response_compression: bool | None,
         event: ResponseEventT,
-    ) -> bool:
+        compression_config: CompressionConfig | None = None,
+    ) -> str | None:
         """
-        Checks if compression is enabled.
+        Checks if compression is enabled and negotiates the encoding to use.
 
         NOTE: Response compression takes precedence.
 
@@ -845,31 +854,47 @@ class ResponseBuilder(Generic[ResponseEventT]):
             A boolean indicating whether compression is enabled or not in the response setting.
         event: ResponseEventT
             The event object containing the request details.
+        compression_config: CompressionConfig, optional
+            The resolver compression config. Defaults to gzip only.
 
         Returns
         -------
-        bool
-            True if compression is enabled and the "gzip" encoding is accepted, False otherwise.
+        str | None
+            The negotiated encoding (e.g. "gzip") if compression is enabled and the client accepts one of the
+            configured encodings, None otherwise.
         """
-        encoding = event.headers.get("accept-encoding", "")
-        if "gzip" in encoding:
-            if response_compression is not None:
-                return response_compression  # e.g., Response(compress=False/True))
-            if route_compression:
-                return True  # e.g., @app.get(compress=True)
-
-        return False
-
-    def _compress(self):
-        """Compress the response body, but only if `Accept-Encoding` headers includes gzip."""
-        self.response.headers["Content-Encoding"] = "gzip"
-        if isinstance(self.response.body, str):
+        compression_enabled = response_compression if response_compression is not None else route_compression
+        if not compression_enabled:
+            return None
+
+        accept_encoding = event.headers.get("accept-encoding", "")
+        return (compression_config or _DEFAULT_COMPRESSION_CONFIG).negotiate(accept_encoding)
+
+    def _compress(self, encoding: str = GZIP, compression_config: CompressionConfig | None = None):
+        """Compress the response body, but only if `Accept-Encoding` headers includes a supported encoding."""
+        compression_config = compression_config or _DEFAULT_COMPRESSION_CONFIG
+
+        body = cast(bytes, self.response.body)
+        if isinstance(body, str):
             logger.debug("Converting string response to bytes before compressing it")
-            self.response.body = bytes(self.response.body, "utf-8")
-        gzip = zlib.compressobj(9, zlib.DEFLATED, zlib.MAX_WBITS | 16)
-        self.response.body = gzip.compress(self.response.body) + gzip.flush()
+            body = bytes(body, "utf-8")
 
-    def _route(self, event: ResponseEventT, cors: CORSConfig | None):
+        content_type = self.response.headers.get("Content-Type")
+        if isinstance(content_type, list):
+            content_type = content_type[0]
+
+        if not compression_config.should_compress(body, content_type):
+            return
+
+        self.response.headers["Content-Encoding"] = encoding
+        self.response.body = compression_config.compress(body, encoding)
+
+    def _route(
+        self,
+        event: ResponseEventT,
+        cors: CORSConfig | None,
+        compression_config: CompressionConfig | None = None,
+    ):
         """Optionally handle any of the route's configure response handling"""
         if self.route is None:
             return
@@ -877,14 +902,22 @@ class ResponseBuilder(Generic[ResponseEventT]):
             self._add_cors(event, cors or CORSConfig())
         if self.route.cache_control:
             self._add_cache_control(self.route.cache_control)
-        if self._has_compression_enabled(
+
+        encoding = self._has_compression_enabled(
             route_compression=self.route.compress,
             response_compression=self.response.compress,
             event=event,
-        ):
-            self._compress()
+            compression_config=compression_config,
+        )
+        if encoding:
+            self._compress(encoding, compression_config)
 
-    def build(self, event: ResponseEventT, cors: CORSConfig | None = None) -> dict[str, Any]:
+    def build(
+        self,
+        event: ResponseEventT,
+        cors: CORSConfig | None = None,
+        compression_config: CompressionConfig | None = None,
+    ) -> dict[str, Any]:
         """Build the full response dict to be returned by the lambda"""
 
         # We only apply the serializer when the content type is JSON and the
@@ -892,7 +925,7 @@ class ResponseBuilder(Generic[ResponseEventT]):
         if self.response.is_json() and not isinstance(self.response.body, str):
             self.response.body = self.serializer(self.response.body)
 
-        self._route(event, cors)
+        self._route(event, cors, compression_config)
 
         if isinstance(self.response.body, bytes):
             logger.debug("Encoding bytes response with base64")
@@ -1390,6 +1423,8 @@ class MiddlewareFrame:
         self.current_middleware: Callable[..., Any] = current_middleware
         self.next_middleware: Callable[..., Any] = next_middleware
         self._next_middleware_name = next_middleware.__name__
+        # Frames are built once per route, so we pre-compute the debug description only once too
+        self._description = f"[{self.__name__}] next call chain is {self.__name__} -> {self._next_middleware_name}"
 
     @property
     def __name__(self) -> str:  # noqa: A003
@@ -1402,8 +1437,7 @@ class MiddlewareFrame:
 
     def __str__(self) -> str:
         """Identify current middleware identity and call chain for debugging purposes."""
-        middleware_name = self.__name__
-        return f"[{middleware_name}] next call chain is {middleware_name} -> {self._next_middleware_name}"
+        return self._description
 
     def __call__(self, app: ApiGatewayResolver) -> dict | tuple | Response:
         """
@@ -1424,8 +1458,11 @@ class MiddlewareFrame:
         """
         # Do debug printing and push processed stack frame AFTER calling middleware
         # else the stack frame text of `current calling next` is confusing.
-        logger.debug("MiddlewareFrame: %s", self)
-        app._push_processed_stack_frame(str(self))
+        logger.debug("MiddlewareFrame: %s", self._description)
+
+        # Processed stack frames are only printed in debug mode, so we don't track them otherwise
+        if app._debug:
+            app._push_processed_stack_frame(self._description)
 
         return self.current_middleware(app, self.next_middleware)
 
@@ -1458,6 +1495,190 @@ def _registered_api_adapter(app: ApiGatewayResolver, next_middleware: Callable[.
     return app._to_response(next_middleware(**route_args))
 
 
+@lru_cache(maxsize=None)
+def _read_swagger_ui_asset(name: str) -> str:
+    """Read a bundled Swagger UI asset once, as they're large and never change"""
+    return (Path(__file__).parent / "openapi" / "swagger_ui" / name).read_text()
+
+
+class _RouteIndexNode:
+    """Internally used node of the RouteIndex segment trie"""
+
+    __slots__ = ("static_children", "dynamic_children", "routes")
+
+    def __init__(self) -> None:
+        # literal path segments are resolved with a single dict lookup
+        self.static_children: dict[str, _RouteIndexNode] = {}
+        # dynamic path segments (e.g. <account_id>) keyed by their segment regex source
+        self.dynamic_children: dict[str, tuple[Pattern, _RouteIndexNode]] = {}
+        # routes whose rule ends at this node along with their resolution priority
+        self.routes: list[tuple[tuple[int, int], Route]] = []
+
+
+class RouteIndex:
+    """
+    Internally used routing index to narrow down which routes can match a request path.
+
+    Rules are split by "/" into segments and stored in a trie per HTTP method. Literal segments are
+    resolved via dict lookups, and only dynamic segments (e.g. `<account_id>`) are matched with a
+    precompiled segment regex. Rules that can't be safely split into segments (custom regexes like `.+`
+    or a custom `_compile_regex`) are kept aside and always returned as candidates.
+
+    Candidates are returned in the same order a linear scan would try them: static routes first,
+    then dynamic routes, each in registration order. Callers must still confirm a candidate with
+    `route.rule.match(path)`, which also preserves the `Match` contract used to extract route arguments.
+
+    Static rules without any regex or `<param>` placeholders are also kept in a `(method, path)` dict,
+    so most requests are resolved with a single hash lookup and no regex at all.
+    """
+
+    def __init__(self) -> None:
+        self._roots: dict[str, _RouteIndexNode] = {}
+        self._unindexed: dict[str, list[tuple[tuple[int, int], Route]]] = {}
+        self._sequence = 0
+
+        # Exact-match fast path for static rules; trailing slashes are stripped from the path
+        # before the lookup for rules compiled with trailing slashes support (e.g. REST API)
+        self._static_routes: dict[tuple[str, str], tuple[tuple[int, int], Route]] = {}
+        self._static_routes_ignoring_trailing_slashes: dict[tuple[str, str], tuple[tuple[int, int], Route]] = {}
+
+        # Static regex rules (e.g. ".+") registered before a static rule take precedence over it
+        self._first_unindexed_static_priority: dict[str, tuple[int, int]] = {}
+
+    def add(self, route: Route, rule: str) -> None:
+        """Add a route to the index
+
+        Parameters
+        ----------
+        route: Route
+            The route registered for a single HTTP method
+        rule: str
+            The original rule used to compile `route.rule`, example "/accounts/<account_id>"
+        """
+        # The more specific route wins: static routes are always tried before dynamic routes
+        priority = (1 if route.rule.groups > 0 else 0, self._sequence)
+        self._sequence += 1
+
+        ignore_trailing_slashes = self._ignores_trailing_slashes(route=route, rule=rule)
+        segments = None if ignore_trailing_slashes is None else self._compile_segments(rule=rule)
+        if segments is None:
+            logger.debug(f"Route rule '{rule}' can't be indexed by segments; it'll be matched by regex only")
+            self._unindexed.setdefault(route.method, []).append((priority, route))
+            if priority[0] == 0:
+                self._first_unindexed_static_priority.setdefault(route.method, priority)
+            return
+
+        if all(segment_regex is None for _, segment_regex in segments):
+            static_routes = (
+                self._static_routes_ignoring_trailing_slashes if ignore_trailing_slashes else self._static_routes
+            )
+            # Duplicate rules are resolved by the first registered route
+            static_routes.setdefault((route.method, rule), (priority, route))
+
+        node = self._roots.setdefault(route.method, _RouteIndexNode())
+        for segment, segment_regex in segments:
+            if segment_regex is None:
+                node = node.static_children.setdefault(segment, _RouteIndexNode())
+                continue
+
+            if segment_regex.pattern not in node.dynamic_children:
+                node.dynamic_children[segment_regex.pattern] = (segment_regex, _RouteIndexNode())
+            node = node.dynamic_children[segment_regex.pattern][1]
+
+        node.routes.append((priority, route))
+
+    def find_static(self, method: str, path: str) -> Route | None:
+        """Return the route for an exact static match, or None when regex matching is required"""
+        if path.endswith("\n"):
+            return None
+
+        match = self._static_routes.get((method, path))
+
+        if self._static_routes_ignoring_trailing_slashes:
+            match_ignoring_trailing_slashes = self._static_routes_ignoring_trailing_slashes.get(
+                (method, path.rstrip("/")),
+            )
+            if match is None or (match_ignoring_trailing_slashes and match_ignoring_trailing_slashes[0] < match[0]):
+                match = match_ignoring_trailing_slashes
+
+        if match is None:
+            return None
+
+        priority, route = match
+        first_unindexed_static_priority = self._first_unindexed_static_priority.get(method)
+        if first_unindexed_static_priority is not None and first_unindexed_static_priority < priority:
+            return None
+
+        return route
+
+    def candidates(self, method: str, path: str) -> list[Route]:
+        """Return routes that can match the method and path, ordered by resolution priority"""
+        found: dict[tuple[int, int], Route] = dict(self._unindexed.get(method, ()))
+
+        root = self._roots.get(method)
+        if root is not None:
+            # Regex "$" also matches right before a trailing newline
+            paths = {path, path[:-1]} if path.endswith("\n") else {path}
+
+            # Rules compiled with trailing slashes support (e.g. REST API) also match "/path//"
+            paths.update([candidate_path.rstrip("/") for candidate_path in paths])
+
+            for candidate_path in paths:
+                self._collect(root, candidate_path.split("/"), 0, found)
+
+        return [found[priority] for priority in sorted(found)]
+
+    @classmethod
+    def _collect(
+        cls,
+        node: _RouteIndexNode,
+        segments: list[str],
+        position: int,
+        found: dict[tuple[int, int], Route],
+    ) -> None:
+        if position == len(segments):
+            found.update(node.routes)
+            return
+
+        segment = segments[position]
+        static_child = node.static_children.get(segment)
+        if static_child is not None:
+            cls._collect(static_child, segments, position + 1, found)
+
+        for segment_regex, dynamic_child in node.dynamic_children.values():
+            if segment_regex.match(segment):
+                cls._collect(dynamic_child, segments, position + 1, found)
+
+    @staticmethod
+    def _ignores_trailing_slashes(route: Route, rule: str) -> bool | None:
+        """Whether the route regex ignores trailing slashes, or None when it wasn't compiled by us"""
+        # We can only index rules compiled by the built-in `_compile_regex` implementations,
+        # as the index must never exclude a route its regex would match
+        rule_regex = re.sub(_DYNAMIC_ROUTE_PATTERN, _NAMED_GROUP_BOUNDARY_PATTERN, rule)
+        if route.rule.pattern == _ROUTE_REGEX.format(rule_regex):
+            return False
+        if route.rule.pattern == _ROUTE_REGEX_TRAILING_SLASHES.format(rule_regex) and not rule.endswith("/"):
+            return True
+        return None
+
+    @staticmethod
+    def _compile_segments(rule: str) -> list[tuple[str, Pattern | None]] | None:
+        """Split a rule into literal and precompiled dynamic segments, or None when it can't be indexed"""
+        segments: list[tuple[str, Pattern | None]] = []
+        for segment in rule.split("/"):
+            if _REGEX_METACHARACTERS.intersection(re.sub(_DYNAMIC_ROUTE_PATTERN, "", segment)):
+                return None
+
+            if re.search(_DYNAMIC_ROUTE_PATTERN, segment) is None:
+                segments.append((segment, None))
+                continue
+
+            segment_regex = re.sub(_DYNAMIC_ROUTE_PATTERN, _NAMED_GROUP_BOUNDARY_PATTERN, segment)
+            segments.append((segment, re.compile(_ROUTE_REGEX.format(segment_regex))))
+
+        return segments
+
+
 class ApiGatewayResolver(BaseRouter):
     """API Gateway and ALB proxy resolver
 
@@ -1495,6 +1716,7 @@ class ApiGatewayResolver(BaseRouter):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression_config: CompressionConfig | None = None,
     ):
         """
         Parameters
@@ -1507,17 +1729,22 @@ class ApiGatewayResolver(BaseRouter):
             Enables debug mode, by default False. Can be also be enabled by "POWERTOOLS_DEV"
             environment variable
         serializer: Callable, optional
-            function to serialize `obj` to a JSON formatted `str`, by default json.dumps
+            function to serialize `obj` to a JSON formatted `str`, by default json.dumps.
+            Use `JSONSerializer()` to serialize with orjson or msgspec when installed.
         strip_prefixes: list[str | Pattern], optional
             optional list of prefixes to be removed from the request path before doing the routing.
             This is often used with api gateways with multiple custom mappings.
             Each prefix can be a static string or a compiled regex pattern
         enable_validation: bool | None
             Enables validation of the request body against the route schema, by default False.
+        compression_config: CompressionConfig | None
+            Optionally configure encodings, level, minimum size and content types used when compressing
+            responses of routes with `compress=True`. Defaults to gzip for any response size and content type.
         """
         self._proxy_type = proxy_type
         self._dynamic_routes: list[Route] = []
         self._static_routes: list[Route] = []
+        self._route_index = RouteIndex()
         self._route_keys: list[str] = []
         self._exception_handlers: dict[type, Callable] = {}
         self._cors = cors
@@ -1526,6 +1753,10 @@ class ApiGatewayResolver(BaseRouter):
         self._debug = self._has_debug(debug)
         self._enable_validation = enable_validation
         self._strip_prefixes = strip_prefixes
+        self._compression_config = compression_config
+        self._openapi_swagger_settings: dict[str, Any] = {}
+        self._openapi_schema_file: str | Path | None = None
+        self._openapi_json_schema_cache: dict[str, str] = {}
         self.context: dict = {}  # early init as customers might add context before event resolution
         self.processed_stack_frames = []
         self._response_builder_class = ResponseBuilder[BaseProxyEvent]
@@ -1538,7 +1769,11 @@ class ApiGatewayResolver(BaseRouter):
 
             # Note the serializer argument: only use custom serializer if provided by the caller
             # Otherwise, fully rely on the internal Pydantic based mechanism to serialize responses for validation.
-            self.use([OpenAPIValidationMiddleware(validation_serializer=serializer)])
+            # JSONSerializer backends encode the same types as jsonable_encoder, so they're only used for the body.
+            if isinstance(serializer, JSONSerializer):
+                self.use([OpenAPIValidationMiddleware()])
+            else:
+                self.use([OpenAPIValidationMiddleware(validation_serializer=serializer)])
 
     def get_openapi_schema(
         self,
@@ -1821,6 +2056,7 @@ class ApiGatewayResolver(BaseRouter):
         oauth2_config: OAuth2Config | None = None,
         persist_authorization: bool = False,
         openapi_extensions: dict[str, Any] | None = None,
+        openapi_schema_file: str | Path | None = None,
     ):
         """
         Returns the OpenAPI schema as a JSON serializable dict
@@ -1865,14 +2101,35 @@ class ApiGatewayResolver(BaseRouter):
             Whether to persist authorization data on browser close/refresh.
         openapi_extensions: dict[str, Any], optional
             Additional OpenAPI extensions as a dictionary.
+        openapi_schema_file: str | Path, optional
+            Path to a pre-built OpenAPI JSON schema to serve instead of generating it on the first request,
+            e.g. built with `python -m aws_lambda_powertools.event_handler.openapi app:app -o openapi.json`.
+            We fall back to generating the schema when the file doesn't exist.
         """
-        from aws_lambda_powertools.event_handler.openapi.compat import model_json
-        from aws_lambda_powertools.event_handler.openapi.models import Server
         from aws_lambda_powertools.event_handler.openapi.swagger_ui import (
             generate_oauth2_redirect_html,
             generate_swagger_html,
         )
 
+        # Schema generation is deferred to the first request, and shared with the CLI building schema files
+        self._openapi_swagger_settings = {
+            "title": title,
+            "version": version,
+            "openapi_version": openapi_version,
+            "summary": summary,
+            "description": description,
+            "tags": tags,
+            "servers": servers,
+            "terms_of_service": terms_of_service,
+            "contact": contact,
+            "license_info": license_info,
+            "security_schemes": security_schemes,
+            "security": security,
+            "openapi_extensions": openapi_extensions,
+        }
+        self._openapi_schema_file = openapi_schema_file
+        self._openapi_json_schema_cache.clear()
+
         @self.get(path, middlewares=middlewares, include_in_schema=False, compress=compress)
         def swagger_handler():
             query_params = self.current_event.query_string_parameters or {}
@@ -1887,45 +2144,15 @@ class ApiGatewayResolver(BaseRouter):
                     body=generate_oauth2_redirect_html(),
                 )
 
-            base_path = self._get_base_path()
-
             if swagger_base_url:
                 swagger_js = f"{swagger_base_url}/swagger-ui-bundle.min.js"
                 swagger_css = f"{swagger_base_url}/swagger-ui.min.css"
             else:
                 # We now inject CSS and JS into the SwaggerUI file
-                swagger_js = Path.open(
-                    Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui-bundle.min.js",
-                ).read()
-                swagger_css = Path.open(Path(__file__).parent / "openapi" / "swagger_ui" / "swagger-ui.min.css").read()
-
-            openapi_servers = servers or [Server(url=(base_path or "/"))]
-
-            spec = self.get_openapi_schema(
-                title=title,
-                version=version,
-                openapi_version=openapi_version,
-                summary=summary,
-                description=description,
-                tags=tags,
-                servers=openapi_servers,
-                terms_of_service=terms_of_service,
-                contact=contact,
-                license_info=license_info,
-                security_schemes=security_schemes,
-                security=security,
-                openapi_extensions=openapi_extensions,
-            )
+                swagger_js = _read_swagger_ui_asset("swagger-ui-bundle.min.js")
+                swagger_css = _read_swagger_ui_asset("swagger-ui.min.css")
 
-            # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string contains
-            # </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON does not
-            # inadvertently close the script tag, and the JSON remains a valid string within the JavaScript code.
-            escaped_spec = model_json(
-                spec,
-                by_alias=True,
-                exclude_none=True,
-                indent=2,
-            ).replace("</", "<\\/")
+            escaped_spec = self._get_swagger_json_schema(self._get_base_path())
 
             # Check for query parameters; if "format" is specified as "json",
             # respond with the JSON used in the OpenAPI spec
@@ -1952,6 +2179,41 @@ class ApiGatewayResolver(BaseRouter):
                 body=body,
             )
 
+    def _get_swagger_json_schema(self, base_path: str) -> str:
+        """
+        Get the OpenAPI JSON schema served by Swagger, generating it once per base path.
+
+        The schema is escaped to be safely embedded in the Swagger UI HTML.
+        """
+        try:
+            return self._openapi_json_schema_cache[base_path]
+        except KeyError:
+            pass
+
+        settings = self._openapi_swagger_settings
+        servers = settings.get("servers")
+
+        if self._openapi_schema_file and Path(self._openapi_schema_file).is_file():
+            logger.debug(f"Loading OpenAPI schema from {self._openapi_schema_file}")
+            json_schema = Path(self._openapi_schema_file).read_text()
+            if not servers:
+                schema = json.loads(json_schema)
+                schema["servers"] = [{"url": base_path or "/"}]
+                json_schema = json.dumps(schema, indent=2)
+        else:
+            from aws_lambda_powertools.event_handler.openapi.compat import model_json
+            from aws_lambda_powertools.event_handler.openapi.models import Server
+
+            spec = self.get_openapi_schema(**{**settings, "servers": servers or [Server(url=(base_path or "/"))]})
+            json_schema = model_json(spec, by_alias=True, exclude_none=True, indent=2)
+
+        # The .replace('</', '<\\/') part is necessary to prevent a potential issue where the JSON string contains
+        # </script> or similar tags. Escaping the forward slash in </ as <\/ ensures that the JSON does not
+        # inadvertently close the script tag, and the JSON remains a valid string within the JavaScript code.
+        escaped_json_schema = json_schema.replace("</", "<\\/")
+        self._openapi_json_schema_cache[base_path] = escaped_json_schema
+        return escaped_json_schema
+
     def route(
         self,
         rule: str,
@@ -2010,6 +2272,9 @@ class ApiGatewayResolver(BaseRouter):
                 else:
                     self._static_routes.append(_route)
 
+                self._route_index.add(_route, rule)
+                # Routes added after the OpenAPI schema was generated must be part of it
+                self._openapi_json_schema_cache.clear()
                 self._create_route_key(item, rule)
 
                 if cors_enabled:
@@ -2079,7 +2344,7 @@ class ApiGatewayResolver(BaseRouter):
         BaseRouter.current_event = self._to_proxy_event(event)
         BaseRouter.lambda_context = context
 
-        response = self._resolve().build(self.current_event, self._cors)
+        response = self._resolve().build(self.current_event, self._cors, self._compression_config)
 
         # Debug print Processed Middlewares
         if self._debug:
@@ -2176,11 +2441,15 @@ class ApiGatewayResolver(BaseRouter):
         method = self.current_event.http_method.upper()
         path = self._remove_prefix(self.current_event.path)
 
-        registered_routes = self._static_routes + self._dynamic_routes
+        # Most routes are static, so we try an exact match before any regex matching
+        static_route = self._route_index.find_static(method, path)
+        if static_route is not None:
+            logger.debug("Found a registered static route. Calling function")
+            self.append_context(_route=static_route, _path=path)
+            return self._call_route(static_route, {})
 
-        for route in registered_routes:
-            if method != route.method:
-                continue
+        # The index narrows down candidates (static before dynamic) so we don't try every route regex
+        for route in self._route_index.candidates(method, path):
             match_results: Match | None = route.rule.match(path)
             if match_results:
                 logger.debug("Found a registered route. Calling function")
@@ -2291,7 +2560,8 @@ class ApiGatewayResolver(BaseRouter):
         """Actually call the matching route with any provided keyword arguments."""
         try:
             # Reset Processed stack for Middleware (for debugging purposes)
-            self._reset_processed_stack()
+            if self._debug:
+                self._reset_processed_stack()
 
             return self._response_builder_class(
                 response=self._to_response(
@@ -2579,6 +2849,7 @@ class APIGatewayRestResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression_config: CompressionConfig | None = None,
     ):
         """Amazon API Gateway REST and HTTP API v1 payload resolver"""
         super().__init__(
@@ -2588,6 +2859,7 @@ class APIGatewayRestResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            compression_config,
         )
 
     def _get_base_path(self) -> str:
@@ -2646,7 +2918,10 @@ class APIGatewayRestResolver(ApiGatewayResolver):
     # Override _compile_regex to exclude trailing slashes for route resolution
     @staticmethod
     def _compile_regex(rule: str, base_regex: str = _ROUTE_REGEX):
-        return super(APIGatewayRestResolver, APIGatewayRestResolver)._compile_regex(rule, "^{}/*$")
+        return super(APIGatewayRestResolver, APIGatewayRestResolver)._compile_regex(
+            rule,
+            _ROUTE_REGEX_TRAILING_SLASHES,
+        )
 
 
 class APIGatewayHttpResolver(ApiGatewayResolver):
@@ -2659,6 +2934,7 @@ class APIGatewayHttpResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression_config: CompressionConfig | None = None,
     ):
         """Amazon API Gateway HTTP API v2 payload resolver"""
         super().__init__(
@@ -2668,6 +2944,7 @@ class APIGatewayHttpResolver(ApiGatewayResolver):
             serializer,
             strip_prefixes,
             enable_validation,
+            compression_config,
         )
 
     def _get_base_path(self) -> str:
@@ -2694,9 +2971,18 @@ class ALBResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression_config: CompressionConfig | None = None,
     ):
         """Amazon Application Load Balancer (ALB) resolver"""
-        super().__init__(ProxyEventType.ALBEvent, cors, debug, serializer, strip_prefixes, enable_validation)
+        super().__init__(
+            ProxyEventType.ALBEvent,
+            cors,
+            debug,
+            serializer,
+            strip_prefixes,
+            enable_validation,
+            compression_config,
+        )
 
     def _get_base_path(self) -> str:
         # ALB doesn't have a stage variable, so we just return an empty string
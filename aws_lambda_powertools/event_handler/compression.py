@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+import zlib
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+GZIP = "gzip"
+BROTLI = "br"
+ZSTD = "zstd"
+
+# Default compression level per encoding, used when CompressionConfig has no explicit level
+_DEFAULT_LEVELS: dict[str, int] = {GZIP: 9, BROTLI: 5, ZSTD: 3}
+
+# Compression levels supported per encoding, inclusive
+_LEVEL_RANGES: dict[str, tuple[int, int]] = {GZIP: (-1, 9), BROTLI: (0, 11), ZSTD: (1, 22)}
+
+
+def _compress_gzip(body: bytes, level: int) -> bytes:
+    gzip = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    return gzip.compress(body) + gzip.flush()
+
+
+def _get_brotli_compressor() -> Callable[[bytes, int], bytes] | None:
+    try:
+        import brotli
+    except ImportError:
+        return None
+
+    return lambda body, level: brotli.compress(body, quality=level)
+
+
+def _get_zstd_compressor() -> Callable[[bytes, int], bytes] | None:
+    try:
+        # Python 3.14+ ships zstd in the standard library
+        from compression import zstd
+
+        return lambda body, level: zstd.compress(body, level=level)
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+    except ImportError:
+        return None
+
+    return lambda body, level: zstandard.ZstdCompressor(level=level).compress(body)
+
+
+class CompressionConfig:
+    """Response compression config
+
+    Compression is only applied to routes or responses with `compress=True`. This config controls which encodings
+    are negotiated with the client via the `Accept-Encoding` header, how hard we compress, and which responses are
+    worth compressing at all.
+
+    Brotli (`br`) requires the `brotli` package, and Zstandard (`zstd`) requires Python 3.14+ or the `zstandard`
+    package. Encodings that aren't available at runtime are ignored.
+
+    Examples
+    --------
+
+    Prefer Brotli when the client supports it, and skip compressing small or binary responses
+
+    ```python
+    from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CompressionConfig
+
+    compression_config = CompressionConfig(
+        encodings=["br", "gzip"],
+        level=5,
+        minimum_size=1024,
+        content_types=["application/json", "text/"],
+    )
+    app = APIGatewayRestResolver(compression_config=compression_config)
+
+    @app.get("/todos", compress=True)
+    def get_todos():
+        return {"todos": [...]}
+    ```
+    """
+
+    def __init__(
+        self,
+        encodings: list[str] | None = None,
+        level: int | None = None,
+        minimum_size: int = 0,
+        content_types: list[str] | None = None,
+        accept_wildcard: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        encodings: list[str] | None
+            Supported encodings in order of preference, used to break ties between encodings the client accepts
+            equally. Supported values are "gzip", "br" and "zstd". Defaults to ["gzip"].
+        level: int | None
+            Compression level applied to any negotiated encoding, so it must be supported by every encoding:
+            -1 to 9 for gzip, 0 to 11 for br and 1 to 22 for zstd. Defaults to 9 for gzip, 5 for br and 3 for zstd.
+        minimum_size: int
+            Responses with a body smaller than this number of bytes are not compressed. Defaults to 0.
+        content_types: list[str] | None
+            Content-Type prefixes eligible for compression, example ["application/json", "text/"], matched
+            case-insensitively and ignoring parameters such as charset.
+            Defaults to None, meaning every content type can be compressed.
+        accept_wildcard: bool
+            Whether an `Accept-Encoding: *` wildcard accepts any supported encoding. Defaults to False, meaning the
+            client must list an encoding explicitly for the response to be compressed.
+        """
+        self.level = level
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+        self.accept_wildcard = accept_wildcard
+        self._content_type_prefixes = tuple(prefix.lower() for prefix in content_types or ())
+        self._compressors: dict[str, Callable[[bytes, int], bytes]] = {}
+
+        for encoding in encodings or [GZIP]:
+            compressor = self._get_compressor(encoding)
+            self._validate_level(encoding, level)
+            if compressor is None:
+                logger.debug(f"Compression encoding '{encoding}' is not available; ignoring it")
+                continue
+            self._compressors[encoding] = compressor
+
+    @property
+    def encodings(self) -> list[str]:
+        """Encodings available at runtime in order of preference"""
+        return list(self._compressors)
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        """Select the encoding to use based on the client `Accept-Encoding` header
+
+        Parameters
+        ----------
+        accept_encoding: str
+            The `Accept-Encoding` request header value, example "gzip, deflate, br;q=0.9"
+
+        Returns
+        -------
+        str | None
+            The negotiated encoding or None when the client accepts none of the supported encodings
+        """
+        qualities = self._parse_accept_encoding(accept_encoding)
+        wildcard_quality = qualities.get("*", 0.0) if self.accept_wildcard else 0.0
+
+        best_encoding: str | None = None
+        best_quality = 0.0
+        for encoding in self._compressors:
+            quality = qualities.get(encoding, wildcard_quality)
+            if quality > best_quality:
+                best_encoding, best_quality = encoding, quality
+
+        return best_encoding
+
+    def should_compress(self, body: bytes, content_type: str | None) -> bool:
+        """Whether a response body is worth compressing based on its size and content type"""
+        if len(body) < self.minimum_size:
+            logger.debug(f"Response body smaller than {self.minimum_size} bytes; skipping compression")
+            return False
+
+        if self.content_types is not None and not self._is_compressible_content_type(content_type):
+            logger.debug(f"Content-Type '{content_type}' not eligible for compression; skipping compression")
+            return False
+
+        return True
+
+    def _is_compressible_content_type(self, content_type: str | None) -> bool:
+        # Media types are case-insensitive, e.g. "Application/JSON; charset=UTF-8" -> "application/json"
+        media_type = (content_type or "").partition(";")[0].strip().lower()
+        return bool(media_type) and media_type.startswith(self._content_type_prefixes)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress the response body with a negotiated encoding"""
+        level = self.level if self.level is not None else _DEFAULT_LEVELS[encoding]
+        return self._compressors[encoding](body, level)
+
+    @staticmethod
+    def _get_compressor(encoding: str) -> Callable[[bytes, int], bytes] | None:
+        if encoding == GZIP:
+            return _compress_gzip
+        if encoding == BROTLI:
+            return _get_brotli_compressor()
+        if encoding == ZSTD:
+            return _get_zstd_compressor()
+
+        raise ValueError(f"Unsupported compression encoding '{encoding}'. Use one of: {GZIP}, {BROTLI}, {ZSTD}")
+
+    @staticmethod
+    def _validate_level(encoding: str, level: int | None) -> None:
+        # Fail when configuring the resolver rather than on the first request negotiating this encoding
+        if level is None:
+            return
+
+        min_level, max_level = _LEVEL_RANGES[encoding]
+        if not min_level <= level <= max_level:
+            raise ValueError(
+                f"Compression level {level} is not supported by '{encoding}'. "
+                f"Use a level between {min_level} and {max_level}",
+            )
+
+    @staticmethod
+    def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+        """Parse `Accept-Encoding` into encoding -> quality, e.g. "gzip;q=0.8, br" -> {"gzip": 0.8, "br": 1.0}"""
+        qualities: dict[str, float] = {}
+        for item in accept_encoding.split(","):
+            encoding, _, parameters = item.partition(";")
+            encoding = encoding.strip().lower()
+            if not encoding:
+                continue
+
+            quality = 1.0
+            parameter_name, _, parameter_value = parameters.partition("=")
+            if parameter_name.strip().lower() == "q":
+                try:
+                    quality = float(parameter_value)
+                except ValueError:
+                    quality = 0.0
+
+            qualities[encoding] = quality
+
+        return qualities
@@ -6,13 +6,14 @@ import logging
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Callable, Mapping, MutableMapping, Sequence
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PydanticUserError, ValidationError
 
 from aws_lambda_powertools.event_handler.middlewares import BaseMiddlewareHandler
 from aws_lambda_powertools.event_handler.openapi.compat import (
     _model_dump,
     _normalize_errors,
     _regenerate_error_with_loc,
+    create_request_model,
     get_missing_field_error,
 )
 from aws_lambda_powertools.event_handler.openapi.dependant import is_scalar_field
@@ -69,12 +70,54 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
             Use it when you have a custom type that cannot be serialized by the default jsonable_encoder.
         """
         self._validation_serializer = validation_serializer
+        self._request_validators: dict[Route, _RequestValidator | None] = {}
 
     def handler(self, app: EventHandlerInstance, next_middleware: NextMiddleware) -> Response:
         logger.debug("OpenAPIValidationMiddleware handler")
 
         route: Route = app.context["_route"]
 
+        request_validator = self._get_request_validator(route)
+        validated = request_validator.validate(app, self._get_body) if request_validator else None
+        values, errors = validated if validated is not None else self._validate_request_fields(app, route)
+
+        if errors:
+            # Raise the validation errors
+            raise RequestValidationError(_normalize_errors(errors))
+        else:
+            # Re-write the route_args with the validated values, and call the next middleware
+            app.context["_route_args"] = values
+
+            # Call the handler by calling the next middleware
+            response = next_middleware(app)
+
+            # Process the response
+            return self._handle_response(route=route, response=response)
+
+    def _get_request_validator(self, route: Route) -> _RequestValidator | None:
+        """
+        Get the compiled request validator of a route, compiling it on the first request to the route.
+        """
+        try:
+            return self._request_validators[route]
+        except KeyError:
+            pass
+
+        try:
+            request_validator: _RequestValidator | None = _RequestValidator(route)
+        except (PydanticUserError, TypeError) as exc:
+            logger.debug(
+                f"Unable to compile request validator for {route.method} {route.path}, validating per field: {exc}",
+            )
+            request_validator = None
+
+        self._request_validators[route] = request_validator
+        return request_validator
+
+    def _validate_request_fields(self, app: EventHandlerInstance, route: Route) -> tuple[dict[str, Any], list[Any]]:
+        """
+        Validate the request field by field, used when the route request validator can't be used.
+        """
         values: dict[str, Any] = {}
         errors: list[Any] = []
 
@@ -122,18 +165,7 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
             values.update(body_values)
             errors.extend(body_errors)
 
-        if errors:
-            # Raise the validation errors
-            raise RequestValidationError(_normalize_errors(errors))
-        else:
-            # Re-write the route_args with the validated values, and call the next middleware
-            app.context["_route_args"] = values
-
-            # Call the handler by calling the next middleware
-            response = next_middleware(app)
-
-            # Process the response
-            return self._handle_response(route=route, response=response)
+        return values, errors
 
     def _handle_response(self, *, route: Route, response: Response):
         # Process the response body if it exists
@@ -261,6 +293,133 @@ class OpenAPIValidationMiddleware(BaseMiddlewareHandler):
             raise NotImplementedError("Only JSON body is supported")
 
 
+class _RequestValidator:
+    """
+    Internally used to validate all path, query, header and body fields of a route with a single Pydantic model.
+
+    The model is compiled once per route, so validating a request is a single call to Pydantic instead of one per
+    field. Values are looked up, normalized and reported in errors exactly like `_request_params_to_args` and
+    `_request_body_to_args` do.
+    """
+
+    def __init__(self, route: Route):
+        dependant = route.dependant
+        fields: dict[str, tuple[tuple[str, str], ModelField]] = {}
+
+        self._path_params = self._get_param_aliases(dependant.path_params)
+        self._query_params = self._get_param_aliases(dependant.query_params)
+        self._header_params = self._get_param_aliases(dependant.header_params)
+        for field in (*dependant.path_params, *dependant.query_params, *dependant.header_params):
+            fields[f"field_{len(fields)}"] = ((field.field_info.in_.value, field.alias), field)  # type: ignore[attr-defined]
+
+        self._body_params = [field.alias for field in dependant.body_params]
+        self._body_alias_omitted = False
+        if dependant.body_params:
+            _, self._body_alias_omitted = _get_embed_body(
+                field=dependant.body_params[0],
+                required_params=dependant.body_params,
+                received_body=None,
+            )
+            for field in dependant.body_params:
+                fields[f"field_{len(fields)}"] = (("body", field.alias), field)
+
+        self._field_names = {name: field.name for name, (_, field) in fields.items()}
+        self._field_locs = {loc for loc, _ in fields.values()}
+        self._model = create_request_model(fields=fields, model_name=f"{route.operation_id}_request")
+
+    @staticmethod
+    def _get_param_aliases(params: Sequence[ModelField]) -> list[tuple[str, bool]]:
+        aliases: list[tuple[str, bool]] = []
+        for field in params:
+            # To ensure early failure, we check if it's not an instance of Param.
+            if not isinstance(field.field_info, Param):
+                raise AssertionError(f"Expected Param field_info, got {field.field_info}")
+            aliases.append((field.alias, is_scalar_field(field)))
+        return aliases
+
+    def validate(
+        self,
+        app: EventHandlerInstance,
+        get_body: Callable[[EventHandlerInstance], Any],
+    ) -> tuple[dict[str, Any], list[Any]] | None:
+        """
+        Validate the current request, returning the validated values and errors.
+
+        Returns None when the request body can't be looked up by alias, so the caller can validate field by field.
+        """
+        data: dict[str, dict[str, Any]] = {
+            "path": _get_param_values(app.context["_route_args"], self._path_params),
+            "query": _get_param_values(
+                app.current_event.resolved_query_string_parameters,
+                self._query_params,
+                _first_value,
+            ),
+            "header": _get_param_values(app.current_event.resolved_headers_field, self._header_params, _single_value),
+        }
+
+        if self._body_params:
+            received_body = get_body(app)
+            if self._body_alias_omitted:
+                received_body = {self._body_params[0]: received_body}
+            elif received_body is None:
+                received_body = {}
+            elif not isinstance(received_body, dict):
+                return None
+
+            data["body"] = {
+                alias: received_body[alias] for alias in self._body_params if received_body.get(alias) is not None
+            }
+
+        try:
+            model = self._model.model_validate(data, from_attributes=True)
+        except ValidationError as exc:
+            return {}, self._regenerate_errors(exc.errors())
+
+        return {self._field_names[name]: value for name, value in model.__dict__.items()}, []
+
+    def _regenerate_errors(self, errors: list[Any]) -> list[Any]:
+        for error in errors:
+            loc = error["loc"]
+            if error["type"] == "missing" and loc in self._field_locs:
+                # Same as get_missing_field_error, we don't report the whole request as the missing field input
+                error["input"] = None
+            if self._body_alias_omitted and loc[0] == "body":
+                error["loc"] = ("body", *loc[2:])
+        return errors
+
+
+def _get_param_values(
+    received_params: Mapping[str, Any] | None,
+    params: list[tuple[str, bool]],
+    normalize_scalar: Callable[[list], Any] | None = None,
+) -> dict[str, Any]:
+    """
+    Get the received values of params by alias, normalizing multi-value params with a scalar type.
+    """
+    values: dict[str, Any] = {}
+    if not received_params:
+        return values
+
+    for alias, is_scalar in params:
+        value = received_params.get(alias)
+        if value is None:
+            continue
+        if normalize_scalar and is_scalar and isinstance(value, list) and value:
+            value = normalize_scalar(value)
+        values[alias] = value
+    return values
+
+
+def _first_value(values: list) -> Any:
+    # Same as _normalize_multi_query_string_with_param: scalars keep the first value regardless of how many we got
+    return values[0]
+
+
+def _single_value(values: list) -> Any:
+    # Same as _normalize_multi_header_values_with_param: scalars are only unwrapped when we got a single value
+    return values[0] if len(values) == 1 else values
+
+
 def _request_params_to_args(
     required_params: Sequence[ModelField],
     received_params: Mapping[str, Any],
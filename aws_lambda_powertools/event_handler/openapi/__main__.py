@@ -0,0 +1,3 @@
+from aws_lambda_powertools.event_handler.openapi.cli import main
+
+main()
@@ -0,0 +1,65 @@
+"""
+Build the OpenAPI schema of an event handler app ahead of time, e.g. while packaging a Lambda function.
+
+Usage:
+
+    python -m aws_lambda_powertools.event_handler.openapi app:app --output openapi.json
+
+The schema file can then be served by Swagger without generating it at runtime, with
+`app.enable_swagger(openapi_schema_file="openapi.json")`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.event_handler.api_gateway import ApiGatewayResolver
+
+
+def write_openapi_schema_file(app: ApiGatewayResolver, path: str | Path) -> None:
+    """
+    Write the OpenAPI JSON schema of an app to a file.
+
+    The schema is generated with the same settings passed to `enable_swagger`, if any.
+
+    Parameters
+    ----------
+    app: ApiGatewayResolver
+        The event handler app
+    path: str | Path
+        Path of the JSON file to write
+    """
+    json_schema = app.get_openapi_json_schema(**app._openapi_swagger_settings)
+    Path(path).write_text(json_schema)
+
+
+def load_app(target: str) -> ApiGatewayResolver:
+    """
+    Import an event handler app from a "module:attribute" target, e.g. "app:app" or "src.handler:app".
+    """
+    module_name, _, attribute = target.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid app '{target}'. Use the format 'module:attribute', e.g. 'app:app'")
+
+    # Allow importing apps relative to where the CLI runs, like `python app.py` would
+    sys.path.insert(0, str(Path.cwd()))
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m aws_lambda_powertools.event_handler.openapi",
+        description="Build the OpenAPI schema of an event handler app",
+    )
+    parser.add_argument("app", help="App to build the schema for, in the format 'module:attribute', e.g. 'app:app'")
+    parser.add_argument("-o", "--output", default="openapi.json", help="Schema file to write (default: openapi.json)")
+    args = parser.parse_args(argv)
+
+    write_openapi_schema_file(load_app(args.app), args.output)
+    print(f"OpenAPI schema written to {args.output}")
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any, Deque, FrozenSet, List, Mapping, Sequence
 
 from typing_extensions import Annotated, Literal, get_origin, get_args
 
-from pydantic import BaseModel, create_model
+from pydantic import AliasPath, BaseModel, create_model
 from pydantic.fields import FieldInfo
 
 from aws_lambda_powertools.event_handler.openapi.types import COMPONENT_REF_PREFIX, UnionType
@@ -229,6 +229,30 @@ def create_body_model(*, fields: Sequence[ModelField], model_name: str) -> type[
     return model
 
 
+def create_request_model(
+    *, fields: Mapping[str, tuple[tuple[str, str], ModelField]], model_name: str
+) -> type[BaseModel]:
+    """
+    Create a single model validating every request field, where each field is read from `data[location][alias]`.
+
+    Parameters
+    ----------
+    fields: Mapping[str, tuple[tuple[str, str], ModelField]]
+        Model field name mapped to the (location, alias) where the value is found, and the request field
+    model_name: str
+        Name of the created model
+    """
+    field_params = {
+        name: (
+            field.field_info.annotation,
+            FieldInfo.merge_field_infos(field.field_info, validation_alias=AliasPath(*loc)),
+        )
+        for name, (loc, field) in fields.items()
+    }
+    model: type[BaseModel] = create_model(model_name, **field_params)
+    return model
+
+
 def _model_dump(model: BaseModel, mode: Literal["json", "python"] = "json", **kwargs: Any) -> Any:
     return model.model_dump(mode=mode, **kwargs)
 
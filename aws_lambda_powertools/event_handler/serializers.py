@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import json
+import logging
+import uuid
+from functools import partial
+from typing import Any, Callable
+
+from aws_lambda_powertools.shared.json_encoder import default_encoder
+
+logger = logging.getLogger(__name__)
+
+AUTO = "auto"
+ORJSON = "orjson"
+MSGSPEC = "msgspec"
+JSON = "json"
+
+# Backends tried in order when backend="auto"; stdlib json is always available
+_AUTO_BACKENDS: tuple[str, ...] = (ORJSON, MSGSPEC, JSON)
+
+
+def _encode_datetime(obj: datetime.date | datetime.time) -> str:
+    """ISO 8601 format, with "Z" for UTC like msgspec and Pydantic do, so every backend agrees"""
+    value = obj.isoformat()
+    if isinstance(obj, (datetime.datetime, datetime.time)) and obj.utcoffset() == datetime.timedelta(0):
+        return f"{value[:-6]}Z"
+    return value
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types of the default serializer, plus the ones orjson and msgspec support natively"""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return _encode_datetime(obj)
+
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+
+    return default_encoder(obj)
+
+
+def _get_json_serializer() -> Callable[[Any], str]:
+    return partial(json.dumps, separators=(",", ":"), default=_default)
+
+
+def _get_orjson_serializer() -> Callable[[Any], str] | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    # json.dumps coerces non-str dict keys, e.g. {1: "a"} -> {"1": "a"}; orjson only does it when asked to
+    # Datetimes are encoded by _default, as orjson uses "+00:00" rather than "Z" for UTC
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    json_serializer = _get_json_serializer()
+
+    def default(obj: Any) -> Any:
+        # orjson would encode NaN as null
+        if isinstance(obj, decimal.Decimal) and obj.is_nan():
+            raise TypeError("Decimal NaN is encoded by the standard library")
+        return _default(obj)
+
+    def serialize(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, or Decimal NaN; unsupported types raise TypeError from json.dumps
+            return json_serializer(obj)
+
+    return serialize
+
+
+def _get_msgspec_serializer() -> Callable[[Any], str] | None:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    encoder = msgspec.json.Encoder(enc_hook=_default)
+    json_serializer = _get_json_serializer()
+
+    def serialize(obj: Any) -> str:
+        encoded = encoder.encode(obj)
+        # msgspec encodes Decimals natively, including NaN as the string "NaN" rather than the NaN constant
+        if b'NaN"' in encoded:
+            return json_serializer(obj)
+        return encoded.decode()
+
+    return serialize
+
+
+class JSONSerializer:
+    """JSON serializer backend for event handler responses
+
+    Uses `orjson` or `msgspec` when installed, falling back to the standard library `json` module otherwise.
+    Every backend supports the types of the default serializer: standard JSON types, Decimals,
+    Pydantic models and Dataclasses, as well as datetimes and UUIDs. They encode them the same way, falling back
+    to the standard library for values the third-party backends can't encode identically, like integers wider
+    than 64 bits or Decimal NaN. Floats are formatted by each backend, e.g. `1e16` rather than `1e+16`, and
+    orjson and msgspec encode float NaN and infinity as `null`.
+
+    When used with `enable_validation=True`, responses of routes with a return type annotation are
+    converted by Pydantic and serialized by the backend, skipping `jsonable_encoder`.
+
+    Examples
+    --------
+
+    ```python
+    from aws_lambda_powertools.event_handler import APIGatewayRestResolver, JSONSerializer
+
+    app = APIGatewayRestResolver(serializer=JSONSerializer())
+
+    @app.get("/todos")
+    def get_todos():
+        return {"todos": [...]}
+    ```
+    """
+
+    def __init__(self, backend: str = AUTO):
+        """
+        Parameters
+        ----------
+        backend: str
+            JSON backend to use: "orjson", "msgspec", "json" or "auto". Defaults to "auto", which picks the
+            first installed backend in that order.
+        """
+        if backend not in (AUTO, *_AUTO_BACKENDS):
+            raise ValueError(
+                f"Unsupported JSON serializer backend '{backend}'. Use one of: {AUTO}, {ORJSON}, {MSGSPEC}, {JSON}",
+            )
+
+        for candidate in _AUTO_BACKENDS if backend == AUTO else (backend,):
+            serializer = self._get_serializer(candidate)
+            if serializer is not None:
+                break
+            logger.debug(f"JSON serializer backend '{candidate}' is not available")
+        else:
+            raise ValueError(f"JSON serializer backend '{backend}' is not installed")
+
+        self.backend = candidate
+        self._serializer = serializer
+
+    def __call__(self, obj: Any) -> str:
+        return self._serializer(obj)
+
+    @staticmethod
+    def _get_serializer(backend: str) -> Callable[[Any], str] | None:
+        if backend == ORJSON:
+            return _get_orjson_serializer()
+        if backend == MSGSPEC:
+            return _get_msgspec_serializer()
+        return _get_json_serializer()
@@ -9,6 +9,7 @@ from aws_lambda_powertools.event_handler.api_gateway import (
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.event_handler import CORSConfig
+    from aws_lambda_powertools.event_handler.compression import CompressionConfig
     from aws_lambda_powertools.utilities.data_classes import VPCLatticeEvent, VPCLatticeEventV2
 
 
@@ -53,9 +54,18 @@ class VPCLatticeResolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression_config: CompressionConfig | None = None,
     ):
         """Amazon VPC Lattice resolver"""
-        super().__init__(ProxyEventType.VPCLatticeEvent, cors, debug, serializer, strip_prefixes, enable_validation)
+        super().__init__(
+            ProxyEventType.VPCLatticeEvent,
+            cors,
+            debug,
+            serializer,
+            strip_prefixes,
+            enable_validation,
+            compression_config,
+        )
 
     def _get_base_path(self) -> str:
         return ""
@@ -102,9 +112,18 @@ class VPCLatticeV2Resolver(ApiGatewayResolver):
         serializer: Callable[[dict], str] | None = None,
         strip_prefixes: list[str | Pattern] | None = None,
         enable_validation: bool = False,
+        compression_config: CompressionConfig | None = None,
     ):
         """Amazon VPC Lattice resolver"""
-        super().__init__(ProxyEventType.VPCLatticeEventV2, cors, debug, serializer, strip_prefixes, enable_validation)
+        super().__init__(
+            ProxyEventType.VPCLatticeEventV2,
+            cors,
+            debug,
+            serializer,
+            strip_prefixes,
+            enable_validation,
+            compression_config,
+        )
 
     def _get_base_path(self) -> str:
         return ""
@@ -1,6 +1,5 @@
 import logging
 
-from aws_lambda_powertools.logging.logger import set_package_logger
 from aws_lambda_powertools.shared.functions import powertools_debug_is_set
 
 
@@ -18,6 +17,9 @@ def set_package_logger_handler(stream=None):
     """
 
     if powertools_debug_is_set():
+        # Imported here so Logger is only loaded when debugging Powertools itself
+        from aws_lambda_powertools.logging.logger import set_package_logger
+
         return set_package_logger(stream=stream)
 
     logger = logging.getLogger("aws_lambda_powertools")
@@ -4,7 +4,7 @@ from collections import OrderedDict
 class LRUDict(OrderedDict):
     """
     Cache implementation based on ordered dict with a maximum number of items. Last accessed item will be evicted
-    first. Currently used by idempotency utility.
+    first. Currently used by the JMESPath utility.
     """
 
     def __init__(self, max_items=1024, *args, **kwargs):
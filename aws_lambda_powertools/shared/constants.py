@@ -49,6 +49,14 @@ EMF_MAX_TIMESTAMP_FUTURE_AGE = 2 * 60 * 60 * 1000  # 2 hours
 # Parameters constants
 PARAMETERS_SSM_DECRYPT_ENV: str = "POWERTOOLS_PARAMETERS_SSM_DECRYPT"
 PARAMETERS_MAX_AGE_ENV: str = "POWERTOOLS_PARAMETERS_MAX_AGE"
+PARAMETERS_SSM_MAX_CONCURRENCY_ENV: str = "POWERTOOLS_PARAMETERS_SSM_MAX_CONCURRENCY"
+PARAMETERS_STALE_WHILE_REVALIDATE_ENV: str = "POWERTOOLS_PARAMETERS_STALE_WHILE_REVALIDATE"
+PARAMETERS_CACHE_MAX_ITEMS_ENV: str = "POWERTOOLS_PARAMETERS_CACHE_MAX_ITEMS"
+PARAMETERS_CACHE_MAX_BYTES_ENV: str = "POWERTOOLS_PARAMETERS_CACHE_MAX_BYTES"
+PARAMETERS_PERSISTENT_CACHE_ENV: str = "POWERTOOLS_PARAMETERS_PERSISTENT_CACHE"
+PARAMETERS_PERSISTENT_CACHE_DIR_ENV: str = "POWERTOOLS_PARAMETERS_PERSISTENT_CACHE_DIR"
+PARAMETERS_PERSISTENT_CACHE_KEY_ENV: str = "POWERTOOLS_PARAMETERS_PERSISTENT_CACHE_KEY"
+PARAMETERS_PERSISTENT_CACHE_MAX_BYTES_ENV: str = "POWERTOOLS_PARAMETERS_PERSISTENT_CACHE_MAX_BYTES"
 
 # Runtime and environment constants
 LAMBDA_TASK_ROOT_ENV: str = "LAMBDA_TASK_ROOT"
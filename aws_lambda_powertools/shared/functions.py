@@ -57,6 +57,17 @@ def resolve_max_age(env: str, choice: int | None) -> int:
     return choice if choice is not None else int(env)
 
 
+def resolve_max_concurrency(env: str, choice: int | None) -> int:
+    """Resolve max concurrency value, failing with a dedicated error message on invalid environment values"""
+    if choice is not None:
+        return choice
+
+    try:
+        return int(env)
+    except ValueError:
+        raise ValueError(f"Invalid max_concurrency value {env!r}, it must be an integer") from None
+
+
 @overload
 def resolve_env_var_choice(env: str | None, choice: float) -> float: ...
 
@@ -137,8 +148,9 @@ def powertools_debug_is_set() -> bool:
 
 
 def slice_dictionary(data: dict, chunk_size: int) -> Generator[dict, None, None]:
+    keys = iter(data)
     for _ in range(0, len(data), chunk_size):
-        yield {dict_key: data[dict_key] for dict_key in itertools.islice(data, chunk_size)}
+        yield {dict_key: data[dict_key] for dict_key in itertools.islice(keys, chunk_size)}
 
 
 def extract_event_from_common_models(data: Any) -> dict | Any:
@@ -1,10 +1,33 @@
 import decimal
 import json
 import math
+from typing import Any
 
 from aws_lambda_powertools.shared.functions import dataclass_to_dict, is_dataclass, is_pydantic, pydantic_to_dict
 
 
+def default_encoder(obj: Any) -> Any:
+    """Convert Decimals, Pydantic models and Dataclasses into JSON serializable types.
+
+    Shared by `Encoder` and the third-party JSON serializer backends to keep their output consistent.
+
+    Raises
+    ------
+    TypeError
+        When obj is not a supported type
+    """
+    if isinstance(obj, decimal.Decimal):
+        return math.nan if obj.is_nan() else str(obj)
+
+    if is_pydantic(obj):
+        return pydantic_to_dict(obj)
+
+    if is_dataclass(obj):
+        return dataclass_to_dict(obj)
+
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
 class Encoder(json.JSONEncoder):
     """Custom JSON encoder to allow for serialization of Decimals, Pydantic and Dataclasses.
 
@@ -12,13 +35,4 @@ class Encoder(json.JSONEncoder):
     """
 
     def default(self, obj):
-        if isinstance(obj, decimal.Decimal):
-            return math.nan if obj.is_nan() else str(obj)
-
-        if is_pydantic(obj):
-            return pydantic_to_dict(obj)
-
-        if is_dataclass(obj):
-            return dataclass_to_dict(obj)
-
-        return super().default(obj)
+        return default_encoder(obj)
@@ -15,8 +15,11 @@
 
 """A LazyLoader class."""
 
+from __future__ import annotations
+
 import importlib
 import types
+from typing import Any, Callable
 
 
 class LazyLoader(types.ModuleType):
@@ -53,3 +56,56 @@ class LazyLoader(types.ModuleType):
     def __dir__(self):
         module = self._load()
         return dir(module)
+
+
+def lazy_exports(
+    package_name: str,
+    package_globals: dict[str, Any],
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create PEP 562 `__getattr__` and `__dir__` functions to lazily import the public names of a package.
+
+    Each name is only imported from its module on first access, and then cached in the package namespace.
+
+    Note: names exported from a submodule with the same name, e.g. `from .event_source import event_source`,
+    must be imported eagerly, since importing the submodule binds its name in the package namespace.
+
+    Parameters
+    ----------
+    package_name: str
+        The package name, usually `__name__`
+    package_globals: dict[str, Any]
+        The package namespace, usually `globals()`
+    exports: dict[str, str]
+        Public name mapped to the name of the module defining it, either absolute or relative to the package.
+        A name mapped to a submodule of the package with the same name exports the submodule itself.
+        Any other submodule of the package is imported on first access too.
+
+    Example
+    -------
+
+        __getattr__, __dir__ = lazy_exports(__name__, globals(), {"Logger": "aws_lambda_powertools.logging"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule_name = f"{package_name}.{name}"
+        if name in exports:
+            module = importlib.import_module(exports[name], package_name)
+            value = module if module.__name__ == submodule_name else getattr(module, name)
+        else:
+            # Submodules that aren't exported are still reachable as attributes once imported,
+            # e.g. `parameters.ssm`, as they were before the package imported them lazily
+            try:
+                value = importlib.import_module(submodule_name)
+            except ModuleNotFoundError as exc:
+                if exc.name != submodule_name:
+                    raise
+                raise AttributeError(f"module {package_name!r} has no attribute {name!r}") from None
+
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*package_globals, *exports})
+
+    return __getattr__, __dir__
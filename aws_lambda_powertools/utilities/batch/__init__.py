@@ -2,26 +2,33 @@
 Batch processing utility
 """
 
-from aws_lambda_powertools.utilities.batch.base import (
-    AsyncBatchProcessor,
-    BasePartialBatchProcessor,
-    BasePartialProcessor,
-    BatchProcessor,
-    EventType,
-    FailureResponse,
-    SuccessResponse,
-)
-from aws_lambda_powertools.utilities.batch.decorators import (
-    async_batch_processor,
-    async_process_partial_response,
-    batch_processor,
-    process_partial_response,
-)
-from aws_lambda_powertools.utilities.batch.exceptions import ExceptionInfo
-from aws_lambda_powertools.utilities.batch.sqs_fifo_partial_processor import (
-    SqsFifoPartialProcessor,
-)
-from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.batch.base import (
+        AsyncBatchProcessor,
+        BasePartialBatchProcessor,
+        BasePartialProcessor,
+        BatchProcessor,
+        EventType,
+        FailureResponse,
+        SuccessResponse,
+    )
+    from aws_lambda_powertools.utilities.batch.decorators import (
+        async_batch_processor,
+        async_process_partial_response,
+        batch_processor,
+        process_partial_response,
+    )
+    from aws_lambda_powertools.utilities.batch.exceptions import ExceptionInfo
+    from aws_lambda_powertools.utilities.batch.sqs_fifo_partial_processor import (
+        SqsFifoPartialProcessor,
+    )
+    from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
 
 __all__ = (
     "async_batch_processor",
@@ -39,3 +46,24 @@ __all__ = (
     "SuccessResponse",
     "SqsFifoPartialProcessor",
 )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "AsyncBatchProcessor": "aws_lambda_powertools.utilities.batch.base",
+        "BasePartialBatchProcessor": "aws_lambda_powertools.utilities.batch.base",
+        "BasePartialProcessor": "aws_lambda_powertools.utilities.batch.base",
+        "BatchProcessor": "aws_lambda_powertools.utilities.batch.base",
+        "EventType": "aws_lambda_powertools.utilities.batch.base",
+        "FailureResponse": "aws_lambda_powertools.utilities.batch.base",
+        "SuccessResponse": "aws_lambda_powertools.utilities.batch.base",
+        "async_batch_processor": "aws_lambda_powertools.utilities.batch.decorators",
+        "async_process_partial_response": "aws_lambda_powertools.utilities.batch.decorators",
+        "batch_processor": "aws_lambda_powertools.utilities.batch.decorators",
+        "process_partial_response": "aws_lambda_powertools.utilities.batch.decorators",
+        "ExceptionInfo": "aws_lambda_powertools.utilities.batch.exceptions",
+        "SqsFifoPartialProcessor": "aws_lambda_powertools.utilities.batch.sqs_fifo_partial_processor",
+        "BatchTypeModels": "aws_lambda_powertools.utilities.batch.types",
+    },
+)
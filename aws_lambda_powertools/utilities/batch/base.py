@@ -5,18 +5,25 @@ Batch processing utilities
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import copy
 import inspect
+import json
 import logging
 import os
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Tuple, Union, overload
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Tuple, Union, overload
 
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.utilities.batch.exceptions import (
+    BatchProcessingDeadlineError,
     BatchProcessingError,
+    BatchProcessingKeyCircuitBreakerError,
     ExceptionInfo,
 )
 from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
@@ -37,6 +44,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Time left to report failures when records are processed concurrently and the Lambda function is about to time out
+DEADLINE_MARGIN_MS = 500
+
 
 class EventType(Enum):
     SQS = "SQS"
@@ -115,7 +125,7 @@ class BasePartialProcessor(ABC):
         """
 
         async def async_process_closure():
-            return list(await asyncio.gather(*[self._async_process_record(record) for record in self.records]))
+            return await self._async_process_records()
 
         # WARNING
         # Do not use "asyncio.run(async_process())" due to Lambda container thaws/freeze, otherwise we might get "Event Loop is closed" # noqa: E501
@@ -135,6 +145,12 @@ class BasePartialProcessor(ABC):
         # Non-Lambda environment, run coroutine as usual
         return asyncio.run(coro)
 
+    async def _async_process_records(self) -> list[tuple]:
+        """
+        Async process every record with handler at once.
+        """
+        return list(await asyncio.gather(*[self._async_process_record(record) for record in self.records]))
+
     def __enter__(self):
         self._prepare()
         return self
@@ -180,8 +196,23 @@ class BasePartialProcessor(ABC):
             self.lambda_context = lambda_context
             self._handler_accepts_lambda_context = "lambda_context" in inspect.signature(self.handler).parameters
 
+        self._deadline = self._get_deadline(lambda_context)
+
         return self
 
+    @staticmethod
+    def _get_deadline(lambda_context: LambdaContext | None) -> float | None:
+        """Time to finish processing records by, as per time.monotonic(), leaving time to report failures"""
+        get_remaining_time_in_millis = getattr(lambda_context, "get_remaining_time_in_millis", None)
+        if get_remaining_time_in_millis is None:
+            return None
+
+        remaining_time_in_millis = get_remaining_time_in_millis()
+        if not isinstance(remaining_time_in_millis, (int, float)):
+            return None
+
+        return time.monotonic() + max(remaining_time_in_millis - DEADLINE_MARGIN_MS, 0) / 1000
+
     def success_handler(self, record, result: Any) -> SuccessResponse:
         """
         Keeps track of batch records that were processed successfully
@@ -229,11 +260,18 @@ class BasePartialProcessor(ABC):
 class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
     DEFAULT_RESPONSE: PartialItemFailureResponse = {"batchItemFailures": []}
 
+    deadline_exc = (
+        BatchProcessingDeadlineError,
+        BatchProcessingDeadlineError("Record not processed before the Lambda function timeout"),
+        None,
+    )
+
     def __init__(
         self,
         event_type: EventType,
         model: BatchTypeModels | None = None,
         raise_on_entire_batch_failure: bool = True,
+        max_workers: int | None = None,
     ):
         """Process batch and partially report failed items
 
@@ -246,6 +284,9 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         raise_on_entire_batch_failure: bool
             Raise an exception when the entire batch has failed processing.
             When set to False, partial failures are reported in the response
+        max_workers: int | None
+            Maximum number of records processed concurrently, e.g. for I/O bound record handlers.
+            By default, BatchProcessor processes records one at a time, and AsyncBatchProcessor all at once.
 
         Exceptions
         ----------
@@ -255,6 +296,7 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         self.event_type = event_type
         self.model = model
         self.raise_on_entire_batch_failure = raise_on_entire_batch_failure
+        self.max_workers = max_workers
         self.batch_response: PartialItemFailureResponse = copy.deepcopy(self.DEFAULT_RESPONSE)
         self._COLLECTOR_MAPPING = {
             EventType.SQS: self._collect_sqs_failures,
@@ -371,7 +413,7 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
             return model.model_validate(record)
         return self._DATA_CLASS_MAPPING[event_type](record)
 
-    def _register_model_validation_error_record(self, record: dict):
+    def _register_model_validation_error_record(self, record: dict, exception: ExceptionInfo | None = None):
         """Convert and register failure due to poison pills where model failed validation early"""
         # Parser will fail validation if record is a poison pill (malformed input)
         # this means we can't collect the message id if we try transforming again
@@ -380,7 +422,46 @@ class BasePartialBatchProcessor(BasePartialProcessor):  # noqa
         # see https://github.com/aws-powertools/powertools-lambda-python/issues/2091
         logger.debug("Record cannot be converted to customer's model; converting without model")
         failed_record: EventSourceDataClassTypes = self._to_batch_type(record=record, event_type=self.event_type)
-        return self.failure_handler(record=failed_record, exception=sys.exc_info())
+        return self.failure_handler(record=failed_record, exception=exception or sys.exc_info())
+
+    def _register_deadline_exceeded_record(self, record: dict) -> FailureResponse:
+        """Register a record not processed before the Lambda function timeout as failed, so it's retried"""
+        # Record handlers may still be running, so we don't use the model to convert it
+        failed_record: EventSourceDataClassTypes = self._to_batch_type(record=record, event_type=self.event_type)
+        return self.failure_handler(record=failed_record, exception=self.deadline_exc)
+
+    def _get_record_identifier(self, record: dict) -> str | None:
+        """Identifier of a raw record, as reported in batchItemFailures"""
+        if self.event_type == EventType.SQS:
+            return record.get("messageId")
+        if self.event_type == EventType.KinesisDataStreams:
+            return record.get("kinesis", {}).get("sequenceNumber")
+        return record.get("dynamodb", {}).get("SequenceNumber")
+
+    def _warn_records_still_running(self, records: list[dict]) -> None:
+        """Warn about records whose handlers keep running in the background after being reported as failed"""
+        if not records:
+            return
+
+        identifiers = ", ".join(str(self._get_record_identifier(record)) for record in records)
+        logger.warning(
+            f"Record handlers still running at the Lambda function timeout: {identifiers}. These records are reported "
+            "as failed and may be retried while their handlers are still running, so their side effects may be "
+            "duplicated.",
+        )
+
+    def _is_model_validation_error(self, exception: BaseException) -> bool:
+        # NOTE: Pydantic is an optional dependency, but when used and a poison pill scenario happens
+        # we need to handle that exception differently.
+        # We check for a public attr in validation errors coming from Pydantic exceptions (subclass or not)
+        # and we compare if it's coming from the same model that trigger the exception in the first place
+
+        # Pydantic v1 raises a ValidationError with ErrorWrappers and store the model instance in a class variable.
+        # Pydantic v2 simplifies this by adding a title variable to store the model name directly.
+        model = getattr(exception, "model", None) or getattr(exception, "title", None)
+        model_name = getattr(self.model, "__name__", None)
+
+        return model in (self.model, model_name)
 
 
 class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibility
@@ -483,6 +564,54 @@ class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibil
         return processor.response()
     ```
 
+    ## Process I/O bound records concurrently
+
+    ```python
+    from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=10)
+
+
+    def record_handler(record: SQSRecord):
+        ...  # e.g. call a downstream API
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
+
+    ## Process stream records concurrently, in order for each partition key
+
+    ```python
+    from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import KinesisStreamRecord
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=10, ordered_by_key=True)
+
+
+    def record_handler(record: KinesisStreamRecord):
+        ...  # records sharing a partition key are processed one at a time, in order
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
+
 
     Raises
     ------
@@ -492,11 +621,248 @@ class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibil
     Limitations
     -----------
     * Async record handler not supported, use AsyncBatchProcessor instead.
+    * When processing records concurrently, record handlers must be thread-safe.
     """
 
+    key_circuit_breaker_exc = (
+        BatchProcessingKeyCircuitBreakerError,
+        BatchProcessingKeyCircuitBreakerError("A previous record with the same key failed processing"),
+        None,
+    )
+
+    def __init__(
+        self,
+        event_type: EventType,
+        model: BatchTypeModels | None = None,
+        raise_on_entire_batch_failure: bool = True,
+        max_workers: int | None = None,
+        ordered_by_key: bool = False,
+    ):
+        """Process batch and partially report failed items
+
+        Parameters
+        ----------
+        event_type: EventType
+            Whether this is a SQS, DynamoDB Streams, or Kinesis Data Stream event
+        model: BatchTypeModels | None
+            Parser's data model using either SqsRecordModel, DynamoDBStreamRecordModel, KinesisDataStreamRecord
+        raise_on_entire_batch_failure: bool
+            Raise an exception when the entire batch has failed processing.
+            When set to False, partial failures are reported in the response
+        max_workers: int | None
+            Maximum number of records processed concurrently, e.g. for I/O bound record handlers.
+            Records are processed one at a time by default.
+        ordered_by_key: bool
+            Kinesis Data Streams and DynamoDB Streams only. When processing records concurrently, process records
+            sharing a partition key (Kinesis) or item keys (DynamoDB) one at a time and in order, and only report
+            the lowest failed sequence number, from which Lambda retries the stream. Default is False.
+
+        Exceptions
+        ----------
+        BatchProcessingError
+            Raised when the entire batch has failed processing
+        ValueError
+            Raised when ordered_by_key is used with SQS
+        """
+        if ordered_by_key and event_type not in (EventType.KinesisDataStreams, EventType.DynamoDBStreams):
+            raise ValueError(
+                "ordered_by_key is only supported for Kinesis Data Streams and DynamoDB Streams. "
+                "Use SqsFifoPartialProcessor to process SQS FIFO message groups in order.",
+            )
+
+        self.ordered_by_key = ordered_by_key
+        super().__init__(
+            event_type,
+            model,
+            raise_on_entire_batch_failure=raise_on_entire_batch_failure,
+            max_workers=max_workers,
+        )
+
     async def _async_process_record(self, record: dict):
         raise NotImplementedError()
 
+    def process(self) -> list[tuple]:
+        """
+        Call instance's handler for each record, concurrently when max_workers is greater than 1.
+        """
+        if not self._is_processing_concurrently():
+            return super().process()
+
+        if self.ordered_by_key:
+            return self._process_groups_concurrently(group_by=self._get_record_key)
+
+        return self._process_concurrently()
+
+    def _is_processing_concurrently(self) -> bool:
+        return self.max_workers is not None and self.max_workers > 1 and len(self.records) > 1
+
+    def _get_record_key(self, record: dict) -> Hashable:
+        """Partition key of a Kinesis record, or item keys of a DynamoDB record, serialized to be hashable"""
+        if self.event_type == EventType.KinesisDataStreams:
+            return record.get("kinesis", {}).get("partitionKey")
+
+        return json.dumps(record.get("dynamodb", {}).get("Keys"), sort_keys=True)
+
+    def _get_messages_to_report(self) -> list[PartialItemFailures]:
+        """
+        Format messages to use in batch deletion
+        """
+        messages = super()._get_messages_to_report()
+        if not (self.ordered_by_key and self._is_processing_concurrently()):
+            return messages
+
+        # Records of a batch come from a single shard, and Lambda retries the shard from the lowest sequence number
+        # reported. Records after it in other keys may have succeeded, and are retried too.
+        return [min(messages, key=lambda message: int(message["itemIdentifier"]))]
+
+    def _process_concurrently(self) -> list[tuple]:
+        """
+        Run record handlers in a thread pool, and register their outcomes in the order of records.
+
+        Records still pending when the Lambda function is about to time out are reported as failed, so they're
+        retried, without waiting for them to complete.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers or 1, len(self.records)),
+            thread_name_prefix="powertools-batch",
+        )
+        try:
+            # Copy the context for each record, so context variables like Logger keys are visible in record handlers
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._run_record_handler, record)
+                for record in self.records
+            ]
+            timeout = None if self._deadline is None else max(self._deadline - time.monotonic(), 0)
+            _, not_done = wait(futures, timeout=timeout)
+        finally:
+            executor.shutdown(wait=False)
+
+        if not_done:
+            logger.debug(f"{len(not_done)} records not processed before the Lambda function timeout")
+
+        processed_messages: list[tuple] = []
+        still_running: list[dict] = []
+        for record, future in zip(self.records, futures):
+            if future in not_done:
+                # Records that started processing can't be cancelled
+                if not future.cancel():
+                    still_running.append(record)
+                processed_messages.append(self._register_deadline_exceeded_record(record))
+            else:
+                processed_messages.append(self._register_record_outcome(record, *future.result()))
+
+        self._warn_records_still_running(still_running)
+        return processed_messages
+
+    def _process_groups_concurrently(self, group_by: Callable[[dict], Hashable]) -> list[tuple]:
+        """
+        Process each group of records in order in a thread pool, and register outcomes in the order of records.
+
+        A failed record short-circuits records that follow, as per _get_short_circuit_exception. Groups still in
+        progress when the Lambda function is about to time out stop processing, and their remaining records are
+        reported as failed.
+
+        Parameters
+        ----------
+        group_by: Callable[[dict], Hashable]
+            Returns the group a raw record belongs to
+        """
+        groups: dict[Hashable, list[tuple[int, dict]]] = {}
+        for index, record in enumerate(self.records):
+            groups.setdefault(group_by(record), []).append((index, record))
+
+        outcomes: dict[int, tuple[BatchTypeModels | None, Any, ExceptionInfo | None]] = {}
+        batch_failed = threading.Event()
+        stopped = threading.Event()
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers or 1, len(groups)),
+            thread_name_prefix="powertools-batch",
+        )
+        try:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._process_group,
+                    group_records,
+                    outcomes,
+                    batch_failed,
+                    stopped,
+                )
+                for group_records in groups.values()
+            ]
+            timeout = None if self._deadline is None else max(self._deadline - time.monotonic(), 0)
+            _, not_done = wait(futures, timeout=timeout)
+        finally:
+            # Groups still in progress past the deadline must not start processing new records
+            stopped.set()
+            executor.shutdown(wait=False)
+
+        if not_done:
+            logger.debug(f"{len(not_done)} groups of records not processed before the Lambda function timeout")
+
+        # Snapshot outcomes, as groups still in progress may add more
+        outcomes = dict(outcomes)
+
+        # Groups that started processing can't be cancelled, and stop after the record they're processing
+        still_running: list[dict] = []
+        for group_records, future in zip(groups.values(), futures):
+            if future in not_done and not future.cancel():
+                pending = [record for index, record in group_records if index not in outcomes]
+                still_running.extend(pending[:1])
+        self._warn_records_still_running(still_running)
+
+        return [
+            self._register_group_record_outcome(record, outcomes.get(index))
+            for index, record in enumerate(self.records)
+        ]
+
+    def _process_group(
+        self,
+        group_records: list[tuple[int, dict]],
+        outcomes: dict[int, tuple[BatchTypeModels | None, Any, ExceptionInfo | None]],
+        batch_failed: threading.Event,
+        stopped: threading.Event,
+    ) -> None:
+        """Process records of a group in order, without registering their outcome"""
+        group_failed = False
+        for index, record in group_records:
+            if stopped.is_set():
+                return
+
+            short_circuit_exception = self._get_short_circuit_exception(group_failed, batch_failed.is_set())
+            if short_circuit_exception is not None:
+                try:
+                    data = self._to_batch_type(record, event_type=self.event_type, model=self.model)
+                except Exception:
+                    # Record failed validation, so report it as such, like _run_record_handler does
+                    outcomes[index] = (None, None, sys.exc_info())
+                    continue
+
+                outcomes[index] = (data, None, short_circuit_exception)
+                continue
+
+            outcome = self._run_record_handler(record)
+            outcomes[index] = outcome
+            if outcome[2] is not None:
+                group_failed = True
+                batch_failed.set()
+
+    def _get_short_circuit_exception(self, group_failed: bool, batch_failed: bool) -> ExceptionInfo | None:
+        """Exception to fail a record with, without processing it, after a previous record failed"""
+        return self.key_circuit_breaker_exc if group_failed else None
+
+    def _register_group_record_outcome(
+        self,
+        record: dict,
+        outcome: tuple[BatchTypeModels | None, Any, ExceptionInfo | None] | None,
+    ) -> SuccessResponse | FailureResponse:
+        """Register the outcome of a record processed by _process_group, or as not processed before the timeout"""
+        if outcome is None:
+            return self._register_deadline_exceeded_record(record)
+
+        return self._register_record_outcome(record, *outcome)
+
     def _process_record(self, record: dict) -> SuccessResponse | FailureResponse:
         """
         Process a record with instance's handler
@@ -506,6 +872,17 @@ class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibil
         record: dict
             A batch record to be processed.
         """
+        return self._register_record_outcome(record, *self._run_record_handler(record))
+
+    def _run_record_handler(self, record: dict) -> tuple[BatchTypeModels | None, Any, ExceptionInfo | None]:
+        """
+        Run instance's handler without registering its outcome, so it's safe to call from multiple threads
+
+        Returns
+        -------
+        tuple[BatchTypeModels | None, Any, ExceptionInfo | None]
+            Record converted to its batch type, if converted, handler's result, and exception info if it failed
+        """
         data: BatchTypeModels | None = None
         try:
             data = self._to_batch_type(record=record, event_type=self.event_type, model=self.model)
@@ -514,22 +891,24 @@ class BatchProcessor(BasePartialBatchProcessor):  # Keep old name for compatibil
             else:
                 result = self.handler(record=data)
 
-            return self.success_handler(record=record, result=result)
-        except Exception as exc:
-            # NOTE: Pydantic is an optional dependency, but when used and a poison pill scenario happens
-            # we need to handle that exception differently.
-            # We check for a public attr in validation errors coming from Pydantic exceptions (subclass or not)
-            # and we compare if it's coming from the same model that trigger the exception in the first place
+            return data, result, None
+        except Exception:
+            return data, None, sys.exc_info()
 
-            # Pydantic v1 raises a ValidationError with ErrorWrappers and store the model instance in a class variable.
-            # Pydantic v2 simplifies this by adding a title variable to store the model name directly.
-            model = getattr(exc, "model", None) or getattr(exc, "title", None)
-            model_name = getattr(self.model, "__name__", None)
+    def _register_record_outcome(
+        self,
+        record: dict,
+        data: BatchTypeModels | None,
+        result: Any,
+        exception: ExceptionInfo | None,
+    ) -> SuccessResponse | FailureResponse:
+        if exception is None:
+            return self.success_handler(record=record, result=result)
 
-            if model in (self.model, model_name):
-                return self._register_model_validation_error_record(record)
+        if exception[1] is not None and self._is_model_validation_error(exception[1]):
+            return self._register_model_validation_error_record(record, exception=exception)
 
-            return self.failure_handler(record=data, exception=sys.exc_info())
+        return self.failure_handler(record=data, exception=exception)
 
 
 class AsyncBatchProcessor(BasePartialBatchProcessor):
@@ -632,6 +1011,30 @@ class AsyncBatchProcessor(BasePartialBatchProcessor):
         return processor.response()
     ```
 
+    ## Limit concurrency, e.g. for large Kinesis batches
+
+    ```python
+    from aws_lambda_powertools.utilities.batch import AsyncBatchProcessor, EventType, async_process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import KinesisStreamRecord
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+    processor = AsyncBatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=50)
+
+
+    async def record_handler(record: KinesisStreamRecord):
+        ...  # e.g. call a downstream API
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return async_process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
+
 
     Raises
     ------
@@ -646,6 +1049,40 @@ class AsyncBatchProcessor(BasePartialBatchProcessor):
     def _process_record(self, record: dict):
         raise NotImplementedError()
 
+    async def _async_process_records(self) -> list[tuple]:
+        """
+        Async process records with handler, up to max_workers at a time.
+
+        Records still pending when the Lambda function is about to time out are cancelled and reported as failed,
+        so the partial batch response is still returned.
+        """
+        if not self.records:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_workers) if self.max_workers else None
+
+        async def process_record(record: dict) -> tuple:
+            if semaphore is None:
+                return await self._async_process_record(record)
+
+            async with semaphore:
+                return await self._async_process_record(record)
+
+        tasks = [asyncio.ensure_future(process_record(record)) for record in self.records]
+        timeout = None if self._deadline is None else max(self._deadline - time.monotonic(), 0)
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        if pending:
+            logger.debug(f"Cancelling {len(pending)} records not processed before the Lambda function timeout")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return [
+            self._register_deadline_exceeded_record(record) if task.cancelled() else task.result()
+            for record, task in zip(self.records, tasks)
+        ]
+
     async def _async_process_record(self, record: dict) -> SuccessResponse | FailureResponse:
         """
         Process a record with instance's handler
@@ -665,17 +1102,7 @@ class AsyncBatchProcessor(BasePartialBatchProcessor):
 
             return self.success_handler(record=record, result=result)
         except Exception as exc:
-            # NOTE: Pydantic is an optional dependency, but when used and a poison pill scenario happens
-            # we need to handle that exception differently.
-            # We check for a public attr in validation errors coming from Pydantic exceptions (subclass or not)
-            # and we compare if it's coming from the same model that trigger the exception in the first place
-
-            # Pydantic v1 raises a ValidationError with ErrorWrappers and store the model instance in a class variable.
-            # Pydantic v2 simplifies this by adding a title variable to store the model name directly.
-            model = getattr(exc, "model", None) or getattr(exc, "title", None)
-            model_name = getattr(self.model, "__name__", None)
-
-            if model in (self.model, model_name):
+            if self._is_model_validation_error(exc):
                 return self._register_model_validation_error_record(record)
 
             return self.failure_handler(record=data, exception=sys.exc_info())
@@ -52,3 +52,19 @@ class SQSFifoMessageGroupCircuitBreakerError(Exception):
     """
 
     pass
+
+
+class BatchProcessingDeadlineError(Exception):
+    """
+    Signals a record not processed before the Lambda function timeout
+    """
+
+    pass
+
+
+class BatchProcessingKeyCircuitBreakerError(Exception):
+    """
+    Signals a record not processed due to a previous record with the same partition key or item key failing
+    """
+
+    pass
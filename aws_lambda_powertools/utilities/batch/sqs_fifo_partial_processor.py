@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
-
-from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, ExceptionInfo, FailureResponse
+from typing import TYPE_CHECKING, Any
+
+from aws_lambda_powertools.utilities.batch import (
+    BatchProcessor,
+    EventType,
+    ExceptionInfo,
+    FailureResponse,
+    SuccessResponse,
+)
 from aws_lambda_powertools.utilities.batch.exceptions import (
     SQSFifoCircuitBreakerError,
     SQSFifoMessageGroupCircuitBreakerError,
 )
 
 if TYPE_CHECKING:
-    from aws_lambda_powertools.utilities.batch.types import BatchSqsTypeModel
+    from aws_lambda_powertools.utilities.batch.types import BatchSqsTypeModel, BatchTypeModels
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +58,30 @@ class SqsFifoPartialProcessor(BatchProcessor):
     def lambda_handler(event, context: LambdaContext):
         return processor.response()
     ```
+
+    ## Process message groups concurrently
+
+    ```python
+    from aws_lambda_powertools.utilities.batch import SqsFifoPartialProcessor, process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_workers=10)
+
+
+    def record_handler(record: SQSRecord):
+        ...
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
     """
 
     circuit_breaker_exc = (
@@ -66,7 +96,12 @@ class SqsFifoPartialProcessor(BatchProcessor):
         None,
     )
 
-    def __init__(self, model: BatchSqsTypeModel | None = None, skip_group_on_error: bool = False):
+    def __init__(
+        self,
+        model: BatchSqsTypeModel | None = None,
+        skip_group_on_error: bool = False,
+        max_workers: int | None = None,
+    ):
         """
         Initialize the SqsFifoProcessor.
 
@@ -77,15 +112,48 @@ class SqsFifoPartialProcessor(BatchProcessor):
         skip_group_on_error: bool
             Determines whether to exclusively skip messages from the MessageGroupID that encountered processing failures
             Default is False.
+        max_workers: int | None
+            Maximum number of message groups processed concurrently, in a thread pool. Messages within a group are
+            always processed in order, one at a time. Message groups are processed one at a time by default.
 
         """
         self._skip_group_on_error: bool = skip_group_on_error
-        self._current_group_id = None
+        self._current_group_id: str | None = None
         self._failed_group_ids: set[str] = set()
-        super().__init__(EventType.SQS, model)
+        super().__init__(EventType.SQS, model, max_workers=max_workers)
+
+    def process(self) -> list[tuple]:
+        """
+        Call instance's handler for each record, processing message groups concurrently when max_workers is
+        greater than 1.
+        """
+        if self.max_workers is None or self.max_workers <= 1 or len(self.records) <= 1:
+            return [self._process_record(record) for record in self.records]
+
+        return self._process_groups_concurrently(group_by=self._get_group_id)
+
+    @staticmethod
+    def _get_group_id(record: dict) -> str | None:
+        return record.get("attributes", {}).get("MessageGroupId")
+
+    def _get_short_circuit_exception(self, group_failed: bool, batch_failed: bool) -> ExceptionInfo | None:
+        # A failed message short-circuits the remaining messages of its group. Unless `skip_group_on_error` is on,
+        # it also short-circuits messages from other groups that haven't started processing yet.
+        if group_failed or (batch_failed and not self._skip_group_on_error):
+            return self.group_circuit_breaker_exc if self._skip_group_on_error else self.circuit_breaker_exc
+
+        return None
+
+    def _register_group_record_outcome(
+        self,
+        record: dict,
+        outcome: tuple[BatchTypeModels | None, Any, ExceptionInfo | None] | None,
+    ) -> SuccessResponse | FailureResponse:
+        self._current_group_id = self._get_group_id(record)
+        return super()._register_group_record_outcome(record, outcome)
 
     def _process_record(self, record):
-        self._current_group_id = record.get("attributes", {}).get("MessageGroupId")
+        self._current_group_id = self._get_group_id(record)
 
         # Short-circuits the process if:
         #     - There are failed messages, OR
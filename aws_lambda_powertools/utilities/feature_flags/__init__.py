@@ -1,10 +1,17 @@
 """Advanced feature flags utility"""
 
-from aws_lambda_powertools.utilities.feature_flags.appconfig import AppConfigStore
-from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
-from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
-from aws_lambda_powertools.utilities.feature_flags.feature_flags import FeatureFlags
-from aws_lambda_powertools.utilities.feature_flags.schema import RuleAction, SchemaValidator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.feature_flags.appconfig import AppConfigStore
+    from aws_lambda_powertools.utilities.feature_flags.base import StoreProvider
+    from aws_lambda_powertools.utilities.feature_flags.exceptions import ConfigurationStoreError
+    from aws_lambda_powertools.utilities.feature_flags.feature_flags import FeatureFlags
+    from aws_lambda_powertools.utilities.feature_flags.schema import RuleAction, SchemaValidator
 
 __all__ = [
     "ConfigurationStoreError",
@@ -14,3 +21,16 @@ __all__ = [
     "AppConfigStore",
     "StoreProvider",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "AppConfigStore": "aws_lambda_powertools.utilities.feature_flags.appconfig",
+        "StoreProvider": "aws_lambda_powertools.utilities.feature_flags.base",
+        "ConfigurationStoreError": "aws_lambda_powertools.utilities.feature_flags.exceptions",
+        "FeatureFlags": "aws_lambda_powertools.utilities.feature_flags.feature_flags",
+        "RuleAction": "aws_lambda_powertools.utilities.feature_flags.schema",
+        "SchemaValidator": "aws_lambda_powertools.utilities.feature_flags.schema",
+    },
+)
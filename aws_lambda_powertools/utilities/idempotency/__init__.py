@@ -2,23 +2,52 @@
 Utility for adding idempotency to lambda functions
 """
 
-from aws_lambda_powertools.utilities.idempotency.hook import (
-    IdempotentHookFunction,
-)
-from aws_lambda_powertools.utilities.idempotency.persistence.base import (
-    BasePersistenceLayer,
-)
-from aws_lambda_powertools.utilities.idempotency.persistence.dynamodb import (
-    DynamoDBPersistenceLayer,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
-from .idempotency import IdempotencyConfig, idempotent, idempotent_function
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.idempotency.batch import IdempotentBatchProcessor
+    from aws_lambda_powertools.utilities.idempotency.hook import (
+        IdempotentHookFunction,
+    )
+    from aws_lambda_powertools.utilities.idempotency.persistence.base import (
+        AsyncBasePersistenceLayer,
+        BasePersistenceLayer,
+    )
+    from aws_lambda_powertools.utilities.idempotency.persistence.dynamodb import (
+        DynamoDBPersistenceLayer,
+    )
+    from aws_lambda_powertools.utilities.idempotency.persistence.local_cache import LocalCache
+
+    from .idempotency import IdempotencyConfig, idempotent, idempotent_function
 
 __all__ = (
     "DynamoDBPersistenceLayer",
     "BasePersistenceLayer",
+    "AsyncBasePersistenceLayer",
     "idempotent",
     "idempotent_function",
     "IdempotencyConfig",
     "IdempotentHookFunction",
+    "IdempotentBatchProcessor",
+    "LocalCache",
+)
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "IdempotentHookFunction": "aws_lambda_powertools.utilities.idempotency.hook",
+        "IdempotentBatchProcessor": "aws_lambda_powertools.utilities.idempotency.batch",
+        "BasePersistenceLayer": "aws_lambda_powertools.utilities.idempotency.persistence.base",
+        "AsyncBasePersistenceLayer": "aws_lambda_powertools.utilities.idempotency.persistence.base",
+        "DynamoDBPersistenceLayer": "aws_lambda_powertools.utilities.idempotency.persistence.dynamodb",
+        "LocalCache": "aws_lambda_powertools.utilities.idempotency.persistence.local_cache",
+        "IdempotencyConfig": "aws_lambda_powertools.utilities.idempotency.idempotency",
+        "idempotent": "aws_lambda_powertools.utilities.idempotency.idempotency",
+        "idempotent_function": "aws_lambda_powertools.utilities.idempotency.idempotency",
+    },
 )
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 import logging
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, NoReturn
 
 from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyAlreadyInProgressError,
@@ -27,7 +27,9 @@ if TYPE_CHECKING:
         IdempotencyConfig,
     )
     from aws_lambda_powertools.utilities.idempotency.persistence.base import (
+        AsyncBasePersistenceLayer,
         BasePersistenceLayer,
+        _BasePersistenceLayer,
     )
     from aws_lambda_powertools.utilities.idempotency.serialization.base import (
         BaseIdempotencySerializer,
@@ -62,9 +64,10 @@ def _prepare_data(data: Any) -> Any:
     return getattr(data, "raw_event", data)
 
 
-class IdempotencyHandler:
+class _BaseIdempotencyHandler:
     """
-    Base class to orchestrate calls to persistence layer.
+    Orchestration shared by synchronous and asyncio idempotency handlers, besides calling the persistence layer and
+    the function.
     """
 
     def __init__(
@@ -72,7 +75,7 @@ class IdempotencyHandler:
         function: Callable,
         function_payload: Any,
         config: IdempotencyConfig,
-        persistence_store: BasePersistenceLayer,
+        persistence_store: _BasePersistenceLayer,
         output_serializer: BaseIdempotencySerializer | None = None,
         function_args: tuple | None = None,
         function_kwargs: dict | None = None,
@@ -86,7 +89,7 @@ class IdempotencyHandler:
             JSON Serializable payload to be hashed
         config: IdempotencyConfig
             Idempotency Configuration
-        persistence_store : BasePersistenceLayer
+        persistence_store : BasePersistenceLayer | AsyncBasePersistenceLayer
             Instance of persistence layer to store idempotency records
         output_serializer: BaseIdempotencySerializer | None
             Serializer to transform the data to and from a dictionary.
@@ -106,54 +109,6 @@ class IdempotencyHandler:
         persistence_store.configure(config, f"{self.function.__module__}.{self.function.__qualname__}")
         self.persistence_store = persistence_store
 
-    def handle(self) -> Any:
-        """
-        Main entry point for handling idempotent execution of a function.
-
-        Returns
-        -------
-        Any
-            Function response
-
-        """
-        # IdempotencyInconsistentStateError can happen under rare but expected cases
-        # when persistent state changes in the small time between put & get requests.
-        # In most cases we can retry successfully on this exception.
-        for i in range(MAX_RETRIES + 1):  # pragma: no cover
-            try:
-                return self._process_idempotency()
-            except IdempotencyInconsistentStateError:
-                if i == MAX_RETRIES:
-                    raise  # Bubble up when exceeded max tries
-
-    def _process_idempotency(self):
-        try:
-            # We call save_inprogress first as an optimization for the most common case where no idempotent record
-            # already exists. If it succeeds, there's no need to call get_record.
-            self.persistence_store.save_inprogress(
-                data=self.data,
-                remaining_time_in_millis=self._get_remaining_time_in_millis(),
-            )
-        except (IdempotencyKeyError, IdempotencyValidationError):
-            raise
-        except IdempotencyItemAlreadyExistsError as exc:
-            # Attempt to retrieve the existing record, either from the exception ReturnValuesOnConditionCheckFailure
-            # or perform a GET operation if the information is not available.
-            # We give preference to ReturnValuesOnConditionCheckFailure because it is a faster and more cost-effective
-            # way of retrieving the existing record after a failed conditional write operation.
-            record = exc.old_data_record or self._get_idempotency_record()
-
-            # If a record is found, handle it for status
-            if record:
-                return self._handle_for_status(record)
-        except Exception as exc:
-            raise IdempotencyPersistenceLayerError(
-                "Failed to save in progress record to idempotency store",
-                exc,
-            ) from exc
-
-        return self._get_function_response()
-
     def _get_remaining_time_in_millis(self) -> int | None:
         """
         Tries to determine the remaining time available for the current lambda invocation.
@@ -173,18 +128,24 @@ class IdempotencyHandler:
 
         return None
 
-    def _get_idempotency_record(self) -> DataRecord | None:
+    @staticmethod
+    def _raise_save_inprogress_error(exc: Exception) -> NoReturn:
+        """Raise the error of saving the in progress record, other than the record already existing"""
+        if isinstance(exc, (IdempotencyKeyError, IdempotencyValidationError)):
+            raise exc
+
+        raise IdempotencyPersistenceLayerError("Failed to save in progress record to idempotency store", exc) from exc
+
+    def _raise_get_record_error(self, exc: Exception) -> NoReturn:
         """
-        Retrieve the idempotency record from the persistence layer.
+        Raise the error of retrieving the idempotency record from the persistence layer.
 
         Raises
         ----------
         IdempotencyInconsistentStateError
 
         """
-        try:
-            data_record = self.persistence_store.get_record(data=self.data)
-        except IdempotencyItemNotFoundError:
+        if isinstance(exc, IdempotencyItemNotFoundError):
             # This code path will only be triggered if the record is removed between save_inprogress and get_record.
             logger.debug(
                 f"An existing idempotency record was deleted before we could fetch it. Proceeding with {self.function}",
@@ -192,15 +153,23 @@ class IdempotencyHandler:
             raise IdempotencyInconsistentStateError("save_inprogress and get_record return inconsistent results.")
 
         # Allow this exception to bubble up
-        except IdempotencyValidationError:
-            raise
+        if isinstance(exc, IdempotencyValidationError):
+            raise exc
 
         # Wrap remaining unhandled exceptions with IdempotencyPersistenceLayerError to ease exception handling for
         # clients
-        except Exception as exc:
-            raise IdempotencyPersistenceLayerError("Failed to get record from idempotency store", exc) from exc
+        raise IdempotencyPersistenceLayerError("Failed to get record from idempotency store", exc) from exc
+
+    @staticmethod
+    def _raise_delete_record_error(exc: Exception) -> NoReturn:
+        raise IdempotencyPersistenceLayerError("Failed to delete record from idempotency store", exc) from exc
 
-        return data_record
+    @staticmethod
+    def _raise_save_success_error(exc: Exception) -> NoReturn:
+        raise IdempotencyPersistenceLayerError(
+            "Failed to update record state to success in idempotency store",
+            exc,
+        ) from exc
 
     def _handle_for_status(self, data_record: DataRecord) -> Any | None:
         """
@@ -249,6 +218,71 @@ class IdempotencyHandler:
 
         return serialized_response
 
+
+class IdempotencyHandler(_BaseIdempotencyHandler):
+    """
+    Base class to orchestrate calls to persistence layer.
+    """
+
+    persistence_store: BasePersistenceLayer
+
+    def handle(self) -> Any:
+        """
+        Main entry point for handling idempotent execution of a function.
+
+        Returns
+        -------
+        Any
+            Function response
+
+        """
+        # IdempotencyInconsistentStateError can happen under rare but expected cases
+        # when persistent state changes in the small time between put & get requests.
+        # In most cases we can retry successfully on this exception.
+        for i in range(MAX_RETRIES + 1):  # pragma: no cover
+            try:
+                return self._process_idempotency()
+            except IdempotencyInconsistentStateError:
+                if i == MAX_RETRIES:
+                    raise  # Bubble up when exceeded max tries
+
+    def _process_idempotency(self):
+        try:
+            # We call save_inprogress first as an optimization for the most common case where no idempotent record
+            # already exists. If it succeeds, there's no need to call get_record.
+            self.persistence_store.save_inprogress(
+                data=self.data,
+                remaining_time_in_millis=self._get_remaining_time_in_millis(),
+            )
+        except IdempotencyItemAlreadyExistsError as exc:
+            # Attempt to retrieve the existing record, either from the exception ReturnValuesOnConditionCheckFailure
+            # or perform a GET operation if the information is not available.
+            # We give preference to ReturnValuesOnConditionCheckFailure because it is a faster and more cost-effective
+            # way of retrieving the existing record after a failed conditional write operation.
+            record = exc.old_data_record or self._get_idempotency_record()
+
+            # If a record is found, handle it for status
+            if record:
+                return self._handle_for_status(record)
+        except Exception as exc:
+            self._raise_save_inprogress_error(exc)
+
+        return self._get_function_response()
+
+    def _get_idempotency_record(self) -> DataRecord | None:
+        """
+        Retrieve the idempotency record from the persistence layer.
+
+        Raises
+        ----------
+        IdempotencyInconsistentStateError
+
+        """
+        try:
+            return self.persistence_store.get_record(data=self.data)
+        except Exception as exc:
+            self._raise_get_record_error(exc)
+
     def _get_function_response(self):
         try:
             response = self.function(*self.fn_args, **self.fn_kwargs)
@@ -258,20 +292,79 @@ class IdempotencyHandler:
             try:
                 self.persistence_store.delete_record(data=self.data, exception=handler_exception)
             except Exception as delete_exception:
-                raise IdempotencyPersistenceLayerError(
-                    "Failed to delete record from idempotency store",
-                    delete_exception,
-                ) from delete_exception
+                self._raise_delete_record_error(delete_exception)
             raise
 
-        else:
+        try:
+            serialized_response: dict = self.output_serializer.to_dict(response) if response else None
+            self.persistence_store.save_success(data=self.data, result=serialized_response)
+        except Exception as save_exception:
+            self._raise_save_success_error(save_exception)
+
+        return response
+
+
+class AsyncIdempotencyHandler(_BaseIdempotencyHandler):
+    """
+    Class to orchestrate calls to an asyncio persistence layer, for idempotent coroutine functions.
+    """
+
+    persistence_store: AsyncBasePersistenceLayer
+
+    async def handle(self) -> Any:
+        """
+        Main entry point for handling idempotent execution of a coroutine function.
+
+        Returns
+        -------
+        Any
+            Function response
+
+        """
+        for i in range(MAX_RETRIES + 1):  # pragma: no cover
             try:
-                serialized_response: dict = self.output_serializer.to_dict(response) if response else None
-                self.persistence_store.save_success(data=self.data, result=serialized_response)
-            except Exception as save_exception:
-                raise IdempotencyPersistenceLayerError(
-                    "Failed to update record state to success in idempotency store",
-                    save_exception,
-                ) from save_exception
+                return await self._process_idempotency()
+            except IdempotencyInconsistentStateError:
+                if i == MAX_RETRIES:
+                    raise  # Bubble up when exceeded max tries
+
+    async def _process_idempotency(self):
+        try:
+            await self.persistence_store.save_inprogress(
+                data=self.data,
+                remaining_time_in_millis=self._get_remaining_time_in_millis(),
+            )
+        except IdempotencyItemAlreadyExistsError as exc:
+            record = exc.old_data_record or await self._get_idempotency_record()
+
+            # If a record is found, handle it for status
+            if record:
+                return self._handle_for_status(record)
+        except Exception as exc:
+            self._raise_save_inprogress_error(exc)
+
+        return await self._get_function_response()
+
+    async def _get_idempotency_record(self) -> DataRecord | None:
+        try:
+            return await self.persistence_store.get_record(data=self.data)
+        except Exception as exc:
+            self._raise_get_record_error(exc)
+
+    async def _get_function_response(self):
+        try:
+            response = await self.function(*self.fn_args, **self.fn_kwargs)
+        except Exception as handler_exception:
+            try:
+                await self.persistence_store.delete_record(data=self.data, exception=handler_exception)
+            except Exception as delete_exception:
+                self._raise_delete_record_error(delete_exception)
+            raise
+
+        try:
+            serialized_response: dict = self.output_serializer.to_dict(response) if response else None
+            await self.persistence_store.save_success(data=self.data, result=serialized_response)
+        except Exception as save_exception:
+            self._raise_save_success_error(save_exception)
 
         return response
@@ -0,0 +1,370 @@
+"""
+Batch processor making record handlers idempotent, with bulk calls to the persistence store
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import warnings
+from inspect import isclass
+from typing import TYPE_CHECKING, Any
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.shared.functions import strtobool
+from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType
+from aws_lambda_powertools.utilities.idempotency.base import IdempotencyHandler
+from aws_lambda_powertools.utilities.idempotency.config import IdempotencyConfig
+from aws_lambda_powertools.utilities.idempotency.exceptions import (
+    IdempotencyInconsistentStateError,
+    IdempotencyItemAlreadyExistsError,
+    IdempotencyItemNotFoundError,
+    IdempotencyKeyError,
+    IdempotencyPersistenceConfigError,
+    IdempotencyPersistenceLayerError,
+    IdempotencyValidationError,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.base import AsyncBasePersistenceLayer
+from aws_lambda_powertools.utilities.idempotency.serialization.base import (
+    BaseIdempotencyModelSerializer,
+    BaseIdempotencySerializer,
+)
+from aws_lambda_powertools.utilities.idempotency.serialization.no_op import NoOpSerializer
+from aws_lambda_powertools.warnings import PowertoolsUserWarning
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.batch.base import EventSourceDataClassTypes, FailureResponse
+    from aws_lambda_powertools.utilities.batch.exceptions import ExceptionInfo
+    from aws_lambda_powertools.utilities.batch.types import BatchTypeModels
+    from aws_lambda_powertools.utilities.idempotency.persistence.base import BasePersistenceLayer
+    from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import DataRecord
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotentBatchProcessor(BatchProcessor):
+    """Process native partial responses from SQS, Kinesis Data Streams, and DynamoDB, idempotently.
+
+    Rather than calling the persistence store twice per record, like `@idempotent_function` in a record handler
+    does, records are looked up all at once before processing the batch, and saved all at once after:
+
+    * Records already completed are reported as successful, without calling the record handler
+    * Records already in progress are reported as failed, so they're retried
+    * Other records are saved as in progress, processed, and saved as completed if they succeed
+
+    The idempotency key is extracted from the raw record, e.g. `IdempotencyConfig(event_key_jmespath="messageId")`.
+
+    Example
+    -------
+
+    ## Process SQS messages idempotently
+
+    ```python
+    from aws_lambda_powertools.utilities.batch import EventType, process_partial_response
+    from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+    from aws_lambda_powertools.utilities.idempotency import (
+        DynamoDBPersistenceLayer,
+        IdempotencyConfig,
+        IdempotentBatchProcessor,
+    )
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+    persistence_layer = DynamoDBPersistenceLayer(table_name="IdempotencyTable")
+    config = IdempotencyConfig(event_key_jmespath="powertools_json(body).order_id")
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_layer,
+        config=config,
+    )
+
+
+    def record_handler(record: SQSRecord):
+        ...
+
+
+    def lambda_handler(event, context: LambdaContext):
+        return process_partial_response(
+            event=event,
+            record_handler=record_handler,
+            processor=processor,
+            context=context,
+        )
+    ```
+
+    Limitations
+    -----------
+    * Records sharing an idempotency key within a batch are processed once, and the others are reported as failed,
+      so they're retried.
+    """
+
+    def __init__(
+        self,
+        event_type: EventType,
+        persistence_store: BasePersistenceLayer,
+        config: IdempotencyConfig | None = None,
+        output_serializer: BaseIdempotencySerializer | type[BaseIdempotencyModelSerializer] | None = None,
+        model: BatchTypeModels | None = None,
+        raise_on_entire_batch_failure: bool = True,
+        max_workers: int | None = None,
+        ordered_by_key: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        event_type: EventType
+            Whether this is a SQS, DynamoDB Streams, or Kinesis Data Stream event
+        persistence_store: BasePersistenceLayer
+            Instance of BasePersistenceLayer to store data
+        config: IdempotencyConfig | None
+            Configuration
+        output_serializer: BaseIdempotencySerializer | type[BaseIdempotencyModelSerializer] | None
+            Serializer to transform record handler results to and from a dictionary.
+            If not supplied, no serialization is done via the NoOpSerializer.
+            In case a serializer of type inheriting BaseIdempotencyModelSerializer is given,
+            the serializer is derived from the record handler return type.
+        model: BatchTypeModels | None
+            Parser's data model using either SqsRecordModel, DynamoDBStreamRecordModel, KinesisDataStreamRecord
+        raise_on_entire_batch_failure: bool
+            Raise an exception when the entire batch has failed processing.
+            When set to False, partial failures are reported in the response
+        max_workers: int | None
+            Maximum number of records processed concurrently, see BatchProcessor
+        ordered_by_key: bool
+            Process records sharing a partition key or item keys in order, see BatchProcessor
+        """
+        if isinstance(persistence_store, AsyncBasePersistenceLayer):
+            raise IdempotencyPersistenceConfigError(
+                "IdempotentBatchProcessor requires a synchronous persistence layer, e.g. RedisCachePersistenceLayer",
+            )
+
+        self.persistence_store = persistence_store
+        self.config = config or IdempotencyConfig()
+        self.output_serializer = output_serializer
+
+        # Outcomes by id() of raw records, as records are dicts
+        self._stored_outcomes: dict[int, tuple[Any, Exception | None]] = {}
+        self._claimed_records: set[int] = set()
+        self._started_records: set[int] = set()
+        self._handler_outcomes: dict[int, tuple[Any, ExceptionInfo | None]] = {}
+
+        super().__init__(
+            event_type,
+            model,
+            raise_on_entire_batch_failure=raise_on_entire_batch_failure,
+            max_workers=max_workers,
+            ordered_by_key=ordered_by_key,
+        )
+
+    def process(self) -> list[tuple]:
+        """
+        Call instance's handler for each record not processed before, looking up and saving records in bulk.
+        """
+        self._stored_outcomes.clear()
+        self._claimed_records.clear()
+        self._started_records.clear()
+        self._handler_outcomes.clear()
+
+        # Skip idempotency controls when POWERTOOLS_IDEMPOTENCY_DISABLED has a truthy value
+        # Raises a warning if not running in development mode
+        if strtobool(os.getenv(constants.IDEMPOTENCY_DISABLED_ENV, "false")):
+            warnings.warn(
+                message="Disabling idempotency is intended for development environments only "
+                "and should not be used in production.",
+                category=PowertoolsUserWarning,
+                stacklevel=2,
+            )
+            return super().process()
+
+        if self.lambda_context is not None:
+            self.config.register_lambda_context(self.lambda_context)
+
+        # Handles records found in the persistence store the same way as @idempotent_function does
+        idempotency_handler = IdempotencyHandler(
+            function=self.handler,
+            function_payload=None,
+            config=self.config,
+            persistence_store=self.persistence_store,
+            output_serializer=self._get_output_serializer(),
+        )
+        self._claim_records(idempotency_handler)
+
+        processed_messages = super().process()
+
+        save_errors = self._save_records(idempotency_handler)
+        if not save_errors:
+            return processed_messages
+
+        # Records processed successfully but not saved as completed are retried, like @idempotent_function does
+        return [
+            self._register_save_failure(message[2], save_errors[id(message[2])])
+            if message[0] == "success" and id(message[2]) in save_errors
+            else message
+            for message in processed_messages
+        ]
+
+    def _get_output_serializer(self) -> BaseIdempotencySerializer:
+        if isclass(self.output_serializer) and issubclass(self.output_serializer, BaseIdempotencyModelSerializer):
+            return self.output_serializer.instantiate(getattr(self.handler, "__annotations__", {}).get("return"))
+        return self.output_serializer or NoOpSerializer()  # type: ignore[return-value]
+
+    def _claim_records(self, idempotency_handler: IdempotencyHandler) -> None:
+        """
+        Look up all records, and save records not already completed or in progress as in progress, in bulk.
+        """
+        try:
+            stored_records = self.persistence_store.get_records(data=self.records)
+        except Exception as exc:
+            error: Exception = IdempotencyPersistenceLayerError("Failed to get records from idempotency store", exc)
+            self._stored_outcomes = {id(record): (None, error) for record in self.records}
+            return
+
+        records_to_claim: list[dict] = []
+        for record, stored_record in zip(self.records, stored_records):
+            if isinstance(stored_record, Exception):
+                self._stored_outcomes[id(record)] = (None, stored_record)
+            elif not self._set_stored_outcome(record, stored_record, idempotency_handler):
+                records_to_claim.append(record)
+
+        if not records_to_claim:
+            return
+
+        try:
+            errors = self.persistence_store.save_inprogress_records(
+                data=records_to_claim,
+                remaining_time_in_millis=idempotency_handler._get_remaining_time_in_millis(),
+            )
+        except Exception as exc:
+            error = IdempotencyPersistenceLayerError("Failed to save in progress records to idempotency store", exc)
+            self._stored_outcomes.update({id(record): (None, error) for record in records_to_claim})
+            return
+
+        for record, claim_error in zip(records_to_claim, errors):
+            if claim_error is None:
+                self._claimed_records.add(id(record))
+            elif isinstance(claim_error, IdempotencyItemAlreadyExistsError):
+                # Saved or completed in the meantime, e.g. by a concurrent invocation, or earlier in the batch
+                existing_record = self._get_existing_record(record, claim_error)
+                if not self._set_stored_outcome(record, existing_record, idempotency_handler):
+                    error = IdempotencyInconsistentStateError("Record changed while saving it as in progress.")
+                    self._stored_outcomes[id(record)] = (None, error)
+            elif isinstance(claim_error, (IdempotencyKeyError, IdempotencyValidationError)):
+                self._stored_outcomes[id(record)] = (None, claim_error)
+            else:
+                error = IdempotencyPersistenceLayerError(
+                    "Failed to save in progress record to idempotency store",
+                    claim_error,
+                )
+                self._stored_outcomes[id(record)] = (None, error)
+
+    def _set_stored_outcome(
+        self,
+        record: dict,
+        stored_record: DataRecord | None,
+        idempotency_handler: IdempotencyHandler,
+    ) -> bool:
+        """
+        Set the outcome of a record from its stored record, unless there's none, or it expired.
+
+        Returns
+        -------
+        bool
+            Whether the record has an outcome, otherwise it needs processing
+        """
+        if stored_record is None:
+            return False
+
+        try:
+            self._stored_outcomes[id(record)] = (idempotency_handler._handle_for_status(stored_record), None)
+        except IdempotencyInconsistentStateError:
+            return False
+        except Exception as exc:
+            self._stored_outcomes[id(record)] = (None, exc)
+
+        return True
+
+    def _get_existing_record(self, record: dict, error: IdempotencyItemAlreadyExistsError) -> DataRecord | None:
+        if error.old_data_record is not None:
+            return error.old_data_record
+
+        try:
+            return self.persistence_store.get_record(data=record)
+        except IdempotencyItemNotFoundError:
+            return None
+
+    def _run_record_handler(self, record: dict) -> tuple[BatchTypeModels | None, Any, ExceptionInfo | None]:
+        stored_outcome = self._stored_outcomes.get(id(record))
+        if stored_outcome is None:
+            self._started_records.add(id(record))
+            outcome = super()._run_record_handler(record)
+            self._handler_outcomes[id(record)] = (outcome[1], outcome[2])
+            return outcome
+
+        # Processed before, or can't be processed yet, so the record handler isn't called
+        data: BatchTypeModels | None = None
+        try:
+            data = self._to_batch_type(record=record, event_type=self.event_type, model=self.model)
+        except Exception:
+            return data, None, sys.exc_info()
+
+        response, error = stored_outcome
+        if error is not None:
+            return data, None, (type(error), error, error.__traceback__)
+
+        return data, response, None
+
+    def _save_records(self, idempotency_handler: IdempotencyHandler) -> dict[int, Exception]:
+        """
+        Save records processed successfully as completed in bulk, and delete records that failed or weren't
+        processed, so they can be retried right away.
+
+        Records still in progress past the Lambda function timeout are left in progress.
+
+        Returns
+        -------
+        dict[int, Exception]
+            Errors saving records processed successfully as completed, by id() of raw records
+        """
+        completed_records: list[dict] = []
+        results: list[Any] = []
+        failed_records: list[tuple[dict, BaseException]] = []
+
+        for record in self.records:
+            if id(record) not in self._claimed_records:
+                continue
+
+            if id(record) in self._handler_outcomes:
+                result, exception = self._handler_outcomes[id(record)]
+                if exception is None:
+                    completed_records.append(record)
+                    results.append(idempotency_handler.output_serializer.to_dict(result) if result else None)
+                else:
+                    failed_records.append((record, exception[1] or Exception("Record processing failed")))
+            elif id(record) not in self._started_records:
+                # e.g. short-circuited after a failure, or past the Lambda function timeout
+                failed_records.append((record, Exception("Record not processed")))
+
+        save_errors: dict[int, Exception] = {}
+        try:
+            self.persistence_store.save_success_records(data=completed_records, results=results)
+        except Exception as exc:
+            error = IdempotencyPersistenceLayerError(
+                "Failed to update records state to success in idempotency store",
+                exc,
+            )
+            save_errors = {id(record): error for record in completed_records}
+
+        # Records failed already, so those we can't delete are left in progress until they expire
+        for record, handler_exception in failed_records:
+            try:
+                self.persistence_store.delete_record(data=record, exception=handler_exception)  # type: ignore[arg-type]
+            except Exception:
+                logger.warning("Failed to delete record from idempotency store", exc_info=True)
+
+        return save_errors
+
+    def _register_save_failure(self, record: dict, error: Exception) -> FailureResponse:
+        """Report a record processed successfully as failed, as it couldn't be saved as completed"""
+        self.success_messages[:] = [message for message in self.success_messages if message is not record]
+        failed_record: EventSourceDataClassTypes = self._to_batch_type(record=record, event_type=self.event_type)
+        return self.failure_handler(record=failed_record, exception=(type(error), error, error.__traceback__))
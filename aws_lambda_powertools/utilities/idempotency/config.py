@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.idempotency import IdempotentHookFunction
+    from aws_lambda_powertools.utilities.idempotency.persistence.local_cache import LocalCache
     from aws_lambda_powertools.utilities.typing import LambdaContext
 
 
@@ -20,6 +21,8 @@ class IdempotencyConfig:
         hash_function: str = "md5",
         lambda_context: LambdaContext | None = None,
         response_hook: IdempotentHookFunction | None = None,
+        local_cache_max_bytes: int | None = None,
+        local_cache: LocalCache | None = None,
     ):
         """
         Initialize the base persistence layer
@@ -39,11 +42,18 @@ class IdempotencyConfig:
         local_cache_max_items: int, optional
             Max number of items to store in local cache, by default 1024
         hash_function: str, optional
-            Function to use for calculating hashes, by default md5.
+            Function to use for calculating hashes, by default md5. Any algorithm in hashlib.algorithms_available
+            except shake_128 and shake_256, e.g. blake2b, or a xxhash function, e.g. xxh3_128, when the xxhash
+            package is installed.
         lambda_context: LambdaContext, optional
             Lambda Context containing information about the invocation, function and execution environment.
         response_hook: IdempotentHookFunction, optional
             Hook function to be called when an idempotent response is returned from the idempotent store.
+        local_cache_max_bytes: int, optional
+            Max approximate size of records to store in local cache, in bytes, by default unbounded
+        local_cache: LocalCache, optional
+            Local cache to use instead of creating one, e.g. to share it between persistence layers. When set,
+            local_cache_max_items and local_cache_max_bytes are ignored.
         """
         self.event_key_jmespath = event_key_jmespath
         self.payload_validation_jmespath = payload_validation_jmespath
@@ -55,6 +65,8 @@ class IdempotencyConfig:
         self.hash_function = hash_function
         self.lambda_context: LambdaContext | None = lambda_context
         self.response_hook: IdempotentHookFunction | None = response_hook
+        self.local_cache_max_bytes = local_cache_max_bytes
+        self.local_cache = local_cache
 
     def register_lambda_context(self, lambda_context: LambdaContext):
         """Captures the Lambda context, to calculate the remaining time before the invocation times out"""
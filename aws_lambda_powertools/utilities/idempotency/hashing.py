@@ -0,0 +1,157 @@
+"""
+Canonical hashing of idempotency keys and payloads
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+from typing import Any, Callable, Iterable, Iterator, Protocol
+
+from aws_lambda_powertools.shared.json_encoder import Encoder
+
+
+class Hasher(Protocol):
+    def update(self, data: bytes) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+# Containers with more items than this are encoded in chunks, so large payloads are never held in memory as JSON
+CHUNK_SIZE = 128
+
+XXHASH_FUNCTIONS = ("xxh32", "xxh64", "xxh3_64", "xxh3_128", "xxh128")
+
+# Same output as json.dumps(data, cls=Encoder, sort_keys=True), so hashes don't change between versions
+_ENCODER = Encoder(sort_keys=True)
+
+
+def get_hash_function(name: str) -> Callable[[], Hasher]:
+    """
+    Get a hash function by name, from hashlib, or from the xxhash package
+
+    Parameters
+    ----------
+    name: str
+        Name of an algorithm in hashlib.algorithms_available, e.g. md5 or blake2b, except shake_128 and shake_256,
+        or of a xxhash function, e.g. xxh3_128
+
+    Raises
+    ------
+    ImportError
+        When a xxhash function is requested but the xxhash package isn't installed
+    ValueError
+        When the hash function is unknown
+    """
+    if name in XXHASH_FUNCTIONS:
+        try:
+            import xxhash
+        except ImportError as exc:
+            raise ImportError(
+                f"The {name} hash function requires the 'xxhash' package. Install it with 'pip install xxhash'.",
+            ) from exc
+        return getattr(xxhash, name)
+
+    # shake_* digests need a length, so they can't be used with hexdigest()
+    if name not in hashlib.algorithms_available or name.startswith("shake_"):
+        raise ValueError(f"Unsupported hash function: {name}")
+
+    # Algorithms only provided by OpenSSL, e.g. sha512_256, have no constructor in hashlib
+    return getattr(hashlib, name, None) or functools.partial(hashlib.new, name)
+
+
+def canonical_hash(data: Any, hash_function: Callable[[], Hasher]) -> str:
+    """
+    Hash the canonical JSON representation of data, feeding the hash incrementally
+
+    Parameters
+    ----------
+    data: Any
+        The data to hash
+    hash_function: Callable[[], Hasher]
+        Constructor of the hash object, e.g. hashlib.md5
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of json.dumps(data, cls=Encoder, sort_keys=True)
+    """
+    hasher = hash_function()
+    for chunk in iter_canonical_json(data):
+        hasher.update(chunk.encode())
+    return hasher.hexdigest()
+
+
+def iter_canonical_json(data: Any) -> Iterator[str]:
+    """
+    Encode data as canonical JSON in chunks, so large payloads are never held in memory as a whole
+
+    Containers with up to CHUNK_SIZE nested items are encoded in one go by the C encoder, as walking them in Python
+    is much slower. Dictionaries and lists with more than CHUNK_SIZE items are encoded CHUNK_SIZE items at a time,
+    and smaller ones holding large values are walked.
+    """
+    if not isinstance(data, (dict, list, tuple)) or _is_small(data):
+        yield _ENCODER.encode(data)
+    elif isinstance(data, dict):
+        yield from _iter_dict(data)
+    else:
+        yield from _iter_list(data)
+
+
+def _is_small(data: dict | list | tuple) -> bool:
+    return _count_items(data, CHUNK_SIZE) <= CHUNK_SIZE
+
+
+def _count_items(data: Any, budget: int) -> int:
+    """Count nested items of lists and dictionaries, stopping as soon as the budget is exceeded"""
+    values: Iterable[Any]
+    if isinstance(data, dict):
+        values = data.values()
+    elif isinstance(data, (list, tuple)):
+        values = data
+    else:
+        return 0
+
+    count = len(data)
+    for value in values:
+        if count > budget:
+            break
+        if isinstance(value, (dict, list, tuple)):
+            count += _count_items(value, budget - count)
+    return count
+
+
+def _iter_dict(data: dict) -> Iterator[str]:
+    yield "{"
+    # Sorted like the encoder does, so items encoded together keep the same order
+    items = sorted(data.items())
+    if len(items) > CHUNK_SIZE:
+        # Items of large dictionaries are encoded together without looking into them, like items of long lists,
+        # as checking the size of every value costs more than encoding them
+        for index in range(0, len(items), CHUNK_SIZE):
+            # Encoded as a dictionary, without its braces
+            yield ("" if index == 0 else ", ") + _ENCODER.encode(dict(items[index : index + CHUNK_SIZE]))[1:-1]
+    else:
+        separator = ""
+        for key, value in items:
+            # Encoding a single item dictionary converts non-string keys the same way, e.g. 1 to "1"
+            yield separator + _ENCODER.encode({key: None})[1 : -len(": null}")] + ": "
+            yield from iter_canonical_json(value)
+            separator = ", "
+    yield "}"
+
+
+def _iter_list(data: list | tuple) -> Iterator[str]:
+    yield "["
+    if len(data) > CHUNK_SIZE:
+        # Items of long lists, like records of a batch, are encoded together without looking into them
+        for index in range(0, len(data), CHUNK_SIZE):
+            # Encoded as a list, without its brackets
+            yield ("" if index == 0 else ", ") + _ENCODER.encode(data[index : index + CHUNK_SIZE])[1:-1]
+    else:
+        separator = ""
+        for value in data:
+            yield separator
+            yield from iter_canonical_json(value)
+            separator = ", "
+    yield "]"
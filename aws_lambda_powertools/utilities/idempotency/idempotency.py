@@ -8,15 +8,17 @@ import functools
 import logging
 import os
 import warnings
-from inspect import isclass
+from inspect import isclass, iscoroutinefunction
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 from aws_lambda_powertools.middleware_factory import lambda_handler_decorator
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.shared.functions import strtobool
 from aws_lambda_powertools.shared.types import AnyCallableT
-from aws_lambda_powertools.utilities.idempotency.base import IdempotencyHandler
+from aws_lambda_powertools.utilities.idempotency.base import AsyncIdempotencyHandler, IdempotencyHandler
 from aws_lambda_powertools.utilities.idempotency.config import IdempotencyConfig
+from aws_lambda_powertools.utilities.idempotency.exceptions import IdempotencyPersistenceConfigError
+from aws_lambda_powertools.utilities.idempotency.persistence.base import AsyncBasePersistenceLayer
 from aws_lambda_powertools.utilities.idempotency.serialization.base import (
     BaseIdempotencyModelSerializer,
     BaseIdempotencySerializer,
@@ -33,14 +35,12 @@ from aws_lambda_powertools.warnings import PowertoolsUserWarning
 logger = logging.getLogger(__name__)
 
 
-@lambda_handler_decorator
 def idempotent(
-    handler: Callable[[Any, LambdaContext], Any],
-    event: dict[str, Any],
-    context: LambdaContext,
+    handler: Callable[[Any, LambdaContext], Any] | None = None,
+    *,
     persistence_store: BasePersistenceLayer,
     config: IdempotencyConfig | None = None,
-    **kwargs,
+    **kwargs: Any,
 ) -> Any:
     """
     Decorator to handle idempotency
@@ -49,10 +49,6 @@ def idempotent(
     ----------
     handler: Callable
         Lambda's handler
-    event: dict
-        Lambda's Event
-    context: dict
-        Lambda's Context
     persistence_store: BasePersistenceLayer
         Instance of BasePersistenceLayer to store data
     config: IdempotencyConfig
@@ -73,7 +69,22 @@ def idempotent(
         >>> def handler(event, context):
         >>>     return {"StatusCode": 200}
     """
+    # Checked once when decorating, rather than on every invocation
+    if isinstance(persistence_store, AsyncBasePersistenceLayer):
+        raise IdempotencyPersistenceConfigError("Asyncio persistence layers only support coroutine functions")
+
+    return _idempotent(handler, persistence_store=persistence_store, config=config, **kwargs)
 
+
+@lambda_handler_decorator
+def _idempotent(
+    handler: Callable[[Any, LambdaContext], Any],
+    event: dict[str, Any],
+    context: LambdaContext,
+    persistence_store: BasePersistenceLayer,
+    config: IdempotencyConfig | None = None,
+    **kwargs,
+) -> Any:
     # Skip idempotency controls when POWERTOOLS_IDEMPOTENCY_DISABLED has a truthy value
     # Raises a warning if not running in development mode
     if strtobool(os.getenv(constants.IDEMPOTENCY_DISABLED_ENV, "false")):
@@ -143,6 +154,18 @@ def idempotent_function(
         @idempotent_function(data_keyword_argument="order", config=idem_config, persistence_store=persistence_layer)
         def process_order(customer_id: str, order: dict, **kwargs):
             return {"StatusCode": 200}
+
+    **Processes an order in an idempotent manner, in a coroutine function**
+
+        from aws_lambda_powertools.utilities.idempotency import idempotent_function, IdempotencyConfig
+        from aws_lambda_powertools.utilities.idempotency.persistence.redis import AsyncRedisCachePersistenceLayer
+
+        idem_config=IdempotencyConfig(event_key_jmespath="order_id")
+        persistence_layer = AsyncRedisCachePersistenceLayer(host="localhost", port=6379)
+
+        @idempotent_function(data_keyword_argument="order", config=idem_config, persistence_store=persistence_layer)
+        async def process_order(customer_id: str, order: dict, **kwargs):
+            return {"StatusCode": 200}
     """
 
     if not function:
@@ -164,8 +187,14 @@ def idempotent_function(
 
     config = config or IdempotencyConfig()
 
-    @functools.wraps(function)
-    def decorate(*args, **kwargs):
+    is_async_persistence_store = isinstance(persistence_store, AsyncBasePersistenceLayer)
+    if iscoroutinefunction(function) != is_async_persistence_store:
+        raise IdempotencyPersistenceConfigError(
+            "Coroutine functions require an asyncio persistence layer, e.g. AsyncRedisCachePersistenceLayer, "
+            "and other functions a synchronous one",
+        )
+
+    def _is_idempotency_disabled() -> bool:
         # Skip idempotency controls when POWERTOOLS_IDEMPOTENCY_DISABLED has a truthy value
         # Raises a warning if not running in development mode
         if strtobool(os.getenv(constants.IDEMPOTENCY_DISABLED_ENV, "false")):
@@ -173,10 +202,12 @@ def idempotent_function(
                 message="Disabling idempotency is intended for development environments only "
                 "and should not be used in production.",
                 category=PowertoolsUserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
-            return function(*args, **kwargs)
+            return True
+        return False
 
+    def _build_idempotency_handler(handler_class: type[IdempotencyHandler], args: tuple, kwargs: dict):
         if data_keyword_argument not in kwargs:
             raise RuntimeError(
                 f"Unable to extract '{data_keyword_argument}' from keyword arguments."
@@ -185,7 +216,7 @@ def idempotent_function(
 
         payload = kwargs.get(data_keyword_argument)
 
-        idempotency_handler = IdempotencyHandler(
+        return handler_class(
             function=function,
             function_payload=payload,
             config=config,
@@ -195,6 +226,24 @@ def idempotent_function(
             function_kwargs=kwargs,
         )
 
+    if is_async_persistence_store:
+
+        @functools.wraps(function)
+        async def async_decorate(*args, **kwargs):
+            if _is_idempotency_disabled():
+                return await function(*args, **kwargs)
+
+            idempotency_handler = _build_idempotency_handler(AsyncIdempotencyHandler, args, kwargs)
+            return await idempotency_handler.handle()
+
+        return cast(AnyCallableT, async_decorate)
+
+    @functools.wraps(function)
+    def decorate(*args, **kwargs):
+        if _is_idempotency_disabled():
+            return function(*args, **kwargs)
+
+        idempotency_handler = _build_idempotency_handler(IdempotencyHandler, args, kwargs)
         return idempotency_handler.handle()
 
     return cast(AnyCallableT, decorate)
@@ -5,7 +5,6 @@ Persistence layers supporting idempotency
 from __future__ import annotations
 
 import datetime
-import hashlib
 import json
 import logging
 import os
@@ -13,21 +12,21 @@ import warnings
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
-import jmespath
-
 from aws_lambda_powertools.shared import constants
-from aws_lambda_powertools.shared.cache_dict import LRUDict
 from aws_lambda_powertools.shared.json_encoder import Encoder
 from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyItemAlreadyExistsError,
+    IdempotencyItemNotFoundError,
     IdempotencyKeyError,
     IdempotencyValidationError,
 )
+from aws_lambda_powertools.utilities.idempotency.hashing import canonical_hash, get_hash_function
 from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import (
     STATUS_CONSTANTS,
     DataRecord,
 )
-from aws_lambda_powertools.utilities.jmespath_utils import PowertoolsFunctions
+from aws_lambda_powertools.utilities.idempotency.persistence.local_cache import LocalCache
+from aws_lambda_powertools.utilities.jmespath_utils import compile_expression
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.idempotency.config import IdempotencyConfig
@@ -35,9 +34,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class BasePersistenceLayer(ABC):
+class _BasePersistenceLayer:
     """
-    Abstract Base Class for Idempotency persistence layer.
+    Hashing, payload validation, local cache and records, shared by synchronous and asyncio persistence layers.
     """
 
     def __init__(self):
@@ -52,7 +51,9 @@ class BasePersistenceLayer(ABC):
         self.raise_on_no_idempotency_key = False
         self.expires_after_seconds: int = 60 * 60  # 1 hour default
         self.use_local_cache = False
-        self.hash_function = hashlib.md5
+        self.hash_function = get_hash_function("md5")
+        # Hashes of payloads by id(), computed once per invocation, see _hash_idempotency_key_and_payload
+        self._hashes: dict[int, tuple[Any, str, str]] = {}
 
     def configure(self, config: IdempotencyConfig, function_name: str | None = None) -> None:
         """
@@ -73,20 +74,25 @@ class BasePersistenceLayer(ABC):
         self.configured = True
 
         self.event_key_jmespath = config.event_key_jmespath
-        if config.event_key_jmespath:
-            self.event_key_compiled_jmespath = jmespath.compile(config.event_key_jmespath)
         self.jmespath_options = config.jmespath_options
-        if not self.jmespath_options:
-            self.jmespath_options = {"custom_functions": PowertoolsFunctions()}
+        if config.event_key_jmespath:
+            self.event_key_compiled_jmespath = compile_expression(config.event_key_jmespath, self.jmespath_options)
         if config.payload_validation_jmespath:
-            self.validation_key_jmespath = jmespath.compile(config.payload_validation_jmespath)
+            self.validation_key_jmespath = compile_expression(config.payload_validation_jmespath, self.jmespath_options)
             self.payload_validation_enabled = True
         self.raise_on_no_idempotency_key = config.raise_on_no_idempotency_key
         self.expires_after_seconds = config.expires_after_seconds
         self.use_local_cache = config.use_local_cache
         if self.use_local_cache:
-            self._cache = LRUDict(max_items=config.local_cache_max_items)
-        self.hash_function = getattr(hashlib, config.hash_function)
+            # An empty cache is falsy, as it has a length
+            if config.local_cache is not None:
+                self._cache = config.local_cache
+            else:
+                self._cache = LocalCache(
+                    max_items=config.local_cache_max_items,
+                    max_bytes=config.local_cache_max_bytes,
+                )
+        self.hash_function = get_hash_function(config.hash_function)
 
     def _get_hashed_idempotency_key(self, data: dict[str, Any]) -> str | None:
         """
@@ -102,9 +108,63 @@ class BasePersistenceLayer(ABC):
         str
             Hashed representation of the data extracted by the jmespath expression
 
+        """
+        hashes = self._get_remembered_hashes(data=data)
+        if hashes is not None:
+            return f"{self.function_name}#{hashes[0]}"
+
+        key_data = self._get_idempotency_key_data(data=data)
+        if key_data is None:
+            return None
+
+        generated_hash = self._generate_hash(data=key_data)
+        return f"{self.function_name}#{generated_hash}"
+
+    def _hash_idempotency_key_and_payload(self, data: dict[str, Any]) -> str | None:
+        """
+        Hash the idempotency key and the payload to validate in a single pass, and remember both hashes so the rest
+        of the invocation doesn't serialize the payload again, even if the function changes it in the meantime.
+
+        Called when an invocation starts using the persistence store, after forgetting hashes of the previous one.
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Incoming data
+
+        Returns
+        -------
+        str
+            Hashed representation of the data extracted by the jmespath expression
+
+        """
+        key_data = self._get_idempotency_key_data(data=data)
+        if key_data is None:
+            return None
+
+        key_hash = self._generate_hash(data=key_data)
+        payload_hash = ""
+        if self.payload_validation_enabled:
+            payload_data = self.validation_key_jmespath.search(data)
+            # e.g. both jmespath expressions select the same field, so it's hashed once
+            payload_hash = key_hash if payload_data is key_data else self._generate_hash(data=payload_data)
+
+        # Keeps a reference to data, so its id() isn't reused by another payload
+        self._hashes[id(data)] = (data, key_hash, payload_hash)
+        return f"{self.function_name}#{key_hash}"
+
+    def _get_remembered_hashes(self, data: dict[str, Any]) -> tuple[str, str] | None:
+        remembered = self._hashes.get(id(data))
+        if remembered is None or remembered[0] is not data:
+            return None
+        return remembered[1], remembered[2]
+
+    def _get_idempotency_key_data(self, data: dict[str, Any]) -> Any:
+        """
+        Extract the data to hash as idempotency key, or None when it's missing and raise_on_no_idempotency_key is off
         """
         if self.event_key_jmespath:
-            data = self.event_key_compiled_jmespath.search(data, options=jmespath.Options(**self.jmespath_options))
+            data = self.event_key_compiled_jmespath.search(data)
 
         if self.is_missing_idempotency_key(data=data):
             if self.raise_on_no_idempotency_key:
@@ -112,12 +172,11 @@ class BasePersistenceLayer(ABC):
 
             warnings.warn(
                 f"No idempotency key value found. Skipping persistence layer and validation operations. jmespath: {self.event_key_jmespath}",  # noqa: E501
-                stacklevel=2,
+                stacklevel=3,
             )
             return None
 
-        generated_hash = self._generate_hash(data=data)
-        return f"{self.function_name}#{generated_hash}"
+        return data
 
     @staticmethod
     def is_missing_idempotency_key(data) -> bool:
@@ -144,6 +203,11 @@ class BasePersistenceLayer(ABC):
         """
         if not self.payload_validation_enabled:
             return ""
+
+        hashes = self._get_remembered_hashes(data=data)
+        if hashes is not None:
+            return hashes[1]
+
         data = self.validation_key_jmespath.search(data)
         return self._generate_hash(data=data)
 
@@ -162,8 +226,7 @@ class BasePersistenceLayer(ABC):
             Hashed representation of the provided data
 
         """
-        hashed_data = self.hash_function(json.dumps(data, cls=Encoder, sort_keys=True).encode())
-        return hashed_data.hexdigest()
+        return canonical_hash(data=data, hash_function=self.hash_function)
 
     def _validate_payload(
         self,
@@ -228,76 +291,82 @@ class BasePersistenceLayer(ABC):
             return
         if data_record.status == STATUS_CONSTANTS["INPROGRESS"]:
             return
-        self._cache[data_record.idempotency_key] = data_record
+        self._cache.put(data_record)
 
     def _retrieve_from_cache(self, idempotency_key: str):
         if not self.use_local_cache:
             return
-        cached_record = self._cache.get(key=idempotency_key)
-        if cached_record:
-            if not cached_record.is_expired:
-                return cached_record
-            logger.debug(f"Removing expired local cache record for idempotency key: {idempotency_key}")
-            self._delete_from_cache(idempotency_key=idempotency_key)
+        # Expired records are evicted by the cache
+        return self._cache.get(idempotency_key)
 
     def _delete_from_cache(self, idempotency_key: str):
         if not self.use_local_cache:
             return
-        if idempotency_key in self._cache:
-            del self._cache[idempotency_key]
+        self._cache.delete(idempotency_key)
 
-    def save_success(self, data: dict[str, Any], result: dict) -> None:
-        """
-        Save record of function's execution completing successfully
-
-        Parameters
-        ----------
-        data: dict[str, Any]
-            Payload
-        result: dict
-            The response from function
-        """
+    def _get_completed_record(self, data: dict[str, Any], result: Any) -> DataRecord | None:
+        """Build the record to save once the function completed, or None when there's no idempotency key"""
         idempotency_key = self._get_hashed_idempotency_key(data=data)
         if idempotency_key is None:
             # If the idempotency key is None, no data will be saved in the Persistence Layer.
             # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
             return None
 
-        response_data = json.dumps(result, cls=Encoder, sort_keys=True)
+        data_record = self._build_completed_record(idempotency_key=idempotency_key, data=data, result=result)
+        logger.debug(
+            f"Function successfully executed. Saving record to persistence store with "
+            f"idempotency key: {data_record.idempotency_key}",
+        )
+        return data_record
 
-        data_record = DataRecord(
+    def _build_completed_record(self, idempotency_key: str, data: dict[str, Any], result: Any) -> DataRecord:
+        return DataRecord(
             idempotency_key=idempotency_key,
             status=STATUS_CONSTANTS["COMPLETED"],
             expiry_timestamp=self._get_expiry_timestamp(),
-            response_data=response_data,
+            response_data=json.dumps(result, cls=Encoder, sort_keys=True),
             payload_hash=self._get_hashed_payload(data=data),
         )
-        logger.debug(
-            f"Function successfully executed. Saving record to persistence store with "
-            f"idempotency key: {data_record.idempotency_key}",
-        )
-        self._update_record(data_record=data_record)
 
-        self._save_to_cache(data_record=data_record)
-
-    def save_inprogress(self, data: dict[str, Any], remaining_time_in_millis: int | None = None) -> None:
+    def _get_in_progress_record(
+        self,
+        data: dict[str, Any],
+        remaining_time_in_millis: int | None,
+    ) -> DataRecord | None:
         """
-        Save record of function's execution being in progress
+        Build the record to save when the function starts, or None when there's no idempotency key
 
-        Parameters
-        ----------
-        data: dict[str, Any]
-            Payload
-        remaining_time_in_millis: int | None
-            If expiry of in-progress invocations is enabled, this will contain the remaining time available in millis
+        Raises
+        ------
+        IdempotencyItemAlreadyExistsError
+            A record for the idempotency key is in the local cache
         """
-
-        idempotency_key = self._get_hashed_idempotency_key(data=data)
+        self._hashes.clear()
+        idempotency_key = self._hash_idempotency_key_and_payload(data=data)
         if idempotency_key is None:
             # If the idempotency key is None, no data will be saved in the Persistence Layer.
             # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
             return None
 
+        data_record = self._build_in_progress_record(
+            idempotency_key=idempotency_key,
+            data=data,
+            remaining_time_in_millis=remaining_time_in_millis,
+        )
+
+        logger.debug(f"Saving in progress record for idempotency key: {data_record.idempotency_key}")
+
+        if self._retrieve_from_cache(idempotency_key=data_record.idempotency_key):
+            raise IdempotencyItemAlreadyExistsError
+
+        return data_record
+
+    def _build_in_progress_record(
+        self,
+        idempotency_key: str,
+        data: dict[str, Any],
+        remaining_time_in_millis: int | None,
+    ) -> DataRecord:
         data_record = DataRecord(
             idempotency_key=idempotency_key,
             status=STATUS_CONSTANTS["INPROGRESS"],
@@ -317,13 +386,74 @@ class BasePersistenceLayer(ABC):
             warnings.warn(
                 "Couldn't determine the remaining time left. "
                 "Did you call register_lambda_context on IdempotencyConfig?",
-                stacklevel=2,
+                stacklevel=3,
             )
 
-        logger.debug(f"Saving in progress record for idempotency key: {data_record.idempotency_key}")
+        return data_record
 
-        if self._retrieve_from_cache(idempotency_key=data_record.idempotency_key):
-            raise IdempotencyItemAlreadyExistsError
+    def _get_deleted_record(self, data: dict[str, Any], exception: Exception) -> DataRecord | None:
+        """Build the record to delete once the function failed, or None when there's no idempotency key"""
+        idempotency_key = self._get_hashed_idempotency_key(data=data)
+        if idempotency_key is None:
+            # If the idempotency key is None, no data will be saved in the Persistence Layer.
+            # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
+            return None
+
+        data_record = DataRecord(idempotency_key=idempotency_key)
+
+        logger.debug(
+            f"Function raised an exception ({type(exception).__name__}). Clearing in progress record in persistence "
+            f"store for idempotency key: {data_record.idempotency_key}",
+        )
+        return data_record
+
+    def _get_validated_cached_record(self, data: dict[str, Any], idempotency_key: str) -> DataRecord | None:
+        cached_record = self._retrieve_from_cache(idempotency_key=idempotency_key)
+        if cached_record:
+            logger.debug(f"Idempotency record found in cache with idempotency key: {idempotency_key}")
+            self._validate_payload(data_payload=data, stored_data_record=cached_record)
+        return cached_record
+
+
+class BasePersistenceLayer(_BasePersistenceLayer, ABC):
+    """
+    Abstract Base Class for Idempotency persistence layer.
+    """
+
+    def save_success(self, data: dict[str, Any], result: dict) -> None:
+        """
+        Save record of function's execution completing successfully
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Payload
+        result: dict
+            The response from function
+        """
+        data_record = self._get_completed_record(data=data, result=result)
+        if data_record is None:
+            return None
+
+        self._update_record(data_record=data_record)
+
+        self._save_to_cache(data_record=data_record)
+
+    def save_inprogress(self, data: dict[str, Any], remaining_time_in_millis: int | None = None) -> None:
+        """
+        Save record of function's execution being in progress
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Payload
+        remaining_time_in_millis: int | None
+            If expiry of in-progress invocations is enabled, this will contain the remaining time available in millis
+        """
+
+        data_record = self._get_in_progress_record(data=data, remaining_time_in_millis=remaining_time_in_millis)
+        if data_record is None:
+            return None
 
         self._put_record(data_record=data_record)
 
@@ -339,18 +469,10 @@ class BasePersistenceLayer(ABC):
             The exception raised by the function
         """
 
-        idempotency_key = self._get_hashed_idempotency_key(data=data)
-        if idempotency_key is None:
-            # If the idempotency key is None, no data will be saved in the Persistence Layer.
-            # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
+        data_record = self._get_deleted_record(data=data, exception=exception)
+        if data_record is None:
             return None
 
-        data_record = DataRecord(idempotency_key=idempotency_key)
-
-        logger.debug(
-            f"Function raised an exception ({type(exception).__name__}). Clearing in progress record in persistence "
-            f"store for idempotency key: {data_record.idempotency_key}",
-        )
         self._delete_record(data_record=data_record)
 
         self._delete_from_cache(idempotency_key=data_record.idempotency_key)
@@ -383,10 +505,8 @@ class BasePersistenceLayer(ABC):
             # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
             return None
 
-        cached_record = self._retrieve_from_cache(idempotency_key=idempotency_key)
+        cached_record = self._get_validated_cached_record(data=data, idempotency_key=idempotency_key)
         if cached_record:
-            logger.debug(f"Idempotency record found in cache with idempotency key: {idempotency_key}")
-            self._validate_payload(data_payload=data, stored_data_record=cached_record)
             return cached_record
 
         record = self._get_record(idempotency_key=idempotency_key)
@@ -396,6 +516,165 @@ class BasePersistenceLayer(ABC):
 
         return record
 
+    def get_records(self, data: list[dict[str, Any]]) -> list[DataRecord | Exception | None]:
+        """
+        Retrieve records for many payloads at once, with as few calls to the persistence store as it supports.
+
+        Parameters
+        ----------
+        data: list[dict[str, Any]]
+            Payloads
+
+        Returns
+        -------
+        list[DataRecord | Exception | None]
+            For each payload, in order: its DataRecord, None when it has no idempotency key or no record was found, or
+            the IdempotencyKeyError or IdempotencyValidationError it failed with
+        """
+        self._hashes.clear()
+        idempotency_keys = self._get_hashed_idempotency_keys(data, remember=True)
+
+        records: dict[str, DataRecord] = {}
+        for idempotency_key in idempotency_keys:
+            if isinstance(idempotency_key, str):
+                cached_record = self._retrieve_from_cache(idempotency_key=idempotency_key)
+                if cached_record:
+                    records[idempotency_key] = cached_record
+
+        missing_keys = [key for key in idempotency_keys if isinstance(key, str) and key not in records]
+        if missing_keys:
+            fetched_records = self._get_records(idempotency_keys=list(dict.fromkeys(missing_keys)))
+            for fetched_record in fetched_records.values():
+                self._save_to_cache(data_record=fetched_record)
+            records.update(fetched_records)
+
+        results: list[DataRecord | Exception | None] = []
+        for payload, idempotency_key in zip(data, idempotency_keys):
+            if not isinstance(idempotency_key, str):
+                results.append(idempotency_key)
+                continue
+
+            record = records.get(idempotency_key)
+            if record is not None:
+                try:
+                    self._validate_payload(data_payload=payload, stored_data_record=record)
+                except IdempotencyValidationError as exc:
+                    results.append(exc)
+                    continue
+
+            results.append(record)
+
+        return results
+
+    def save_inprogress_records(
+        self,
+        data: list[dict[str, Any]],
+        remaining_time_in_millis: int | None = None,
+    ) -> list[Exception | None]:
+        """
+        Save records of many executions being in progress at once, with as few calls to the persistence store as it
+        supports.
+
+        Payloads sharing an idempotency key are only saved once, and the others fail with
+        IdempotencyItemAlreadyExistsError, as if they were saved right after.
+
+        Parameters
+        ----------
+        data: list[dict[str, Any]]
+            Payloads
+        remaining_time_in_millis: int | None
+            If expiry of in-progress invocations is enabled, this will contain the remaining time available in millis
+
+        Returns
+        -------
+        list[Exception | None]
+            For each payload, in order, the exception it failed with, e.g. IdempotencyItemAlreadyExistsError, or None
+            if it was saved, or has no idempotency key
+        """
+        results: list[Exception | None] = [None] * len(data)
+        data_records: list[DataRecord] = []
+        indexes: list[int] = []
+        claimed: dict[str, DataRecord] = {}
+
+        for index, (payload, idempotency_key) in enumerate(zip(data, self._get_hashed_idempotency_keys(data))):
+            if not isinstance(idempotency_key, str):
+                results[index] = idempotency_key
+                continue
+
+            if idempotency_key in claimed:
+                results[index] = IdempotencyItemAlreadyExistsError(old_data_record=claimed[idempotency_key])
+                continue
+
+            cached_record = self._retrieve_from_cache(idempotency_key=idempotency_key)
+            if cached_record:
+                results[index] = IdempotencyItemAlreadyExistsError(old_data_record=cached_record)
+                continue
+
+            data_record = self._build_in_progress_record(
+                idempotency_key=idempotency_key,
+                data=payload,
+                remaining_time_in_millis=remaining_time_in_millis,
+            )
+            claimed[idempotency_key] = data_record
+            data_records.append(data_record)
+            indexes.append(index)
+
+        if data_records:
+            logger.debug(f"Saving {len(data_records)} in progress records")
+            for index, error in zip(indexes, self._put_records(data_records=data_records)):
+                results[index] = error
+
+        return results
+
+    def save_success_records(self, data: list[dict[str, Any]], results: list[Any]) -> None:
+        """
+        Save records of many executions completing successfully at once, with as few calls to the persistence store
+        as it supports.
+
+        Parameters
+        ----------
+        data: list[dict[str, Any]]
+            Payloads
+        results: list[Any]
+            The response from function for each payload
+        """
+        data_records: dict[str, DataRecord] = {}
+        for payload, result in zip(data, results):
+            idempotency_key = self._get_hashed_idempotency_key(data=payload)
+            if idempotency_key is None:
+                continue
+
+            data_records[idempotency_key] = self._build_completed_record(
+                idempotency_key=idempotency_key,
+                data=payload,
+                result=result,
+            )
+
+        if not data_records:
+            return
+
+        logger.debug(f"Functions successfully executed. Saving {len(data_records)} records to persistence store")
+        self._update_records(data_records=list(data_records.values()))
+
+        for data_record in data_records.values():
+            self._save_to_cache(data_record=data_record)
+
+    def _get_hashed_idempotency_keys(
+        self,
+        data: list[dict[str, Any]],
+        remember: bool = False,
+    ) -> list[str | IdempotencyKeyError | None]:
+        get_hashed_idempotency_key = (
+            self._hash_idempotency_key_and_payload if remember else self._get_hashed_idempotency_key
+        )
+        idempotency_keys: list[str | IdempotencyKeyError | None] = []
+        for payload in data:
+            try:
+                idempotency_keys.append(get_hashed_idempotency_key(data=payload))
+            except IdempotencyKeyError as exc:
+                idempotency_keys.append(exc)
+        return idempotency_keys
+
     @abstractmethod
     def _get_record(self, idempotency_key) -> DataRecord:
         """
@@ -455,3 +734,209 @@ class BasePersistenceLayer(ABC):
         """
 
         raise NotImplementedError
+
+    def _get_records(self, idempotency_keys: list[str]) -> dict[str, DataRecord]:
+        """
+        Retrieve many items from persistence store at once.
+
+        Persistence stores supporting bulk reads should override it, as it retrieves items one at a time by default.
+
+        Parameters
+        ----------
+        idempotency_keys: list[str]
+            Unique idempotency keys
+
+        Returns
+        -------
+        dict[str, DataRecord]
+            DataRecord of each item found, by idempotency key
+        """
+        records: dict[str, DataRecord] = {}
+        for idempotency_key in idempotency_keys:
+            try:
+                records[idempotency_key] = self._get_record(idempotency_key=idempotency_key)
+            except IdempotencyItemNotFoundError:
+                continue
+        return records
+
+    def _put_records(self, data_records: list[DataRecord]) -> list[Exception | None]:
+        """
+        Add many DataRecords to persistence store at once, if they don't already exist, like _put_record.
+
+        Persistence stores supporting bulk conditional writes should override it, as it adds items one at a time by
+        default.
+
+        Parameters
+        ----------
+        data_records: list[DataRecord]
+            DataRecord instances, with unique idempotency keys
+
+        Returns
+        -------
+        list[Exception | None]
+            For each DataRecord, in order, the exception _put_record would raise, or None if it was added
+        """
+        errors: list[Exception | None] = []
+        for data_record in data_records:
+            try:
+                self._put_record(data_record=data_record)
+            except Exception as exc:
+                errors.append(exc)
+            else:
+                errors.append(None)
+        return errors
+
+    def _update_records(self, data_records: list[DataRecord]) -> None:
+        """
+        Update many items in persistence store at once.
+
+        Persistence stores supporting bulk writes should override it, as it updates items one at a time by default.
+
+        Parameters
+        ----------
+        data_records: list[DataRecord]
+            DataRecord instances, with unique idempotency keys
+        """
+        for data_record in data_records:
+            self._update_record(data_record=data_record)
+
+
+class AsyncBasePersistenceLayer(_BasePersistenceLayer, ABC):
+    """
+    Abstract Base Class for asyncio persistence layers, used by idempotent coroutine functions.
+
+    Calls to the persistence store are awaited, so coroutines, e.g. records processed by AsyncBatchProcessor, don't
+    block each other while waiting for it. Hashing and the local cache work the same as for BasePersistenceLayer,
+    but bulk operations used by IdempotentBatchProcessor aren't supported.
+    """
+
+    async def save_success(self, data: dict[str, Any], result: dict) -> None:
+        """
+        Save record of function's execution completing successfully
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Payload
+        result: dict
+            The response from function
+        """
+        data_record = self._get_completed_record(data=data, result=result)
+        if data_record is None:
+            return None
+
+        await self._update_record(data_record=data_record)
+
+        self._save_to_cache(data_record=data_record)
+
+    async def save_inprogress(
+        self,
+        data: dict[str, Any],
+        remaining_time_in_millis: int | None = None,
+    ) -> None:
+        """
+        Save record of function's execution being in progress
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Payload
+        remaining_time_in_millis: int | None
+            If expiry of in-progress invocations is enabled, this will contain the remaining time available in millis
+        """
+        data_record = self._get_in_progress_record(data=data, remaining_time_in_millis=remaining_time_in_millis)
+        if data_record is None:
+            return None
+
+        await self._put_record(data_record=data_record)
+
+    async def delete_record(self, data: dict[str, Any], exception: Exception):
+        """
+        Delete record from the persistence store
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Payload
+        exception
+            The exception raised by the function
+        """
+        data_record = self._get_deleted_record(data=data, exception=exception)
+        if data_record is None:
+            return None
+
+        await self._delete_record(data_record=data_record)
+
+        self._delete_from_cache(idempotency_key=data_record.idempotency_key)
+
+    async def get_record(self, data: dict[str, Any]) -> DataRecord | None:
+        """
+        Retrieve idempotency key for data provided, fetch from persistence store, and convert to DataRecord.
+
+        Parameters
+        ----------
+        data: dict[str, Any]
+            Payload
+
+        Returns
+        -------
+        DataRecord
+            DataRecord representation of existing record found in persistence store
+
+        Raises
+        ------
+        IdempotencyItemNotFoundError
+            Exception raised if no record exists in persistence store with the idempotency key
+        IdempotencyValidationError
+            Payload doesn't match the stored record for the given idempotency key
+        """
+        idempotency_key = self._get_hashed_idempotency_key(data=data)
+        if idempotency_key is None:
+            # If the idempotency key is None, no data will be saved in the Persistence Layer.
+            # See: https://github.com/aws-powertools/powertools-lambda-python/issues/2465
+            return None
+
+        cached_record = self._get_validated_cached_record(data=data, idempotency_key=idempotency_key)
+        if cached_record:
+            return cached_record
+
+        record = await self._get_record(idempotency_key=idempotency_key)
+
+        self._validate_payload(data_payload=data, stored_data_record=record)
+        self._save_to_cache(data_record=record)
+
+        return record
+
+    @abstractmethod
+    async def _get_record(self, idempotency_key) -> DataRecord:
+        """
+        Retrieve item from persistence store using idempotency key and return it as a DataRecord instance.
+
+        Raises
+        ------
+        IdempotencyItemNotFoundError
+            Exception raised if no record exists in persistence store with the idempotency key
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _put_record(self, data_record: DataRecord) -> None:
+        """
+        Add a DataRecord to persistence store if it does not already exist with that key. Raise ItemAlreadyExists
+        if a non-expired entry already exists.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _update_record(self, data_record: DataRecord) -> None:
+        """
+        Update item in persistence store
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _delete_record(self, data_record: DataRecord) -> None:
+        """
+        Remove item from persistence store
+        """
+        raise NotImplementedError
@@ -3,6 +3,8 @@ from __future__ import annotations
 import datetime
 import logging
 import os
+import random
+import time
 from typing import TYPE_CHECKING, Any
 
 import boto3
@@ -28,6 +30,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# DynamoDB limits of items per request
+BATCH_GET_ITEM_MAX_KEYS = 100
+BATCH_WRITE_ITEM_MAX_ITEMS = 25
+TRANSACT_WRITE_ITEMS_MAX_ITEMS = 100
+
+# Attempts at unprocessed keys and items of bulk requests, e.g. when throttled, before falling back to single requests
+BATCH_MAX_ATTEMPTS = 3
+# Maximum delay before the second attempt, doubled for each of the following ones
+BATCH_BACKOFF_BASE_SECONDS = 0.05
+
+
+def _backoff(attempt: int) -> None:
+    """Wait before retrying unprocessed keys or items, with exponential backoff and full jitter, as AWS recommends"""
+    time.sleep(random.uniform(0, BATCH_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1)))  # nosec - jitter, not cryptography
+
 
 class DynamoDBPersistenceLayer(BasePersistenceLayer):
     def __init__(
@@ -183,6 +200,21 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
         return self._item_to_data_record(item)
 
     def _put_record(self, data_record: DataRecord) -> None:
+        try:
+            logger.debug(f"Putting record for idempotency key: {data_record.idempotency_key}")
+            self.client.put_item(**self._build_put_item_request(data_record))  # type: ignore[arg-type]
+        except ClientError as exc:
+            error_code = exc.response.get("Error", {}).get("Code")
+            if error_code == "ConditionalCheckFailedException":
+                raise self._build_item_already_exists_error(
+                    data_record=data_record,
+                    item=exc.response.get("Item"),  # type: ignore[arg-type]
+                ) from exc
+
+            raise
+
+    def _build_put_item_request(self, data_record: DataRecord) -> dict[str, Any]:
+        """Build a conditional put of an in progress record, for either PutItem or TransactWriteItems"""
         item = {
             # get simple or composite primary key
             **self._get_key(data_record.idempotency_key),
@@ -197,83 +229,79 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
             item[self.validation_key_attr] = {"S": data_record.payload_hash}
 
         now = datetime.datetime.now()
-        try:
-            logger.debug(f"Putting record for idempotency key: {data_record.idempotency_key}")
 
-            # |     LOCKED     |         RETRY if status = "INPROGRESS"                |     RETRY
-            # |----------------|-------------------------------------------------------|-------------> .... (time)
-            # |             Lambda                                              Idempotency Record
-            # |             Timeout                                                 Timeout
-            # |       (in_progress_expiry)                                          (expiry)
-
-            # Conditions to successfully save a record:
-
-            # The idempotency key does not exist:
-            #    - first time that this invocation key is used
-            #    - previous invocation with the same key was deleted due to TTL
-            idempotency_key_not_exist = "attribute_not_exists(#id)"
-
-            # The idempotency record exists but it's expired:
-            idempotency_expiry_expired = "#expiry < :now"
-
-            # The status of the record is "INPROGRESS", there is an in-progress expiry timestamp, but it's expired
-            inprogress_expiry_expired = " AND ".join(
-                [
-                    "#status = :inprogress",
-                    "attribute_exists(#in_progress_expiry)",
-                    "#in_progress_expiry < :now_in_millis",
-                ],
-            )
-
-            condition_expression = (
-                f"{idempotency_key_not_exist} OR {idempotency_expiry_expired} OR ({inprogress_expiry_expired})"
-            )
-
-            self.client.put_item(
-                TableName=self.table_name,
-                Item=item,
-                ConditionExpression=condition_expression,
-                ExpressionAttributeNames={
-                    "#id": self.key_attr,
-                    "#expiry": self.expiry_attr,
-                    "#in_progress_expiry": self.in_progress_expiry_attr,
-                    "#status": self.status_attr,
-                },
-                ExpressionAttributeValues={
-                    ":now": {"N": str(int(now.timestamp()))},
-                    ":now_in_millis": {"N": str(int(now.timestamp() * 1000))},
-                    ":inprogress": {"S": STATUS_CONSTANTS["INPROGRESS"]},
-                },
-                **self.return_value_on_condition,  # type: ignore[arg-type]
-            )
-        except ClientError as exc:
-            error_code = exc.response.get("Error", {}).get("Code")
-            if error_code == "ConditionalCheckFailedException":
-                try:
-                    item = exc.response["Item"]  # type: ignore[typeddict-item]
-                except KeyError:
-                    logger.debug(
-                        f"Failed to put record for already existing idempotency key: {data_record.idempotency_key}",
-                    )
-                    raise IdempotencyItemAlreadyExistsError() from exc
-                else:
-                    old_data_record = self._item_to_data_record(item)
-                    logger.debug(
-                        f"Failed to put record for already existing idempotency key: "
-                        f"{data_record.idempotency_key} with status: {old_data_record.status}, "
-                        f"expiry_timestamp: {old_data_record.expiry_timestamp}, "
-                        f"and in_progress_expiry_timestamp: {old_data_record.in_progress_expiry_timestamp}",
-                    )
-
-                    try:
-                        self._validate_payload(data_payload=data_record, stored_data_record=old_data_record)
-                        self._save_to_cache(data_record=old_data_record)
-                    except IdempotencyValidationError as idempotency_validation_error:
-                        raise idempotency_validation_error from exc
-
-                    raise IdempotencyItemAlreadyExistsError(old_data_record=old_data_record) from exc
+        # |     LOCKED     |         RETRY if status = "INPROGRESS"                |     RETRY
+        # |----------------|-------------------------------------------------------|-------------> .... (time)
+        # |             Lambda                                              Idempotency Record
+        # |             Timeout                                                 Timeout
+        # |       (in_progress_expiry)                                          (expiry)
+
+        # Conditions to successfully save a record:
+
+        # The idempotency key does not exist:
+        #    - first time that this invocation key is used
+        #    - previous invocation with the same key was deleted due to TTL
+        idempotency_key_not_exist = "attribute_not_exists(#id)"
+
+        # The idempotency record exists but it's expired:
+        idempotency_expiry_expired = "#expiry < :now"
+
+        # The status of the record is "INPROGRESS", there is an in-progress expiry timestamp, but it's expired
+        inprogress_expiry_expired = " AND ".join(
+            [
+                "#status = :inprogress",
+                "attribute_exists(#in_progress_expiry)",
+                "#in_progress_expiry < :now_in_millis",
+            ],
+        )
 
-            raise
+        condition_expression = (
+            f"{idempotency_key_not_exist} OR {idempotency_expiry_expired} OR ({inprogress_expiry_expired})"
+        )
+
+        return {
+            "TableName": self.table_name,
+            "Item": item,
+            "ConditionExpression": condition_expression,
+            "ExpressionAttributeNames": {
+                "#id": self.key_attr,
+                "#expiry": self.expiry_attr,
+                "#in_progress_expiry": self.in_progress_expiry_attr,
+                "#status": self.status_attr,
+            },
+            "ExpressionAttributeValues": {
+                ":now": {"N": str(int(now.timestamp()))},
+                ":now_in_millis": {"N": str(int(now.timestamp() * 1000))},
+                ":inprogress": {"S": STATUS_CONSTANTS["INPROGRESS"]},
+            },
+            **self.return_value_on_condition,
+        }
+
+    def _build_item_already_exists_error(
+        self,
+        data_record: DataRecord,
+        item: dict[str, Any] | None,
+    ) -> IdempotencyItemAlreadyExistsError | IdempotencyValidationError:
+        """Build the error of a conditional put that failed, with the existing item if DynamoDB returned it"""
+        if item is None:
+            logger.debug(f"Failed to put record for already existing idempotency key: {data_record.idempotency_key}")
+            return IdempotencyItemAlreadyExistsError()
+
+        old_data_record = self._item_to_data_record(item)
+        logger.debug(
+            f"Failed to put record for already existing idempotency key: "
+            f"{data_record.idempotency_key} with status: {old_data_record.status}, "
+            f"expiry_timestamp: {old_data_record.expiry_timestamp}, "
+            f"and in_progress_expiry_timestamp: {old_data_record.in_progress_expiry_timestamp}",
+        )
+
+        try:
+            self._validate_payload(data_payload=data_record, stored_data_record=old_data_record)
+            self._save_to_cache(data_record=old_data_record)
+        except IdempotencyValidationError as idempotency_validation_error:
+            return idempotency_validation_error
+
+        return IdempotencyItemAlreadyExistsError(old_data_record=old_data_record)
 
     @staticmethod
     def boto3_supports_condition_check_failure(boto3_version: str) -> bool:
@@ -324,3 +352,97 @@ class DynamoDBPersistenceLayer(BasePersistenceLayer):
     def _delete_record(self, data_record: DataRecord) -> None:
         logger.debug(f"Deleting record for idempotency key: {data_record.idempotency_key}")
         self.client.delete_item(TableName=self.table_name, Key={**self._get_key(data_record.idempotency_key)})
+
+    def _get_records(self, idempotency_keys: list[str]) -> dict[str, DataRecord]:
+        # BatchGetItem retrieves up to 100 items per request, with strongly consistent reads like _get_record
+        records: dict[str, DataRecord] = {}
+        for start in range(0, len(idempotency_keys), BATCH_GET_ITEM_MAX_KEYS):
+            request_keys = [
+                self._get_key(idempotency_key)
+                for idempotency_key in idempotency_keys[start : start + BATCH_GET_ITEM_MAX_KEYS]
+            ]
+            request_items: dict[str, Any] = {self.table_name: {"Keys": request_keys, "ConsistentRead": True}}
+
+            # Keys left unprocessed after a few attempts are treated as not found. It's safe, as records are only
+            # saved as in progress when they don't already exist, or expired.
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                if attempt:
+                    _backoff(attempt)
+                response = self.client.batch_get_item(RequestItems=request_items)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    record = self._item_to_data_record(item)
+                    records[self._get_idempotency_key_from_item(item)] = record
+
+                request_items = response.get("UnprocessedKeys") or {}  # type: ignore[assignment]
+                if not request_items:
+                    break
+
+        return records
+
+    def _put_records(self, data_records: list[DataRecord]) -> list[Exception | None]:
+        # BatchWriteItem doesn't support conditions, so records are put in transactions of up to 100 items instead.
+        # A transaction is cancelled as a whole when any condition fails, so only items whose condition didn't fail
+        # are put again, one at a time.
+        errors: list[Exception | None] = []
+        for start in range(0, len(data_records), TRANSACT_WRITE_ITEMS_MAX_ITEMS):
+            chunk = data_records[start : start + TRANSACT_WRITE_ITEMS_MAX_ITEMS]
+            transact_items = [{"Put": self._build_put_item_request(data_record)} for data_record in chunk]
+            try:
+                logger.debug(f"Putting {len(chunk)} records in a transaction")
+                self.client.transact_write_items(TransactItems=transact_items)  # type: ignore[arg-type]
+            except ClientError as exc:
+                if exc.response.get("Error", {}).get("Code") != "TransactionCanceledException":
+                    raise
+
+                reasons: list[dict[str, Any]] = exc.response.get("CancellationReasons", [])  # type: ignore[assignment]
+                reasons += [{}] * (len(chunk) - len(reasons))
+                for data_record, reason in zip(chunk, reasons):
+                    if reason.get("Code") == "ConditionalCheckFailed":
+                        errors.append(self._build_item_already_exists_error(data_record, reason.get("Item")))
+                    else:
+                        errors.extend(super()._put_records([data_record]))
+            else:
+                errors.extend([None] * len(chunk))
+
+        return errors
+
+    def _update_records(self, data_records: list[DataRecord]) -> None:
+        # BatchWriteItem replaces up to 25 items per request, instead of updating their attributes like _update_record.
+        # Attributes only set on in progress records, i.e. in_progress_expiry_attr, are dropped, which is safe as
+        # they're only checked while records are in progress. Attributes written outside of this layer are dropped too.
+        requests = [{"PutRequest": {"Item": self._build_completed_item(data_record)}} for data_record in data_records]
+        for start in range(0, len(requests), BATCH_WRITE_ITEM_MAX_ITEMS):
+            request_items: dict[str, Any] = {self.table_name: requests[start : start + BATCH_WRITE_ITEM_MAX_ITEMS]}
+            for attempt in range(BATCH_MAX_ATTEMPTS):
+                if attempt:
+                    _backoff(attempt)
+                logger.debug(f"Updating {len(request_items[self.table_name])} records in a batch")
+                response = self.client.batch_write_item(RequestItems=request_items)
+                request_items = response.get("UnprocessedItems") or {}  # type: ignore[assignment]
+                if not request_items:
+                    break
+            else:
+                unprocessed = {
+                    self._get_idempotency_key_from_item(request["PutRequest"]["Item"])
+                    for request in request_items.get(self.table_name, [])
+                }
+                super()._update_records(
+                    [data_record for data_record in data_records if data_record.idempotency_key in unprocessed],
+                )
+
+    def _build_completed_item(self, data_record: DataRecord) -> dict[str, AttributeValueTypeDef]:
+        item: dict[str, AttributeValueTypeDef] = {
+            **self._get_key(data_record.idempotency_key),
+            self.expiry_attr: {"N": str(data_record.expiry_timestamp)},
+            self.data_attr: {"S": data_record.response_data},
+            self.status_attr: {"S": data_record.status},
+        }
+
+        if self.payload_validation_enabled:
+            item[self.validation_key_attr] = {"S": data_record.payload_hash}
+
+        return item
+
+    def _get_idempotency_key_from_item(self, item: dict[str, Any]) -> str:
+        """Idempotency key of a raw item, stored in the sort key when using a composite primary key"""
+        return item[self.sort_key_attr or self.key_attr]["S"]
@@ -0,0 +1,162 @@
+"""
+In-memory cache of idempotency records
+"""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import DataRecord
+
+
+class LocalCache:
+    """
+    In-memory cache of idempotency records, bounded by number of records, and optionally by their approximate size.
+
+    The least recently used records are evicted first when the cache is full, and expired records are evicted as
+    soon as they expire.
+
+    Pass the same instance to the IdempotencyConfig of several functions, e.g. using the same table, to share a
+    single memory budget between their persistence layers.
+
+    Example
+    -------
+
+    ## Share a 10 MB cache between persistence layers
+
+    ```python
+    from aws_lambda_powertools.utilities.idempotency import (
+        DynamoDBPersistenceLayer,
+        IdempotencyConfig,
+        LocalCache,
+        idempotent_function,
+    )
+
+    local_cache = LocalCache(max_items=1024, max_bytes=10 * 1024 * 1024)
+    config = IdempotencyConfig(use_local_cache=True, local_cache=local_cache)
+    orders = DynamoDBPersistenceLayer(table_name="IdempotencyTable")
+    payments = DynamoDBPersistenceLayer(table_name="IdempotencyTable")
+
+
+    @idempotent_function(data_keyword_argument="order", config=config, persistence_store=orders)
+    def process_order(order: dict):
+        ...
+
+
+    @idempotent_function(data_keyword_argument="payment", config=config, persistence_store=payments)
+    def process_payment(payment: dict):
+        ...
+    ```
+    """
+
+    def __init__(self, max_items: int = 256, max_bytes: int | None = None):
+        """
+        Parameters
+        ----------
+        max_items: int
+            Max number of records to store, by default 256
+        max_bytes: int | None
+            Max approximate size of records to store, in bytes, by default unbounded.
+            Records larger than max_bytes on their own aren't cached.
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.size_in_bytes = 0
+
+        self._records: OrderedDict[str, tuple[DataRecord, int]] = OrderedDict()
+        # Min-heap of (expiry_timestamp, idempotency_key), entries of replaced or evicted records are skipped
+        self._expirations: list[tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def get(self, idempotency_key: str) -> DataRecord | None:
+        """
+        Get a record that hasn't expired, marking it as the most recently used
+        """
+        with self._lock:
+            self._evict_expired()
+
+            entry = self._records.get(idempotency_key)
+            if entry is None:
+                return None
+
+            self._records.move_to_end(idempotency_key)
+            return entry[0]
+
+    def put(self, data_record: DataRecord) -> None:
+        """
+        Add or replace a record, evicting expired and least recently used records when the cache is full
+        """
+        size = self._get_size(data_record)
+        idempotency_key = data_record.idempotency_key
+
+        with self._lock:
+            self._remove(idempotency_key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+
+            self._records[idempotency_key] = (data_record, size)
+            self.size_in_bytes += size
+            if data_record.expiry_timestamp:
+                heapq.heappush(self._expirations, (data_record.expiry_timestamp, idempotency_key))
+
+            self._evict_expired()
+            while len(self._records) > self.max_items or (
+                self.max_bytes is not None and self.size_in_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._records)))
+
+            self._compact_expirations()
+
+    def delete(self, idempotency_key: str) -> None:
+        """
+        Remove a record, if cached
+        """
+        with self._lock:
+            self._remove(idempotency_key)
+
+    def __contains__(self, idempotency_key: object) -> bool:
+        with self._lock:
+            self._evict_expired()
+            return idempotency_key in self._records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _remove(self, idempotency_key: str) -> None:
+        entry = self._records.pop(idempotency_key, None)
+        if entry is not None:
+            self.size_in_bytes -= entry[1]
+
+    def _evict_expired(self) -> None:
+        now = int(datetime.datetime.now().timestamp())
+        while self._expirations and self._expirations[0][0] < now:
+            expiry_timestamp, idempotency_key = heapq.heappop(self._expirations)
+            entry = self._records.get(idempotency_key)
+            # The record may have been replaced since, by one expiring later
+            if entry is not None and entry[0].expiry_timestamp == expiry_timestamp:
+                self._remove(idempotency_key)
+
+    def _compact_expirations(self) -> None:
+        # Entries of records evicted before they expire pile up, e.g. when many records are evicted by size
+        if len(self._expirations) > 2 * len(self._records) + 64:
+            self._expirations = [
+                (record.expiry_timestamp, key) for key, (record, _) in self._records.items() if record.expiry_timestamp
+            ]
+            heapq.heapify(self._expirations)
+
+    @staticmethod
+    def _get_size(data_record: DataRecord) -> int:
+        """Approximate memory used by a record, dominated by its response data for larger responses"""
+        return (
+            sys.getsizeof(data_record)
+            + sys.getsizeof(data_record.__dict__)
+            + sys.getsizeof(data_record.idempotency_key)
+            + sys.getsizeof(data_record.response_data or "")
+            + sys.getsizeof(data_record.payload_hash or "")
+        )
@@ -16,14 +16,50 @@ from aws_lambda_powertools.utilities.idempotency.exceptions import (
     IdempotencyPersistenceConfigError,
     IdempotencyPersistenceConnectionError,
     IdempotencyPersistenceConsistencyError,
+    IdempotencyValidationError,
 )
 from aws_lambda_powertools.utilities.idempotency.persistence.base import (
     STATUS_CONSTANTS,
+    AsyncBasePersistenceLayer,
     DataRecord,
+    _BasePersistenceLayer,
 )
 
 logger = logging.getLogger(__name__)
 
+# Saves an in progress record unless a valid one exists, taking over orphan records, in a single round trip.
+# Returns the existing record if it's completed and not expired, or in progress and not timed out, otherwise nil.
+#
+# KEYS[1]: idempotency key
+# ARGV[1]: in progress record, ARGV[2]: TTL in seconds
+# ARGV[3]: current timestamp in seconds, ARGV[4]: current timestamp in milliseconds
+# ARGV[5]: status attribute, ARGV[6]: expiry attribute, ARGV[7]: in progress expiry attribute
+# ARGV[8]: completed status, ARGV[9]: in progress status
+CLAIM_IN_PROGRESS_SCRIPT = """
+if redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[2], "NX") then
+    return false
+end
+
+local existing = redis.call("GET", KEYS[1])
+local decoded, item = pcall(cjson.decode, existing)
+if decoded and type(item) == "table" then
+    local status = item[ARGV[5]]
+    local expiry = tonumber(item[ARGV[6]])
+    local in_progress_expiry = tonumber(item[ARGV[7]])
+
+    if status == ARGV[8] and not (expiry and tonumber(ARGV[3]) > expiry) then
+        return existing
+    end
+    if status == ARGV[9] and in_progress_expiry and in_progress_expiry > tonumber(ARGV[4]) then
+        return existing
+    end
+end
+
+-- Orphan record: timed out while in progress, expired but not evicted yet, or corrupted
+redis.call("SET", KEYS[1], ARGV[1], "EX", ARGV[2])
+return false
+"""
+
 
 class RedisClientProtocol(Protocol):
     """
@@ -78,6 +114,33 @@ class RedisClientProtocol(Protocol):
         raise NotImplementedError
 
 
+class AsyncRedisClientProtocol(Protocol):
+    """
+    Protocol class defining the interface for an asyncio Redis client, e.g. redis.asyncio.Redis.
+
+    Unlike RedisClientProtocol, register_script is required, as in progress records are saved with a Lua script.
+    """
+
+    async def get(self, name: bytes | str | memoryview) -> bytes | str | None:
+        raise NotImplementedError
+
+    async def set(  # noqa
+        self,
+        name: str | bytes,
+        value: bytes | float | str,
+        ex: float | timedelta | None = ...,
+        px: float | timedelta | None = ...,
+        nx: bool = ...,
+    ) -> bool | None:
+        raise NotImplementedError
+
+    async def delete(self, keys: bytes | str | memoryview) -> Any:
+        raise NotImplementedError
+
+    def register_script(self, script: str) -> Any:
+        raise NotImplementedError
+
+
 class RedisConnection:
     def __init__(
         self,
@@ -89,6 +152,9 @@ class RedisConnection:
         db_index: int = 0,
         mode: Literal["standalone", "cluster"] = "standalone",
         ssl: bool = True,
+        max_connections: int | None = None,
+        socket_keepalive: bool = False,
+        health_check_interval: int = 0,
     ) -> None:
         """
         Initialize Redis connection which will be used in Redis persistence_store to support Idempotency
@@ -111,6 +177,12 @@ class RedisConnection:
             set Redis client mode, choose from standalone/cluster. The default is standalone
         ssl: bool, optional: default True
             set whether to use ssl for Redis connection
+        max_connections: int, optional
+            Max number of connections in the connection pool, per node in cluster mode. Unbounded by default
+        socket_keepalive: bool, optional: default False
+            set whether to enable TCP keepalive on connections, so idle pooled connections aren't dropped silently
+        health_check_interval: int, optional: default 0
+            Seconds a connection can be idle before checking it's still alive before using it, 0 to disable
 
         Examples
         --------
@@ -168,6 +240,9 @@ class RedisConnection:
         self.db_index = db_index
         self.ssl = ssl
         self.mode = mode
+        self.max_connections = max_connections
+        self.socket_keepalive = socket_keepalive
+        self.health_check_interval = health_check_interval
 
     def _init_client(self) -> RedisClientProtocol:
         logger.debug(f"Trying to connect to Redis: {self.host}")
@@ -179,10 +254,39 @@ class RedisConnection:
         else:
             raise IdempotencyPersistenceConfigError(f"Mode {self.mode} not supported")
 
+        return self._connect(client)
+
+    def _init_async_client(self) -> AsyncRedisClientProtocol:
+        logger.debug(f"Trying to connect to Redis with an asyncio client: {self.host}")
+        # Imported on demand, as most functions only use the synchronous client
+        from redis import asyncio as redis_asyncio
+
+        client: type[redis_asyncio.Redis | redis_asyncio.RedisCluster]
+        if self.mode == "standalone":
+            client = redis_asyncio.Redis
+        elif self.mode == "cluster":
+            client = redis_asyncio.RedisCluster
+        else:
+            raise IdempotencyPersistenceConfigError(f"Mode {self.mode} not supported")
+
+        return self._connect(client)
+
+    def _get_pool_params(self) -> dict[str, Any]:
+        # Only set when configured, so the client defaults apply otherwise
+        pool_params: dict[str, Any] = {}
+        if self.max_connections is not None:
+            pool_params["max_connections"] = self.max_connections
+        if self.socket_keepalive:
+            pool_params["socket_keepalive"] = self.socket_keepalive
+        if self.health_check_interval:
+            pool_params["health_check_interval"] = self.health_check_interval
+        return pool_params
+
+    def _connect(self, client: Any) -> Any:
         try:
             if self.url:
                 logger.debug(f"Using URL format to connect to Redis: {self.host}")
-                return client.from_url(url=self.url)
+                return client.from_url(url=self.url, **self._get_pool_params())
             else:
                 # Redis in cluster mode doesn't support db parameter
                 extra_param_connection: dict[str, Any] = {}
@@ -198,13 +302,152 @@ class RedisConnection:
                     decode_responses=True,
                     ssl=self.ssl,
                     **extra_param_connection,
+                    **self._get_pool_params(),
                 )
         except redis.exceptions.ConnectionError as exc:
             logger.debug(f"Cannot connect in Redis: {self.host}")
             raise IdempotencyPersistenceConnectionError("Could not to connect to Redis", exc) from exc
 
 
-class RedisCachePersistenceLayer(BasePersistenceLayer):
+class _BaseRedisCachePersistenceLayer(_BasePersistenceLayer):
+    """
+    Mapping between Redis values and idempotency records, shared by synchronous and asyncio Redis persistence layers
+    """
+
+    client: Any
+
+    def __init__(
+        self,
+        in_progress_expiry_attr: str = "in_progress_expiration",
+        expiry_attr: str = "expiration",
+        status_attr: str = "status",
+        data_attr: str = "data",
+        validation_key_attr: str = "validation",
+    ):
+        self.in_progress_expiry_attr = in_progress_expiry_attr
+        self.expiry_attr = expiry_attr
+        self.status_attr = status_attr
+        self.data_attr = data_attr
+        self.validation_key_attr = validation_key_attr
+        self._json_serializer = json.dumps
+        self._json_deserializer = json.loads
+        self._claim_script: Any = None
+        super().__init__()
+
+    def _get_expiry_second(self, expiry_timestamp: int | None = None) -> int:
+        """
+        Calculates the number of seconds remaining until a specified expiry time
+        """
+        if expiry_timestamp:
+            return expiry_timestamp - int(datetime.datetime.now().timestamp())
+        return self.expires_after_seconds
+
+    def _item_to_data_record(self, idempotency_key: str, item: dict[str, Any]) -> DataRecord:
+        in_progress_expiry_timestamp = item.get(self.in_progress_expiry_attr)
+
+        return DataRecord(
+            idempotency_key=idempotency_key,
+            status=item[self.status_attr],
+            in_progress_expiry_timestamp=in_progress_expiry_timestamp,
+            response_data=str(item.get(self.data_attr)),
+            payload_hash=str(item.get(self.validation_key_attr)),
+            expiry_timestamp=item.get("expiration", None),
+        )
+
+    def _response_to_data_record(self, idempotency_key: str, response: bytes | str | None) -> DataRecord:
+        # key not found
+        if not response:
+            raise IdempotencyItemNotFoundError
+
+        try:
+            item = self._json_deserializer(response)
+        except json.JSONDecodeError:
+            # Json decoding error is considered an Consistency error. This scenario will also introduce possible
+            # race condition just like Orphan record does. As two lambda handlers is possible to reach this line
+            # of code almost simultaneously. If we simply regard this record as non-valid record. The two lambda
+            # handlers will both start the overwrite process without knowing each other. Causing this value being
+            # overwritten twice (ultimately two Lambda Handlers will both be executed, which is against idempotency).
+            # So this case should also be handled by the error handling in IdempotencyPersistenceConsistencyError
+            # part to avoid the possible race condition.
+
+            raise IdempotencyPersistenceConsistencyError
+
+        return self._item_to_data_record(idempotency_key, item)
+
+    def _build_in_progress_mapping(self, data_record: DataRecord) -> dict[str, Any]:
+        mapping: dict[str, Any] = {
+            self.status_attr: data_record.status,
+            self.expiry_attr: data_record.expiry_timestamp,
+        }
+
+        if data_record.in_progress_expiry_timestamp is not None:
+            mapping[self.in_progress_expiry_attr] = data_record.in_progress_expiry_timestamp
+
+        if self.payload_validation_enabled:
+            mapping[self.validation_key_attr] = data_record.payload_hash
+
+        return mapping
+
+    def _build_completed_mapping(self, data_record: DataRecord) -> dict[str, Any]:
+        return {
+            self.data_attr: data_record.response_data,
+            self.status_attr: data_record.status,
+            self.expiry_attr: data_record.expiry_timestamp,
+        }
+
+    def _supports_scripts(self) -> bool:
+        # Clients only implementing RedisClientProtocol save in progress records with SET NX, and a lock for orphans
+        return hasattr(self.client, "register_script")
+
+    def _get_claim_script(self) -> Any:
+        """
+        Get the claim script, registered once per persistence layer.
+
+        Scripts are called with EVALSHA, and loaded with SCRIPT LOAD the first time Redis doesn't know about them.
+        """
+        if self._claim_script is None:
+            self._claim_script = self.client.register_script(CLAIM_IN_PROGRESS_SCRIPT)
+        return self._claim_script
+
+    def _build_claim_args(self, data_record: DataRecord) -> list[Any]:
+        now = datetime.datetime.now()
+        return [
+            self._json_serializer(self._build_in_progress_mapping(data_record)),
+            self._get_expiry_second(expiry_timestamp=data_record.expiry_timestamp),
+            int(now.timestamp()),
+            int(now.timestamp() * 1000),
+            self.status_attr,
+            self.expiry_attr,
+            self.in_progress_expiry_attr,
+            STATUS_CONSTANTS["COMPLETED"],
+            STATUS_CONSTANTS["INPROGRESS"],
+        ]
+
+    def _build_claim_error(
+        self,
+        data_record: DataRecord,
+        existing_item: bytes | str | None,
+    ) -> IdempotencyItemAlreadyExistsError | IdempotencyValidationError | None:
+        """Build the error of a claim that failed, with the existing record returned by the claim script"""
+        if not existing_item:
+            return None
+
+        old_data_record = self._item_to_data_record(data_record.idempotency_key, self._json_deserializer(existing_item))
+        logger.debug(
+            f"Failed to put record for already existing idempotency key: "
+            f"{data_record.idempotency_key} with status: {old_data_record.status}",
+        )
+
+        try:
+            self._validate_payload(data_payload=data_record, stored_data_record=old_data_record)
+            self._save_to_cache(data_record=old_data_record)
+        except IdempotencyValidationError as idempotency_validation_error:
+            return idempotency_validation_error
+
+        return IdempotencyItemAlreadyExistsError(old_data_record=old_data_record)
+
+
+class RedisCachePersistenceLayer(_BaseRedisCachePersistenceLayer, BasePersistenceLayer):
     def __init__(
         self,
         url: str = "",
@@ -221,6 +464,9 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
         status_attr: str = "status",
         data_attr: str = "data",
         validation_key_attr: str = "validation",
+        max_connections: int | None = None,
+        socket_keepalive: bool = False,
+        health_check_interval: int = 0,
     ):
         """
         Initialize the Redis Persistence Layer
@@ -256,6 +502,12 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
             Redis json attribute name for response data, by default "data"
         validation_key_attr: str, optional
             Redis json attribute name for hashed representation of the parts of the event used for validation
+        max_connections: int, optional
+            Max number of connections in the connection pool, per node in cluster mode. Unbounded by default
+        socket_keepalive: bool, optional: default False
+            set whether to enable TCP keepalive on connections, so idle pooled connections aren't dropped silently
+        health_check_interval: int, optional: default 0
+            Seconds a connection can be idle before checking it's still alive before using it, 0 to disable
 
         Examples
         --------
@@ -299,78 +551,51 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
                 url=url,
                 mode=mode,
                 ssl=ssl,
+                max_connections=max_connections,
+                socket_keepalive=socket_keepalive,
+                health_check_interval=health_check_interval,
             )._init_client()
         else:
             self.client = client
 
-        self.in_progress_expiry_attr = in_progress_expiry_attr
-        self.expiry_attr = expiry_attr
-        self.status_attr = status_attr
-        self.data_attr = data_attr
-        self.validation_key_attr = validation_key_attr
-        self._json_serializer = json.dumps
-        self._json_deserializer = json.loads
-        super().__init__()
-        self._orphan_lock_timeout = min(10, self.expires_after_seconds)
-
-    def _get_expiry_second(self, expiry_timestamp: int | None = None) -> int:
-        """
-        Calculates the number of seconds remaining until a specified expiry time
-        """
-        if expiry_timestamp:
-            return expiry_timestamp - int(datetime.datetime.now().timestamp())
-        return self.expires_after_seconds
-
-    def _item_to_data_record(self, idempotency_key: str, item: dict[str, Any]) -> DataRecord:
-        in_progress_expiry_timestamp = item.get(self.in_progress_expiry_attr)
-
-        return DataRecord(
-            idempotency_key=idempotency_key,
-            status=item[self.status_attr],
-            in_progress_expiry_timestamp=in_progress_expiry_timestamp,
-            response_data=str(item.get(self.data_attr)),
-            payload_hash=str(item.get(self.validation_key_attr)),
-            expiry_timestamp=item.get("expiration", None),
+        super().__init__(
+            in_progress_expiry_attr=in_progress_expiry_attr,
+            expiry_attr=expiry_attr,
+            status_attr=status_attr,
+            data_attr=data_attr,
+            validation_key_attr=validation_key_attr,
         )
+        self._orphan_lock_timeout = min(10, self.expires_after_seconds)
 
     def _get_record(self, idempotency_key) -> DataRecord:
         # See: https://redis.io/commands/get/
         response = self.client.get(idempotency_key)
+        return self._response_to_data_record(idempotency_key, response)
 
-        # key not found
-        if not response:
-            raise IdempotencyItemNotFoundError
-
-        try:
-            item = self._json_deserializer(response)
-        except json.JSONDecodeError:
-            # Json decoding error is considered an Consistency error. This scenario will also introduce possible
-            # race condition just like Orphan record does. As two lambda handlers is possible to reach this line
-            # of code almost simultaneously. If we simply regard this record as non-valid record. The two lambda
-            # handlers will both start the overwrite process without knowing each other. Causing this value being
-            # overwritten twice (ultimately two Lambda Handlers will both be executed, which is against idempotency).
-            # So this case should also be handled by the error handling in IdempotencyPersistenceConsistencyError
-            # part to avoid the possible race condition.
-
-            raise IdempotencyPersistenceConsistencyError
+    def _claim_in_progress_record(self, data_record: DataRecord) -> None:
+        """
+        Save an in progress record with the claim script, so checking for an existing record, and taking over
+        orphan records, takes a single round trip.
+        """
+        logger.debug(f"Claiming record on Redis for idempotency key: {data_record.idempotency_key}")
+        existing_item = self._get_claim_script()(
+            keys=[data_record.idempotency_key],
+            args=self._build_claim_args(data_record),
+        )
 
-        return self._item_to_data_record(idempotency_key, item)
+        error = self._build_claim_error(data_record, existing_item)
+        if error is not None:
+            raise error
 
     def _put_in_progress_record(self, data_record: DataRecord) -> None:
+        if self._supports_scripts():
+            return self._claim_in_progress_record(data_record=data_record)
+
         item: dict[str, Any] = {
             "name": data_record.idempotency_key,
-            "mapping": {
-                self.status_attr: data_record.status,
-                self.expiry_attr: data_record.expiry_timestamp,
-            },
+            "mapping": self._build_in_progress_mapping(data_record),
         }
 
-        if data_record.in_progress_expiry_timestamp is not None:
-            item["mapping"][self.in_progress_expiry_attr] = data_record.in_progress_expiry_timestamp
-
-        if self.payload_validation_enabled:
-            item["mapping"][self.validation_key_attr] = data_record.payload_hash
-
         now = datetime.datetime.now()
         try:
             # |     LOCKED     |         RETRY if status = "INPROGRESS"                |     RETRY
@@ -482,11 +707,7 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
     def _update_record(self, data_record: DataRecord) -> None:
         item: dict[str, Any] = {
             "name": data_record.idempotency_key,
-            "mapping": {
-                self.data_attr: data_record.response_data,
-                self.status_attr: data_record.status,
-                self.expiry_attr: data_record.expiry_timestamp,
-            },
+            "mapping": self._build_completed_mapping(data_record),
         }
         logger.debug(f"Updating record for idempotency key: {data_record.idempotency_key}")
         encoded_item = self._json_serializer(item["mapping"])
@@ -508,3 +729,244 @@ class RedisCachePersistenceLayer(BasePersistenceLayer):
 
         # See: https://redis.io/commands/del/
         self.client.delete(data_record.idempotency_key)
+
+    def _get_records(self, idempotency_keys: list[str]) -> dict[str, DataRecord]:
+        # Pipelined GETs take a single round trip, like MGET, but also work across slots in cluster mode
+        if not hasattr(self.client, "pipeline"):
+            return super()._get_records(idempotency_keys=idempotency_keys)
+
+        pipeline = self.client.pipeline(transaction=False)
+        for idempotency_key in idempotency_keys:
+            pipeline.get(idempotency_key)
+
+        records: dict[str, DataRecord] = {}
+        for idempotency_key, response in zip(idempotency_keys, pipeline.execute()):
+            if not response:
+                continue
+
+            try:
+                item = self._json_deserializer(response)
+            except json.JSONDecodeError:
+                # Corrupted records are treated as not found, and handled as orphan records when saving them
+                logger.debug(f"Ignoring corrupted record for idempotency key: {idempotency_key}")
+                continue
+
+            records[idempotency_key] = self._item_to_data_record(idempotency_key, item)
+
+        return records
+
+    def _put_records(self, data_records: list[DataRecord]) -> list[Exception | None]:
+        if not hasattr(self.client, "pipeline"):
+            return super()._put_records(data_records=data_records)
+
+        pipeline = self.client.pipeline(transaction=False)
+
+        # Pipelined claim scripts save all records in a single round trip, whether they exist already or not.
+        # Cluster pipelines can't load scripts before executing them, so they put records without scripts.
+        if self._supports_scripts() and isinstance(pipeline, redis.client.Pipeline):
+            claim_script = self._get_claim_script()
+            for data_record in data_records:
+                claim_script(
+                    keys=[data_record.idempotency_key],
+                    args=self._build_claim_args(data_record),
+                    client=pipeline,
+                )
+
+            return [
+                self._build_claim_error(data_record, existing_item)
+                for data_record, existing_item in zip(data_records, pipeline.execute())
+            ]
+
+        # Records that don't exist yet are set in a single round trip. Others are put one at a time, to tell
+        # completed and in progress records from orphan records.
+        for data_record in data_records:
+            pipeline.set(
+                name=data_record.idempotency_key,
+                value=self._json_serializer(self._build_in_progress_mapping(data_record)),
+                ex=self._get_expiry_second(expiry_timestamp=data_record.expiry_timestamp),
+                nx=True,
+            )
+
+        errors: list[Exception | None] = []
+        for data_record, response in zip(data_records, pipeline.execute()):
+            errors.extend([None] if response else super()._put_records([data_record]))
+
+        return errors
+
+    def _update_records(self, data_records: list[DataRecord]) -> None:
+        if not hasattr(self.client, "pipeline"):
+            return super()._update_records(data_records=data_records)
+
+        logger.debug(f"Updating {len(data_records)} records in a pipeline")
+        pipeline = self.client.pipeline(transaction=False)
+        for data_record in data_records:
+            pipeline.set(
+                name=data_record.idempotency_key,
+                value=self._json_serializer(self._build_completed_mapping(data_record)),
+                ex=self._get_expiry_second(data_record.expiry_timestamp),
+            )
+        pipeline.execute()
+
+
+class AsyncRedisCachePersistenceLayer(_BaseRedisCachePersistenceLayer, AsyncBasePersistenceLayer):
+    def __init__(
+        self,
+        url: str = "",
+        host: str = "",
+        port: int = 6379,
+        username: str = "",
+        password: str = "",  # nosec - password for Redis connection
+        db_index: int = 0,
+        mode: Literal["standalone", "cluster"] = "standalone",
+        ssl: bool = True,
+        client: AsyncRedisClientProtocol | None = None,
+        in_progress_expiry_attr: str = "in_progress_expiration",
+        expiry_attr: str = "expiration",
+        status_attr: str = "status",
+        data_attr: str = "data",
+        validation_key_attr: str = "validation",
+        max_connections: int | None = None,
+        socket_keepalive: bool = False,
+        health_check_interval: int = 0,
+    ):
+        """
+        Initialize the asyncio Redis Persistence Layer, for idempotent coroutine functions
+
+        Commands are sent with an asyncio client, using a connection from its pool, so concurrent coroutines, e.g.
+        records processed by AsyncBatchProcessor, don't wait for each other's commands. Records are stored the same
+        way as with RedisCachePersistenceLayer, so both layers can be used with the same Redis database.
+
+        Parameters
+        ----------
+        host: str, optional
+            Redis host
+        port: int, optional: default 6379
+            Redis port
+        username: str, optional
+            Redis username
+        password: str, optional
+            Redis password
+        url: str, optional
+            Redis connection string, using url will override the host/port in the previous parameters
+        db_index: int, optional: default 0
+            Redis db index
+        mode: str, Literal["standalone","cluster"]
+            set Redis client mode, choose from standalone/cluster
+        ssl: bool, optional: default True
+            set whether to use ssl for Redis connection
+        client: AsyncRedisClientProtocol, optional
+            Bring your own asyncio Redis client that follows AsyncRedisClientProtocol, e.g. redis.asyncio.Redis.
+            If provided, all other connection configuration options will be ignored
+        expiry_attr: str, optional
+            Redis json attribute name for expiry timestamp, by default "expiration"
+        in_progress_expiry_attr: str, optional
+            Redis json attribute name for in-progress expiry timestamp, by default "in_progress_expiration"
+        status_attr: str, optional
+            Redis json attribute name for status, by default "status"
+        data_attr: str, optional
+            Redis json attribute name for response data, by default "data"
+        validation_key_attr: str, optional
+            Redis json attribute name for hashed representation of the parts of the event used for validation
+        max_connections: int, optional
+            Max number of connections in the connection pool, per node in cluster mode. Unbounded by default
+        socket_keepalive: bool, optional: default False
+            set whether to enable TCP keepalive on connections, so idle pooled connections aren't dropped silently
+        health_check_interval: int, optional: default 0
+            Seconds a connection can be idle before checking it's still alive before using it, 0 to disable
+
+        Examples
+        --------
+
+        ```python
+        from aws_lambda_powertools.utilities.batch import AsyncBatchProcessor, EventType, async_process_partial_response
+        from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+        from aws_lambda_powertools.utilities.idempotency import IdempotencyConfig, idempotent_function
+        from aws_lambda_powertools.utilities.idempotency.persistence.redis import AsyncRedisCachePersistenceLayer
+        from aws_lambda_powertools.utilities.typing import LambdaContext
+
+        processor = AsyncBatchProcessor(event_type=EventType.SQS)
+        persistence_layer = AsyncRedisCachePersistenceLayer(host="localhost", port=6379, max_connections=10)
+        config = IdempotencyConfig(event_key_jmespath="messageId")
+
+
+        @idempotent_function(data_keyword_argument="record", config=config, persistence_store=persistence_layer)
+        async def process_record(record: dict):
+            ...
+
+
+        async def record_handler(record: SQSRecord):
+            return await process_record(record=record.raw_event)
+
+
+        def lambda_handler(event: dict, context: LambdaContext):
+            config.register_lambda_context(context)
+            return async_process_partial_response(
+                event=event,
+                record_handler=record_handler,
+                processor=processor,
+                context=context,
+            )
+        ```
+        """
+
+        # Initialize Redis client with Redis config if no client is passed in
+        if client is None:
+            self.client = RedisConnection(
+                host=host,
+                port=port,
+                username=username,
+                password=password,
+                db_index=db_index,
+                url=url,
+                mode=mode,
+                ssl=ssl,
+                max_connections=max_connections,
+                socket_keepalive=socket_keepalive,
+                health_check_interval=health_check_interval,
+            )._init_async_client()
+        else:
+            self.client = client
+
+        super().__init__(
+            in_progress_expiry_attr=in_progress_expiry_attr,
+            expiry_attr=expiry_attr,
+            status_attr=status_attr,
+            data_attr=data_attr,
+            validation_key_attr=validation_key_attr,
+        )
+
+    async def _get_record(self, idempotency_key) -> DataRecord:
+        # See: https://redis.io/commands/get/
+        response = await self.client.get(idempotency_key)
+        return self._response_to_data_record(idempotency_key, response)
+
+    async def _put_record(self, data_record: DataRecord) -> None:
+        if data_record.status != STATUS_CONSTANTS["INPROGRESS"]:
+            # current this function only support set in_progress. set complete should use update_record
+            raise NotImplementedError
+
+        # Claims the record, checking for an existing record and taking over orphan records, in a single round trip
+        logger.debug(f"Claiming record on Redis for idempotency key: {data_record.idempotency_key}")
+        existing_item = await self._get_claim_script()(
+            keys=[data_record.idempotency_key],
+            args=self._build_claim_args(data_record),
+        )
+
+        error = self._build_claim_error(data_record, existing_item)
+        if error is not None:
+            raise error
+
+    async def _update_record(self, data_record: DataRecord) -> None:
+        logger.debug(f"Updating record for idempotency key: {data_record.idempotency_key}")
+        # need to set ttl again, if we don't set ex here the record will not have a ttl
+        await self.client.set(
+            name=data_record.idempotency_key,
+            value=self._json_serializer(self._build_completed_mapping(data_record)),
+            ex=self._get_expiry_second(data_record.expiry_timestamp),
+        )
+
+    async def _delete_record(self, data_record: DataRecord) -> None:
+        logger.debug(f"Deleting record for idempotency key: {data_record.idempotency_key}")
+
+        # See: https://redis.io/commands/del/
+        await self.client.delete(data_record.idempotency_key)
@@ -4,15 +4,18 @@ import base64
 import gzip
 import json
 import logging
+import threading
 import warnings
 from typing import Any
 
 import jmespath
 from jmespath.exceptions import LexerError
 from jmespath.functions import Functions, signature
+from jmespath.visitor import TreeInterpreter
 from typing_extensions import deprecated
 
 from aws_lambda_powertools.exceptions import InvalidEnvelopeExpressionError
+from aws_lambda_powertools.shared.cache_dict import LRUDict
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 logger = logging.getLogger(__name__)
@@ -35,6 +38,66 @@ class PowertoolsFunctions(Functions):
         return uncompressed.decode()
 
 
+# Compiled expressions shared by every utility evaluating JMESPath, keyed by expression and options
+COMPILED_EXPRESSIONS_MAX_ITEMS = 256
+_compiled_expressions: LRUDict = LRUDict(max_items=COMPILED_EXPRESSIONS_MAX_ITEMS)
+_compiled_expressions_lock = threading.Lock()
+_default_functions = PowertoolsFunctions()
+
+
+class CompiledExpression:
+    """JMESPath expression parsed once, and evaluated with the same options and interpreter on every search
+
+    Parameters
+    ----------
+    expression : str
+        JMESPath expression
+    jmespath_options : dict | None
+        Alternative JMESPath options, by default Powertools built-in functions
+    """
+
+    def __init__(self, expression: str, jmespath_options: dict | None = None):
+        self.expression = expression
+        self._parsed = jmespath.compile(expression)
+        options = jmespath.Options(**(jmespath_options or {"custom_functions": _default_functions}))
+        self._interpreter = TreeInterpreter(options)
+
+    def search(self, data: Any) -> Any:
+        return self._interpreter.visit(self._parsed.parsed, data)
+
+
+def compile_expression(expression: str, jmespath_options: dict | None = None) -> CompiledExpression:
+    """Compiles a JMESPath expression, or reuses it when it was compiled before with the same options
+
+    Parameters
+    ----------
+    expression : str
+        JMESPath expression
+    jmespath_options : dict | None
+        Alternative JMESPath options, by default Powertools built-in functions
+
+    Returns
+    -------
+    CompiledExpression
+        Compiled expression, cached up to COMPILED_EXPRESSIONS_MAX_ITEMS expressions
+    """
+    cache_key = (expression, tuple(sorted(jmespath_options.items())) if jmespath_options else None)
+    try:
+        hash(cache_key)
+    except TypeError:
+        # Options with unhashable values can't be told apart, so the expression isn't cached
+        return CompiledExpression(expression, jmespath_options)
+
+    with _compiled_expressions_lock:
+        compiled_expression = _compiled_expressions.get(cache_key)
+    if compiled_expression is None:
+        compiled_expression = CompiledExpression(expression, jmespath_options)
+        with _compiled_expressions_lock:
+            _compiled_expressions[cache_key] = compiled_expression
+
+    return compiled_expression
+
+
 def query(data: dict | str, envelope: str, jmespath_options: dict | None = None) -> Any:
     """Searches and extracts data using JMESPath
 
@@ -72,12 +135,9 @@ def query(data: dict | str, envelope: str, jmespath_options: dict | None = None)
     Any
         Data found using JMESPath expression given in envelope
     """
-    if not jmespath_options:
-        jmespath_options = {"custom_functions": PowertoolsFunctions()}
-
     try:
         logger.debug(f"Envelope detected: {envelope}. JMESPath options: {jmespath_options}")
-        return jmespath.search(envelope, data, options=jmespath.Options(**jmespath_options))
+        return compile_expression(expression=envelope, jmespath_options=jmespath_options).search(data)
     except (LexerError, TypeError, UnicodeError) as e:
         message = f"Failed to unwrap event from envelope using expression. Error: {e} Exp: {envelope}, Data: {data}"  # noqa: B306, E501
         raise InvalidEnvelopeExpressionError(message)
@@ -2,12 +2,20 @@
 Parameter retrieval and caching utility
 """
 
-from .appconfig import AppConfigProvider, get_app_config
-from .base import BaseProvider, clear_caches
-from .dynamodb import DynamoDBProvider
-from .exceptions import GetParameterError, TransformParameterError
-from .secrets import SecretsProvider, get_secret, set_secret
-from .ssm import SSMProvider, get_parameter, get_parameters, get_parameters_by_name, set_parameter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from .appconfig import AppConfigProvider, get_app_config
+    from .base import BaseProvider, clear_caches
+    from .dynamodb import DynamoDBProvider
+    from .exceptions import GetParameterError, TransformParameterError
+    from .prefetching import prefetch
+    from .secrets import SecretsProvider, get_secret, set_secret
+    from .ssm import SSMProvider, get_parameter, get_parameters, get_parameters_by_name, set_parameter
 
 __all__ = [
     "AppConfigProvider",
@@ -25,4 +33,28 @@ __all__ = [
     "get_secret",
     "set_secret",
     "clear_caches",
+    "prefetch",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "AppConfigProvider": ".appconfig",
+        "get_app_config": ".appconfig",
+        "BaseProvider": ".base",
+        "clear_caches": ".base",
+        "DynamoDBProvider": ".dynamodb",
+        "GetParameterError": ".exceptions",
+        "TransformParameterError": ".exceptions",
+        "prefetch": ".prefetching",
+        "SecretsProvider": ".secrets",
+        "get_secret": ".secrets",
+        "set_secret": ".secrets",
+        "SSMProvider": ".ssm",
+        "get_parameter": ".ssm",
+        "get_parameters": ".ssm",
+        "get_parameters_by_name": ".ssm",
+        "set_parameter": ".ssm",
+    },
+)
@@ -4,11 +4,14 @@ AWS App Config configuration retrieval and caching utility
 
 from __future__ import annotations
 
+import hashlib
 import os
+import time
 import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import boto3
+from botocore.exceptions import ClientError
 
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.shared.functions import (
@@ -22,10 +25,18 @@ from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 if TYPE_CHECKING:
     from botocore.config import Config
     from mypy_boto3_appconfigdata.client import AppConfigDataClient
+    from mypy_boto3_appconfigdata.type_defs import GetLatestConfigurationResponseTypeDef
 
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
 
+class TransformedConfiguration(NamedTuple):
+    # Configuration as returned by AppConfig, and its hash, to detect unchanged configurations
+    raw: bytes
+    digest: bytes
+    value: Any
+
+
 class AppConfigProvider(BaseProvider):
     """
     AWS App Config Provider
@@ -83,9 +94,6 @@ class AppConfigProvider(BaseProvider):
         """
         Initialize the App Config client
         """
-
-        super().__init__()
-
         if config:
             warnings.warn(
                 message="The 'config' parameter is deprecated in V3 and will be removed in V4. "
@@ -110,9 +118,39 @@ class AppConfigProvider(BaseProvider):
         self._next_token: dict[str, str] = {}  # nosec - token for get_latest_configuration executions
         # Dict to store the recently retrieved value for a specific configuration.
         self.last_returned_value: dict[str, bytes] = {}
+        # Earliest time, as per time.monotonic(), AppConfig can be polled again for a specific configuration
+        self._next_poll_at: dict[str, float] = {}
+        # Most recently transformed value for a specific configuration and transform
+        self._last_transformed: dict[tuple, TransformedConfiguration] = {}
 
         super().__init__(client=self.client)
 
+    def _persistent_cache_namespace(self, client=None, resource=None) -> str:
+        namespace = super()._persistent_cache_namespace(client=client, resource=resource)
+        return f"{namespace}:{self.application}:{self.environment}"
+
+    def get(
+        self,
+        name: str,
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        force_fetch: bool = False,
+        stale_while_revalidate: int | None = None,
+        **sdk_options,
+    ) -> str | bytes | dict | None:
+        if force_fetch:
+            # Poll AppConfig right away, rather than returning the last configuration until the poll interval elapses
+            self._next_poll_at.pop(name, None)
+
+        return super().get(
+            name,
+            max_age=max_age,
+            transform=transform,
+            force_fetch=force_fetch,
+            stale_while_revalidate=stale_while_revalidate,
+            **sdk_options,
+        )
+
     def _get(self, name: str, **sdk_options) -> bytes:
         """
         Retrieve a parameter value from AWS App config.
@@ -124,19 +162,22 @@ class AppConfigProvider(BaseProvider):
         sdk_options: dict, optional
             SDK options to propagate to `start_configuration_session` API call
         """
-        if name not in self._next_token:
-            sdk_options["ConfigurationProfileIdentifier"] = name
-            sdk_options["ApplicationIdentifier"] = self.application
-            sdk_options["EnvironmentIdentifier"] = self.environment
-            response_configuration = self.client.start_configuration_session(**sdk_options)
-            self._next_token[name] = response_configuration["InitialConfigurationToken"]
+        # AppConfig returns the same configuration until the poll interval elapses, and may throttle earlier calls
+        if name in self.last_returned_value and self.seconds_until_next_poll(name) > 0:
+            return self.last_returned_value[name]
+
+        try:
+            response = self._get_latest_configuration(name, **sdk_options)
+        except ClientError as exc:
+            # Tokens expire after 24 hours, so start a new session once before giving up
+            if exc.response.get("Error", {}).get("Code") != "BadRequestException" or name not in self._next_token:
+                raise
+            self._next_token.pop(name)
+            response = self._get_latest_configuration(name, **sdk_options)
 
-        # The new AppConfig APIs require two API calls to return the configuration
-        # First we start the session and after that we retrieve the configuration
-        # We need to store the token to use in the next execution
-        response = self.client.get_latest_configuration(ConfigurationToken=self._next_token[name])
         return_value = response["Configuration"].read()
         self._next_token[name] = response["NextPollConfigurationToken"]
+        self._next_poll_at[name] = time.monotonic() + response.get("NextPollIntervalInSeconds", 0)
 
         # The return of get_latest_configuration can be null because this value is supposed to be cached
         # on the customer side.
@@ -147,6 +188,58 @@ class AppConfigProvider(BaseProvider):
 
         return self.last_returned_value[name]
 
+    def _get_latest_configuration(self, name: str, **sdk_options) -> GetLatestConfigurationResponseTypeDef:
+        if name not in self._next_token:
+            sdk_options["ConfigurationProfileIdentifier"] = name
+            sdk_options["ApplicationIdentifier"] = self.application
+            sdk_options["EnvironmentIdentifier"] = self.environment
+            response_configuration = self.client.start_configuration_session(**sdk_options)
+            self._next_token[name] = response_configuration["InitialConfigurationToken"]
+
+        # The new AppConfig APIs require two API calls to return the configuration
+        # First we start the session and after that we retrieve the configuration
+        # We need to store the token to use in the next execution
+        return self.client.get_latest_configuration(ConfigurationToken=self._next_token[name])
+
+    def _transform_value(self, name: str, value: Any, transform: TransformOptions) -> Any:
+        """Transform a configuration only when it changed, e.g. not when AppConfig returns an empty body"""
+        if not isinstance(value, bytes):
+            return super()._transform_value(name=name, value=value, transform=transform)
+
+        key = (name, transform)
+        last = self._last_transformed.get(key)
+        if last is not None and last.raw is value:
+            return last.value
+
+        # The same configuration can still be returned in full, e.g. when starting a new session
+        digest = hashlib.sha256(value).digest()
+        if last is not None and last.digest == digest:
+            self._last_transformed[key] = last._replace(raw=value)
+            return last.value
+
+        transformed = super()._transform_value(name=name, value=value, transform=transform)
+        self._last_transformed[key] = TransformedConfiguration(raw=value, digest=digest, value=transformed)
+        return transformed
+
+    def seconds_until_next_poll(self, name: str) -> float:
+        """
+        Seconds until AppConfig can be polled again for a configuration, as per its `NextPollIntervalInSeconds`
+
+        Until then, fetching the configuration returns the last value retrieved without calling AppConfig, unless
+        using `force_fetch`.
+
+        Parameters
+        ----------
+        name: str
+            Name of the configuration
+
+        Returns
+        -------
+        float
+            Seconds until the next poll, or 0 if it can be polled right away
+        """
+        return max(self._next_poll_at.get(name, 0) - time.monotonic(), 0)
+
     def _get_multiple(self, path: str, **sdk_options) -> dict[str, str]:
         """
         Retrieving multiple parameter values is not supported with AWS App Config Provider
@@ -161,6 +254,7 @@ def get_app_config(
     transform: TransformOptions = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str | bytes | list | dict:
     """
@@ -180,6 +274,9 @@ def get_app_config(
         Force update even before a cached item has expired, defaults to False
     max_age: int, optional
         Maximum age of the cached value
+    stale_while_revalidate: int, optional
+        For how long after expiring a cached value is still returned while it's refreshed in the background,
+        in seconds. Disabled by default.
     sdk_options: dict, optional
         SDK options to propagate to `start_configuration_session` API call
 
@@ -223,5 +320,6 @@ def get_app_config(
         max_age=max_age,
         transform=transform,
         force_fetch=force_fetch,
+        stale_while_revalidate=stale_while_revalidate,
         **sdk_options,
     )
@@ -4,29 +4,61 @@ Base for Parameter providers
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Callable, NamedTuple, cast, overload
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypeVar, cast, overload
 
 from aws_lambda_powertools.shared import constants, user_agent
-from aws_lambda_powertools.shared.functions import resolve_max_age
+from aws_lambda_powertools.shared.functions import resolve_max_age, resolve_truthy_env_var_choice
+from aws_lambda_powertools.utilities.parameters.cache import ExpirableValue, ParameterCache
 from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError, TransformParameterError
 
 if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.parameters.persistent_cache import PersistentCache
     from aws_lambda_powertools.utilities.parameters.types import TransformOptions
 
 
 from aws_lambda_powertools.utilities.parameters.constants import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ITEMS,
     DEFAULT_MAX_AGE_SECS,
+    DEFAULT_PERSISTENT_CACHE,
+    DEFAULT_PERSISTENT_CACHE_DIR,
+    DEFAULT_PERSISTENT_CACHE_MAX_BYTES,
+    DEFAULT_PREFETCH_MAX_CONCURRENCY,
     DEFAULT_PROVIDERS,
+    DEFAULT_STALE_WHILE_REVALIDATE_SECS,
     TRANSFORM_METHOD_MAPPING,
 )
 
+logger = logging.getLogger(__name__)
 
-class ExpirableValue(NamedTuple):
-    value: str | bytes | dict[str, Any]
-    ttl: datetime
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Backoff between failed background refreshes of a stale value, doubling on every failure
+REVALIDATE_BACKOFF_SECS = 1
+REVALIDATE_MAX_BACKOFF_SECS = 60
+
+
+class RevalidationFailure(NamedTuple):
+    attempts: int
+    # Next background refresh attempt, as per time.monotonic()
+    retry_at: float
+
+
+class PrefetchReport(NamedTuple):
+    # Names or paths now cached, including those that were already cached
+    fetched: list[str]
+    # Names or paths that failed to be fetched or transformed, when raise_on_error is disabled
+    errors: list[str]
+    duration_ms: float
 
 
 class BaseProvider(ABC):
@@ -34,7 +66,7 @@ class BaseProvider(ABC):
     Abstract Base Class for Parameter providers
     """
 
-    store: dict[tuple, ExpirableValue]
+    store: ParameterCache
 
     def __init__(self, *, client=None, resource=None):
         """
@@ -45,10 +77,62 @@ class BaseProvider(ABC):
         if resource is not None:
             user_agent.register_feature_to_resource(resource=resource, feature="parameters")
 
-        self.store: dict[tuple, ExpirableValue] = {}
+        # Bounded LRU cache; set either limit to 0 to disable it
+        max_items = int(os.getenv(constants.PARAMETERS_CACHE_MAX_ITEMS_ENV, DEFAULT_CACHE_MAX_ITEMS))
+        max_bytes = int(os.getenv(constants.PARAMETERS_CACHE_MAX_BYTES_ENV, DEFAULT_CACHE_MAX_BYTES))
+        self.store = ParameterCache(
+            max_items=max_items or None,
+            max_bytes=max_bytes or None,
+            persistent=self._create_persistent_cache(client=client, resource=resource),
+        )
+
+        # Cache keys being refreshed in the background, and failed refreshes backing off
+        self._revalidating: set[tuple] = set()
+        self._revalidation_failures: dict[tuple, RevalidationFailure] = {}
+        self._revalidation_lock = threading.Lock()
+
+    def _create_persistent_cache(self, client=None, resource=None) -> PersistentCache | None:
+        """Encrypted cache in /tmp beneath the in-memory cache, when enabled, shared by providers for the same source"""
+        if not resolve_truthy_env_var_choice(
+            env=os.getenv(constants.PARAMETERS_PERSISTENT_CACHE_ENV, DEFAULT_PERSISTENT_CACHE),
+        ):
+            return None
+
+        from aws_lambda_powertools.utilities.parameters.persistent_cache import PersistentCache
+
+        # Set to 0 to disable the limit
+        max_bytes = int(
+            os.getenv(constants.PARAMETERS_PERSISTENT_CACHE_MAX_BYTES_ENV, DEFAULT_PERSISTENT_CACHE_MAX_BYTES),
+        )
+        return PersistentCache(
+            directory=os.getenv(constants.PARAMETERS_PERSISTENT_CACHE_DIR_ENV, DEFAULT_PERSISTENT_CACHE_DIR),
+            namespace=self._persistent_cache_namespace(client=client, resource=resource),
+            max_bytes=max_bytes or None,
+        )
+
+    def _persistent_cache_namespace(self, client=None, resource=None) -> str:
+        """Identifies the source of cached values, so providers for different sources don't share them"""
+        if client is None and resource is not None:
+            client = resource.meta.client
+
+        meta = getattr(client, "meta", None)
+        region = getattr(meta, "region_name", None)
+        endpoint_url = getattr(meta, "endpoint_url", None)
+        return f"{type(self).__name__}:{region}:{endpoint_url}:{self._credentials_fingerprint(client)}"
+
+    @staticmethod
+    def _credentials_fingerprint(client) -> str | None:
+        """Hash of the access key the client signs requests with, so accounts and roles don't share values"""
+        # botocore doesn't expose the credentials of a client publicly
+        credentials = getattr(getattr(client, "_request_signer", None), "_credentials", None)
+        access_key = getattr(credentials, "access_key", None)
+        if not access_key:
+            return None
+
+        return hashlib.sha256(access_key.encode()).hexdigest()[:16]
 
     def has_not_expired_in_cache(self, key: tuple) -> bool:
-        return key in self.store and self.store[key].ttl >= datetime.now()
+        return self.store.get_valid(key) is not None
 
     def get(
         self,
@@ -56,6 +140,7 @@ class BaseProvider(ABC):
         max_age: int | None = None,
         transform: TransformOptions = None,
         force_fetch: bool = False,
+        stale_while_revalidate: int | None = None,
         **sdk_options,
     ) -> str | bytes | dict | None:
         """
@@ -73,6 +158,9 @@ class BaseProvider(ABC):
             values.
         force_fetch: bool, optional
             Force update even before a cached item has expired, defaults to False
+        stale_while_revalidate: int, optional
+            For how long after expiring a cached value is still returned while it's refreshed in the background,
+            in seconds. Disabled by default.
         sdk_options: dict, optional
             Arguments that will be passed directly to the underlying API call
 
@@ -94,14 +182,53 @@ class BaseProvider(ABC):
         # of supported transform is small and the probability that a given
         # parameter will always be used in a specific transform, this should be
         # an acceptable tradeoff.
-        value: str | bytes | dict | None = None
         key = self._build_cache_key(name=name, transform=transform)
 
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
 
-        if not force_fetch and self.has_not_expired_in_cache(key):
-            return self.fetch_from_cache(key)
+        # If stale_while_revalidate is not set, resolve it from the environment variable, disabled by default
+        stale_while_revalidate = resolve_max_age(
+            env=os.getenv(constants.PARAMETERS_STALE_WHILE_REVALIDATE_ENV, DEFAULT_STALE_WHILE_REVALIDATE_SECS),
+            choice=stale_while_revalidate,
+        )
+
+        if not force_fetch and (cached := self.store.get_valid(key)) is not None:
+            return cached.value
+
+        fetch = functools.partial(
+            self._fetch_and_cache,
+            key=key,
+            name=name,
+            transform=transform,
+            max_age=max_age,
+            stale_while_revalidate=stale_while_revalidate,
+            **sdk_options,
+        )
+
+        def refresh() -> list[tuple]:
+            fetch()
+            return []
+
+        # Serve an expired value right away, and refresh it in the background
+        if not force_fetch and stale_while_revalidate > 0:
+            stale = self.store.get_stale(key)
+            if stale is not None:
+                self.revalidate_in_background(keys=[key], refresh=refresh)
+                return stale.value
+
+        return fetch()
+
+    def _fetch_and_cache(
+        self,
+        key: tuple,
+        name: str,
+        transform: TransformOptions,
+        max_age: int,
+        stale_while_revalidate: int,
+        **sdk_options,
+    ) -> str | bytes | dict | None:
+        value: str | bytes | dict | None = None
 
         try:
             value = self._get(name, **sdk_options)
@@ -110,14 +237,18 @@ class BaseProvider(ABC):
             raise GetParameterError(str(exc))
 
         if transform:
-            value = transform_value(key=name, value=value, transform=transform, raise_on_transform_error=True)
+            value = self._transform_value(name=name, value=value, transform=transform)
 
         # NOTE: don't cache None, as they might've been failed transforms and may be corrected
         if value is not None:
-            self.add_to_cache(key=key, value=value, max_age=max_age)
+            self.add_to_cache(key=key, value=value, max_age=max_age, stale_while_revalidate=stale_while_revalidate)
 
         return value
 
+    def _transform_value(self, name: str, value: Any, transform: TransformOptions) -> Any:
+        """Transform a value fetched by `get()`, raising TransformParameterError on failure"""
+        return transform_value(key=name, value=value, transform=transform, raise_on_transform_error=True)
+
     @abstractmethod
     def _get(self, name: str, **sdk_options) -> str | bytes | dict[str, Any]:
         """
@@ -174,8 +305,8 @@ class BaseProvider(ABC):
         # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
         max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
 
-        if not force_fetch and self.has_not_expired_in_cache(key):
-            return self.fetch_from_cache(key)
+        if not force_fetch and (cached := self.store.get_valid(key)) is not None:
+            return cached.value
 
         try:
             values = self._get_multiple(path, **sdk_options)
@@ -203,11 +334,150 @@ class BaseProvider(ABC):
     def fetch_from_cache(self, key: tuple):
         return self.store[key].value if key in self.store else {}
 
-    def add_to_cache(self, key: tuple, value: Any, max_age: int):
+    def add_to_cache(self, key: tuple, value: Any, max_age: int, stale_while_revalidate: int = 0):
         if max_age <= 0:
             return
 
-        self.store[key] = ExpirableValue(value, datetime.now() + timedelta(seconds=max_age))
+        ttl = time.monotonic() + max_age
+        stale_ttl = ttl + stale_while_revalidate if stale_while_revalidate > 0 else None
+        self.store[key] = ExpirableValue(value, ttl, stale_ttl)
+
+        with self._revalidation_lock:
+            self._revalidation_failures.pop(key, None)
+
+    def revalidate_in_background(self, keys: list[tuple], refresh: Callable[[], list[tuple]]) -> None:
+        """Refresh stale cached values in a background thread, unless already in progress or backing off
+
+        NOTE: Lambda freezes the execution environment between invocations, so a refresh started near the end of
+        an invocation completes in the next one. The stale value is served in the meantime, up to its hard limit.
+
+        Parameters
+        ----------
+        keys: list[tuple]
+            Cache keys of the stale values being refreshed
+        refresh: Callable[[], list[tuple]]
+            Fetches and caches fresh values, returning cache keys that failed to refresh. Raising an exception
+            fails every key.
+        """
+        now = time.monotonic()
+        with self._revalidation_lock:
+            keys = [
+                key
+                for key in keys
+                if key not in self._revalidating
+                and (key not in self._revalidation_failures or self._revalidation_failures[key].retry_at <= now)
+            ]
+            if not keys:
+                return
+            self._revalidating.update(keys)
+
+        thread = threading.Thread(target=self._revalidate, args=(keys, refresh), daemon=True)
+        thread.start()
+
+    def _revalidate(self, keys: list[tuple], refresh: Callable[[], list[tuple]]) -> None:
+        failed_keys: list[tuple] = []
+        try:
+            failed_keys = refresh()
+        except Exception as exc:
+            logger.debug(f"Failed to refresh stale parameters in the background: {exc}")
+            failed_keys = keys
+        finally:
+            with self._revalidation_lock:
+                self._revalidating.difference_update(keys)
+
+                for key in failed_keys:
+                    attempts = (
+                        self._revalidation_failures[key].attempts + 1 if key in self._revalidation_failures else 1
+                    )
+                    backoff = min(REVALIDATE_BACKOFF_SECS * 2 ** (attempts - 1), REVALIDATE_MAX_BACKOFF_SECS)
+                    self._revalidation_failures[key] = RevalidationFailure(attempts, time.monotonic() + backoff)
+
+    def prefetch(
+        self,
+        parameters: dict[str, dict] | list[str],
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        max_concurrency: int | None = None,
+        raise_on_error: bool = True,
+    ) -> PrefetchReport:
+        """
+        Fetch and cache parameters ahead of time, e.g. during the init phase, so later calls are served from cache
+
+        Values are cached under the same keys as `get()`, or `get_multiple()` for paths.
+
+        Parameters
+        ----------
+        parameters: dict[str, dict] | list[str]
+            Parameter names, and any optional overrides of max_age, transform or other `get()` arguments.
+            Set the "path" override to True to fetch a path with `get_multiple()` instead.
+        max_age: int, optional
+            Maximum age of the cached values
+        transform: str, optional
+            Optional transformation of the parameter values
+        max_concurrency: int, optional
+            Maximum number of parameters fetched concurrently, by default 10
+        raise_on_error: bool
+            Whether to fail-fast or to report failed parameters in the returned `errors`, by default True
+
+        Raises
+        ------
+        GetParameterError
+            When the parameter provider fails to retrieve a parameter value, and raise_on_error is enabled
+        TransformParameterError
+            When the parameter provider fails to transform a parameter value, and raise_on_error is enabled
+        """
+        start = time.perf_counter()
+
+        if isinstance(parameters, list):
+            parameters = {name: {} for name in parameters}
+
+        tasks: list[Callable[[], list[str]]] = [
+            functools.partial(
+                self._prefetch_parameter,
+                name,
+                {"max_age": max_age, "transform": transform, **(options or {})},
+                raise_on_error,
+            )
+            for name, options in parameters.items()
+        ]
+
+        return self._run_prefetch(tasks, names=list(parameters), max_concurrency=max_concurrency, start=start)
+
+    def _prefetch_parameter(self, name: str, options: dict[str, Any], raise_on_error: bool) -> list[str]:
+        """Fetch and cache a single parameter or path, returning it if it failed"""
+        options = dict(options)
+        try:
+            if options.pop("path", False):
+                self.get_multiple(name, **options)
+            else:
+                self.get(name, **options)
+        except (GetParameterError, TransformParameterError):
+            if raise_on_error:
+                raise
+            return [name]
+
+        return []
+
+    @staticmethod
+    def _run_prefetch(
+        tasks: list[Callable[[], list[str]]],
+        names: list[str],
+        max_concurrency: int | None,
+        start: float,
+    ) -> PrefetchReport:
+        """Run prefetch tasks concurrently, each returning the names it failed to fetch"""
+        if max_concurrency is None:
+            max_concurrency = DEFAULT_PREFETCH_MAX_CONCURRENCY
+
+        results = map_concurrently(lambda task: task(), tasks, max_concurrency)
+        errors = [name for failed in results for name in failed]
+        failed_names = set(errors)
+
+        return PrefetchReport(
+            fetched=[name for name in names if name not in failed_names],
+            errors=errors,
+            duration_ms=(time.perf_counter() - start) * 1000,
+        )
 
     def _build_cache_key(
         self,
@@ -354,6 +624,43 @@ def transform_value(
         return None
 
 
+def map_concurrently(func: Callable[[T], R], items: list[T], max_concurrency: int = 1) -> list[R]:
+    """
+    Call func with every item using up to max_concurrency threads, returning results in the same order as items
+
+    boto3 clients are thread-safe, so providers can share a single client across threads.
+
+    Parameters
+    ----------
+    func: Callable[[T], R]
+        Function to call with each item
+    items: list[T]
+        Items to call func with
+    max_concurrency: int, optional
+        Maximum number of concurrent calls, by default 1 which calls func serially in the current thread
+
+    Raises
+    ------
+    Exception
+        The first exception raised by func. Calls not yet started are cancelled, and calls already in
+        progress are awaited before raising.
+    """
+    if max_concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+        failed = next((future for future in futures if future in done and future.exception() is not None), None)
+        if failed is not None:
+            for future in pending:
+                future.cancel()
+            raise cast(BaseException, failed.exception())
+
+        return [future.result() for future in futures]
+
+
 def clear_caches():
     """Clear cached parameter values from all providers"""
     DEFAULT_PROVIDERS.clear()
@@ -0,0 +1,244 @@
+"""
+Bounded in-memory cache for Parameter providers
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.parameters.persistent_cache import PersistentCache
+
+logger = logging.getLogger(__name__)
+
+# How often we sweep expired entries when adding new ones, in seconds
+SWEEP_INTERVAL_SECS = 60
+
+
+class ExpirableValue(NamedTuple):
+    value: str | bytes | dict[str, Any]
+    # Deadline as per time.monotonic(), so it's unaffected by system clock changes
+    ttl: float
+    # Deadline up to which an expired value can still be served while it's refreshed in the background
+    stale_ttl: float | None = None
+
+    def is_evictable(self, now: float) -> bool:
+        return max(self.ttl, self.stale_ttl or self.ttl) < now
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    items: int
+    bytes: int
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate size in bytes of a cached value, cheap enough to compute on every cache write"""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(estimate_size(key) + estimate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ParameterCache(MutableMapping):
+    """
+    LRU cache of ExpirableValue bounded by number of items and total size in bytes.
+
+    Least recently used items are evicted first once any bound is reached. Expired items are evicted
+    lazily on access, and swept at most every SWEEP_INTERVAL_SECS when adding new items.
+
+    It's safe to use from multiple threads, as values may be refreshed in the background.
+
+    When a persistent cache is provided, values are also written to it, and values missing from memory are loaded
+    from it. Clearing the cache only clears memory, so values can still be loaded from the persistent cache.
+    """
+
+    def __init__(
+        self,
+        max_items: int | None = None,
+        max_bytes: int | None = None,
+        persistent: PersistentCache | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        max_items: int, optional
+            Maximum number of cached values, unbounded when None
+        max_bytes: int, optional
+            Maximum approximate size of cached values in bytes, unbounded when None
+        persistent: PersistentCache, optional
+            Slower cache tier beneath memory, e.g. files in /tmp, that outlives this cache
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.persistent = persistent
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._data: OrderedDict[tuple, ExpirableValue] = OrderedDict()
+        self._sizes: dict[tuple, int] = {}
+        self._total_bytes = 0
+        self._last_sweep = time.monotonic()
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            items=len(self._data),
+            bytes=self._total_bytes,
+        )
+
+    def get_valid(self, key: tuple) -> ExpirableValue | None:
+        """Return a cached value that hasn't expired yet, recording a cache hit or miss"""
+        with self._lock:
+            item = self._data.get(key) or self._load(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            now = time.monotonic()
+            if item.ttl < now:
+                self.misses += 1
+                # Values too large to be kept in memory are only in the persistent cache
+                if item.is_evictable(now) and key in self._data:
+                    self._evict(key)
+                return None
+
+            self.hits += 1
+            if key in self._data:
+                self._data.move_to_end(key)
+            return item
+
+    def get_stale(self, key: tuple) -> ExpirableValue | None:
+        """Return an expired value that can still be served while it's refreshed, recording a cache hit"""
+        with self._lock:
+            item = self._data.get(key) or self._load(key)
+            if item is None or item.stale_ttl is None:
+                return None
+
+            now = time.monotonic()
+            if item.ttl >= now or item.stale_ttl < now:
+                return None
+
+            self.hits += 1
+            if key in self._data:
+                self._data.move_to_end(key)
+            return item
+
+    def sweep_expired(self) -> None:
+        """Evict every expired item that can no longer be served"""
+        with self._lock:
+            now = self._last_sweep = time.monotonic()
+            for key in [key for key, item in self._data.items() if item.is_evictable(now)]:
+                self._evict(key)
+
+        if self.persistent is not None:
+            self.persistent.sweep_expired()
+
+    def __getitem__(self, key: tuple) -> ExpirableValue:
+        with self._lock:
+            item = self._data[key]
+            self._data.move_to_end(key)
+            return item
+
+    def __setitem__(self, key: tuple, item: ExpirableValue) -> None:
+        size = estimate_size(item.value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.debug(f"Value is larger than the cache size limit of {self.max_bytes} bytes; not caching it")
+            self.pop(key, None)
+            if self.persistent is not None:
+                self.persistent.delete(key)
+            return
+
+        if self.persistent is not None:
+            self.persistent.set(key, item)
+
+        with self._lock:
+            self._insert(key, item, size)
+
+            # Sweeping can read every file of the persistent cache, so it's never done on every insert
+            if time.monotonic() - self._last_sweep >= SWEEP_INTERVAL_SECS:
+                self.sweep_expired()
+
+            while self._is_over_capacity():
+                self._evict(next(iter(self._data)))
+
+    def __delitem__(self, key: tuple) -> None:
+        with self._lock:
+            self._remove(key)
+
+        if self.persistent is not None:
+            self.persistent.delete(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._data)!r})"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def _load(self, key: tuple) -> ExpirableValue | None:
+        """Load a value missing from memory from the persistent cache, without writing it back"""
+        if self.persistent is None:
+            return None
+
+        item = self.persistent.get(key)
+        if item is None:
+            return None
+
+        size = estimate_size(item.value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return item
+
+        self._insert(key, item, size)
+        while self._is_over_capacity():
+            self._evict(next(iter(self._data)))
+
+        return item
+
+    def _insert(self, key: tuple, item: ExpirableValue, size: int) -> None:
+        if key in self._data:
+            self._remove(key)
+
+        self._data[key] = item
+        self._sizes[key] = size
+        self._total_bytes += size
+
+    def _is_over_capacity(self) -> bool:
+        return (self.max_items is not None and len(self._data) > self.max_items) or (
+            self.max_bytes is not None and self._total_bytes > self.max_bytes
+        )
+
+    def _evict(self, key: tuple) -> None:
+        self._remove(key)
+        self.evictions += 1
+
+    def _remove(self, key: tuple) -> None:
+        del self._data[key]
+        self._total_bytes -= self._sizes.pop(key)
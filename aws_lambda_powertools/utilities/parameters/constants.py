@@ -8,6 +8,14 @@ SSM_PARAMETER_TYPES = Literal["String", "StringList", "SecureString"]
 SSM_PARAMETER_TIER = Literal["Standard", "Advanced", "Intelligent-Tiering"]
 
 DEFAULT_MAX_AGE_SECS = "300"
+DEFAULT_STALE_WHILE_REVALIDATE_SECS = "0"
+DEFAULT_SSM_MAX_CONCURRENCY = "1"
+DEFAULT_PREFETCH_MAX_CONCURRENCY = 10
+DEFAULT_CACHE_MAX_ITEMS = "1024"
+DEFAULT_CACHE_MAX_BYTES = str(32 * 1024 * 1024)  # 32 MiB
+DEFAULT_PERSISTENT_CACHE = "false"
+DEFAULT_PERSISTENT_CACHE_DIR = "/tmp/powertools_parameters"  # nosec - Lambda's only writable directory
+DEFAULT_PERSISTENT_CACHE_MAX_BYTES = str(32 * 1024 * 1024)  # 32 MiB
 
 # These providers will be dynamically initialized on first use of the helper functions
 DEFAULT_PROVIDERS: dict[str, Any] = {}
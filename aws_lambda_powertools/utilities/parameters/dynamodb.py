@@ -185,6 +185,10 @@ class DynamoDBProvider(BaseProvider):
 
         super().__init__(resource=boto3_client)
 
+    def _persistent_cache_namespace(self, client=None, resource=None) -> str:
+        namespace = super()._persistent_cache_namespace(client=client, resource=resource)
+        return f"{namespace}:{self.table.name}:{self.key_attr}:{self.sort_attr}:{self.value_attr}"
+
     def _get(self, name: str, **sdk_options) -> str:
         """
         Retrieve a parameter value from Amazon DynamoDB
@@ -0,0 +1,238 @@
+"""
+Encrypted file-backed cache for Parameter providers
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from aws_lambda_powertools.shared import constants
+from aws_lambda_powertools.utilities.parameters.cache import ExpirableValue
+
+logger = logging.getLogger(__name__)
+
+# Fixed-size little-endian header, 8-byte aligned, followed by the encrypted value. Expiry can be checked by reading
+# or memory-mapping the header only, without decrypting the value.
+#   magic (4s) | format version (B) | padding (3x) | expires at (d) | stale until (d), 0 if unset | nonce (12s)
+HEADER = struct.Struct("<4sB3xdd12s")
+MAGIC = b"PTPC"
+FORMAT_VERSION = 1
+NONCE_SIZE = 12
+FILE_SUFFIX = ".cache"
+
+# Bytes aren't JSON serializable, so they're encoded as {"__powertools_bytes__": "<base64>"}
+BYTES_MARKER = "__powertools_bytes__"
+
+# Key used when none is provided, so files can only be decrypted by the process that wrote them
+_PROCESS_KEY: bytes | None = None
+
+
+def _get_process_key() -> bytes:
+    global _PROCESS_KEY
+    if _PROCESS_KEY is None:
+        _PROCESS_KEY = os.urandom(32)
+    return _PROCESS_KEY
+
+
+def _encode_bytes(value: Any) -> dict[str, str]:
+    if isinstance(value, bytes):
+        return {BYTES_MARKER: base64.b64encode(value).decode()}
+    raise TypeError(f"Object of type {type(value).__name__} can't be persisted")
+
+
+def _decode_bytes(value: dict[str, Any]) -> Any:
+    if len(value) == 1 and BYTES_MARKER in value:
+        return base64.b64decode(value[BYTES_MARKER])
+    return value
+
+
+class PersistentCache:
+    """
+    Encrypted file-backed cache of ExpirableValue, e.g. in /tmp, that outlives providers and their in-memory cache.
+
+    Each value is stored in its own file, named after a hash of its cache key, and encrypted with AES-GCM. The header
+    is authenticated along with the cache key, so files can't be read, tampered with, swapped or have their expiry
+    extended without the encryption key. Files that can't be decrypted are treated as cache misses and removed.
+
+    Expiry is stored as wall clock time, since monotonic clocks can't be compared across processes.
+
+    NOTE: Requires the `cryptography` package.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        namespace: str = "",
+        key: bytes | None = None,
+        max_bytes: int | None = None,
+    ):
+        """
+        Parameters
+        ----------
+        directory: str | os.PathLike
+            Directory to store cache files in, created if it doesn't exist
+        namespace: str, optional
+            Identifies the provider values belong to, so providers for different sources don't share values
+        key: bytes, optional
+            AES key of 16, 24 or 32 bytes. Defaults to the base64 encoded key in the
+            POWERTOOLS_PARAMETERS_PERSISTENT_CACHE_KEY environment variable, or a random key generated once per
+            process, in which case files are only readable by the process that wrote them.
+        max_bytes: int, optional
+            Maximum size of the files in this namespace, unbounded when None. Least recently written files over it
+            are removed when sweeping expired files.
+        """
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError as exc:
+            raise ImportError(
+                "The persistent parameters cache requires the 'cryptography' package. "
+                "Install it with 'pip install cryptography'.",
+            ) from exc
+
+        if key is None:
+            env_key = os.getenv(constants.PARAMETERS_PERSISTENT_CACHE_KEY_ENV)
+            try:
+                key = base64.b64decode(env_key, validate=True) if env_key else _get_process_key()
+            except binascii.Error as exc:
+                raise ValueError(f"{constants.PARAMETERS_PERSISTENT_CACHE_KEY_ENV} must be base64 encoded") from exc
+
+        self.namespace = namespace
+        self.max_bytes = max_bytes
+        # Namespaces are kept in separate directories, so they can be cleared independently
+        self.directory = Path(directory) / hashlib.sha256(namespace.encode()).hexdigest()[:16]
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        self._cipher = AESGCM(key)
+
+    def get(self, key: tuple) -> ExpirableValue | None:
+        """Return a persisted value that can still be served, even if stale, or None"""
+        path, key_id = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        header = self._read_header(data)
+        now = time.time()
+        if header is None or max(header[0], header[1]) < now:
+            self._remove(path)
+            return None
+
+        expires_at, stale_until, nonce = header
+        try:
+            plaintext = self._cipher.decrypt(nonce, data[HEADER.size :], data[: HEADER.size] + key_id)
+            value = json.loads(plaintext, object_hook=_decode_bytes)
+        except Exception as exc:
+            # Written with another key, e.g. by a previous process, or tampered with
+            logger.debug(f"Unable to decrypt persisted parameter, ignoring it: {exc}")
+            self._remove(path)
+            return None
+
+        # Convert wall clock expiry back to monotonic deadlines, like in-memory values
+        monotonic_now = time.monotonic()
+        return ExpirableValue(
+            value=value,
+            ttl=monotonic_now + (expires_at - now),
+            stale_ttl=monotonic_now + (stale_until - now) if stale_until else None,
+        )
+
+    def set(self, key: tuple, item: ExpirableValue) -> None:
+        """Persist a value; values that can't be serialized as JSON, or failed writes, are skipped"""
+        try:
+            plaintext = json.dumps(item.value, default=_encode_bytes, separators=(",", ":")).encode()
+        except (TypeError, ValueError) as exc:
+            logger.debug(f"Unable to persist parameter, skipping it: {exc}")
+            return
+
+        now, monotonic_now = time.time(), time.monotonic()
+        expires_at = now + (item.ttl - monotonic_now)
+        stale_until = now + (item.stale_ttl - monotonic_now) if item.stale_ttl is not None else 0.0
+
+        path, key_id = self._path(key)
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, expires_at, stale_until, os.urandom(NONCE_SIZE))
+        ciphertext = self._cipher.encrypt(header[-NONCE_SIZE:], plaintext, header + key_id)
+
+        # Write to a temporary file first, so readers never see partially written files
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as exc:
+            logger.debug(f"Unable to persist parameter, skipping it: {exc}")
+            return
+
+        tmp_path = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(header + ciphertext)
+            tmp_path.replace(path)
+        except OSError as exc:
+            logger.debug(f"Unable to persist parameter, skipping it: {exc}")
+            self._remove(tmp_path)
+
+    def delete(self, key: tuple) -> None:
+        self._remove(self._path(key)[0])
+
+    def clear(self) -> None:
+        """Remove every value persisted in this namespace"""
+        for path in self.directory.glob(f"*{FILE_SUFFIX}"):
+            self._remove(path)
+
+    def sweep_expired(self) -> None:
+        """Remove every persisted value that can no longer be served, reading their header only, then the least
+        recently written values over max_bytes"""
+        now = time.time()
+        # Files that can still be served, as (modified at, size, path)
+        remaining: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{FILE_SUFFIX}"):
+            try:
+                with path.open("rb") as cache_file:
+                    header = self._read_header(cache_file.read(HEADER.size))
+                    stat = os.fstat(cache_file.fileno())
+            except OSError:
+                continue
+
+            if header is None or max(header[0], header[1]) < now:
+                self._remove(path)
+            else:
+                remaining.append((stat.st_mtime, stat.st_size, path))
+
+        if self.max_bytes is None:
+            return
+
+        total_bytes = sum(size for _, size, _ in remaining)
+        for _, size, path in sorted(remaining):
+            if total_bytes <= self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    def _path(self, key: tuple) -> tuple[Path, bytes]:
+        key_id = f"{self.namespace}\0{key!r}".encode()
+        return self.directory / f"{hashlib.sha256(key_id).hexdigest()}{FILE_SUFFIX}", key_id
+
+    @staticmethod
+    def _read_header(data: bytes) -> tuple[float, float, bytes] | None:
+        if len(data) < HEADER.size:
+            return None
+
+        magic, version, expires_at, stale_until, nonce = HEADER.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+
+        return expires_at, stale_until, nonce
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
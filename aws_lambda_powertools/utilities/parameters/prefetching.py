@@ -0,0 +1,120 @@
+"""
+Prefetch parameters from multiple sources ahead of time
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.utilities.parameters.appconfig import AppConfigProvider
+from aws_lambda_powertools.utilities.parameters.base import map_concurrently
+from aws_lambda_powertools.utilities.parameters.constants import DEFAULT_PROVIDERS
+from aws_lambda_powertools.utilities.parameters.secrets import SecretsProvider
+from aws_lambda_powertools.utilities.parameters.ssm import SSMProvider
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.parameters.base import BaseProvider, PrefetchReport
+
+logger = logging.getLogger(__name__)
+
+
+def prefetch(
+    ssm: dict[str, dict] | list[str] | None = None,
+    secrets: dict[str, dict] | list[str] | None = None,
+    appconfig: dict[str, dict] | list[str] | None = None,
+    environment: str | None = None,
+    application: str | None = None,
+    max_concurrency: int | None = None,
+    raise_on_error: bool = True,
+) -> dict[str, PrefetchReport]:
+    """
+    Fetch and cache parameters from SSM Parameter Store, Secrets Manager and AppConfig concurrently, ahead of time
+
+    Call it during the init phase, outside of your handler, so later calls to `get_parameter()`, `get_parameters()`,
+    `get_secret()` and `get_app_config()` are served from cache.
+
+    Parameters
+    ----------
+    ssm: dict[str, dict] | list[str], optional
+        SSM parameter names, and any optional overrides of max_age, transform, decrypt or stale_while_revalidate.
+        Set the "path" override to True to fetch a path like `get_parameters()` instead.
+    secrets: dict[str, dict] | list[str], optional
+        Secret names, and any optional overrides of max_age, transform or stale_while_revalidate
+    appconfig: dict[str, dict] | list[str], optional
+        AppConfig configuration profile names, and any optional overrides of max_age, transform or
+        stale_while_revalidate
+    environment: str, optional
+        AppConfig environment, required to prefetch AppConfig configurations unless `get_app_config()` was used before
+    application: str, optional
+        AppConfig application, defaults to the service name
+    max_concurrency: int, optional
+        Maximum number of concurrent calls per source, by default 10
+    raise_on_error: bool
+        Whether to fail-fast or to report failed parameters in the returned `errors`, by default True
+
+    Returns
+    -------
+    dict[str, PrefetchReport]
+        Names fetched, names that failed and duration for each source: "ssm", "secrets" and "appconfig"
+
+    Raises
+    ------
+    GetParameterError
+        When a parameter provider fails to retrieve a parameter value, and raise_on_error is enabled
+    TransformParameterError
+        When a parameter provider fails to transform a parameter value, and raise_on_error is enabled
+
+    Example
+    -------
+    **Prefetches parameters, secrets and configurations at init time**
+
+        >>> from aws_lambda_powertools.utilities import parameters
+        >>>
+        >>> parameters.prefetch(
+        ...     ssm={"/app/config": {"transform": "json"}, "/app/api_key": {"decrypt": True}},
+        ...     secrets=["db-credentials"],
+        ...     appconfig={"features": {"transform": "json"}},
+        ...     environment="prod",
+        ... )
+        >>>
+        >>> def handler(event, context):
+        ...     config = parameters.get_parameter("/app/config", transform="json")  # served from cache
+    """
+    manifest = {"ssm": ssm, "secrets": secrets, "appconfig": appconfig}
+    sources = [source for source, parameters in manifest.items() if parameters]
+
+    # Only create the providers if they're used, before fetching concurrently
+    providers: dict[str, BaseProvider] = {}
+    for source in sources:
+        if source not in DEFAULT_PROVIDERS:
+            DEFAULT_PROVIDERS[source] = _create_default_provider(source, environment, application)
+        providers[source] = DEFAULT_PROVIDERS[source]
+
+    def prefetch_source(source: str) -> PrefetchReport:
+        return providers[source].prefetch(
+            manifest[source],  # type: ignore[arg-type] # sources only include set parameters
+            max_concurrency=max_concurrency,
+            raise_on_error=raise_on_error,
+        )
+
+    reports = dict(zip(sources, map_concurrently(prefetch_source, sources, max_concurrency=len(sources))))
+
+    for source, report in reports.items():
+        logger.debug(
+            f"Prefetched {len(report.fetched)} parameters from {source} in {report.duration_ms:.2f}ms, "
+            f"{len(report.errors)} failed",
+        )
+
+    return reports
+
+
+def _create_default_provider(source: str, environment: str | None, application: str | None) -> BaseProvider:
+    if source == "ssm":
+        return SSMProvider()
+    if source == "secrets":
+        return SecretsProvider()
+
+    if environment is None:
+        raise ValueError("An AppConfig environment is required to prefetch AppConfig configurations")
+    return AppConfigProvider(environment=environment, application=application)
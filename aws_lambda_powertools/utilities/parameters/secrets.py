@@ -267,6 +267,7 @@ def get_secret(
     transform: None = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str: ...
 
@@ -277,6 +278,7 @@ def get_secret(
     transform: Literal["json"],
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> dict: ...
 
@@ -287,6 +289,7 @@ def get_secret(
     transform: Literal["binary"],
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str | bytes | dict: ...
 
@@ -297,6 +300,7 @@ def get_secret(
     transform: Literal["auto"],
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> bytes: ...
 
@@ -306,6 +310,7 @@ def get_secret(
     transform: TransformOptions = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str | bytes | dict:
     """
@@ -321,6 +326,9 @@ def get_secret(
         Force update even before a cached item has expired, defaults to False
     max_age: int, optional
         Maximum age of the cached value
+    stale_while_revalidate: int, optional
+        For how long after expiring a cached value is still returned while it's refreshed in the background,
+        in seconds. Disabled by default.
     sdk_options: dict, optional
         Dictionary of options that will be passed to the get_secret_value call
 
@@ -365,6 +373,7 @@ def get_secret(
         max_age=max_age,
         transform=transform,
         force_fetch=force_fetch,
+        stale_while_revalidate=stale_while_revalidate,
         **sdk_options,
     )
 
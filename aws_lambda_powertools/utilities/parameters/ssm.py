@@ -4,30 +4,41 @@ AWS SSM Parameter retrieval and caching utility
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import time
 import warnings
-from typing import TYPE_CHECKING, Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Callable, Literal, overload
 
 import boto3
 
 from aws_lambda_powertools.shared import constants
 from aws_lambda_powertools.shared.functions import (
     resolve_max_age,
+    resolve_max_concurrency,
     resolve_truthy_env_var_choice,
     slice_dictionary,
 )
 from aws_lambda_powertools.utilities.parameters.base import (
     BaseProvider,
+    PrefetchReport,
+    map_concurrently,
     transform_value,
 )
 from aws_lambda_powertools.utilities.parameters.constants import (
     DEFAULT_MAX_AGE_SECS,
     DEFAULT_PROVIDERS,
+    DEFAULT_SSM_MAX_CONCURRENCY,
+    DEFAULT_STALE_WHILE_REVALIDATE_SECS,
     SSM_PARAMETER_TIER,
     SSM_PARAMETER_TYPES,
 )
-from aws_lambda_powertools.utilities.parameters.exceptions import GetParameterError, SetParameterError
+from aws_lambda_powertools.utilities.parameters.exceptions import (
+    GetParameterError,
+    SetParameterError,
+    TransformParameterError,
+)
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 if TYPE_CHECKING:
@@ -199,6 +210,7 @@ class SSMProvider(BaseProvider):
         transform: TransformOptions = None,
         decrypt: bool | None = None,
         force_fetch: bool = False,
+        stale_while_revalidate: int | None = None,
         **sdk_options,
     ) -> str | bytes | dict | None:
         """
@@ -218,6 +230,9 @@ class SSMProvider(BaseProvider):
             If the parameter value should be decrypted
         force_fetch: bool, optional
             Force update even before a cached item has expired, defaults to False
+        stale_while_revalidate: int, optional
+            For how long after expiring a cached value is still returned while it's refreshed in the background,
+            in seconds. Disabled by default.
         sdk_options: dict, optional
             Arguments that will be passed directly to the underlying API call
 
@@ -242,7 +257,7 @@ class SSMProvider(BaseProvider):
         # Add to `decrypt` sdk_options to we can have an explicit option for this
         sdk_options["decrypt"] = decrypt
 
-        return super().get(name, max_age, transform, force_fetch, **sdk_options)
+        return super().get(name, max_age, transform, force_fetch, stale_while_revalidate, **sdk_options)
 
     @overload
     def set(
@@ -435,6 +450,8 @@ class SSMProvider(BaseProvider):
         decrypt: bool | None = None,
         max_age: int | None = None,
         raise_on_error: bool = True,
+        stale_while_revalidate: int | None = None,
+        max_concurrency: int | None = None,
     ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
         """
         Retrieve multiple parameter values by name from SSM or cache.
@@ -446,6 +463,9 @@ class SSMProvider(BaseProvider):
 
         It transparently uses GetParameter and/or GetParameters depending on decryption requirements.
 
+        GetParameters chunks and GetParameter calls are made serially by default. Use max_concurrency to make up
+        to that many calls concurrently, sharing the same boto3 client.
+
                                     ┌────────────────────────┐
                                 ┌───▶  Decrypt entire batch  │─────┐
                                 │   └────────────────────────┘     │     ┌────────────────────┐
@@ -471,6 +491,11 @@ class SSMProvider(BaseProvider):
             Maximum age of the cached value
         raise_on_error: bool
             Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+        stale_while_revalidate: int, optional
+            For how long after expiring a cached value is still returned while it's refreshed in the background,
+            in seconds. Disabled by default.
+        max_concurrency: int, optional
+            Maximum number of concurrent calls to SSM, by default 1 which makes them serially
 
         Raises
         ------
@@ -489,6 +514,18 @@ class SSMProvider(BaseProvider):
             choice=decrypt,
         )
 
+        # If stale_while_revalidate is not set, resolve it from the environment variable, disabled by default
+        stale_while_revalidate = resolve_max_age(
+            env=os.getenv(constants.PARAMETERS_STALE_WHILE_REVALIDATE_ENV, DEFAULT_STALE_WHILE_REVALIDATE_SECS),
+            choice=stale_while_revalidate,
+        )
+
+        # If max_concurrency is not set, resolve it from the environment variable, defaulting to serial calls
+        max_concurrency = resolve_max_concurrency(
+            env=os.getenv(constants.PARAMETERS_SSM_MAX_CONCURRENCY_ENV, DEFAULT_SSM_MAX_CONCURRENCY),
+            choice=max_concurrency,
+        )
+
         # Init potential batch/decrypt batch responses and errors
         batch_ret: dict[str, Any] = {}
         decrypt_ret: dict[str, Any] = {}
@@ -499,7 +536,13 @@ class SSMProvider(BaseProvider):
         # NOTE: We fail early to avoid unintended graceful errors being replaced with their '_errors' param values
         self._raise_if_errors_key_is_present(parameters, self._ERRORS_KEY, raise_on_error)
 
-        batch_params, decrypt_params = self._split_batch_and_decrypt_parameters(parameters, transform, max_age, decrypt)
+        batch_params, decrypt_params = self._split_batch_and_decrypt_parameters(
+            parameters,
+            transform,
+            max_age,
+            decrypt,
+            stale_while_revalidate,
+        )
 
         # NOTE: We need to find out whether all parameters must be decrypted or not to know which API to use
         ## Logic:
@@ -508,10 +551,24 @@ class SSMProvider(BaseProvider):
         ## GetParameter  API -> When decrypt is used for one or more in the batch
 
         if len(decrypt_params) != len(parameters):
-            decrypt_ret, decrypt_err = self._get_parameters_by_name_with_decrypt_option(decrypt_params, raise_on_error)
-            batch_ret, batch_err = self._get_parameters_batch_by_name(batch_params, raise_on_error, decrypt=False)
+            decrypt_ret, decrypt_err = self._get_parameters_by_name_with_decrypt_option(
+                decrypt_params,
+                raise_on_error,
+                max_concurrency,
+            )
+            batch_ret, batch_err = self._get_parameters_batch_by_name(
+                batch_params,
+                raise_on_error,
+                decrypt=False,
+                max_concurrency=max_concurrency,
+            )
         else:
-            batch_ret, batch_err = self._get_parameters_batch_by_name(decrypt_params, raise_on_error, decrypt=True)
+            batch_ret, batch_err = self._get_parameters_batch_by_name(
+                decrypt_params,
+                raise_on_error,
+                decrypt=True,
+                max_concurrency=max_concurrency,
+            )
 
         # Fail-fast disabled, let's aggregate errors under "_errors" key so they can handle gracefully
         if not raise_on_error:
@@ -523,20 +580,35 @@ class SSMProvider(BaseProvider):
         self,
         batch: dict[str, dict],
         raise_on_error: bool,
+        max_concurrency: int = 1,
     ) -> tuple[dict, list]:
         response: dict[str, Any] = {}
         errors: list[str] = []
 
-        # Decided for single-thread as it outperforms in 128M and 1G + reduce timeout risk
+        # Serial by default as it outperforms threads in 128M and 1G + reduce timeout risk
         # see: https://github.com/aws-powertools/powertools-lambda-python/issues/1040#issuecomment-1299954613
-        for parameter, options in batch.items():
+        def fetch(parameter: str) -> tuple[str, Any, bool]:
+            options = batch[parameter]
             try:
-                response[parameter] = self.get(parameter, options["max_age"], options["transform"], options["decrypt"])
+                value = self.get(
+                    parameter,
+                    options["max_age"],
+                    options["transform"],
+                    options["decrypt"],
+                    stale_while_revalidate=options["stale_while_revalidate"],
+                )
             except GetParameterError:
                 if raise_on_error:
                     raise
+                return parameter, None, False
+
+            return parameter, value, True
+
+        for parameter, value, succeeded in map_concurrently(fetch, list(batch), max_concurrency):
+            if succeeded:
+                response[parameter] = value
+            else:
                 errors.append(parameter)
-                continue
 
         return response, errors
 
@@ -545,29 +617,53 @@ class SSMProvider(BaseProvider):
         batch: dict[str, dict],
         raise_on_error: bool = True,
         decrypt: bool = False,
+        max_concurrency: int = 1,
     ) -> tuple[dict, list]:
         """Slice batch and fetch parameters using GetParameters by max permitted"""
         errors: list[str] = []
 
         # Fetch each possible batch param from cache and return if entire batch is cached
-        cached_params = self._get_parameters_by_name_from_cache(batch)
+        cached_params, stale_params = self._get_parameters_by_name_from_cache(batch)
+        if stale_params:
+            self._revalidate_parameters_by_name_in_background(stale_params, decrypt)
+
         if len(cached_params) == len(batch):
             return cached_params, errors
 
         # Slice batch by max permitted GetParameters call
-        batch_ret, errors = self._get_parameters_by_name_in_chunks(batch, cached_params, raise_on_error, decrypt)
+        batch_ret, errors = self._get_parameters_by_name_in_chunks(
+            batch,
+            cached_params,
+            raise_on_error,
+            decrypt,
+            max_concurrency,
+        )
 
         return {**cached_params, **batch_ret}, errors
 
-    def _get_parameters_by_name_from_cache(self, batch: dict[str, dict]) -> dict[str, Any]:
-        """Fetch each parameter from batch that hasn't been expired"""
+    def _get_parameters_by_name_from_cache(self, batch: dict[str, dict]) -> tuple[dict[str, Any], dict[str, dict]]:
+        """Fetch each parameter from batch that hasn't been expired, or is stale but can be served while revalidated"""
         cache = {}
+        stale: dict[str, dict] = {}
         for name, options in batch.items():
             cache_key = (name, options["transform"])
-            if self.has_not_expired_in_cache(cache_key):
-                cache[name] = self.store[cache_key].value
+            if (item := self.store.get_valid(cache_key)) is not None:
+                cache[name] = item.value
+            elif options.get("stale_while_revalidate") and (item := self.store.get_stale(cache_key)) is not None:
+                cache[name] = item.value
+                stale[name] = options
 
-        return cache
+        return cache, stale
+
+    def _revalidate_parameters_by_name_in_background(self, batch: dict[str, dict], decrypt: bool) -> None:
+        """Refresh stale parameters in the background with as few GetParameters calls as possible"""
+
+        def refresh() -> list[tuple]:
+            _, errors = self._get_parameters_by_name_in_chunks(batch, {}, raise_on_error=False, decrypt=decrypt)
+            return [(name, batch[name]["transform"]) for name in errors]
+
+        keys = [(name, options["transform"]) for name, options in batch.items()]
+        self.revalidate_in_background(keys=keys, refresh=refresh)
 
     def _get_parameters_by_name_in_chunks(
         self,
@@ -575,20 +671,18 @@ class SSMProvider(BaseProvider):
         cache: dict[str, Any],
         raise_on_error: bool,
         decrypt: bool = False,
+        max_concurrency: int = 1,
     ) -> tuple[dict, list]:
-        """Take out differences from cache and batch, slice it and fetch from SSM"""
+        """Take out differences from cache and batch, slice it and fetch from SSM, one chunk per thread if allowed"""
         response: dict[str, Any] = {}
         errors: list[str] = []
 
         diff = {key: value for key, value in batch.items() if key not in cache}
+        chunks = list(slice_dictionary(data=diff, chunk_size=self._MAX_GET_PARAMETERS_ITEM))
+        fetch = functools.partial(self._get_parameters_by_name, raise_on_error=raise_on_error, decrypt=decrypt)
 
-        for chunk in slice_dictionary(data=diff, chunk_size=self._MAX_GET_PARAMETERS_ITEM):
-            response, possible_errors = self._get_parameters_by_name(
-                parameters=chunk,
-                raise_on_error=raise_on_error,
-                decrypt=decrypt,
-            )
-            response.update(response)
+        for chunk_response, possible_errors in map_concurrently(fetch, chunks, max_concurrency):
+            response.update(chunk_response)
             errors.extend(possible_errors)
 
         return response, errors
@@ -648,16 +742,26 @@ class SSMProvider(BaseProvider):
 
         for parameter in api_response["Parameters"]:
             name = parameter["Name"]
-            value = parameter["Value"]
+            value: Any = parameter["Value"]
             options = parameters[name]
             transform = options.get("transform")
 
             # NOTE: If transform is set, we do it before caching to reduce number of operations
             if transform:
-                value = transform_value(name, value, transform, raise_on_error)  # type: ignore
+                value = transform_value(
+                    key=name,
+                    value=value,
+                    transform=transform,
+                    raise_on_transform_error=raise_on_error,
+                )
 
             _cache_key = (name, options["transform"])
-            self.add_to_cache(key=_cache_key, value=value, max_age=options["max_age"])
+            self.add_to_cache(
+                key=_cache_key,
+                value=value,
+                max_age=options["max_age"],
+                stale_while_revalidate=options.get("stale_while_revalidate", 0),
+            )
 
             response[name] = value
 
@@ -684,6 +788,7 @@ class SSMProvider(BaseProvider):
         transform: TransformOptions,
         max_age: int,
         decrypt: bool,
+        stale_while_revalidate: int = 0,
     ) -> tuple[dict[str, dict], dict[str, dict]]:
         """Split parameters that can be fetched by GetParameters vs GetParameter
 
@@ -697,6 +802,8 @@ class SSMProvider(BaseProvider):
             How long to cache a parameter for
         decrypt : bool
             Whether to use KMS to decrypt a parameter
+        stale_while_revalidate : int
+            For how long an expired parameter can be served while it's refreshed in the background
 
         Returns
         -------
@@ -718,6 +825,9 @@ class SSMProvider(BaseProvider):
             if "max_age" not in _overrides:
                 _overrides["max_age"] = max_age
 
+            if "stale_while_revalidate" not in _overrides:
+                _overrides["stale_while_revalidate"] = stale_while_revalidate
+
             # NOTE: Split parameters who have decrypt OR have it global
             if _overrides["decrypt"]:
                 decrypt_parameters[parameter] = _overrides
@@ -726,6 +836,140 @@ class SSMProvider(BaseProvider):
 
         return batch_parameters, decrypt_parameters
 
+    def prefetch(  # type: ignore[override]
+        self,
+        parameters: dict[str, dict] | list[str],
+        max_age: int | None = None,
+        transform: TransformOptions = None,
+        decrypt: bool | None = None,
+        max_concurrency: int | None = None,
+        raise_on_error: bool = True,
+    ) -> PrefetchReport:
+        """
+        Fetch and cache parameters ahead of time, e.g. during the init phase, so later calls are served from cache
+
+        Parameters are fetched with as few GetParameters calls as possible, and cached under the same keys as
+        `get()`, or `get_multiple()` for paths.
+
+        Parameters
+        ----------
+        parameters: dict[str, dict] | list[str]
+            Parameter names, and any optional overrides of max_age, transform, decrypt or stale_while_revalidate.
+            Set the "path" override to True to fetch a path with `get_multiple()` instead, e.g.
+            `{"/app/config/": {"path": True, "recursive": True}}`.
+        max_age: int, optional
+            Maximum age of the cached values
+        transform: str, optional
+            Optional transformation of the parameter values
+        decrypt: bool, optional
+            If the parameter values should be decrypted
+        max_concurrency: int, optional
+            Maximum number of concurrent calls to SSM, by default 10
+        raise_on_error: bool
+            Whether to fail-fast or to report failed parameters in the returned `errors`, by default True
+
+        Raises
+        ------
+        GetParameterError
+            When the parameter provider fails to retrieve a parameter value, and raise_on_error is enabled
+        TransformParameterError
+            When the parameter provider fails to transform a parameter value, and raise_on_error is enabled
+        """
+        start = time.perf_counter()
+
+        if isinstance(parameters, list):
+            parameters = {name: {} for name in parameters}
+
+        # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
+        max_age = resolve_max_age(env=os.getenv(constants.PARAMETERS_MAX_AGE_ENV, DEFAULT_MAX_AGE_SECS), choice=max_age)
+
+        # If decrypt is not set, resolve it from the environment variable, defaulting to False
+        decrypt = resolve_truthy_env_var_choice(
+            env=os.getenv(constants.PARAMETERS_SSM_DECRYPT_ENV, "false"),
+            choice=decrypt,
+        )
+
+        stale_while_revalidate = resolve_max_age(
+            env=os.getenv(constants.PARAMETERS_STALE_WHILE_REVALIDATE_ENV, DEFAULT_STALE_WHILE_REVALIDATE_SECS),
+            choice=None,
+        )
+
+        tasks: list[Callable[[], list[str]]] = []
+
+        # NOTE: copy overrides as splitting parameters merges globals into them
+        names = {name: dict(options or {}) for name, options in parameters.items() if not (options or {}).get("path")}
+        batch_params, decrypt_params = self._split_batch_and_decrypt_parameters(
+            names,
+            transform,
+            max_age,
+            decrypt,
+            stale_while_revalidate,
+        )
+
+        # Unlike get_parameters_by_name, parameters to decrypt are also fetched in GetParameters chunks
+        for batch, with_decryption in ((batch_params, False), (decrypt_params, True)):
+            uncached = {
+                name: options
+                for name, options in batch.items()
+                if not self.has_not_expired_in_cache(self._build_cache_key(name=name, transform=options["transform"]))
+            }
+            tasks.extend(
+                functools.partial(self._prefetch_chunk, chunk, with_decryption, raise_on_error)
+                for chunk in slice_dictionary(data=uncached, chunk_size=self._MAX_GET_PARAMETERS_ITEM)
+            )
+
+        tasks.extend(
+            functools.partial(
+                self._prefetch_parameter,
+                path,
+                {"max_age": max_age, "transform": transform, "decrypt": decrypt, **options},
+                raise_on_error,
+            )
+            for path, options in parameters.items()
+            if path not in names
+        )
+
+        return self._run_prefetch(tasks, names=list(parameters), max_concurrency=max_concurrency, start=start)
+
+    def _prefetch_chunk(self, chunk: dict[str, dict], decrypt: bool, raise_on_error: bool) -> list[str]:
+        """Fetch a chunk of parameters with GetParameters and cache them individually, returning any that failed"""
+        try:
+            response = self.client.get_parameters(Names=list(chunk), WithDecryption=decrypt)
+        except Exception as exc:
+            if raise_on_error:
+                raise GetParameterError(str(exc)) from exc
+            return list(chunk)
+
+        errors = self._handle_any_invalid_get_parameter_errors(response, raise_on_error)
+
+        for parameter in response["Parameters"]:
+            name = parameter["Name"]
+            options = chunk[name]
+            value: Any = parameter["Value"]
+
+            if options["transform"]:
+                try:
+                    value = transform_value(
+                        key=name,
+                        value=value,
+                        transform=options["transform"],
+                        raise_on_transform_error=True,
+                    )
+                except TransformParameterError:
+                    if raise_on_error:
+                        raise
+                    errors.append(name)
+                    continue
+
+            self.add_to_cache(
+                key=self._build_cache_key(name=name, transform=options["transform"]),
+                value=value,
+                max_age=options["max_age"],
+                stale_while_revalidate=options["stale_while_revalidate"],
+            )
+
+        return errors
+
     @staticmethod
     def _raise_if_errors_key_is_present(parameters: dict, reserved_parameter: str, raise_on_error: bool):
         """Raise GetParameterError if fail-fast is disabled and '_errors' key is in parameters batch"""
@@ -742,6 +986,7 @@ def get_parameter(
     decrypt: bool | None = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str: ...
 
@@ -753,6 +998,7 @@ def get_parameter(
     decrypt: bool | None = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> dict: ...
 
@@ -764,6 +1010,7 @@ def get_parameter(
     decrypt: bool | None = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str | bytes | dict: ...
 
@@ -775,6 +1022,7 @@ def get_parameter(
     decrypt: bool | None = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> bytes: ...
 
@@ -785,6 +1033,7 @@ def get_parameter(
     decrypt: bool | None = None,
     force_fetch: bool = False,
     max_age: int | None = None,
+    stale_while_revalidate: int | None = None,
     **sdk_options,
 ) -> str | bytes | dict:
     """
@@ -802,6 +1051,9 @@ def get_parameter(
         Force update even before a cached item has expired, defaults to False
     max_age: int, optional
         Maximum age of the cached value
+    stale_while_revalidate: int, optional
+        For how long after expiring a cached value is still returned while it's refreshed in the background,
+        in seconds. Disabled by default.
     sdk_options: dict, optional
         Dictionary of options that will be passed to the Parameter Store get_parameter API call
 
@@ -853,6 +1105,7 @@ def get_parameter(
         transform=transform,
         force_fetch=force_fetch,
         decrypt=decrypt,
+        stale_while_revalidate=stale_while_revalidate,
         **sdk_options,
     )
 
@@ -1079,6 +1332,8 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    stale_while_revalidate: int | None = None,
+    max_concurrency: int | None = None,
 ) -> dict[str, str]: ...
 
 
@@ -1089,6 +1344,8 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    stale_while_revalidate: int | None = None,
+    max_concurrency: int | None = None,
 ) -> dict[str, bytes]: ...
 
 
@@ -1099,6 +1356,8 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    stale_while_revalidate: int | None = None,
+    max_concurrency: int | None = None,
 ) -> dict[str, dict[str, Any]]: ...
 
 
@@ -1109,6 +1368,8 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    stale_while_revalidate: int | None = None,
+    max_concurrency: int | None = None,
 ) -> dict[str, str] | dict[str, dict]: ...
 
 
@@ -1118,6 +1379,8 @@ def get_parameters_by_name(
     decrypt: bool | None = None,
     max_age: int | None = None,
     raise_on_error: bool = True,
+    stale_while_revalidate: int | None = None,
+    max_concurrency: int | None = None,
 ) -> dict[str, str] | dict[str, bytes] | dict[str, dict]:
     """
     Retrieve multiple parameter values by name from AWS Systems Manager (SSM) Parameter Store
@@ -1134,6 +1397,11 @@ def get_parameters_by_name(
         Maximum age of the cached value
     raise_on_error: bool, optional
         Whether to fail-fast or fail gracefully by including "_errors" key in the response, by default True
+    stale_while_revalidate: int, optional
+        For how long after expiring a cached value is still returned while it's refreshed in the background,
+        in seconds. Disabled by default.
+    max_concurrency: int, optional
+        Maximum number of concurrent calls to SSM, by default 1 which makes them serially
 
     Example
     -------
@@ -1167,7 +1435,7 @@ def get_parameters_by_name(
         a given name.
     """
 
-    # NOTE: Decided against using multi-thread due to single-thread outperforming in 128M and 1G + timeout risk
+    # NOTE: Serial by default due to single-thread outperforming in 128M and 1G + timeout risk; opt-in max_concurrency
     # see: https://github.com/aws-powertools/powertools-lambda-python/issues/1040#issuecomment-1299954613
 
     # If max_age is not set, resolve it from the environment variable, defaulting to DEFAULT_MAX_AGE_SECS
@@ -1189,4 +1457,6 @@ def get_parameters_by_name(
         transform=transform,
         decrypt=decrypt,
         raise_on_error=raise_on_error,
+        stale_while_revalidate=stale_while_revalidate,
+        max_concurrency=max_concurrency,
     )
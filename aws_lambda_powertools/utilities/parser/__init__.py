@@ -1,11 +1,17 @@
-"""Advanced event_parser utility
-"""
+"""Advanced event_parser utility"""
 
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from __future__ import annotations
 
-from aws_lambda_powertools.utilities.parser import envelopes
-from aws_lambda_powertools.utilities.parser.envelopes import BaseEnvelope
-from aws_lambda_powertools.utilities.parser.parser import event_parser, parse
+from typing import TYPE_CHECKING
+
+from aws_lambda_powertools.shared.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+    from aws_lambda_powertools.utilities.parser import envelopes
+    from aws_lambda_powertools.utilities.parser.envelopes import BaseEnvelope
+    from aws_lambda_powertools.utilities.parser.parser import event_parser, parse
 
 __all__ = [
     "event_parser",
@@ -18,3 +24,19 @@ __all__ = [
     "model_validator",
     "ValidationError",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    globals(),
+    {
+        "BaseModel": "pydantic",
+        "Field": "pydantic",
+        "ValidationError": "pydantic",
+        "field_validator": "pydantic",
+        "model_validator": "pydantic",
+        "envelopes": "aws_lambda_powertools.utilities.parser.envelopes",
+        "BaseEnvelope": "aws_lambda_powertools.utilities.parser.envelopes",
+        "event_parser": "aws_lambda_powertools.utilities.parser.parser",
+        "parse": "aws_lambda_powertools.utilities.parser.parser",
+    },
+)
@@ -0,0 +1,262 @@
+"""Offline cold start benchmark
+
+Measures the cold start cost of Powertools for AWS Lambda (Python) without deploying anything. Every run spawns a
+fresh interpreter, like a Lambda execution environment would, and measures:
+
+* `import_ms`: time to import the handler module and initialize global state (Lambda INIT phase)
+* `first_invocation_ms`: time to run the first invocation (Lambda first INVOKE phase)
+* `total_ms`: wall time of the whole process, interpreter startup included
+
+Results are aggregated as median and p99 across runs, and can be written as JSON and compared against a previous
+run for regression tracking.
+
+Usage:
+
+    python benchmark/cold_start.py --runs 20 --output results.json
+    python benchmark/cold_start.py --scenario instrumented --scenario reference
+    python benchmark/cold_start.py --baseline results.json --tolerance 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+BENCHMARK_DIR = Path(__file__).parent
+REPOSITORY_DIR = BENCHMARK_DIR.parent
+
+METRICS = ("import_ms", "first_invocation_ms", "total_ms")
+
+# Code each scenario runs in a fresh interpreter: `init` at import time, and `invoke` as the first invocation
+SCENARIOS: dict[str, dict[str, str]] = {
+    "reference": {
+        "init": "from main import handler",
+        "invoke": "handler({}, context)",
+        "path": str(BENCHMARK_DIR / "src" / "reference"),
+    },
+    "instrumented": {
+        "init": "from main import handler",
+        "invoke": "handler({}, context)",
+        "path": str(BENCHMARK_DIR / "src" / "instrumented"),
+    },
+    "logger": {
+        "init": "from aws_lambda_powertools import Logger\nlogger = Logger()",
+        "invoke": "logger.info('cold start')",
+    },
+    "metrics": {
+        "init": "from aws_lambda_powertools import Metrics\nmetrics = Metrics()",
+        "invoke": "metrics.add_metric(name='ColdStart', unit='Count', value=1)\nmetrics.flush_metrics()",
+    },
+    "tracer": {
+        "init": "from aws_lambda_powertools import Tracer\ntracer = Tracer()",
+        "invoke": "tracer.put_annotation(key='ColdStart', value=True)",
+    },
+    "event_handler": {
+        "init": (
+            "from aws_lambda_powertools.event_handler import APIGatewayRestResolver\n"
+            "app = APIGatewayRestResolver()\n"
+            "@app.get('/todos')\n"
+            "def get_todos():\n"
+            "    return {'todos': []}"
+        ),
+        "invoke": (
+            "app.resolve({'path': '/todos', 'httpMethod': 'GET', 'headers': {}, 'requestContext': {}}, context)"
+        ),
+    },
+    "parser": {
+        "init": (
+            "from aws_lambda_powertools.utilities.parser import BaseModel, parse\n"
+            "class Order(BaseModel):\n"
+            "    id: int\n"
+            "    description: str"
+        ),
+        "invoke": "parse(event={'id': 1, 'description': 'cold start'}, model=Order)",
+    },
+    "batch": {
+        "init": (
+            "from aws_lambda_powertools.utilities.batch import BatchProcessor, EventType, process_partial_response\n"
+            "processor = BatchProcessor(event_type=EventType.SQS)"
+        ),
+        "invoke": (
+            "process_partial_response(event={'Records': [{'messageId': '1', 'body': 'cold start', "
+            "'receiptHandle': '', 'attributes': {}, 'messageAttributes': {}, 'md5OfBody': '', "
+            "'eventSource': 'aws:sqs', 'eventSourceARN': '', 'awsRegion': 'us-east-1'}]}, "
+            "record_handler=lambda record: record.body, processor=processor, context=context)"
+        ),
+    },
+    "data_classes": {
+        "init": "from aws_lambda_powertools.utilities.data_classes import SQSEvent",
+        "invoke": "[record.body for record in SQSEvent({'Records': [{'body': 'cold start'}]}).records]",
+    },
+    "validation": {
+        "init": "from aws_lambda_powertools.utilities.validation import validate",
+        "invoke": "validate(event={'id': 1}, schema={'type': 'object', 'properties': {'id': {'type': 'integer'}}})",
+    },
+    "idempotency": {
+        "init": "from aws_lambda_powertools.utilities.idempotency import IdempotencyConfig, idempotent",
+        "invoke": "IdempotencyConfig(event_key_jmespath='id')",
+    },
+    "parameters": {
+        "init": "from aws_lambda_powertools.utilities.parameters import SSMProvider",
+        "invoke": "",
+    },
+}
+
+# Runs in the fresh interpreter; results are written to a file so handlers are free to use stdout
+CHILD_RUNNER = """
+import json, sys, time, types
+
+scenario = json.loads(sys.argv[1])
+if scenario.get("path"):
+    sys.path.insert(0, scenario["path"])
+
+context = types.SimpleNamespace(
+    function_name="cold-start-benchmark",
+    memory_limit_in_mb=128,
+    invoked_function_arn="arn:aws:lambda:us-east-1:123456789012:function:cold-start-benchmark",
+    aws_request_id="52fdfc07-2182-154f-163f-5f0f9a621d72",
+)
+namespace = {"context": context}
+
+start = time.perf_counter()
+exec(scenario["init"], namespace)
+import_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+exec(scenario["invoke"], namespace)
+first_invocation_ms = (time.perf_counter() - start) * 1000
+
+with open(sys.argv[2], "w") as results:
+    json.dump({"import_ms": import_ms, "first_invocation_ms": first_invocation_ms}, results)
+"""
+
+# Keep the benchmark hermetic: no credentials lookup, no X-Ray daemon, no warnings noise
+CHILD_ENV = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "POWERTOOLS_SERVICE_NAME": "cold-start-benchmark",
+    "POWERTOOLS_METRICS_NAMESPACE": "ColdStartBenchmark",
+    "POWERTOOLS_TRACE_DISABLED": "true",
+    "PYTHONWARNINGS": "ignore",
+}
+
+
+def run_once(scenario: dict[str, str]) -> dict[str, float]:
+    """Run a scenario in a fresh interpreter and return its timings in milliseconds"""
+    env = {**os.environ, **CHILD_ENV}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPOSITORY_DIR), env.get("PYTHONPATH")]))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results_file = Path(tmp_dir) / "results.json"
+
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", CHILD_RUNNER, json.dumps(scenario), str(results_file)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        total_ms = (time.perf_counter() - start) * 1000
+
+        timings = json.loads(results_file.read_text())
+
+    return {**timings, "total_ms": total_ms}
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Inclusive percentile, e.g. percentile(values, 99) for p99"""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def benchmark(name: str, runs: int) -> dict[str, Any]:
+    """Run a scenario `runs` times and aggregate its timings as median and p99"""
+    samples = [run_once(SCENARIOS[name]) for _ in range(runs)]
+
+    results: dict[str, Any] = {"runs": runs}
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples]
+        results[metric] = {
+            "median": round(statistics.median(values), 3),
+            "p99": round(percentile(values, 99), 3),
+        }
+
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return the median timings that regressed more than `tolerance` compared to a baseline run"""
+    regressions: list[str] = []
+    for name, scenario in results["scenarios"].items():
+        baseline_scenario = baseline["scenarios"].get(name)
+        if baseline_scenario is None:
+            continue
+
+        for metric in METRICS:
+            current, previous = scenario[metric]["median"], baseline_scenario[metric]["median"]
+            if previous and current > previous * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {previous:.3f}ms -> {current:.3f}ms")
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure Powertools for AWS Lambda (Python) cold starts locally")
+    parser.add_argument("--runs", type=int, default=20, help="Fresh interpreter runs per scenario (default: 20)")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Scenario to run, can be repeated (default: all)",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Previous JSON results to compare medians against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed median regression against the baseline, e.g. 0.1 for 10%% (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {},
+    }
+
+    print(f"{'scenario':<16}{'import p50/p99 (ms)':>24}{'invoke p50/p99 (ms)':>24}{'total p50/p99 (ms)':>24}")
+    for name in args.scenario or SCENARIOS:
+        scenario = results["scenarios"][name] = benchmark(name, args.runs)
+        columns = "".join(f"{scenario[m]['median']:>14.2f} / {scenario[m]['p99']:<7.2f}" for m in METRICS)
+        print(f"{name:<16}{columns}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
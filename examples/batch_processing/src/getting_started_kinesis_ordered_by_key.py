@@ -0,0 +1,27 @@
+import boto3
+
+from aws_lambda_powertools.utilities.batch import (
+    BatchProcessor,
+    EventType,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.kinesis_stream_event import KinesisStreamRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+processor = BatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=10, ordered_by_key=True)
+table = boto3.resource("dynamodb").Table("devices")
+
+
+def record_handler(record: KinesisStreamRecord):
+    # Readings from the same device share a partition key, so they're never applied out of order
+    reading: dict = record.kinesis.data_as_json()
+    table.put_item(Item={"id": record.kinesis.partition_key, "reading": reading})
+
+
+def lambda_handler(event, context: LambdaContext):
+    return process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=processor,
+        context=context,
+    )
@@ -0,0 +1,26 @@
+import boto3
+
+from aws_lambda_powertools.utilities.batch import (
+    BatchProcessor,
+    EventType,
+    process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+processor = BatchProcessor(event_type=EventType.SQS, max_workers=10)
+table = boto3.resource("dynamodb").Table("orders")
+
+
+def record_handler(record: SQSRecord):
+    # I/O bound calls release the GIL, so other records are processed while waiting for DynamoDB
+    table.put_item(Item={"id": record.message_id, "payload": record.body})
+
+
+def lambda_handler(event, context: LambdaContext):
+    return process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=processor,
+        context=context,
+    )
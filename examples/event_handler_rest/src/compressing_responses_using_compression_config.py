@@ -0,0 +1,32 @@
+import requests
+
+from aws_lambda_powertools import Logger, Tracer
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver, CompressionConfig
+from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+tracer = Tracer()
+logger = Logger()
+
+compression_config = CompressionConfig(
+    encodings=["br", "gzip"],  # br requires the `brotli` package; unavailable encodings are ignored
+    level=5,
+    minimum_size=1024,  # don't compress bodies smaller than 1KB
+    content_types=["application/json", "text/"],
+)
+app = APIGatewayRestResolver(compression_config=compression_config)
+
+
+@app.get("/todos", compress=True)
+@tracer.capture_method
+def get_todos():
+    todos: requests.Response = requests.get("https://jsonplaceholder.typicode.com/todos")
+    todos.raise_for_status()
+
+    return {"todos": todos.json()}
+
+
+@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
+@tracer.capture_lambda_handler
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
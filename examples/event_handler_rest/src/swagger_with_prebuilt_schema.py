@@ -0,0 +1,30 @@
+from typing import List
+
+import requests
+from pydantic import BaseModel, Field
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+app = APIGatewayRestResolver(enable_validation=True)
+# Built at packaging time with: python -m aws_lambda_powertools.event_handler.openapi app:app -o openapi.json
+app.enable_swagger(title="Todos API", openapi_schema_file="openapi.json")
+
+
+class Todo(BaseModel):
+    userId: int
+    id_: int = Field(alias="id")
+    title: str
+    completed: bool
+
+
+@app.get("/todos")
+def get_todos() -> List[Todo]:
+    todos = requests.get("https://jsonplaceholder.typicode.com/todos")
+    todos.raise_for_status()
+
+    return todos.json()
+
+
+def lambda_handler(event: dict, context: LambdaContext) -> dict:
+    return app.resolve(event, context)
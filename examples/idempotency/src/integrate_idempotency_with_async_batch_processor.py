@@ -0,0 +1,42 @@
+import os
+
+from aws_lambda_powertools.utilities.batch import (
+    AsyncBatchProcessor,
+    EventType,
+    async_process_partial_response,
+)
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.idempotency import (
+    IdempotencyConfig,
+    idempotent_function,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import (
+    AsyncRedisCachePersistenceLayer,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+processor = AsyncBatchProcessor(event_type=EventType.SQS)
+
+redis_endpoint = os.getenv("REDIS_CLUSTER_ENDPOINT", "localhost")
+persistence_layer = AsyncRedisCachePersistenceLayer(host=redis_endpoint, port=6379, max_connections=10)
+config = IdempotencyConfig(event_key_jmespath="messageId")
+
+
+@idempotent_function(data_keyword_argument="record", config=config, persistence_store=persistence_layer)
+async def process_record(record: dict):
+    return {"message": record["body"]}
+
+
+async def record_handler(record: SQSRecord):
+    return await process_record(record=record.raw_event)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    config.register_lambda_context(context)  # see Lambda timeouts section
+
+    return async_process_partial_response(
+        event=event,
+        record_handler=record_handler,
+        processor=processor,
+        context=context,
+    )
@@ -0,0 +1,30 @@
+import os
+from typing import Any, Dict
+
+from aws_lambda_powertools.utilities.batch import EventType, process_partial_response
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.idempotency import (
+    DynamoDBPersistenceLayer,
+    IdempotencyConfig,
+    IdempotentBatchProcessor,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+table = os.getenv("IDEMPOTENCY_TABLE", "")
+dynamodb = DynamoDBPersistenceLayer(table_name=table)
+config = IdempotencyConfig(event_key_jmespath="messageId")
+
+processor = IdempotentBatchProcessor(event_type=EventType.SQS, persistence_store=dynamodb, config=config)
+
+
+def record_handler(record: SQSRecord):
+    return {"message": record.body}
+
+
+def lambda_handler(event: Dict[str, Any], context: LambdaContext):
+    return process_partial_response(
+        event=event,
+        context=context,
+        processor=processor,
+        record_handler=record_handler,
+    )
@@ -0,0 +1,23 @@
+import os
+
+from aws_lambda_powertools.utilities.idempotency import (
+    idempotent,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import (
+    RedisCachePersistenceLayer,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+redis_endpoint = os.getenv("REDIS_CLUSTER_ENDPOINT", "localhost")
+persistence_layer = RedisCachePersistenceLayer(
+    host=redis_endpoint,
+    port=6379,
+    max_connections=10,  # (1)!
+    socket_keepalive=True,
+    health_check_interval=30,  # (2)!
+)
+
+
+@idempotent(persistence_store=persistence_layer)
+def lambda_handler(event: dict, context: LambdaContext):
+    return {"message": "success", "statusCode": 200}
@@ -0,0 +1,37 @@
+import os
+
+from aws_lambda_powertools.utilities.idempotency import (
+    DynamoDBPersistenceLayer,
+    IdempotencyConfig,
+    LocalCache,
+    idempotent_function,
+)
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+table = os.getenv("IDEMPOTENCY_TABLE", "")
+
+# a single 10 MB budget for all records cached in this execution environment
+local_cache = LocalCache(max_items=1024, max_bytes=10 * 1024 * 1024)  # (1)!
+config = IdempotencyConfig(use_local_cache=True, local_cache=local_cache)
+
+orders_persistence_layer = DynamoDBPersistenceLayer(table_name=table)
+payments_persistence_layer = DynamoDBPersistenceLayer(table_name=table)
+
+
+@idempotent_function(data_keyword_argument="order", config=config, persistence_store=orders_persistence_layer)
+def process_order(order: dict) -> dict:
+    return {"order_id": order["order_id"], "status": "processed"}
+
+
+@idempotent_function(data_keyword_argument="payment", config=config, persistence_store=payments_persistence_layer)
+def process_payment(payment: dict) -> dict:
+    return {"payment_id": payment["payment_id"], "status": "captured"}
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    config.register_lambda_context(context)
+
+    return {
+        "order": process_order(order=event["order"]),
+        "payment": process_payment(payment=event["payment"]),
+    }
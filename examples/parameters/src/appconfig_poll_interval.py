@@ -0,0 +1,17 @@
+from typing import Any
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+appconf_provider = parameters.AppConfigProvider(environment="dev", application="comments")
+logger = Logger()
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    features: Any = appconf_provider.get("features", transform="json", RequiredMinimumPollIntervalInSeconds=60)
+
+    # only polls AppConfig again once the poll interval elapsed, otherwise returns the last configuration
+    logger.info("Next poll", seconds=appconf_provider.seconds_until_next_poll("features"))
+
+    return {"features": features, "statusCode": 200}
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Any
+
+from aws_lambda_powertools.utilities.parameters.ssm import get_parameters_by_name
+
+# Fetched in GetParameters chunks of 10 names; the ones to decrypt via one GetParameter call each
+parameters = {f"/develop/service/tenants/{tenant}/config": {"transform": "json"} for tenant in range(200)}
+parameters["/develop/service/payment/api_key"] = {"decrypt": True}
+
+# Fetch up to 8 chunks or parameters concurrently during the init phase
+config: dict[str, Any] = get_parameters_by_name(parameters=parameters, max_concurrency=8)
+
+
+def handler(event, context):
+    return config[f"/develop/service/tenants/{event['tenant']}/config"]
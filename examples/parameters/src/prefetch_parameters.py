@@ -0,0 +1,32 @@
+from typing import Any
+
+from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+logger = Logger()
+
+# Fetched concurrently during the init phase, and cached for later calls
+reports = parameters.prefetch(
+    ssm={
+        "/lambda-powertools/endpoint_comments": {},
+        "/lambda-powertools/api-key": {"decrypt": True},
+        "/lambda-powertools/settings/": {"path": True, "recursive": True},
+    },
+    secrets=["/lambda-powertools/database"],
+    appconfig={"features": {"transform": "json"}},
+    environment="prod",
+)
+
+for source, report in reports.items():
+    logger.info("Prefetched parameters", source=source, count=len(report.fetched), duration_ms=report.duration_ms)
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    # Served from cache, no network calls
+    endpoint_comments: Any = parameters.get_parameter("/lambda-powertools/endpoint_comments")
+    api_key: Any = parameters.get_parameter("/lambda-powertools/api-key", decrypt=True)
+    settings: Any = parameters.get_parameters("/lambda-powertools/settings/", recursive=True)
+    features: Any = parameters.get_app_config("features", environment="prod", transform="json")
+
+    return {"endpoint": endpoint_comments, "has_api_key": bool(api_key), "settings": settings, "features": features}
@@ -0,0 +1,21 @@
+from typing import Any
+
+import requests
+
+from aws_lambda_powertools.utilities import parameters
+from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def lambda_handler(event: dict, context: LambdaContext):
+    try:
+        endpoint_comments: Any = parameters.get_parameter("/lambda-powertools/endpoint_comments")
+        # Cached for 5 minutes, then served for up to 1 more minute while it's refreshed in the background
+        api_key: Any = parameters.get_secret("/lambda-powertools/api-key", max_age=300, stale_while_revalidate=60)
+
+        headers: dict = {"X-API-Key": api_key}
+
+        comments: requests.Response = requests.get(endpoint_comments, headers=headers)
+
+        return {"comments": comments.json()[:10], "statusCode": 200}
+    except parameters.exceptions.GetParameterError as error:
+        return {"comments": None, "message": str(error), "statusCode": 400}
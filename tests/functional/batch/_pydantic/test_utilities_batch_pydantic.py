@@ -4,7 +4,7 @@ from random import randint
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 import pytest
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationError, field_validator
 
 from aws_lambda_powertools.utilities.batch import (
     AsyncBatchProcessor,
@@ -485,6 +485,35 @@ def test_sqs_fifo_batch_processor_middleware_with_skip_group_on_error_and_model(
     assert result["batchItemFailures"][2]["itemIdentifier"] == fifth_record.message_id
 
 
+def test_sqs_fifo_batch_processor_max_workers_with_model_validation_error_after_failure(sqs_event_fifo_factory):
+    # GIVEN a message group failing on its second message, followed by a malformed message and a valid message
+    records = [
+        sqs_event_fifo_factory("success", "1"),
+        sqs_event_fifo_factory("fail", "1"),
+        sqs_event_fifo_factory("success", "1"),
+        sqs_event_fifo_factory("success", "1"),
+    ]
+    del records[2]["receiptHandle"]
+
+    class OrderSqsRecord(SqsRecordModel):
+        receiptHandle: str
+
+    def record_handler(record: OrderSqsRecord):
+        if record.body == "fail":
+            raise ValueError("blah")
+
+    processor = SqsFifoPartialProcessor(model=OrderSqsRecord, max_workers=2)
+
+    # WHEN processing message groups concurrently
+    with processor(records, record_handler) as batch:
+        batch.process()
+
+    # THEN the malformed message is reported as failing validation, rather than not processed before the timeout
+    failures = [{"itemIdentifier": record["messageId"]} for record in records[1:]]
+    assert batch.response() == {"batchItemFailures": failures}
+    assert processor.exceptions[1][0] is ValidationError
+
+
 def test_batch_processor_model_with_partial_validation_error(
     record_handler_model: Callable,
     sqs_event_factory,
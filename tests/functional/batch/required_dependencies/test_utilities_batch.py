@@ -1,4 +1,7 @@
+import asyncio
 import json
+import threading
+import time
 import uuid
 from random import randint
 from typing import Any, Awaitable, Callable, Dict
@@ -15,7 +18,14 @@ from aws_lambda_powertools.utilities.batch import (
     batch_processor,
     process_partial_response,
 )
-from aws_lambda_powertools.utilities.batch.exceptions import BatchProcessingError
+from aws_lambda_powertools.utilities.batch.base import DEADLINE_MARGIN_MS
+from aws_lambda_powertools.utilities.batch.exceptions import (
+    BatchProcessingDeadlineError,
+    BatchProcessingError,
+    BatchProcessingKeyCircuitBreakerError,
+    SQSFifoCircuitBreakerError,
+    SQSFifoMessageGroupCircuitBreakerError,
+)
 from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import (
     DynamoDBRecord,
 )
@@ -708,3 +718,369 @@ def test_async_process_partial_response_invalid_input(async_record_handler: Call
     # WHEN/THEN
     with pytest.raises(ValueError):
         async_process_partial_response(batch, record_handler, processor)
+
+
+class DeadlineContext:
+    def __init__(self, remaining_time_in_millis: int):
+        self.remaining_time_in_millis = remaining_time_in_millis
+
+    def get_remaining_time_in_millis(self) -> int:
+        return self.remaining_time_in_millis
+
+
+def test_batch_processor_max_workers_processes_records_concurrently(sqs_event_factory):
+    # GIVEN a record handler that only completes once all records are being processed at the same time
+    records = [sqs_event_factory(f"success-{i}") for i in range(4)]
+    barrier = threading.Barrier(len(records), timeout=5)
+
+    def handler(record: SQSRecord):
+        barrier.wait()
+        return record.body
+
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=len(records))
+
+    # WHEN processing records with as many workers as records
+    with processor(records, handler) as batch:
+        processed_messages = batch.process()
+
+    # THEN every record succeeds
+    assert [message[1] for message in processed_messages] == [record["body"] for record in records]
+    assert batch.response() == {"batchItemFailures": []}
+
+
+def test_batch_processor_max_workers_preserves_order(sqs_event_factory):
+    # GIVEN records completing in reverse order, some of them failing
+    records = [sqs_event_factory(f"{status}-{i}") for i, status in enumerate(["success", "fail", "success", "fail"])]
+
+    def handler(record: SQSRecord):
+        status, index = record.body.split("-")
+        time.sleep(0.01 * (len(records) - int(index)))
+        if status == "fail":
+            raise ValueError("Failed to process record.")
+        return record.body
+
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=4)
+
+    # WHEN processing them concurrently
+    with processor(records, handler) as batch:
+        processed_messages = batch.process()
+
+    # THEN outcomes, successes and failures are reported in the order of records
+    assert [message[0] for message in processed_messages] == ["success", "fail", "success", "fail"]
+    assert batch.success_messages == [records[0], records[2]]
+    assert [message.message_id for message in batch.fail_messages] == [records[1]["messageId"], records[3]["messageId"]]
+    assert batch.response() == {
+        "batchItemFailures": [{"itemIdentifier": records[1]["messageId"]}, {"itemIdentifier": records[3]["messageId"]}],
+    }
+
+
+def test_batch_processor_max_workers_reports_records_past_deadline_as_failed(sqs_event_factory):
+    # GIVEN a record handler stuck on one record, and a Lambda function about to time out
+    records = [sqs_event_factory("success"), sqs_event_factory("stuck"), sqs_event_factory("success")]
+    release = threading.Event()
+
+    def handler(record: SQSRecord):
+        if record.body == "stuck":
+            release.wait(timeout=5)
+        return record.body
+
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=3)
+    context = DeadlineContext(remaining_time_in_millis=DEADLINE_MARGIN_MS + 100)
+
+    # WHEN processing records concurrently
+    try:
+        with processor(records, handler, lambda_context=context) as batch:
+            processed_messages = batch.process()
+    finally:
+        release.set()
+
+    # THEN the pending record is reported as failed without waiting for it
+    assert [message[0] for message in processed_messages] == ["success", "fail", "success"]
+    assert batch.exceptions[0][0] is BatchProcessingDeadlineError
+    assert batch.response() == {"batchItemFailures": [{"itemIdentifier": records[1]["messageId"]}]}
+
+
+def test_batch_processor_max_workers_warns_about_records_still_running_past_deadline(sqs_event_factory, caplog):
+    # GIVEN a record handler stuck on one record, and a Lambda function about to time out
+    records = [sqs_event_factory("success"), sqs_event_factory("stuck"), sqs_event_factory("success")]
+    release = threading.Event()
+
+    def handler(record: SQSRecord):
+        if record.body == "stuck":
+            release.wait(timeout=5)
+        return record.body
+
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=3)
+    context = DeadlineContext(remaining_time_in_millis=DEADLINE_MARGIN_MS + 100)
+
+    # WHEN processing records concurrently
+    try:
+        with processor(records, handler, lambda_context=context) as batch:
+            batch.process()
+    finally:
+        release.set()
+
+    # THEN a warning names the record whose handler is still running
+    warnings = [log for log in caplog.records if log.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert records[1]["messageId"] in warnings[0].getMessage()
+    assert records[0]["messageId"] not in warnings[0].getMessage()
+
+
+def test_batch_processor_ordered_by_key_warns_about_records_still_running_past_deadline(kinesis_event_factory, caplog):
+    # GIVEN a record handler stuck on the first record of a partition key, and a Lambda function about to time out
+    records = [kinesis_event_factory(body) for body in ("1-stuck", "1-b", "2-a")]
+    for sequence_number, record in enumerate(records, start=1):
+        record["kinesis"]["partitionKey"] = b64_to_str(record["kinesis"]["data"])[0]
+        record["kinesis"]["sequenceNumber"] = str(sequence_number)
+    release = threading.Event()
+
+    def handler(record: KinesisStreamRecord):
+        if b64_to_str(record.kinesis.data).endswith("stuck"):
+            release.wait(timeout=5)
+
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=2, ordered_by_key=True)
+    context = DeadlineContext(remaining_time_in_millis=DEADLINE_MARGIN_MS + 100)
+
+    # WHEN processing partition keys concurrently
+    try:
+        with processor(records, handler, lambda_context=context) as batch:
+            batch.process()
+    finally:
+        release.set()
+
+    # THEN a warning only names the record still running, not the records of its key it didn't start
+    warnings = [log for log in caplog.records if log.levelname == "WARNING"]
+    assert len(warnings) == 1
+    assert warnings[0].getMessage().startswith("Record handlers still running at the Lambda function timeout: 1.")
+
+
+def test_process_partial_response_with_max_workers(sqs_event_factory, record_handler):
+    # GIVEN a processor with a thread pool
+    records = [sqs_event_factory("success"), sqs_event_factory("fail"), sqs_event_factory("success")]
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=2)
+
+    # WHEN
+    ret = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN
+    assert ret == {"batchItemFailures": [{"itemIdentifier": records[1]["messageId"]}]}
+
+
+def test_async_batch_processor_max_workers_bounds_concurrency(sqs_event_factory):
+    # GIVEN an async record handler tracking how many records are processed at the same time
+    records = [sqs_event_factory(f"success-{i}") for i in range(10)]
+    in_flight = []
+    max_in_flight = []
+
+    async def handler(record: SQSRecord):
+        in_flight.append(record)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(record)
+        return record.body
+
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_workers=3)
+
+    # WHEN processing records with at most 3 at a time
+    with processor(records, handler) as batch:
+        processed_messages = batch.async_process()
+
+    # THEN no more than 3 records are processed concurrently, and every record succeeds
+    assert max(max_in_flight) == 3
+    assert [message[1] for message in processed_messages] == [record["body"] for record in records]
+    assert batch.response() == {"batchItemFailures": []}
+
+
+def test_async_batch_processor_cancels_records_past_deadline(sqs_event_factory):
+    # GIVEN an async record handler stuck on one record, and a Lambda function about to time out
+    records = [sqs_event_factory("success"), sqs_event_factory("stuck"), sqs_event_factory("success")]
+    cancelled = []
+
+    async def handler(record: SQSRecord):
+        if record.body == "stuck":
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(record.message_id)
+                raise
+        return record.body
+
+    processor = AsyncBatchProcessor(event_type=EventType.SQS)
+    context = DeadlineContext(remaining_time_in_millis=DEADLINE_MARGIN_MS + 100)
+
+    # WHEN processing records
+    with processor(records, handler, lambda_context=context) as batch:
+        processed_messages = batch.async_process()
+
+    # THEN the pending record is cancelled and reported as failed, and the partial batch response is returned
+    assert cancelled == [records[1]["messageId"]]
+    assert [message[0] for message in processed_messages] == ["success", "fail", "success"]
+    assert batch.exceptions[0][0] is BatchProcessingDeadlineError
+    assert batch.response() == {"batchItemFailures": [{"itemIdentifier": records[1]["messageId"]}]}
+
+
+def test_async_process_partial_response_with_max_workers(sqs_event_factory, async_record_handler):
+    # GIVEN a processor with bounded concurrency
+    records = [sqs_event_factory("success"), sqs_event_factory("fail"), sqs_event_factory("success")]
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_workers=1)
+
+    # WHEN
+    ret = async_process_partial_response({"Records": records}, async_record_handler, processor)
+
+    # THEN
+    assert ret == {"batchItemFailures": [{"itemIdentifier": records[1]["messageId"]}]}
+
+
+def test_sqs_fifo_batch_processor_max_workers_processes_groups_concurrently(sqs_event_fifo_factory):
+    # GIVEN two message groups, whose first messages only complete once both groups are being processed
+    records = [
+        sqs_event_fifo_factory("1-a", "1"),
+        sqs_event_fifo_factory("2-a", "2"),
+        sqs_event_fifo_factory("1-b", "1"),
+        sqs_event_fifo_factory("2-b", "2"),
+    ]
+    barrier = threading.Barrier(2, timeout=5)
+    processed = {"1": [], "2": []}
+
+    def handler(record: SQSRecord):
+        group_id = record.attributes.message_group_id
+        if record.body.endswith("a"):
+            barrier.wait()
+        processed[group_id].append(record.body)
+        return record.body
+
+    processor = SqsFifoPartialProcessor(max_workers=2)
+
+    # WHEN processing message groups concurrently
+    with processor(records, handler) as batch:
+        processed_messages = batch.process()
+
+    # THEN messages are processed in order within each group, and outcomes are reported in the order of records
+    assert processed == {"1": ["1-a", "1-b"], "2": ["2-a", "2-b"]}
+    assert [message[1] for message in processed_messages] == ["1-a", "2-a", "1-b", "2-b"]
+    assert batch.response() == {"batchItemFailures": []}
+
+
+def test_sqs_fifo_batch_processor_max_workers_with_skip_group_on_error(sqs_event_fifo_factory, record_handler):
+    # GIVEN a batch of 5 records with 3 different MessageGroupID, where groups 1 and 2 fail on their first message
+    records = [
+        sqs_event_fifo_factory("fail", "1"),
+        sqs_event_fifo_factory("success", "1"),
+        sqs_event_fifo_factory("fail", "2"),
+        sqs_event_fifo_factory("success", "2"),
+        sqs_event_fifo_factory("success", "3"),
+    ]
+    processor = SqsFifoPartialProcessor(skip_group_on_error=True, max_workers=3)
+
+    # WHEN processing message groups concurrently
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN messages from group 1 and 2 fail, but not group 3, in the order of records
+    assert result == {"batchItemFailures": [{"itemIdentifier": record["messageId"]} for record in records[:4]]}
+    assert [exception[0] for exception in processor.exceptions] == [
+        Exception,
+        SQSFifoMessageGroupCircuitBreakerError,
+        Exception,
+        SQSFifoMessageGroupCircuitBreakerError,
+    ]
+
+
+def test_sqs_fifo_batch_processor_max_workers_short_circuits_failed_group(sqs_event_fifo_factory, record_handler):
+    # GIVEN a single message group failing on its second message
+    records = [
+        sqs_event_fifo_factory("success", "1"),
+        sqs_event_fifo_factory("fail", "1"),
+        sqs_event_fifo_factory("success", "1"),
+    ]
+    processor = SqsFifoPartialProcessor(max_workers=2)
+
+    # WHEN processing message groups concurrently
+    result = process_partial_response({"Records": records}, record_handler, processor)
+
+    # THEN the failed message and the remaining messages of its group fail
+    assert result == {"batchItemFailures": [{"itemIdentifier": record["messageId"]} for record in records[1:]]}
+    assert processor.exceptions[1][0] is SQSFifoCircuitBreakerError
+
+
+def test_batch_processor_ordered_by_key_processes_kinesis_partition_keys_concurrently(kinesis_event_factory):
+    # GIVEN two partition keys, whose first records only complete once both keys are being processed
+    records = [kinesis_event_factory(body) for body in ("1-a", "2-a", "1-b", "2-b")]
+    for sequence_number, record in enumerate(records, start=1):
+        record["kinesis"]["partitionKey"] = b64_to_str(record["kinesis"]["data"])[0]
+        record["kinesis"]["sequenceNumber"] = str(sequence_number)
+    barrier = threading.Barrier(2, timeout=5)
+    processed = {"1": [], "2": []}
+
+    def handler(record: KinesisStreamRecord):
+        body = b64_to_str(record.kinesis.data)
+        if body.endswith("a"):
+            barrier.wait()
+        processed[record.kinesis.partition_key].append(body)
+        return body
+
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=2, ordered_by_key=True)
+
+    # WHEN processing partition keys concurrently
+    with processor(records, handler) as batch:
+        processed_messages = batch.process()
+
+    # THEN records are processed in order within each key, and outcomes are reported in the order of records
+    assert processed == {"1": ["1-a", "1-b"], "2": ["2-a", "2-b"]}
+    assert [message[1] for message in processed_messages] == ["1-a", "2-a", "1-b", "2-b"]
+    assert batch.response() == {"batchItemFailures": []}
+
+
+def test_batch_processor_ordered_by_key_reports_lowest_failed_sequence_number(
+    kinesis_event_factory,
+    kinesis_record_handler,
+):
+    # GIVEN two partition keys, failing on their second and third record
+    records = [kinesis_event_factory(body) for body in ("success", "success", "success", "fail", "fail", "success")]
+    for sequence_number, record in enumerate(records, start=1):
+        record["kinesis"]["partitionKey"] = str(sequence_number % 2)
+        record["kinesis"]["sequenceNumber"] = str(sequence_number)
+    processor = BatchProcessor(event_type=EventType.KinesisDataStreams, max_workers=2, ordered_by_key=True)
+
+    # WHEN processing partition keys concurrently
+    result = process_partial_response({"Records": records}, kinesis_record_handler, processor)
+
+    # THEN records after a failure in the same key aren't processed
+    assert [exception[0] for exception in processor.exceptions] == [
+        Exception,
+        Exception,
+        BatchProcessingKeyCircuitBreakerError,
+    ]
+
+    # AND only the lowest failed sequence number is reported, from which Lambda retries the shard
+    assert result == {"batchItemFailures": [{"itemIdentifier": "4"}]}
+
+
+def test_batch_processor_ordered_by_key_groups_dynamodb_records_by_keys(
+    dynamodb_event_factory,
+    dynamodb_record_handler,
+):
+    # GIVEN two items, where the first change of item 101 fails
+    records = [dynamodb_event_factory(body) for body in ("fail", "success", "success")]
+    records[1]["dynamodb"]["Keys"] = {"Id": {"N": "102"}}
+    for sequence_number, record in enumerate(records, start=1):
+        record["dynamodb"]["SequenceNumber"] = str(sequence_number * 100)
+    processor = BatchProcessor(event_type=EventType.DynamoDBStreams, max_workers=2, ordered_by_key=True)
+
+    # WHEN processing items concurrently
+    result = process_partial_response({"Records": records}, dynamodb_record_handler, processor)
+
+    # THEN the next change of item 101 isn't processed, unlike item 102
+    assert [record["dynamodb"]["SequenceNumber"] for record in processor.success_messages] == ["200"]
+    assert processor.exceptions[1][0] is BatchProcessingKeyCircuitBreakerError
+
+    # AND the lowest failed sequence number is reported
+    assert result == {"batchItemFailures": [{"itemIdentifier": "100"}]}
+
+
+def test_batch_processor_ordered_by_key_not_supported_for_sqs():
+    # GIVEN an SQS event type
+    # WHEN processing records in order by key
+    # THEN it's rejected in favor of the SQS FIFO processor
+    with pytest.raises(ValueError, match="SqsFifoPartialProcessor"):
+        BatchProcessor(event_type=EventType.SQS, ordered_by_key=True)
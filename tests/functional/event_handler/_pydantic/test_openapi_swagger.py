@@ -1,10 +1,12 @@
 import json
+import sys
 import warnings
 from typing import Dict
 
 import pytest
 
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.event_handler.openapi.cli import main, write_openapi_schema_file
 from aws_lambda_powertools.event_handler.openapi.swagger_ui import OAuth2Config
 from tests.functional.utils import load_event
 
@@ -124,3 +126,101 @@ def test_openapi_swagger_oauth2_with_powertools_dev(monkeypatch):
         )
 
     monkeypatch.delenv("POWERTOOLS_DEV")
+
+
+def test_openapi_swagger_schema_generated_once(mocker):
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger(title="OpenAPI JSON View")
+    get_openapi_schema_spy = mocker.spy(app, "get_openapi_schema")
+
+    @app.get("/todos")
+    def get_todos() -> Dict:
+        return {}
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["queryStringParameters"] = {"format": "json"}
+
+    # Repeated requests are served from the memoized schema
+    first_result = app(event, {})
+    second_result = app(event, {})
+    assert first_result["body"] == second_result["body"]
+    assert get_openapi_schema_spy.call_count == 1
+
+    # Routes registered later invalidate the memoized schema
+    @app.get("/users")
+    def get_users() -> Dict:
+        return {}
+
+    result = app(event, {})
+    assert get_openapi_schema_spy.call_count == 2
+    assert "/users" in json.loads(result["body"])["paths"]
+
+
+def test_openapi_swagger_with_schema_file(tmp_path, mocker):
+    schema_file = tmp_path / "openapi.json"
+
+    def build_app() -> APIGatewayRestResolver:
+        app = APIGatewayRestResolver(enable_validation=True)
+        app.enable_swagger(title="OpenAPI from file", openapi_schema_file=schema_file)
+
+        @app.get("/todos")
+        def get_todos() -> Dict:
+            return {}
+
+        return app
+
+    # Build the schema file ahead of time with the swagger settings
+    write_openapi_schema_file(build_app(), schema_file)
+
+    app = build_app()
+    get_openapi_schema_spy = mocker.spy(app, "get_openapi_schema")
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["requestContext"]["stage"] = "prod"
+    event["requestContext"]["path"] = "/prod/swagger"
+    event["queryStringParameters"] = {"format": "json"}
+    result = app(event, {})
+
+    # The schema comes from the file, with servers matching the current stage
+    schema = json.loads(result["body"])
+    assert get_openapi_schema_spy.call_count == 0
+    assert schema["info"]["title"] == "OpenAPI from file"
+    assert "/todos" in schema["paths"]
+    assert schema["servers"] == [{"url": "/prod"}]
+
+
+def test_openapi_swagger_with_missing_schema_file(tmp_path, mocker):
+    app = APIGatewayRestResolver(enable_validation=True)
+    app.enable_swagger(title="OpenAPI JSON View", openapi_schema_file=tmp_path / "missing.json")
+    get_openapi_schema_spy = mocker.spy(app, "get_openapi_schema")
+
+    event = load_event("apiGatewayProxyEvent.json")
+    event["path"] = "/swagger"
+    event["queryStringParameters"] = {"format": "json"}
+    result = app(event, {})
+
+    # Without the file, we generate the schema instead
+    assert result["statusCode"] == 200
+    assert get_openapi_schema_spy.call_count == 1
+    assert "OpenAPI JSON View" in result["body"]
+
+
+def test_openapi_schema_cli(tmp_path, monkeypatch):
+    (tmp_path / "cli_app.py").write_text(
+        "from aws_lambda_powertools.event_handler import APIGatewayRestResolver\n"
+        "app = APIGatewayRestResolver(enable_validation=True)\n"
+        "app.enable_swagger(title='CLI app')\n"
+        "@app.get('/todos')\n"
+        "def get_todos():\n"
+        "    return {}\n",
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("sys.path", list(sys.path))
+
+    main(["cli_app:app", "--output", "schema.json"])
+
+    schema = json.loads((tmp_path / "schema.json").read_text())
+    assert schema["info"]["title"] == "CLI app"
+    assert "/todos" in schema["paths"]
@@ -12,11 +12,13 @@ from aws_lambda_powertools.event_handler import (
     ALBResolver,
     APIGatewayHttpResolver,
     APIGatewayRestResolver,
+    JSONSerializer,
     LambdaFunctionUrlResolver,
     Response,
     VPCLatticeResolver,
     VPCLatticeV2Resolver,
 )
+from aws_lambda_powertools.event_handler.middlewares import openapi_validation
 from aws_lambda_powertools.event_handler.openapi.params import Body, Header, Query
 
 
@@ -238,6 +240,66 @@ def test_validate_return_model(gw_event):
     assert json.loads(result["body"]) == {"name": "John", "age": 30}
 
 
+def test_validate_return_model_with_json_serializer(gw_event, mocker):
+    # GIVEN an APIGatewayRestResolver with validation enabled and a JSONSerializer backend
+    serializer = JSONSerializer()
+    app = APIGatewayRestResolver(enable_validation=True, serializer=serializer)
+    serializer_spy = mocker.spy(serializer, "_serializer")
+
+    class Model(BaseModel):
+        name: str
+        age: int
+
+    # WHEN a handler is defined with a return type as Pydantic model
+    @app.get("/")
+    def handler() -> Model:
+        return Model(name="John", age=30)
+
+    gw_event["path"] = "/"
+
+    # THEN the handler should be invoked and return 200
+    # THEN the body is serialized to JSON by the serializer backend, like the default serializer does
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert result["body"] == '{"name":"John","age":30}'
+    serializer_spy.assert_called_once()
+
+
+@pytest.mark.parametrize("enable_validation", [True, False])
+def test_validate_return_str_with_json_serializer(gw_event, enable_validation: bool):
+    # GIVEN an APIGatewayRestResolver with a JSONSerializer backend, with or without validation
+    app = APIGatewayRestResolver(enable_validation=enable_validation, serializer=JSONSerializer())
+
+    # WHEN a handler is defined with a str return type
+    @app.get("/")
+    def handler() -> str:
+        return "hello"
+
+    gw_event["path"] = "/"
+
+    # THEN the string is returned as the body as-is, like without a serializer
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert result["body"] == "hello"
+
+
+def test_validate_return_without_annotation_with_json_serializer(gw_event):
+    # GIVEN an APIGatewayRestResolver with validation enabled and a JSONSerializer backend
+    app = APIGatewayRestResolver(enable_validation=True, serializer=JSONSerializer())
+
+    # WHEN a handler is defined without a return type
+    @app.get("/")
+    def handler():
+        return {"name": "John", "tags": ("a", "b")}
+
+    gw_event["path"] = "/"
+
+    # THEN the response is serialized with the serializer backend
+    result = app(gw_event, {})
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"name": "John", "tags": ["a", "b"]}
+
+
 def test_validate_invalid_return_model(gw_event):
     # GIVEN an APIGatewayRestResolver with validation enabled
     app = APIGatewayRestResolver(enable_validation=True)
@@ -364,6 +426,78 @@ def test_validate_embed_body_param(gw_event):
     assert result["statusCode"] == 200
 
 
+def test_validate_embed_body_param_with_non_object_body(gw_event):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+
+    class Model(BaseModel):
+        name: str
+        age: int
+
+    # WHEN a handler is defined with an embedded body parameter
+    @app.post("/")
+    def handler(user: Annotated[Model, Body(embed=True)]) -> Model:
+        return user
+
+    gw_event["httpMethod"] = "POST"
+    gw_event["path"] = "/"
+    gw_event["body"] = json.dumps([{"name": "John", "age": 30}])
+
+    # THEN the handler should be invoked and return 422
+    # THEN the embedded body param is reported as missing
+    result = app(gw_event, {})
+    assert result["statusCode"] == 422
+    assert json.loads(result["body"])["detail"] == [{"loc": ["body", "user"], "type": "missing"}]
+
+
+def test_validate_request_compiles_route_validator_once(gw_event, mocker):
+    # GIVEN an APIGatewayRestResolver with validation enabled
+    app = APIGatewayRestResolver(enable_validation=True)
+    create_request_model_spy = mocker.spy(openapi_validation, "create_request_model")
+
+    # WHEN a handler is defined with path, query, header and body parameters
+    @app.post("/users/<user_id>")
+    def handler(
+        user_id: int,
+        user: Annotated[dict, Body(embed=True)],
+        limit: Annotated[int, Query(gt=0)] = 10,
+        request_id: Annotated[str, Header()] = "",
+    ):
+        return {"user_id": user_id, "user": user, "limit": limit, "request_id": request_id}
+
+    gw_event["httpMethod"] = "POST"
+    gw_event["path"] = "/users/123"
+    gw_event["multiValueQueryStringParameters"] = {"limit": ["5", "6"]}
+    gw_event["multiValueHeaders"] = {"Request-Id": ["abc"]}
+    gw_event["body"] = json.dumps({"user": {"name": "John"}})
+
+    # THEN every parameter is validated and coerced
+    for _ in range(2):
+        result = app(gw_event, {})
+        assert result["statusCode"] == 200
+        assert json.loads(result["body"]) == {
+            "user_id": 123,
+            "user": {"name": "John"},
+            "limit": 5,
+            "request_id": "abc",
+        }
+
+    # THEN the route request validator is compiled on the first request only
+    create_request_model_spy.assert_called_once()
+
+    # THEN errors of every location are reported in a single response
+    gw_event["path"] = "/users/abc"
+    gw_event["multiValueQueryStringParameters"] = {"limit": ["0"]}
+    gw_event["body"] = json.dumps({})
+    result = app(gw_event, {})
+    assert result["statusCode"] == 422
+    assert [(error["type"], error["loc"]) for error in json.loads(result["body"])["detail"]] == [
+        ("int_parsing", ["path", "user_id"]),
+        ("greater_than", ["query", "limit"]),
+        ("missing", ["body", "user"]),
+    ]
+
+
 def test_validate_response_return(gw_event):
     # GIVEN an APIGatewayRestResolver with validation enabled
     app = APIGatewayRestResolver(enable_validation=True)
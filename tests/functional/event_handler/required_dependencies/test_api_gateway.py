@@ -18,6 +18,7 @@ from aws_lambda_powertools.event_handler.api_gateway import (
     APIGatewayHttpResolver,
     ApiGatewayResolver,
     APIGatewayRestResolver,
+    CompressionConfig,
     CORSConfig,
     ProxyEventType,
     Response,
@@ -1903,3 +1904,215 @@ def test_alb_empty_response_object():
     # THEN body should be converted to an empty string
     assert result["statusCode"] == 200
     assert result["body"] == ""
+
+
+def test_route_match_prioritize_static_routes_registered_later():
+    # GIVEN a dynamic route registered before a static route sharing the same prefix
+    app = ApiGatewayResolver()
+
+    @app.get("/accounts/<account_id>")
+    def get_account(account_id: str):
+        return {"handler": "dynamic", "account_id": account_id}
+
+    @app.get("/accounts/fetch")
+    def fetch_accounts():
+        return {"handler": "static"}
+
+    # WHEN calling the event handler with both paths
+    static_result = app({"path": "/accounts/fetch", "httpMethod": "GET"}, {})
+    dynamic_result = app({"path": "/accounts/123", "httpMethod": "GET"}, {})
+
+    # THEN the static route wins for its exact path and the dynamic route handles the rest
+    assert json.loads(static_result["body"]) == {"handler": "static"}
+    assert json.loads(dynamic_result["body"]) == {"handler": "dynamic", "account_id": "123"}
+
+
+def test_route_match_prioritize_dynamic_routes_in_registration_order():
+    # GIVEN two dynamic routes that can both match the same path
+    app = ApiGatewayResolver()
+
+    @app.get("/<resource>/<resource_id>")
+    def get_any(resource: str, resource_id: str):
+        return {"handler": "generic"}
+
+    @app.get("/accounts/<account_id>")
+    def get_account(account_id: str):
+        return {"handler": "accounts"}
+
+    # WHEN calling the event handler with a path matching both routes
+    result = app({"path": "/accounts/123", "httpMethod": "GET"}, {})
+
+    # THEN the first registered route wins, as with a linear scan
+    assert json.loads(result["body"]) == {"handler": "generic"}
+
+
+def test_route_match_dynamic_segment_with_literal_text():
+    # GIVEN a route mixing literal text and route parameters in the same path segment
+    app = ApiGatewayResolver()
+
+    @app.get("/reports/<year>-<month>/v<version>")
+    def get_report(year: str, month: str, version: str):
+        return {"year": year, "month": month, "version": version}
+
+    # WHEN calling the event handler with matching and non-matching paths
+    result = app({"path": "/reports/2024-06/v2", "httpMethod": "GET"}, {})
+    not_found = app({"path": "/reports/2024-06/2", "httpMethod": "GET"}, {})
+
+    # THEN route parameters are extracted per segment and non-matching segments are not found
+    assert json.loads(result["body"]) == {"year": "2024", "month": "06", "version": "2"}
+    assert not_found["statusCode"] == 404
+
+
+def test_route_match_regex_rule_alongside_indexed_routes():
+    # GIVEN a catch-all regex rule registered between a static and a dynamic route
+    app = ApiGatewayResolver()
+
+    @app.get("/health")
+    def health():
+        return {"handler": "health"}
+
+    @app.get(".+")
+    def catch_all():
+        return {"handler": "catch_all"}
+
+    @app.get("/accounts/<account_id>")
+    def get_account(account_id: str):
+        return {"handler": "accounts"}
+
+    # WHEN calling the event handler
+    static_result = app({"path": "/health", "httpMethod": "GET"}, {})
+    dynamic_result = app({"path": "/accounts/123", "httpMethod": "GET"}, {})
+    nested_result = app({"path": "/a/b/c", "httpMethod": "GET"}, {})
+
+    # THEN routes are tried in the same order as before: static rules first, then dynamic rules
+    assert json.loads(static_result["body"]) == {"handler": "health"}
+    assert json.loads(dynamic_result["body"]) == {"handler": "catch_all"}
+    assert json.loads(nested_result["body"]) == {"handler": "catch_all"}
+
+
+def test_rest_api_route_match_multiple_trailing_slashes():
+    # GIVEN a REST API resolver with a dynamic route
+    app = APIGatewayRestResolver()
+
+    @app.get("/accounts/<account_id>/")
+    def get_account(account_id: str):
+        return {"account_id": account_id}
+
+    # WHEN calling the event handler with trailing slashes
+    result = app({"path": "/accounts/123//", "httpMethod": "GET", "requestContext": {"stage": "dev"}}, {})
+
+    # THEN the trailing slashes are ignored
+    assert result["statusCode"] == 200
+    assert json.loads(result["body"]) == {"account_id": "123"}
+
+
+def test_static_route_match_does_not_bypass_earlier_regex_rule():
+    # GIVEN a catch-all regex rule registered before a static route
+    app = ApiGatewayResolver()
+
+    @app.get(".+")
+    def catch_all():
+        return {"handler": "catch_all"}
+
+    @app.get("/health")
+    def health():
+        return {"handler": "health"}
+
+    # WHEN calling the event handler with the static route path
+    result = app({"path": "/health", "httpMethod": "GET"}, {})
+
+    # THEN the earlier regex rule still wins, as with a linear scan
+    assert json.loads(result["body"]) == {"handler": "catch_all"}
+
+
+@pytest.mark.parametrize("path", ["/health", "/health/", "/health//"])
+def test_rest_api_static_route_match_ignores_trailing_slashes(path: str):
+    # GIVEN a REST API resolver with a static route
+    app = APIGatewayRestResolver()
+
+    @app.get("/health")
+    def health():
+        return {"handler": "health"}
+
+    # WHEN calling the event handler with and without trailing slashes
+    result = app({"path": path, "httpMethod": "GET", "requestContext": {"stage": "dev"}}, {})
+
+    # THEN the static route is matched
+    assert json.loads(result["body"]) == {"handler": "health"}
+
+
+def test_http_api_static_route_match_is_exact():
+    # GIVEN a HTTP API resolver with a static route
+    app = APIGatewayHttpResolver()
+
+    @app.get("/health")
+    def health():
+        return {"handler": "health"}
+
+    # WHEN calling the event handler with a trailing slash
+    result = app(
+        {
+            "version": "2.0",
+            "rawPath": "/health/",
+            "requestContext": {"http": {"method": "GET", "path": "/health/"}, "stage": "$default"},
+        },
+        {},
+    )
+
+    # THEN the route is not matched, since HTTP APIs don't ignore trailing slashes
+    assert result["statusCode"] == 404
+
+
+def test_compress_with_brotli_compression_config():
+    # GIVEN a resolver preferring Brotli over gzip
+    brotli = pytest.importorskip("brotli")
+    app = ApiGatewayResolver(compression_config=CompressionConfig(encodings=["br", "gzip"]))
+    mock_event = {"path": "/my/request", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip, br"}}
+    expected_value = json.dumps({"message": "hello world" * 10})
+
+    @app.get("/my/request", compress=True)
+    def with_compression() -> Response:
+        return Response(200, content_types.APPLICATION_JSON, expected_value)
+
+    # WHEN calling the event handler
+    result = app(mock_event, None)
+
+    # THEN the response is compressed with Brotli and base64 encoded
+    assert result["isBase64Encoded"] is True
+    assert result["multiValueHeaders"]["Content-Encoding"] == ["br"]
+    assert brotli.decompress(base64.b64decode(result["body"])).decode() == expected_value
+
+
+def test_compress_skipped_below_minimum_size():
+    # GIVEN a resolver only compressing bodies larger than 1KB
+    app = ApiGatewayResolver(compression_config=CompressionConfig(minimum_size=1024))
+    mock_event = {"path": "/my/request", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip"}}
+    expected_value = json.dumps({"message": "small"})
+
+    @app.get("/my/request", compress=True)
+    def with_compression() -> Response:
+        return Response(200, content_types.APPLICATION_JSON, expected_value)
+
+    # WHEN calling the event handler
+    result = app(mock_event, None)
+
+    # THEN the response is not compressed
+    assert "Content-Encoding" not in result["multiValueHeaders"]
+    assert result["isBase64Encoded"] is False
+    assert result["body"] == expected_value
+
+
+def test_compress_skipped_for_content_type_not_allowed():
+    # GIVEN a resolver only compressing JSON responses
+    app = ApiGatewayResolver(compression_config=CompressionConfig(content_types=[content_types.APPLICATION_JSON]))
+    mock_event = {"path": "/my/request", "httpMethod": "GET", "headers": {"Accept-Encoding": "gzip"}}
+
+    @app.get("/my/request", compress=True)
+    def with_compression() -> Response:
+        return Response(200, content_types.TEXT_HTML, "<html></html>")
+
+    # WHEN calling the event handler
+    result = app(mock_event, None)
+
+    # THEN the response is not compressed
+    assert "Content-Encoding" not in result["multiValueHeaders"]
@@ -561,3 +561,74 @@ def test_global_middleware_not_found_preflight():
     # AND ensure middlewares are called
     assert result["statusCode"] == 204
     assert result["body"] == "middleware works"
+
+
+def test_middleware_stack_is_built_once_per_route():
+    # GIVEN a route with a global middleware
+    app = ApiGatewayResolver(proxy_type=ProxyEventType.APIGatewayProxyEvent)
+
+    def middleware(app: ApiGatewayResolver, next_middleware: NextMiddleware):
+        return next_middleware(app)
+
+    app.use(middlewares=[middleware])
+
+    @app.get("/my/path")
+    def get_lambda() -> Response:
+        return Response(200, content_types.TEXT_HTML, "foo")
+
+    # WHEN calling the event handler multiple times
+    app(API_REST_EVENT, {})
+    route = app._static_routes[0]
+    middleware_stack = route._middleware_stack
+    app(API_REST_EVENT, {})
+
+    # THEN the middleware stack is reused across invocations
+    assert route._middleware_stack is middleware_stack
+
+
+def test_middleware_stack_is_rebuilt_after_use():
+    # GIVEN a route that has already processed a request
+    app = ApiGatewayResolver(proxy_type=ProxyEventType.APIGatewayProxyEvent)
+
+    @app.get("/my/path")
+    def get_lambda() -> Response:
+        return Response(200, content_types.TEXT_HTML, "foo")
+
+    app(API_REST_EVENT, {})
+
+    # WHEN a global middleware is registered afterwards
+    def middleware(app: ApiGatewayResolver, next_middleware: NextMiddleware):
+        ret = next_middleware(app)
+        ret.body = "middleware works"
+        return ret
+
+    app.use(middlewares=[middleware])
+    result = app(API_REST_EVENT, {})
+
+    # THEN the new middleware is part of the request chain
+    assert result["body"] == "middleware works"
+
+
+@pytest.mark.parametrize("debug", [True, False])
+def test_processed_stack_frames_only_tracked_in_debug_mode(debug: bool, capsys):
+    # GIVEN a route with a global middleware
+    app = ApiGatewayResolver(proxy_type=ProxyEventType.APIGatewayProxyEvent, debug=debug)
+
+    def middleware(app: ApiGatewayResolver, next_middleware: NextMiddleware):
+        return next_middleware(app)
+
+    app.use(middlewares=[middleware])
+
+    @app.get("/my/path")
+    def get_lambda() -> Response:
+        return Response(200, content_types.TEXT_HTML, "foo")
+
+    # WHEN calling the event handler
+    app(API_REST_EVENT, {})
+
+    # THEN processed stack frames are only tracked when debug is enabled
+    expected_frames = [
+        "[middleware] next call chain is middleware -> _registered_api_adapter",
+        "[_registered_api_adapter] next call chain is _registered_api_adapter -> get_lambda",
+    ]
+    assert app.processed_stack_frames == (expected_frames if debug else [])
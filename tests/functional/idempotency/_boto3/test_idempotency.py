@@ -681,6 +681,42 @@ def test_idempotent_lambda_first_execution_with_validation(
     stubber.deactivate()
 
 
+@pytest.mark.parametrize(
+    "idempotency_config",
+    [{"use_local_cache": False, "payload_validation_jmespath": "requestContext"}],
+    indirect=True,
+)
+def test_idempotent_lambda_first_execution_hashes_payload_once(
+    idempotency_config: IdempotencyConfig,
+    persistence_store: DynamoDBPersistenceLayer,
+    lambda_apigw_event,
+    expected_params_update_item_with_validation,
+    expected_params_put_item_with_validation,
+    lambda_response,
+    lambda_context,
+    mocker,
+):
+    # GIVEN an idempotent lambda handler with payload validation
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("put_item", {}, expected_params_put_item_with_validation)
+    stubber.add_response("update_item", {}, expected_params_update_item_with_validation)
+    stubber.activate()
+    generate_hash_spy = mocker.spy(persistence_store, "_generate_hash")
+
+    @idempotent(config=idempotency_config, persistence_store=persistence_store)
+    def lambda_handler(event, context):
+        return lambda_response
+
+    # WHEN the lambda handler is executed for the first time
+    lambda_handler(lambda_apigw_event, lambda_context)
+
+    # THEN the idempotency key and the payload validation hash are computed once,
+    # when saving the record in progress, and reused when saving it as completed
+    assert generate_hash_spy.call_count == 2
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
 @pytest.mark.parametrize(
     "config_without_jmespath",
     [{"use_local_cache": False}, {"use_local_cache": True}],
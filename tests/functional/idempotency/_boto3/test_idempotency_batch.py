@@ -0,0 +1,449 @@
+import json
+import uuid
+from typing import Callable, Dict, List
+
+import pytest
+from botocore import stub
+
+from aws_lambda_powertools.utilities.batch import EventType, process_partial_response
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.idempotency import (
+    DynamoDBPersistenceLayer,
+    IdempotencyConfig,
+    IdempotentBatchProcessor,
+)
+from aws_lambda_powertools.utilities.idempotency.exceptions import (
+    IdempotencyAlreadyInProgressError,
+    IdempotencyPersistenceLayerError,
+)
+from tests.functional.idempotency._boto3.conftest import TABLE_NAME
+from tests.functional.idempotency.utils import hash_idempotency_key
+
+
+def build_sqs_record(body: str) -> Dict:
+    return {
+        "messageId": f"{uuid.uuid4()}",
+        "receiptHandle": "AQEBwJnKyrHigUMZj6rYigCgxlaS3SLy0a",
+        "body": body,
+        "attributes": {},
+        "messageAttributes": {},
+        "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+        "eventSource": "aws:sqs",
+        "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+        "awsRegion": "us-east-1",
+    }
+
+
+def build_idempotency_key(record_handler: Callable, record: Dict) -> str:
+    function_name = f"test-func.{record_handler.__module__}.{record_handler.__qualname__}"
+    return f"{function_name}#{hash_idempotency_key(record['messageId'])}"
+
+
+def build_batch_get_item_stub(idempotency_keys: List[str]) -> Dict:
+    keys = [{"id": {"S": idempotency_key}} for idempotency_key in idempotency_keys]
+    return {"RequestItems": {TABLE_NAME: {"Keys": keys, "ConsistentRead": True}}}
+
+
+def build_transact_write_items_stub(idempotency_keys: List[str]) -> Dict:
+    return {
+        "TransactItems": [
+            {
+                "Put": {
+                    "TableName": TABLE_NAME,
+                    "Item": {
+                        "id": {"S": idempotency_key},
+                        "expiration": {"N": stub.ANY},
+                        "in_progress_expiration": {"N": stub.ANY},
+                        "status": {"S": "INPROGRESS"},
+                    },
+                    "ConditionExpression": stub.ANY,
+                    "ExpressionAttributeNames": stub.ANY,
+                    "ExpressionAttributeValues": stub.ANY,
+                    "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+                },
+            }
+            for idempotency_key in idempotency_keys
+        ],
+    }
+
+
+def build_batch_write_item_stub(idempotency_keys: List[str], responses: List) -> Dict:
+    return {
+        "RequestItems": {
+            TABLE_NAME: [
+                {
+                    "PutRequest": {
+                        "Item": {
+                            "id": {"S": idempotency_key},
+                            "expiration": {"N": stub.ANY},
+                            "data": {"S": json.dumps(response)},
+                            "status": {"S": "COMPLETED"},
+                        },
+                    },
+                }
+                for idempotency_key, response in zip(idempotency_keys, responses)
+            ],
+        },
+    }
+
+
+def build_item(idempotency_key: str, status: str, timestamp_future: str, data: str = "") -> Dict:
+    item = {
+        "id": {"S": idempotency_key},
+        "expiration": {"N": timestamp_future},
+        "status": {"S": status},
+    }
+    if data:
+        item["data"] = {"S": data}
+    if status == "INPROGRESS":
+        item["in_progress_expiration"] = {"N": f"{timestamp_future}000"}
+    return item
+
+
+@pytest.fixture
+def idempotency_config() -> IdempotencyConfig:
+    return IdempotencyConfig(event_key_jmespath="messageId")
+
+
+def record_handler(record: SQSRecord):
+    if record.body == "fail":
+        raise ValueError("Failed to process record.")
+    return {"body": record.body}
+
+
+def test_idempotent_batch_processor_first_execution(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+):
+    # GIVEN a batch of records never processed before
+    records = [build_sqs_record(body) for body in ("a", "b", "c")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub(keys))
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys))
+    stubber.add_response(
+        "batch_write_item",
+        {},
+        build_batch_write_item_stub(keys, [{"body": "a"}, {"body": "b"}, {"body": "c"}]),
+    )
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    result = process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN records are looked up, saved as in progress, and saved as completed with one call each
+    assert result == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_skips_completed_records(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+    timestamp_future,
+):
+    # GIVEN a batch whose first record was already processed
+    records = [build_sqs_record("a"), build_sqs_record("b")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+    completed_item = build_item(keys[0], "COMPLETED", timestamp_future, data=json.dumps({"body": "stored"}))
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response(
+        "batch_get_item",
+        {"Responses": {TABLE_NAME: [completed_item]}},
+        build_batch_get_item_stub(keys),
+    )
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys[1:]))
+    stubber.add_response("batch_write_item", {}, build_batch_write_item_stub(keys[1:], [{"body": "b"}]))
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    with processor(records, record_handler, lambda_context) as batch:
+        processed_messages = batch.process()
+
+    # THEN the stored response is returned for the completed record, without processing it again
+    assert [message[1] for message in processed_messages] == [{"body": "stored"}, {"body": "b"}]
+    assert processor.response() == {"batchItemFailures": []}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_fails_records_in_progress(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+    timestamp_future,
+):
+    # GIVEN a batch whose first record is being processed by another invocation
+    records = [build_sqs_record("a"), build_sqs_record("b")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response(
+        "batch_get_item",
+        {"Responses": {TABLE_NAME: [build_item(keys[0], "INPROGRESS", timestamp_future)]}},
+        build_batch_get_item_stub(keys),
+    )
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys[1:]))
+    stubber.add_response("batch_write_item", {}, build_batch_write_item_stub(keys[1:], [{"body": "b"}]))
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    result = process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN the record in progress is reported as failed, so it's retried
+    assert result == {"batchItemFailures": [{"itemIdentifier": records[0]["messageId"]}]}
+    assert processor.exceptions[0][0] is IdempotencyAlreadyInProgressError
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_handles_cancelled_claims(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+    timestamp_future,
+):
+    # GIVEN a batch whose first record is completed by another invocation while saving records as in progress
+    records = [build_sqs_record("a"), build_sqs_record("b")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+    completed_item = build_item(keys[0], "COMPLETED", timestamp_future, data=json.dumps({"body": "stored"}))
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub(keys))
+    stubber.add_client_error(
+        "transact_write_items",
+        "TransactionCanceledException",
+        modeled_fields={
+            "CancellationReasons": [
+                {"Code": "ConditionalCheckFailed", "Item": completed_item},
+                {"Code": "None"},
+            ],
+        },
+        expected_params=build_transact_write_items_stub(keys),
+    )
+    stubber.add_response("put_item", {}, None)
+    stubber.add_response("batch_write_item", {}, build_batch_write_item_stub(keys[1:], [{"body": "b"}]))
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    with processor(records, record_handler, lambda_context) as batch:
+        processed_messages = batch.process()
+
+    # THEN the completed record returns its stored response, and the other one is saved on its own, and processed
+    assert [message[1] for message in processed_messages] == [{"body": "stored"}, {"body": "b"}]
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_deletes_failed_records(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+):
+    # GIVEN a batch whose second record fails processing
+    records = [build_sqs_record("a"), build_sqs_record("fail")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub(keys))
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys))
+    stubber.add_response("batch_write_item", {}, build_batch_write_item_stub(keys[:1], [{"body": "a"}]))
+    stubber.add_response("delete_item", {}, {"TableName": TABLE_NAME, "Key": {"id": {"S": keys[1]}}})
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    result = process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN the failed record is reported, and its in progress record is deleted so it can be retried
+    assert result == {"batchItemFailures": [{"itemIdentifier": records[1]["messageId"]}]}
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_processes_duplicate_records_once(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+):
+    # GIVEN a batch with the same record twice
+    record = build_sqs_record("a")
+    records = [record, dict(record)]
+    key = build_idempotency_key(record_handler, record)
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub([key]))
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub([key]))
+    stubber.add_response("batch_write_item", {}, build_batch_write_item_stub([key], [{"body": "a"}]))
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN the record is processed once, and its duplicate is reported as failed, so it's retried
+    assert len(processor.success_messages) == 1
+    assert processor.exceptions[0][0] is IdempotencyAlreadyInProgressError
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_reports_records_failing_to_save(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+):
+    # GIVEN a batch whose first two records are processed, but can't be saved as completed
+    records = [build_sqs_record("a"), build_sqs_record("b"), build_sqs_record("fail")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub(keys))
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys))
+    stubber.add_client_error("batch_write_item", "InternalServerError")
+    stubber.add_response("delete_item", {}, {"TableName": TABLE_NAME, "Key": {"id": {"S": keys[2]}}})
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+        raise_on_entire_batch_failure=False,
+    )
+
+    # WHEN processing the batch
+    with processor(records, record_handler, lambda_context):
+        processed_messages = processor.process()
+    result = processor.response()
+
+    # THEN every record is reported as failed, so they're retried, and the failed record is still deleted
+    assert [message[0] for message in processed_messages] == ["fail", "fail", "fail"]
+    assert sorted(failure["itemIdentifier"] for failure in result["batchItemFailures"]) == sorted(
+        record["messageId"] for record in records
+    )
+    assert processor.success_messages == []
+    assert processor.exceptions[-1][0] is IdempotencyPersistenceLayerError
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_keeps_deleting_after_delete_failure(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+):
+    # GIVEN a batch with two records failing processing, where deleting the first one fails
+    records = [build_sqs_record("fail"), build_sqs_record("fail"), build_sqs_record("a")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub(keys))
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys))
+    stubber.add_response("batch_write_item", {}, build_batch_write_item_stub(keys[2:], [{"body": "a"}]))
+    stubber.add_client_error("delete_item", "InternalServerError")
+    stubber.add_response("delete_item", {}, {"TableName": TABLE_NAME, "Key": {"id": {"S": keys[1]}}})
+    stubber.activate()
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    result = process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN the remaining record is still deleted, and the partial batch response is returned
+    assert result == {
+        "batchItemFailures": [{"itemIdentifier": records[0]["messageId"]}, {"itemIdentifier": records[1]["messageId"]}],
+    }
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
+
+
+def test_idempotent_batch_processor_retries_unprocessed_items_with_backoff(
+    persistence_store: DynamoDBPersistenceLayer,
+    idempotency_config: IdempotencyConfig,
+    lambda_context,
+    monkeypatch,
+):
+    # GIVEN a batch whose lookup and completed records are only partially processed at first, e.g. when throttled
+    records = [build_sqs_record(body) for body in ("a", "b")]
+    keys = [build_idempotency_key(record_handler, record) for record in records]
+    unprocessed_keys = build_batch_get_item_stub(keys[1:])["RequestItems"]
+    unprocessed_items = build_batch_write_item_stub(keys[1:], [{"body": "b"}])["RequestItems"]
+    unprocessed_items[TABLE_NAME][0]["PutRequest"]["Item"]["expiration"] = {"N": "0"}
+
+    stubber = stub.Stubber(persistence_store.client)
+    stubber.add_response(
+        "batch_get_item",
+        {"Responses": {TABLE_NAME: []}, "UnprocessedKeys": unprocessed_keys},
+        build_batch_get_item_stub(keys),
+    )
+    stubber.add_response("batch_get_item", {"Responses": {TABLE_NAME: []}}, build_batch_get_item_stub(keys[1:]))
+    stubber.add_response("transact_write_items", {}, build_transact_write_items_stub(keys))
+    stubber.add_response(
+        "batch_write_item",
+        {"UnprocessedItems": unprocessed_items},
+        build_batch_write_item_stub(keys, [{"body": "a"}, {"body": "b"}]),
+    )
+    stubber.add_response("batch_write_item", {"UnprocessedItems": unprocessed_items}, {"RequestItems": stub.ANY})
+    stubber.add_response("batch_write_item", {}, {"RequestItems": stub.ANY})
+    stubber.activate()
+
+    delays = []
+    monkeypatch.setattr("aws_lambda_powertools.utilities.idempotency.persistence.dynamodb.random.uniform", max)
+    monkeypatch.setattr("aws_lambda_powertools.utilities.idempotency.persistence.dynamodb.time.sleep", delays.append)
+
+    processor = IdempotentBatchProcessor(
+        event_type=EventType.SQS,
+        persistence_store=persistence_store,
+        config=idempotency_config,
+    )
+
+    # WHEN processing the batch
+    result = process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN unprocessed keys and items are retried after an exponentially growing delay
+    assert result == {"batchItemFailures": []}
+    assert delays == [0.05, 0.05, 0.1]
+    stubber.assert_no_pending_responses()
+    stubber.deactivate()
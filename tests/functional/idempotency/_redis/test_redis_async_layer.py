@@ -0,0 +1,259 @@
+import asyncio
+import json
+
+import fakeredis
+import pytest
+
+from aws_lambda_powertools.utilities.batch import AsyncBatchProcessor, EventType, async_process_partial_response
+from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
+from aws_lambda_powertools.utilities.idempotency import (
+    BasePersistenceLayer,
+    IdempotencyConfig,
+    IdempotentBatchProcessor,
+    idempotent,
+    idempotent_function,
+)
+from aws_lambda_powertools.utilities.idempotency.exceptions import (
+    IdempotencyAlreadyInProgressError,
+    IdempotencyPersistenceConfigError,
+    IdempotencyValidationError,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import (
+    AsyncRedisCachePersistenceLayer,
+    RedisCachePersistenceLayer,
+    RedisConnection,
+)
+
+
+@pytest.fixture
+def redis_client():
+    # fakeredis runs Lua scripts with lupa, from the fakeredis[lua] extra
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def persistence_layer(redis_client):
+    return AsyncRedisCachePersistenceLayer(client=redis_client)
+
+
+@pytest.fixture
+def lambda_context():
+    class LambdaContext:
+        def __init__(self):
+            self.function_name = "test-func"
+            self.memory_limit_in_mb = 128
+            self.invoked_function_arn = "arn:aws:lambda:eu-west-1:809313241234:function:test-func"
+            self.aws_request_id = "52fdfc07-2182-154f-163f-5f0f9a621d72"
+
+        def get_remaining_time_in_millis(self) -> int:
+            return 1000
+
+    return LambdaContext()
+
+
+def build_sqs_record(message_id: str, body: str) -> dict:
+    return {
+        "messageId": message_id,
+        "receiptHandle": "AQEBwJnKyrHigUMZj6rYigCgxlaS3SLy0a",
+        "body": body,
+        "attributes": {},
+        "messageAttributes": {},
+        "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+        "eventSource": "aws:sqs",
+        "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+        "awsRegion": "us-east-1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_idempotent_function_returns_stored_result(persistence_layer, redis_client):
+    # GIVEN an idempotent coroutine function
+    calls = []
+
+    @idempotent_function(data_keyword_argument="order", persistence_store=persistence_layer)
+    async def process_order(order: dict):
+        calls.append(order)
+        return {"order_id": order["order_id"]}
+
+    # WHEN calling it twice with the same payload
+    first_result = await process_order(order={"order_id": 1})
+    second_result = await process_order(order={"order_id": 1})
+
+    # THEN the function runs once, and its result is saved as completed
+    assert first_result == second_result == {"order_id": 1}
+    assert len(calls) == 1
+    (idempotency_key,) = await redis_client.keys()
+    stored_item = json.loads(await redis_client.get(idempotency_key))
+    assert stored_item["status"] == "COMPLETED"
+    assert json.loads(stored_item["data"]) == {"order_id": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_idempotent_function_deletes_record_on_failure(persistence_layer, redis_client):
+    # GIVEN an idempotent coroutine function failing
+    @idempotent_function(data_keyword_argument="order", persistence_store=persistence_layer)
+    async def process_order(order: dict):
+        raise ValueError("Failed to process order")
+
+    # WHEN calling it
+    with pytest.raises(ValueError):
+        await process_order(order={"order_id": 1})
+
+    # THEN its in progress record is deleted, so it can be retried
+    assert await redis_client.keys() == []
+
+
+@pytest.mark.asyncio
+async def test_async_idempotent_function_concurrent_calls(persistence_layer, lambda_context):
+    # GIVEN an idempotent coroutine function, waiting on I/O
+    started = asyncio.Event()
+    config = IdempotencyConfig()
+    config.register_lambda_context(lambda_context)
+
+    @idempotent_function(data_keyword_argument="order", persistence_store=persistence_layer, config=config)
+    async def process_order(order: dict):
+        started.set()
+        await asyncio.sleep(0.05)
+        return {"order_id": order["order_id"]}
+
+    # WHEN calling it concurrently, with different payloads and twice the same one
+    async def call_after_start(order: dict):
+        await started.wait()
+        return await process_order(order=order)
+
+    results = await asyncio.gather(
+        process_order(order={"order_id": 1}),
+        process_order(order={"order_id": 2}),
+        call_after_start(order={"order_id": 1}),
+        return_exceptions=True,
+    )
+
+    # THEN different payloads are processed concurrently, and the same payload only once
+    assert results[:2] == [{"order_id": 1}, {"order_id": 2}]
+    assert isinstance(results[2], IdempotencyAlreadyInProgressError)
+
+
+@pytest.mark.asyncio
+async def test_async_idempotent_function_validates_payload(redis_client):
+    # GIVEN a persistence layer validating payloads
+    persistence_layer = AsyncRedisCachePersistenceLayer(client=redis_client)
+    config = IdempotencyConfig(event_key_jmespath="id", payload_validation_jmespath="amount")
+
+    @idempotent_function(data_keyword_argument="payment", persistence_store=persistence_layer, config=config)
+    async def process_payment(payment: dict):
+        return {"id": payment["id"]}
+
+    await process_payment(payment={"id": 1, "amount": 10})
+
+    # WHEN processing the same idempotency key with a different payload
+    # THEN the payload is validated against the stored record
+    with pytest.raises(IdempotencyValidationError):
+        await process_payment(payment={"id": 1, "amount": 20})
+
+
+def test_async_idempotent_function_with_async_batch_processor(persistence_layer, lambda_context):
+    # GIVEN an idempotent coroutine function called by the record handler of an AsyncBatchProcessor
+    config = IdempotencyConfig(event_key_jmespath="messageId")
+    config.register_lambda_context(lambda_context)
+    processed_bodies = []
+
+    @idempotent_function(data_keyword_argument="record", persistence_store=persistence_layer, config=config)
+    async def process_record(record: dict):
+        await asyncio.sleep(0.01)
+        processed_bodies.append(record["body"])
+        return {"body": record["body"]}
+
+    async def record_handler(record: SQSRecord):
+        return await process_record(record=record.raw_event)
+
+    records = [build_sqs_record("1", "a"), build_sqs_record("2", "b"), build_sqs_record("1", "a")]
+
+    # WHEN processing a batch with a duplicate record twice
+    processor = AsyncBatchProcessor(event_type=EventType.SQS)
+    first_response = async_process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+    second_response = async_process_partial_response({"Records": records}, record_handler, processor, lambda_context)
+
+    # THEN records are processed once, and the duplicate in progress concurrently is reported as failed
+    assert first_response == {"batchItemFailures": [{"itemIdentifier": "1"}]}
+    assert second_response == {"batchItemFailures": []}
+    assert sorted(processed_bodies) == ["a", "b"]
+
+
+def test_async_persistence_layer_requires_coroutine_function():
+    # GIVEN an asyncio persistence layer
+    persistence_layer = AsyncRedisCachePersistenceLayer(client=object())
+
+    # WHEN decorating a synchronous function, or a Lambda handler
+    # THEN a configuration error is raised
+    with pytest.raises(IdempotencyPersistenceConfigError):
+
+        @idempotent_function(data_keyword_argument="order", persistence_store=persistence_layer)
+        def process_order(order: dict): ...
+
+    with pytest.raises(IdempotencyPersistenceConfigError):
+
+        @idempotent(persistence_store=persistence_layer)
+        def lambda_handler(event, context): ...
+
+
+def test_idempotent_batch_processor_requires_sync_persistence_layer():
+    # GIVEN an asyncio persistence layer
+    persistence_layer = AsyncRedisCachePersistenceLayer(client=object())
+
+    # WHEN creating an IdempotentBatchProcessor with it
+    # THEN a configuration error is raised, rather than failing every batch at run time
+    with pytest.raises(IdempotencyPersistenceConfigError):
+        IdempotentBatchProcessor(event_type=EventType.SQS, persistence_store=persistence_layer)
+
+
+def test_async_persistence_layer_does_not_inherit_synchronous_api():
+    # GIVEN an asyncio persistence layer
+    persistence_layer = AsyncRedisCachePersistenceLayer(client=object())
+
+    # THEN it isn't a synchronous persistence layer, and has no bulk operations it can't support
+    assert not isinstance(persistence_layer, BasePersistenceLayer)
+    assert not hasattr(persistence_layer, "get_records")
+    assert not hasattr(persistence_layer, "save_inprogress_records")
+
+
+def test_coroutine_function_requires_async_persistence_layer():
+    # GIVEN a synchronous persistence layer
+    persistence_layer = RedisCachePersistenceLayer(client=object())
+
+    # WHEN decorating a coroutine function
+    # THEN a configuration error is raised
+    with pytest.raises(IdempotencyPersistenceConfigError):
+
+        @idempotent_function(data_keyword_argument="order", persistence_store=persistence_layer)
+        async def process_order(order: dict): ...
+
+
+@pytest.mark.parametrize("init_client", ["_init_client", "_init_async_client"])
+def test_redis_connection_pool_params(init_client):
+    # GIVEN a Redis connection with connection pool settings
+    connection = RedisConnection(
+        host="localhost",
+        ssl=False,
+        max_connections=5,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+
+    # WHEN initializing the client, which connects lazily
+    client = getattr(connection, init_client)()
+
+    # THEN the connection pool is configured accordingly
+    assert client.connection_pool.max_connections == 5
+    assert client.connection_pool.connection_kwargs["socket_keepalive"] is True
+    assert client.connection_pool.connection_kwargs["health_check_interval"] == 30
+
+
+def test_redis_connection_default_pool_params():
+    # GIVEN a Redis connection without connection pool settings
+    connection = RedisConnection(url="redis://localhost:6379")
+
+    # WHEN initializing the client
+    client = connection._init_client()
+
+    # THEN the client defaults apply
+    assert client.connection_pool.connection_kwargs.get("health_check_interval", 0) == 0
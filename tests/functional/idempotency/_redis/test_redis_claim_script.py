@@ -0,0 +1,195 @@
+import datetime
+import json
+
+import fakeredis
+import pytest
+
+from aws_lambda_powertools.utilities.idempotency import IdempotencyConfig, idempotent_function
+from aws_lambda_powertools.utilities.idempotency.exceptions import (
+    IdempotencyItemAlreadyExistsError,
+    IdempotencyValidationError,
+)
+from aws_lambda_powertools.utilities.idempotency.persistence.base import STATUS_CONSTANTS, DataRecord
+from aws_lambda_powertools.utilities.idempotency.persistence.redis import (
+    CLAIM_IN_PROGRESS_SCRIPT,
+    RedisCachePersistenceLayer,
+)
+
+
+# fakeredis runs Lua scripts with lupa, from the fakeredis[lua] extra
+class CountingFakeRedis(fakeredis.FakeRedis):
+    """FakeRedis counting commands sent to the server, one per round trip outside of pipelines"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands = []
+
+    def execute_command(self, *args, **options):
+        self.commands.append(args[0])
+        return super().execute_command(*args, **options)
+
+
+@pytest.fixture
+def redis_client():
+    # Script already loaded, like in a warm execution environment
+    client = CountingFakeRedis(decode_responses=True)
+    client.script_load(CLAIM_IN_PROGRESS_SCRIPT)
+    client.commands.clear()
+    return client
+
+
+@pytest.fixture
+def persistence_layer(redis_client):
+    return RedisCachePersistenceLayer(client=redis_client)
+
+
+def now_in_seconds() -> int:
+    return int(datetime.datetime.now().timestamp())
+
+
+def build_in_progress_record(idempotency_key: str = "key", in_progress_expires_in_ms: int = 10_000) -> DataRecord:
+    return DataRecord(
+        idempotency_key=idempotency_key,
+        status=STATUS_CONSTANTS["INPROGRESS"],
+        expiry_timestamp=now_in_seconds() + 3600,
+        in_progress_expiry_timestamp=int(datetime.datetime.now().timestamp() * 1000) + in_progress_expires_in_ms,
+    )
+
+
+def save_item(redis_client, idempotency_key: str, item: dict):
+    redis_client.set(idempotency_key, json.dumps(item), ex=3600)
+
+
+def test_claim_script_saves_new_record_in_a_single_round_trip(persistence_layer, redis_client):
+    # GIVEN no record for the idempotency key
+    data_record = build_in_progress_record()
+
+    # WHEN saving it as in progress
+    persistence_layer._put_in_progress_record(data_record)
+
+    # THEN it's saved with a single script call
+    assert redis_client.commands == ["EVALSHA"]
+    assert persistence_layer._get_record("key").status == STATUS_CONSTANTS["INPROGRESS"]
+    assert 0 < redis_client.ttl("key") <= 3600
+
+
+def test_claim_script_returns_completed_record(persistence_layer, redis_client):
+    # GIVEN a completed record
+    expiry_timestamp = now_in_seconds() + 3600
+    save_item(redis_client, "key", {"status": "COMPLETED", "expiration": expiry_timestamp, "data": '{"ok": true}'})
+    redis_client.commands.clear()
+
+    # WHEN saving a record with the same idempotency key as in progress
+    with pytest.raises(IdempotencyItemAlreadyExistsError) as exc_info:
+        persistence_layer._put_in_progress_record(build_in_progress_record())
+
+    # THEN the completed record is returned by the script in the same round trip, and left untouched
+    assert redis_client.commands == ["EVALSHA"]
+    assert exc_info.value.old_data_record.status == STATUS_CONSTANTS["COMPLETED"]
+    assert exc_info.value.old_data_record.response_data == '{"ok": true}'
+    assert exc_info.value.old_data_record.expiry_timestamp == expiry_timestamp
+    assert persistence_layer._get_record("key").status == STATUS_CONSTANTS["COMPLETED"]
+
+
+def test_claim_script_returns_record_in_progress(persistence_layer):
+    # GIVEN a record in progress by another invocation
+    persistence_layer._put_in_progress_record(build_in_progress_record())
+
+    # WHEN saving a record with the same idempotency key as in progress
+    # THEN the existing record is returned
+    with pytest.raises(IdempotencyItemAlreadyExistsError) as exc_info:
+        persistence_layer._put_in_progress_record(build_in_progress_record())
+
+    assert exc_info.value.old_data_record.status == STATUS_CONSTANTS["INPROGRESS"]
+
+
+@pytest.mark.parametrize(
+    "orphan_item",
+    [
+        pytest.param({"status": "INPROGRESS", "in_progress_expiration": 1000}, id="timed_out"),
+        pytest.param({"status": "COMPLETED", "expiration": 1000}, id="expired"),
+        pytest.param("not_json", id="corrupted"),
+    ],
+)
+def test_claim_script_takes_over_orphan_records(persistence_layer, redis_client, orphan_item):
+    # GIVEN an orphan record, e.g. left in progress by an invocation that timed out
+    redis_client.set("key", orphan_item if isinstance(orphan_item, str) else json.dumps(orphan_item), ex=3600)
+    redis_client.commands.clear()
+    data_record = build_in_progress_record()
+
+    # WHEN saving a record with the same idempotency key as in progress
+    persistence_layer._put_in_progress_record(data_record)
+
+    # THEN the orphan record is overwritten in the same round trip, without taking a lock
+    assert redis_client.commands == ["EVALSHA"]
+    stored_record = persistence_layer._get_record("key")
+    assert stored_record.status == STATUS_CONSTANTS["INPROGRESS"]
+    assert stored_record.in_progress_expiry_timestamp == data_record.in_progress_expiry_timestamp
+    assert not redis_client.exists("key:lock")
+
+
+def test_claim_script_loaded_once(persistence_layer, redis_client):
+    # GIVEN a Redis server that doesn't know about the script yet
+    redis_client.script_flush()
+    redis_client.commands.clear()
+
+    # WHEN saving several records as in progress
+    persistence_layer._put_in_progress_record(build_in_progress_record("first"))
+    persistence_layer._put_in_progress_record(build_in_progress_record("second"))
+
+    # THEN the script is loaded on first use only
+    assert redis_client.commands == ["EVALSHA", "SCRIPT LOAD", "EVALSHA", "EVALSHA"]
+
+
+def test_claim_script_validates_payload_of_existing_record(redis_client):
+    # GIVEN a persistence layer validating payloads, and a completed record for a different payload
+    persistence_layer = RedisCachePersistenceLayer(client=redis_client)
+    config = IdempotencyConfig(event_key_jmespath="id", payload_validation_jmespath="amount")
+
+    @idempotent_function(data_keyword_argument="payment", persistence_store=persistence_layer, config=config)
+    def process_payment(payment: dict):
+        return {"id": payment["id"]}
+
+    process_payment(payment={"id": 1, "amount": 10})
+
+    # WHEN processing the same idempotency key with a different payload
+    # THEN the payload is validated against the record returned by the script
+    with pytest.raises(IdempotencyValidationError):
+        process_payment(payment={"id": 1, "amount": 20})
+
+
+def test_claim_script_idempotent_function(persistence_layer, redis_client):
+    # GIVEN an idempotent function
+    calls = []
+
+    @idempotent_function(data_keyword_argument="order", persistence_store=persistence_layer)
+    def process_order(order: dict):
+        calls.append(order)
+        return {"order_id": order["order_id"]}
+
+    # WHEN calling it twice with the same payload
+    first_result = process_order(order={"order_id": 1})
+    redis_client.commands.clear()
+    second_result = process_order(order={"order_id": 1})
+
+    # THEN the stored result is returned from the claim script, without reading the record again
+    assert first_result == second_result == {"order_id": 1}
+    assert len(calls) == 1
+    assert redis_client.commands == ["EVALSHA"]
+
+
+def test_claim_script_pipelined_for_batches(persistence_layer, redis_client):
+    # GIVEN a completed record, an orphan record, and a new record
+    save_item(redis_client, "completed", {"status": "COMPLETED", "expiration": now_in_seconds() + 3600})
+    save_item(redis_client, "orphan", {"status": "INPROGRESS", "in_progress_expiration": 1000})
+    data_records = [build_in_progress_record(key) for key in ("completed", "orphan", "new")]
+
+    # WHEN saving them as in progress at once
+    errors = persistence_layer._put_records(data_records=data_records)
+
+    # THEN only the completed record fails to be saved, with its existing record
+    assert isinstance(errors[0], IdempotencyItemAlreadyExistsError)
+    assert errors[0].old_data_record.status == STATUS_CONSTANTS["COMPLETED"]
+    assert errors[1:] == [None, None]
+    assert persistence_layer._get_record("orphan").status == STATUS_CONSTANTS["INPROGRESS"]
+    assert persistence_layer._get_record("new").status == STATUS_CONSTANTS["INPROGRESS"]
@@ -2,8 +2,10 @@ import base64
 import json
 import random
 import string
+import threading
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -169,7 +171,7 @@ def test_dynamodb_provider_get_expired(mock_name, mock_value, config):
     provider = parameters.DynamoDBProvider(table_name, boto_config=config)
 
     # Inject value in the internal store
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() - 60)
 
     # Stub the boto3 client
     stubber = stub.Stubber(provider.table.meta.client)
@@ -1045,7 +1047,7 @@ def test_providers_global_clear_cache(mock_name, mock_value, monkeypatch):
 def test_ssm_provider_clear_cache(mock_name, mock_value, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.SSMProvider(boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1223,7 +1225,7 @@ def test_ssm_provider_get_parameters_by_name_all_decrypt_should_use_get_paramete
 def test_dynamodb_provider_clear_cache(mock_name, mock_value, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.DynamoDBProvider(table_name="test", boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1235,7 +1237,7 @@ def test_dynamodb_provider_clear_cache(mock_name, mock_value, config):
 def test_secrets_provider_clear_cache(mock_name, mock_value, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.SecretsProvider(boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1247,7 +1249,7 @@ def test_secrets_provider_clear_cache(mock_name, mock_value, config):
 def test_appconf_provider_clear_cache(mock_name, config):
     # GIVEN a provider is initialized with a cached value
     provider = parameters.AppConfigProvider(environment="test", application="test", boto_config=config)
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() + 60)
 
     # WHEN clear_cache is called from within the provider instance
     provider.clear_cache()
@@ -1265,7 +1267,7 @@ def test_ssm_provider_get_expired(mock_name, mock_value, mock_version, config):
     provider = parameters.SSMProvider(boto_config=config)
 
     # Inject value in the internal store
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() - 60)
 
     # Stub the boto3 client
     stubber = stub.Stubber(provider.client)
@@ -1781,7 +1783,7 @@ def test_secrets_provider_get_expired(mock_name, mock_value, config):
     provider = parameters.SecretsProvider(boto_config=config)
 
     # Inject value in the internal store
-    provider.store[(mock_name, None)] = ExpirableValue(mock_value, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue(mock_value, time.monotonic() - 60)
 
     # Stub the boto3 client
     stubber = stub.Stubber(provider.client)
@@ -2183,7 +2185,7 @@ def test_base_provider_get_multiple_expired(mock_name, mock_value):
 
     provider = TestProvider()
 
-    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, datetime.now() - timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, time.monotonic() - 60)
 
     value = provider.get_multiple(mock_name)
 
@@ -2340,6 +2342,39 @@ def test_get_parameters_by_name_cache(monkeypatch, mock_name, mock_value, config
     assert provider.has_not_expired_in_cache(key=cache_key)
 
 
+def test_get_parameters_by_name_stale_while_revalidate(monkeypatch, mock_name, mock_value, config):
+    # GIVEN we have an expired parameter in cache that can still be served while it's refreshed
+    params = {mock_name: {}}
+    cache_key = (mock_name, None)
+    refreshed = threading.Event()
+
+    class TestProvider(SSMProvider):
+        def __init__(self, boto_config: Config = config, **kwargs):
+            super().__init__(boto_config=boto_config, **kwargs)
+
+        def _get_parameters_by_name(self, parameters, *args, **kwargs) -> Tuple[Dict[str, Any], List[str]]:
+            self._transform_and_cache_get_parameters_response(
+                build_get_parameters_stub(params={name: "fresh" for name in parameters}),
+                parameters,
+            )
+            refreshed.set()
+            return {}, []
+
+    provider = TestProvider()
+    provider.store[cache_key] = ExpirableValue(mock_value, time.monotonic() - 1, time.monotonic() + 60)
+
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "ssm", provider)
+
+    # WHEN get_parameters_by_name is called with stale_while_revalidate
+    values = parameters.get_parameters_by_name(parameters=params, stale_while_revalidate=60)
+
+    # THEN the stale value is returned, and the parameter is refreshed in the background
+    assert values[mock_name] == mock_value
+    assert refreshed.wait(timeout=5)
+    assert provider.store[cache_key].value == "fresh"
+    assert provider.store[cache_key].stale_ttl is not None
+
+
 def test_get_parameters_by_name_empty_batch(monkeypatch, config):
     # GIVEN we have an empty dictionary
     params = {}
@@ -2378,6 +2413,95 @@ def test_get_parameters_by_name_cache_them_individually_not_batch(monkeypatch, m
     assert len(provider.store) == len(params)
 
 
+def test_get_parameters_by_name_max_concurrency(monkeypatch, mock_value):
+    # GIVEN a batch of 25 parameters, spanning 3 GetParameters chunks
+    params = {f"/param_{i}": {} for i in range(25)}
+    calling_threads = set()
+
+    class FakeClient:
+        def get_parameters(self, Names, **kwargs):
+            calling_threads.add(threading.get_ident())
+            return build_get_parameters_stub(params={name: mock_value for name in Names})
+
+    provider = SSMProvider(boto3_client=FakeClient())
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "ssm", provider)
+
+    # WHEN get_parameters_by_name is called with max_concurrency
+    values = parameters.get_parameters_by_name(parameters=params, max_concurrency=3)
+
+    # THEN chunks should be fetched from worker threads sharing the same client
+    assert threading.get_ident() not in calling_threads
+
+    # AND every parameter should be returned and cached
+    assert values == {name: mock_value for name in params}
+    assert len(provider.store) == len(params)
+
+
+def test_get_parameters_by_name_max_concurrency_decrypt_graceful_error(monkeypatch, mock_value):
+    # GIVEN a batch of parameters where some must be decrypted, and one of them fails
+    failing_param = "/secret_2"
+    decrypt_params = {f"/secret_{i}": {"decrypt": True} for i in range(5)}
+    params = {"/param": {}, **decrypt_params}
+
+    class FakeClient:
+        def get_parameters(self, Names, **kwargs):
+            return build_get_parameters_stub(params={name: mock_value for name in Names})
+
+        def get_parameter(self, Name, WithDecryption, **kwargs):
+            assert WithDecryption
+            if Name == failing_param:
+                raise RuntimeError("AccessDenied")
+            return {"Parameter": {"Value": mock_value}}
+
+    provider = SSMProvider(boto3_client=FakeClient())
+
+    # WHEN get_parameters_by_name is called with max_concurrency in graceful error mode
+    values = provider.get_parameters_by_name(parameters=params, raise_on_error=False, max_concurrency=4)
+
+    # THEN the failing parameter should be aggregated under "_errors", and others returned
+    assert values["_errors"] == [failing_param]
+    assert values == {"_errors": [failing_param], **{name: mock_value for name in params if name != failing_param}}
+
+
+def test_get_parameters_by_name_max_concurrency_raise_on_error(monkeypatch, mock_value):
+    # GIVEN a batch of 25 parameters where one is invalid
+    invalid_param = "/param_13"
+    params = {f"/param_{i}": {} for i in range(25)}
+
+    class FakeClient:
+        def get_parameters(self, Names, **kwargs):
+            invalid_parameters = [invalid_param] if invalid_param in Names else []
+            return build_get_parameters_stub(
+                params={name: mock_value for name in Names},
+                invalid_parameters=invalid_parameters,
+            )
+
+    provider = SSMProvider(boto3_client=FakeClient())
+
+    # WHEN get_parameters_by_name is called with max_concurrency
+    # THEN it should fail fast like when fetching serially
+    with pytest.raises(parameters.exceptions.GetParameterError, match=invalid_param):
+        provider.get_parameters_by_name(parameters=params, max_concurrency=3)
+
+
+def test_get_parameters_by_name_max_concurrency_from_env(monkeypatch, config):
+    # GIVEN max concurrency is set via environment variable
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_SSM_MAX_CONCURRENCY", "7")
+    params = {f"param_{i}": {} for i in range(20)}
+
+    class TestProvider(SSMProvider):
+        def __init__(self, boto_config: Config = config, **kwargs):
+            super().__init__(boto_config=boto_config, **kwargs)
+
+        def _get_parameters_batch_by_name(self, batch, raise_on_error=True, decrypt=False, max_concurrency=1):
+            # THEN it should be used for fetching chunks
+            assert max_concurrency == 7
+            return {}, []
+
+    # WHEN get_parameters_by_name is called without max_concurrency
+    TestProvider().get_parameters_by_name(parameters=params)
+
+
 def test_get_parameter_new(monkeypatch, mock_name, mock_value):
     """
     Test get_parameter() without a default provider
@@ -2883,7 +3007,7 @@ def test_base_provider_get_multiple_force_update(mock_name, mock_value):
 
     provider = TestProvider()
 
-    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue({"B": mock_value}, time.monotonic() + 60)
 
     value = provider.get_multiple(mock_name, force_fetch=True)
 
@@ -2905,7 +3029,7 @@ def test_base_provider_get_force_update(mock_name, mock_value):
 
     provider = TestProvider()
 
-    provider.store[(mock_name, None)] = ExpirableValue("not-value", datetime.now() + timedelta(seconds=60))
+    provider.store[(mock_name, None)] = ExpirableValue("not-value", time.monotonic() + 60)
 
     value = provider.get(mock_name, force_fetch=True)
 
@@ -2976,3 +3100,304 @@ def test_raise_warning_when_using_config_parameter_secrets(config):
     # THEN must raise a warning
     with pytest.warns(PowertoolsDeprecationWarning, match="The 'config' parameter is deprecated in V3*"):
         SecretsProvider(config=config)
+
+
+def test_get_parameters_by_name_with_transform(mock_name):
+    # GIVEN a JSON parameter fetched via GetParameters
+    class FakeClient:
+        def get_parameters(self, Names, **kwargs):
+            return build_get_parameters_stub(params={name: '{"feature": true}' for name in Names})
+
+    provider = SSMProvider(boto3_client=FakeClient())
+
+    # WHEN get_parameters_by_name is called with a json transform
+    values = provider.get_parameters_by_name(parameters={mock_name: {}}, transform="json")
+
+    # THEN the value should be transformed, and cached transformed
+    assert values[mock_name] == {"feature": True}
+    assert provider.store[(mock_name, "json")].value == {"feature": True}
+
+
+def test_ssm_provider_prefetch(mock_value):
+    # GIVEN 23 parameters, one of them JSON, and 2 parameters to decrypt
+    plain_params = {f"/param_{i}": {} for i in range(22)}
+    params = {
+        **plain_params,
+        "/json": {"transform": "json"},
+        "/secret_1": {"decrypt": True},
+        "/secret_2": {"decrypt": True},
+    }
+    calls = []
+
+    class FakeClient:
+        def get_parameters(self, Names, WithDecryption):
+            calls.append((sorted(Names), WithDecryption))
+            values = {name: '{"feature": true}' if name == "/json" else mock_value for name in Names}
+            return build_get_parameters_stub(params=values)
+
+    provider = SSMProvider(boto3_client=FakeClient())
+
+    # WHEN parameters are prefetched
+    report = provider.prefetch(params)
+
+    # THEN they should be fetched in GetParameters chunks, decrypting only the ones that must be decrypted
+    assert len(calls) == 4
+    assert (["/secret_1", "/secret_2"], True) in calls
+    assert all(not with_decryption for names, with_decryption in calls if "/secret_1" not in names)
+    assert report.fetched == list(params)
+    assert report.errors == []
+    assert report.duration_ms > 0
+
+    # AND later calls to get() should be served from cache
+    assert provider.get("/param_0") == mock_value
+    assert provider.get("/secret_1", decrypt=True) == mock_value
+    assert provider.get("/json", transform="json") == {"feature": True}
+    assert len(calls) == 4
+
+
+def test_ssm_provider_prefetch_skips_cached_parameters(mock_name, mock_value):
+    # GIVEN a parameter already in cache
+    class FakeClient:
+        def get_parameters(self, Names, WithDecryption):
+            raise RuntimeError("Should not be called if it's in cache")
+
+    provider = SSMProvider(boto3_client=FakeClient())
+    provider.add_to_cache(key=(mock_name, None, False), value=mock_value, max_age=10)
+
+    # WHEN it's prefetched
+    report = provider.prefetch([mock_name])
+
+    # THEN it should be reported as fetched without calling SSM
+    assert report.fetched == [mock_name]
+
+
+def test_ssm_provider_prefetch_graceful_error(mock_value):
+    # GIVEN a parameter that doesn't exist
+    class FakeClient:
+        def get_parameters(self, Names, WithDecryption):
+            return build_get_parameters_stub(
+                params={name: mock_value for name in Names},
+                invalid_parameters=["/missing"],
+            )
+
+    provider = SSMProvider(boto3_client=FakeClient())
+
+    # WHEN parameters are prefetched in graceful error mode
+    report = provider.prefetch(["/param", "/missing"], raise_on_error=False)
+
+    # THEN the missing parameter should be reported as an error
+    assert report.fetched == ["/param"]
+    assert report.errors == ["/missing"]
+
+    # AND it should raise otherwise
+    with pytest.raises(parameters.exceptions.GetParameterError, match="/missing"):
+        provider.prefetch(["/missing"])
+
+
+def test_base_provider_prefetch(mock_value):
+    # GIVEN a provider where one parameter fails
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            if name == "/failing":
+                raise RuntimeError("AccessDenied")
+            return mock_value
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            return {"a": mock_value}
+
+    provider = TestProvider()
+
+    # WHEN parameters and a path are prefetched in graceful error mode
+    report = provider.prefetch(
+        {"/param": {}, "/failing": {}, "/path": {"path": True}},
+        max_age=60,
+        raise_on_error=False,
+    )
+
+    # THEN failures should be reported, and the rest cached under get() and get_multiple() keys
+    assert report.fetched == ["/param", "/path"]
+    assert report.errors == ["/failing"]
+    assert provider.has_not_expired_in_cache(("/param", None, False))
+    assert provider.has_not_expired_in_cache(("/path", None, True))
+
+    # AND it should raise otherwise
+    with pytest.raises(parameters.exceptions.GetParameterError, match="AccessDenied"):
+        provider.prefetch(["/failing"])
+
+
+def test_prefetch_across_sources(monkeypatch, mock_value):
+    # GIVEN default providers for SSM, Secrets Manager and AppConfig
+    class FakeSSMClient:
+        def get_parameters(self, Names, WithDecryption):
+            return build_get_parameters_stub(params={name: mock_value for name in Names})
+
+    class TestProvider(BaseProvider):
+        def _get(self, name: str, **kwargs) -> str:
+            return '{"feature": true}'
+
+        def _get_multiple(self, path: str, **kwargs) -> Dict[str, str]:
+            raise NotImplementedError()
+
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "ssm", SSMProvider(boto3_client=FakeSSMClient()))
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "secrets", TestProvider())
+    monkeypatch.setitem(parameters.base.DEFAULT_PROVIDERS, "appconfig", TestProvider())
+
+    # WHEN parameters are prefetched from every source
+    reports = parameters.prefetch(
+        ssm=["/param"],
+        secrets={"secret": {"transform": "json"}},
+        appconfig={"features": {"transform": "json"}},
+    )
+
+    # THEN each source should be reported
+    assert set(reports) == {"ssm", "secrets", "appconfig"}
+    assert reports["ssm"].fetched == ["/param"]
+    assert reports["secrets"].fetched == ["secret"]
+    assert reports["appconfig"].fetched == ["features"]
+
+    # AND values should be cached for the high-level functions
+    assert parameters.base.DEFAULT_PROVIDERS["ssm"].has_not_expired_in_cache(("/param", None, False))
+    assert parameters.base.DEFAULT_PROVIDERS["secrets"].has_not_expired_in_cache(("secret", "json", False))
+    assert parameters.get_app_config("features", environment="dev", transform="json") == {"feature": True}
+
+
+def test_prefetch_appconfig_requires_environment(monkeypatch):
+    # GIVEN no AppConfig provider was created before
+    monkeypatch.setattr(parameters.prefetching, "DEFAULT_PROVIDERS", {})
+
+    # WHEN AppConfig configurations are prefetched without an environment
+    # THEN it should raise ValueError
+    with pytest.raises(ValueError, match="environment"):
+        parameters.prefetch(appconfig=["features"])
+
+
+def _appconfig_response(body: bytes, poll_interval: int = 0) -> Dict[str, Any]:
+    return {
+        "Configuration": StreamingBody(BytesIO(body), len(body)),
+        "NextPollConfigurationToken": "next_token",
+        "NextPollIntervalInSeconds": poll_interval,
+        "ContentType": "application/json",
+    }
+
+
+def test_appconf_provider_skips_transform_when_unchanged(monkeypatch, mock_name, config):
+    # GIVEN an AppConfig provider, and a configuration that doesn't change between polls
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+    mock_body = json.dumps({"feature": True}).encode()
+
+    calls = []
+
+    def counting_loads(value):
+        calls.append(value)
+        return json.loads(value)
+
+    monkeypatch.setitem(TRANSFORM_METHOD_MAPPING, "json", counting_loads)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response("get_latest_configuration", _appconfig_response(mock_body))
+    stubber.add_response("get_latest_configuration", _appconfig_response(b""))
+    stubber.add_response("get_latest_configuration", _appconfig_response(mock_body))
+    stubber.activate()
+
+    try:
+        # WHEN fetching it again, with an empty body and then with the same body
+        values = [provider.get(mock_name, transform="json", force_fetch=True) for _ in range(3)]
+
+        # THEN it's only parsed once
+        assert values == [{"feature": True}] * 3
+        assert len(calls) == 1
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_appconf_provider_transforms_changed_configuration(mock_name, config):
+    # GIVEN an AppConfig provider
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": true}'))
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": false}'))
+    stubber.activate()
+
+    try:
+        # WHEN the configuration changes between polls
+        first = provider.get(mock_name, transform="json", force_fetch=True)
+        second = provider.get(mock_name, transform="json", force_fetch=True)
+
+        # THEN the new configuration is returned
+        assert first == {"feature": True}
+        assert second == {"feature": False}
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_appconf_provider_respects_next_poll_interval(mock_name, config):
+    # GIVEN an AppConfig provider, and AppConfig requiring 60 seconds between polls
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": true}', poll_interval=60))
+    stubber.activate()
+
+    try:
+        # WHEN fetching the configuration again before the poll interval elapses, once the cached value expired
+        provider.get(mock_name, transform="json")
+        value = provider.get(mock_name, transform="json", max_age=0)
+
+        # THEN AppConfig isn't called again, and the last value is returned
+        assert value == {"feature": True}
+        assert 59 < provider.seconds_until_next_poll(mock_name) <= 60
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_appconf_provider_force_fetch_polls_before_next_poll_interval(mock_name, config):
+    # GIVEN an AppConfig provider, and AppConfig requiring 60 seconds between polls
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": true}', poll_interval=60))
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": false}', poll_interval=60))
+    stubber.activate()
+
+    try:
+        # WHEN force fetching the configuration before the poll interval elapses
+        provider.get(mock_name, transform="json")
+        value = provider.get(mock_name, transform="json", force_fetch=True)
+
+        # THEN AppConfig is polled right away
+        assert value == {"feature": False}
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
+
+
+def test_appconf_provider_restarts_expired_session(mock_name, config):
+    # GIVEN an AppConfig provider whose configuration token expired
+    provider = parameters.AppConfigProvider(environment="dev", application="myapp", boto_config=config)
+
+    stubber = stub.Stubber(provider.client)
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "initial_token"})
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": true}'))
+    stubber.add_client_error("get_latest_configuration", service_error_code="BadRequestException")
+    stubber.add_response("start_configuration_session", {"InitialConfigurationToken": "new_token"})
+    stubber.add_response("get_latest_configuration", _appconfig_response(b'{"feature": false}'))
+    stubber.activate()
+
+    try:
+        # WHEN fetching the configuration again
+        provider.get(mock_name, transform="json")
+        value = provider.get(mock_name, transform="json", force_fetch=True)
+
+        # THEN a new session is started
+        assert value == {"feature": False}
+        stubber.assert_no_pending_responses()
+    finally:
+        stubber.deactivate()
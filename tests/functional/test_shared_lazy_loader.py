@@ -1,4 +1,11 @@
-from aws_lambda_powertools.shared.lazy_import import LazyLoader
+import importlib
+import subprocess
+import sys
+from enum import Enum
+
+import pytest
+
+from aws_lambda_powertools.shared.lazy_import import LazyLoader, lazy_exports
 
 
 def test_lazy_loader_dir():
@@ -7,3 +14,112 @@ def test_lazy_loader_dir():
     module_dir = lazy_loader.__dir__()
     assert isinstance(module_dir, list)
     assert "Enum" in module_dir
+
+
+def test_lazy_exports_imports_on_first_access():
+    # GIVEN a package namespace lazily exporting a name from a module
+    package_globals = {}
+    lazy_getattr, lazy_dir = lazy_exports("aws_lambda_powertools", package_globals, {"Enum": "enum"})
+
+    # WHEN accessing the exported name
+    value = lazy_getattr("Enum")
+
+    # THEN it's imported from its module and cached in the package namespace
+    assert value is Enum
+    assert package_globals["Enum"] is Enum
+    assert "Enum" in lazy_dir()
+
+
+def test_lazy_exports_submodule():
+    # GIVEN a package lazily exporting one of its submodules
+    lazy_getattr, _ = lazy_exports(
+        "aws_lambda_powertools.utilities.parser",
+        {},
+        {"envelopes": ".envelopes"},
+    )
+
+    # WHEN accessing the exported name
+    value = lazy_getattr("envelopes")
+
+    # THEN the submodule itself is returned
+    assert value is importlib.import_module("aws_lambda_powertools.utilities.parser.envelopes")
+
+
+def test_lazy_exports_unknown_name():
+    # GIVEN a package with lazy exports
+    lazy_getattr, _ = lazy_exports("aws_lambda_powertools", {}, {"Enum": "enum"})
+
+    # WHEN accessing a name that isn't exported
+    # THEN we raise AttributeError like a regular module
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        lazy_getattr("Unknown")
+
+
+def test_top_level_package_import_does_not_load_core_utilities():
+    # GIVEN a fresh interpreter
+    code = (
+        "import sys, aws_lambda_powertools;"
+        "print(','.join(m for m in ('aws_lambda_powertools.logging.logger', 'aws_lambda_powertools.metrics.metrics',"
+        "'aws_lambda_powertools.tracing.tracer') if m in sys.modules))"
+    )
+
+    # WHEN importing the top-level package
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    # THEN Logger, Metrics and Tracer are only imported on first access
+    assert output.strip() == ""
+
+
+def test_top_level_package_exports():
+    # GIVEN the top-level package
+    import aws_lambda_powertools
+
+    # WHEN accessing its lazy exports
+    # THEN they resolve to the core utilities
+    assert aws_lambda_powertools.Logger is importlib.import_module("aws_lambda_powertools.logging").Logger
+    assert aws_lambda_powertools.Tracer is importlib.import_module("aws_lambda_powertools.tracing").Tracer
+    assert set(aws_lambda_powertools.__all__) <= set(dir(aws_lambda_powertools))
+
+
+def test_lazy_exports_unexported_submodule():
+    # GIVEN a package lazily exporting names but not all of its submodules
+    lazy_getattr, _ = lazy_exports("aws_lambda_powertools.utilities.parser", {}, {})
+
+    # WHEN accessing a submodule that isn't exported
+    value = lazy_getattr("envelopes")
+
+    # THEN the submodule is imported like a regular package attribute
+    assert value is importlib.import_module("aws_lambda_powertools.utilities.parser.envelopes")
+
+
+def test_lazy_exports_submodule_with_missing_dependency(tmp_path, monkeypatch):
+    # GIVEN a package whose submodule imports a dependency that isn't installed
+    package = tmp_path / "lazy_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "broken.py").write_text("import not_installed_dependency\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    lazy_getattr, _ = lazy_exports("lazy_pkg", {}, {})
+
+    # WHEN accessing the submodule
+    # THEN we surface the missing dependency instead of a missing attribute
+    with pytest.raises(ModuleNotFoundError, match="not_installed_dependency"):
+        lazy_getattr("broken")
+
+
+def test_unexported_submodules_in_fresh_interpreter():
+    # GIVEN a fresh interpreter where no test imported the submodules first
+    code = (
+        "from aws_lambda_powertools.utilities import batch, parameters;"
+        "print(parameters.ssm.__name__, parameters.base.__name__, batch.base.__name__)"
+    )
+
+    # WHEN accessing submodules that aren't lazy exports
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    # THEN they're imported on first access
+    assert output.split() == [
+        "aws_lambda_powertools.utilities.parameters.ssm",
+        "aws_lambda_powertools.utilities.parameters.base",
+        "aws_lambda_powertools.utilities.batch.base",
+    ]
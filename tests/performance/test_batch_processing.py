@@ -0,0 +1,102 @@
+import asyncio
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import pytest
+
+from aws_lambda_powertools.utilities.batch import (
+    AsyncBatchProcessor,
+    BatchProcessor,
+    EventType,
+    async_process_partial_response,
+    process_partial_response,
+)
+
+# simulated I/O latency of a record handler, e.g. a boto3 call
+IO_LATENCY_SECS: float = 0.01
+NUMBER_OF_RECORDS: int = 50
+
+# adjusted for slower machines in CI too: concurrent processing should take a fraction of serial processing
+CONCURRENT_PROCESSING_SLA: float = NUMBER_OF_RECORDS * IO_LATENCY_SECS / 3
+
+
+def build_event(number_of_records: int) -> Dict[str, List[Dict]]:
+    return {
+        "Records": [
+            {
+                "messageId": f"{uuid.uuid4()}",
+                "receiptHandle": "AQEBwJnKyrHigUMZj6rYigCgxlaS3SLy0a",
+                "body": f"record-{i}",
+                "attributes": {},
+                "messageAttributes": {},
+                "md5OfBody": "e4e68fb7bd0e697a0ae8f1bb342846b3",
+                "eventSource": "aws:sqs",
+                "eventSourceARN": "arn:aws:sqs:us-east-2:123456789012:my-queue",
+                "awsRegion": "us-east-1",
+            }
+            for i in range(number_of_records)
+        ],
+    }
+
+
+def record_handler(record):
+    time.sleep(IO_LATENCY_SECS)
+    return record.body
+
+
+async def async_record_handler(record):
+    await asyncio.sleep(IO_LATENCY_SECS)
+    return record.body
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="batch")
+def test_batch_processor_serial(benchmark):
+    # GIVEN a batch of I/O bound records processed one at a time
+    event = build_event(NUMBER_OF_RECORDS)
+    processor = BatchProcessor(event_type=EventType.SQS)
+
+    # WHEN processing the batch
+    response = benchmark.pedantic(process_partial_response, args=(event, record_handler, processor), rounds=3)
+
+    # THEN every record succeeds, as a baseline for concurrent processing
+    assert response == {"batchItemFailures": []}
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="batch")
+@pytest.mark.parametrize("max_workers", [4, 16])
+def test_batch_processor_thread_pool(benchmark, max_workers: int):
+    # GIVEN a batch of I/O bound records processed by a thread pool
+    event = build_event(NUMBER_OF_RECORDS)
+    processor = BatchProcessor(event_type=EventType.SQS, max_workers=max_workers)
+
+    # WHEN processing the batch
+    response = benchmark.pedantic(process_partial_response, args=(event, record_handler, processor), rounds=3)
+
+    # THEN every record succeeds, in a fraction of the time it takes to process them one at a time
+    assert response == {"batchItemFailures": []}
+
+    stat = benchmark.stats.stats.mean
+    if stat > CONCURRENT_PROCESSING_SLA:
+        pytest.fail(f"Processing {NUMBER_OF_RECORDS} records should be below {CONCURRENT_PROCESSING_SLA}s")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="batch")
+@pytest.mark.parametrize("max_workers", [None, 16])
+def test_async_batch_processor(benchmark, max_workers: Optional[int]):
+    # GIVEN a batch of I/O bound records processed by coroutines, all at once or with bounded concurrency
+    event = build_event(NUMBER_OF_RECORDS)
+    processor = AsyncBatchProcessor(event_type=EventType.SQS, max_workers=max_workers)
+
+    # WHEN processing the batch
+    response = benchmark.pedantic(
+        async_process_partial_response,
+        args=(event, async_record_handler, processor),
+        rounds=3,
+    )
+
+    # THEN every record succeeds, as a reference for the thread pool
+    assert response == {"batchItemFailures": []}
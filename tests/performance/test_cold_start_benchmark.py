@@ -0,0 +1,68 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_SCRIPT = Path(__file__).parents[2] / "benchmark" / "cold_start.py"
+
+
+@pytest.mark.perf
+def test_cold_start_benchmark_json_output(tmp_path: Path):
+    # GIVEN the offline cold start benchmark
+    output = tmp_path / "results.json"
+
+    # WHEN running the reference and instrumented functions in fresh interpreters
+    subprocess.run(
+        [
+            sys.executable,
+            str(BENCHMARK_SCRIPT),
+            "--runs",
+            "2",
+            "--scenario",
+            "reference",
+            "--scenario",
+            "instrumented",
+            "--output",
+            str(output),
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+    # THEN median and p99 timings are reported per scenario as JSON
+    results = json.loads(output.read_text())
+    assert set(results["scenarios"]) == {"reference", "instrumented"}
+    for scenario in results["scenarios"].values():
+        assert scenario["runs"] == 2
+        for metric in ("import_ms", "first_invocation_ms", "total_ms"):
+            assert 0 <= scenario[metric]["median"] <= scenario[metric]["p99"]
+
+
+@pytest.mark.perf
+def test_cold_start_benchmark_baseline_regression(tmp_path: Path):
+    # GIVEN a baseline where the reference function cold start was much faster
+    baseline = tmp_path / "baseline.json"
+    timings = {"median": 0.0001, "p99": 0.0001}
+    baseline.write_text(
+        json.dumps(
+            {
+                "scenarios": {
+                    "reference": {"import_ms": timings, "first_invocation_ms": timings, "total_ms": timings},
+                },
+            },
+        ),
+    )
+
+    # WHEN comparing a new run against the baseline
+    result = subprocess.run(
+        [sys.executable, str(BENCHMARK_SCRIPT), "--runs", "1", "--scenario", "reference", "--baseline", str(baseline)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    # THEN the regression is reported with a non-zero exit code
+    assert result.returncode == 1
+    assert "Regression: reference.total_ms" in result.stdout
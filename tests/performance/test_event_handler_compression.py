@@ -0,0 +1,54 @@
+import json
+from typing import Dict, List
+
+import pytest
+
+from aws_lambda_powertools.event_handler.compression import CompressionConfig
+
+# adjusted for slower machines in CI too
+COMPRESSION_1MB_SLA: float = 0.1
+
+
+def build_payload(number_of_items: int) -> bytes:
+    """Representative JSON API payload, e.g. a paginated list of orders"""
+    items: List[Dict] = [
+        {
+            "id": f"order-{i}",
+            "customer": {"id": f"customer-{i % 50}", "email": f"customer-{i % 50}@example.com"},
+            "status": "SHIPPED" if i % 3 else "PENDING",
+            "total": round(i * 1.37, 2),
+            "items": [{"sku": f"SKU-{i}-{n}", "quantity": n} for n in range(3)],
+        }
+        for i in range(number_of_items)
+    ]
+    return json.dumps({"items": items}).encode()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="compression")
+@pytest.mark.parametrize("number_of_items", [5, 500, 5000], ids=["1KB", "100KB", "1MB"])
+@pytest.mark.parametrize(
+    "encoding, level",
+    [("gzip", 9), ("gzip", 6), ("gzip", 1), ("br", 5), ("zstd", 3)],
+)
+def test_compression_latency_vs_bytes_saved(benchmark, encoding: str, level: int, number_of_items: int):
+    # GIVEN a representative JSON payload and an available encoding
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    if encoding == "zstd":
+        pytest.importorskip("zstandard")
+
+    compression_config = CompressionConfig(encodings=[encoding], level=level)
+    body = build_payload(number_of_items)
+
+    # WHEN compressing the payload
+    compressed = benchmark(compression_config.compress, body, encoding)
+
+    # THEN we record bytes saved alongside latency to compare encodings and levels
+    benchmark.extra_info["original_bytes"] = len(body)
+    benchmark.extra_info["compressed_bytes"] = len(compressed)
+    benchmark.extra_info["bytes_saved_ratio"] = round(1 - len(compressed) / len(body), 4)
+
+    stat = benchmark.stats.stats.mean
+    if stat > COMPRESSION_1MB_SLA:
+        pytest.fail(f"Compressing {len(body)} bytes with {encoding}:{level} should be below {COMPRESSION_1MB_SLA}s")
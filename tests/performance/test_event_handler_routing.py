@@ -0,0 +1,74 @@
+from typing import Dict
+
+import pytest
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+
+# adjusted for slower machines in CI too
+ROUTE_MATCH_SLA: float = 0.0005
+
+
+def build_app(number_of_routes: int) -> APIGatewayRestResolver:
+    """Registers half static and half dynamic routes, similar to a typical REST API"""
+    app = APIGatewayRestResolver()
+
+    for i in range(number_of_routes // 2):
+
+        @app.get(f"/v1/resource_{i}")
+        def static_handler():
+            return {}
+
+        @app.get(f"/v1/resource_{i}/<item_id>/details")
+        def dynamic_handler(item_id: str):
+            return {}
+
+    return app
+
+
+def match_route(app: APIGatewayRestResolver, event: Dict) -> None:
+    """Resolves a route the same way ApiGatewayResolver._resolve does"""
+    method, path = event["httpMethod"], event["path"]
+    if app._route_index.find_static(method, path):
+        return
+
+    for route in app._route_index.candidates(method, path):
+        if route.rule.match(path):
+            return
+
+    raise AssertionError(f"No route matched {path}")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="routing")
+@pytest.mark.parametrize("number_of_routes", [10, 100, 1000])
+def test_route_match_cost_per_request(benchmark, number_of_routes: int):
+    # GIVEN an app with many static and dynamic routes registered
+    app = build_app(number_of_routes)
+    last_route = number_of_routes // 2 - 1
+    event = {"path": f"/v1/resource_{last_route}/123/details", "httpMethod": "GET"}
+
+    # WHEN matching a request against the last registered route
+    benchmark(match_route, app, event)
+
+    # THEN the per-request match cost should stay flat regardless of the number of routes
+    stat = benchmark.stats.stats.mean
+    if stat > ROUTE_MATCH_SLA:
+        pytest.fail(f"Route matching with {number_of_routes} routes should be below {ROUTE_MATCH_SLA}s: {stat}")
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="routing")
+@pytest.mark.parametrize("number_of_routes", [10, 100, 1000])
+def test_static_route_match_cost_per_request(benchmark, number_of_routes: int):
+    # GIVEN an app with many static and dynamic routes registered
+    app = build_app(number_of_routes)
+    last_route = number_of_routes // 2 - 1
+    event = {"path": f"/v1/resource_{last_route}/", "httpMethod": "GET"}
+
+    # WHEN matching a request against the last registered static route
+    benchmark(match_route, app, event)
+
+    # THEN the per-request match cost should stay flat regardless of the number of routes
+    stat = benchmark.stats.stats.mean
+    if stat > ROUTE_MATCH_SLA:
+        pytest.fail(f"Route matching with {number_of_routes} routes should be below {ROUTE_MATCH_SLA}s: {stat}")
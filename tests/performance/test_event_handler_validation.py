@@ -0,0 +1,75 @@
+import json
+from typing import Dict
+
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from aws_lambda_powertools.event_handler import APIGatewayRestResolver
+from aws_lambda_powertools.event_handler.openapi.params import Body, Header, Query
+
+# adjusted for slower machines in CI too
+REQUEST_SLA: float = 0.001
+
+
+class Todo(BaseModel):
+    title: str
+    completed: bool = False
+
+
+def build_app(enable_validation: bool) -> APIGatewayRestResolver:
+    """Registers a route with path, query, header and body parameters, read by hand when validation is off"""
+    app = APIGatewayRestResolver(enable_validation=enable_validation)
+
+    if enable_validation:
+
+        @app.post("/users/<user_id>/todos")
+        def create_todo(
+            user_id: int,
+            todo: Annotated[Todo, Body()],
+            notify: Annotated[bool, Query()] = False,
+            correlation_id: Annotated[str, Header()] = "",
+        ) -> Dict:
+            return {"user_id": user_id, "todo": todo.title, "notify": notify, "correlation_id": correlation_id}
+
+    else:
+
+        @app.post("/users/<user_id>/todos")
+        def create_todo_without_validation(user_id: str) -> Dict:
+            todo = app.current_event.json_body
+            notify = app.current_event.get_query_string_value("notify", default_value="false") == "true"
+            correlation_id = app.current_event.headers.get("correlation-id", "")
+            return {"user_id": int(user_id), "todo": todo["title"], "notify": notify, "correlation_id": correlation_id}
+
+    return app
+
+
+def build_event() -> Dict:
+    return {
+        "path": "/users/123/todos",
+        "httpMethod": "POST",
+        "headers": {"Content-Type": "application/json", "Correlation-Id": "abc"},
+        "multiValueHeaders": {"Content-Type": ["application/json"], "Correlation-Id": ["abc"]},
+        "queryStringParameters": {"notify": "true"},
+        "multiValueQueryStringParameters": {"notify": ["true"]},
+        "requestContext": {"stage": "prod"},
+        "body": json.dumps({"title": "Write benchmarks", "completed": False}),
+    }
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="validation")
+@pytest.mark.parametrize("enable_validation", [False, True], ids=["validation_off", "validation_on"])
+def test_request_overhead_with_validation(benchmark, enable_validation: bool):
+    # GIVEN an app with a route taking path, query, header and body parameters
+    app = build_app(enable_validation)
+    event = build_event()
+
+    # WHEN resolving requests to the route
+    result = benchmark(app.resolve, event, {})
+
+    # THEN the per-request overhead of validation should stay low
+    assert result["statusCode"] == 200
+    stat = benchmark.stats.stats.mean
+    if stat > REQUEST_SLA:
+        pytest.fail(f"Resolving a request with validation={enable_validation} should be below {REQUEST_SLA}s: {stat}")
@@ -1,6 +1,8 @@
 import importlib
+import subprocess
+import sys
 from types import ModuleType
-from typing import Tuple
+from typing import Dict, Tuple
 
 import pytest
 
@@ -15,6 +17,20 @@ LOGGING_PACKAGE = "aws_lambda_powertools.logging"
 METRICS_PACKAGE = "aws_lambda_powertools.metrics"
 TRACER_PACKAGE = "aws_lambda_powertools.utilities.parser"
 
+# Cold start import budget per module in microseconds, as reported by `python -X importtime`,
+# excluding modules already imported on interpreter startup.
+# Budgets are the best of five runs measured for each package, plus a 50% margin for different CI machines,
+# so a regression in any single package fails its own budget
+IMPORT_TIME_BUDGETS: Dict[str, int] = {
+    PARENT_PACKAGE: 22_000,
+    "aws_lambda_powertools.utilities.batch": 22_000,
+    "aws_lambda_powertools.utilities.data_classes": 50_000,
+    "aws_lambda_powertools.utilities.feature_flags": 28_000,
+    "aws_lambda_powertools.utilities.idempotency": 30_000,
+    "aws_lambda_powertools.utilities.parameters": 28_000,
+    "aws_lambda_powertools.utilities.parser": 25_000,
+}
+
 
 def import_core_utilities() -> Tuple[ModuleType, ModuleType, ModuleType]:
     """Dynamically imports and return Tracing, Logging, and Metrics modules"""
@@ -26,6 +42,25 @@ def import_core_utilities() -> Tuple[ModuleType, ModuleType, ModuleType]:
     )
 
 
+def measure_import_time(code: str) -> Dict[str, int]:
+    """Time in microseconds spent importing each module in a fresh interpreter running `code`"""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    # import time: self [us] | cumulative | imported package
+    import_times: Dict[str, int] = {}
+    for line in output.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_time, _, module = line.split("|")
+            import_times[module.strip()] = int(self_time.split(":")[1])
+
+    return import_times
+
+
 @pytest.fixture(autouse=True)
 def clear_cache():
     importlib.invalidate_caches()
@@ -108,3 +143,20 @@ def test_parser_init(benchmark):
     stat = benchmark.stats.stats.max
     if stat > PARSER_INIT_SLA:
         pytest.fail(f"High level imports should be below ${PARSER_INIT_SLA}s: {stat}")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("module, budget", IMPORT_TIME_BUDGETS.items(), ids=list(IMPORT_TIME_BUDGETS))
+def test_import_time_budget(module: str, budget: int):
+    # GIVEN a fresh interpreter, i.e. a Lambda cold start
+    # WHEN only importing a Powertools package
+    # best of five runs to rule out noisy neighbours, excluding the interpreter startup imports
+    startup = measure_import_time("pass").keys()
+    import_time = min(
+        sum(time for name, time in measure_import_time(f"import {module}").items() if name not in startup)
+        for _ in range(5)
+    )
+
+    # THEN its import time should be within budget
+    if import_time > budget:
+        pytest.fail(f"Importing {module} should be below {budget}us: {import_time}us")
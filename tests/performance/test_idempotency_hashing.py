@@ -0,0 +1,58 @@
+import hashlib
+import json
+from typing import Dict, List
+
+import pytest
+
+from aws_lambda_powertools.shared.json_encoder import Encoder
+from aws_lambda_powertools.utilities.idempotency.hashing import canonical_hash, get_hash_function
+
+PAYLOAD_SIZES: List[int] = [1_000, 100_000, 1_000_000]
+PAYLOAD_SHAPES: List[str] = ["records", "keys"]
+
+
+def build_payload(size_in_bytes: int, shape: str = "records") -> Dict:
+    # each record is about 100 bytes once serialized
+    records = [
+        {"messageId": f"id-{i}", "body": "x" * 40, "attributes": {"ApproximateReceiveCount": i}}
+        for i in range(max(1, size_in_bytes // 100))
+    ]
+    if shape == "keys":
+        # e.g. items keyed by id, rather than a list of records
+        return {record["messageId"]: record for record in records}
+    return {"Records": records}
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="idempotency_hashing")
+@pytest.mark.parametrize("size_in_bytes", PAYLOAD_SIZES)
+@pytest.mark.parametrize("shape", PAYLOAD_SHAPES)
+def test_hash_serialized_payload(benchmark, size_in_bytes: int, shape: str):
+    # GIVEN a payload hashed after serializing it as a whole, as a baseline
+    payload = build_payload(size_in_bytes, shape)
+
+    # WHEN hashing it
+    result = benchmark(lambda: hashlib.md5(json.dumps(payload, cls=Encoder, sort_keys=True).encode()).hexdigest())
+
+    # THEN the hash is the one of the canonical JSON document
+    assert result == canonical_hash(payload, hashlib.md5)
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="idempotency_hashing")
+@pytest.mark.parametrize("size_in_bytes", PAYLOAD_SIZES)
+@pytest.mark.parametrize("shape", PAYLOAD_SHAPES)
+@pytest.mark.parametrize("hash_function", ["md5", "blake2b", "xxh3_128"])
+def test_canonical_hash(benchmark, size_in_bytes: int, shape: str, hash_function: str):
+    # GIVEN a payload hashed incrementally while it's serialized
+    if hash_function.startswith("xxh"):
+        pytest.importorskip("xxhash")
+    payload = build_payload(size_in_bytes, shape)
+    hash_constructor = get_hash_function(hash_function)
+
+    # WHEN hashing it
+    result = benchmark(canonical_hash, payload, hash_constructor)
+
+    # THEN the hash is the one of the canonical JSON document
+    expected = hash_constructor(json.dumps(payload, cls=Encoder, sort_keys=True).encode()).hexdigest()
+    assert result == expected
@@ -0,0 +1,70 @@
+import base64
+import gzip
+import json
+from typing import Any, Dict
+
+import jmespath
+import pytest
+
+from aws_lambda_powertools.utilities.jmespath_utils import PowertoolsFunctions, envelopes, query
+
+PAYLOAD = {"customerId": "dd4649e6-2484-4993-acb8-0f9123103394", "amount": 10}
+S3_EVENT = {"Records": [{"s3": {"bucket": {"name": "my-bucket"}, "object": {"key": "my-key"}}}]}
+
+
+def encode(data: Any) -> str:
+    return base64.b64encode(json.dumps(data).encode()).decode()
+
+
+EVENTS: Dict[str, Dict] = {
+    "API_GATEWAY_REST": {"body": json.dumps(PAYLOAD)},
+    "SQS": {"Records": [{"body": json.dumps(PAYLOAD)}] * 10},
+    "SNS": {"Records": [{"Sns": {"Message": json.dumps(PAYLOAD)}}]},
+    "EVENTBRIDGE": {"detail": PAYLOAD},
+    "KINESIS_DATA_STREAM": {"Records": [{"kinesis": {"data": encode(PAYLOAD)}}] * 10},
+    "CLOUDWATCH_LOGS": {
+        "awslogs": {
+            "data": base64.b64encode(gzip.compress(json.dumps({"logEvents": [PAYLOAD] * 10}).encode())).decode(),
+        },
+    },
+    "S3_SNS_SQS": {"Records": [{"body": json.dumps({"Message": json.dumps(S3_EVENT)})}] * 10},
+    "S3_SQS": {"Records": [{"body": json.dumps(S3_EVENT)}] * 10},
+    "S3_SNS_KINESIS_FIREHOSE": {"records": [{"data": encode({"Message": json.dumps(S3_EVENT)})}] * 10},
+    "S3_KINESIS_FIREHOSE": {"records": [{"data": encode(S3_EVENT)}] * 10},
+    "S3_EVENTBRIDGE_SQS": {"Records": [{"body": json.dumps({"detail": PAYLOAD})}] * 10},
+}
+
+
+def search_uncompiled(data: Dict, envelope: str) -> Any:
+    # how envelopes were evaluated before compiled expressions were shared
+    return jmespath.search(envelope, data, options=jmespath.Options(custom_functions=PowertoolsFunctions()))
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="jmespath_envelopes")
+@pytest.mark.parametrize("envelope_name", EVENTS.keys())
+def test_envelope_uncompiled(benchmark, envelope_name: str):
+    # GIVEN an event unwrapped by parsing the envelope expression and building its options every time
+    envelope = getattr(envelopes, envelope_name)
+    event = EVENTS[envelope_name]
+
+    # WHEN unwrapping it
+    result = benchmark(search_uncompiled, event, envelope)
+
+    # THEN the data is found, as a baseline for compiled expressions
+    assert result
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="jmespath_envelopes")
+@pytest.mark.parametrize("envelope_name", EVENTS.keys())
+def test_envelope_query(benchmark, envelope_name: str):
+    # GIVEN an event unwrapped with query, which reuses compiled expressions
+    envelope = getattr(envelopes, envelope_name)
+    event = EVENTS[envelope_name]
+
+    # WHEN unwrapping it
+    result = benchmark(query, event, envelope)
+
+    # THEN the same data is found
+    assert result == search_uncompiled(event, envelope)
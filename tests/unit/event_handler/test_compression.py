@@ -0,0 +1,129 @@
+import zlib
+
+import pytest
+
+from aws_lambda_powertools.event_handler.compression import CompressionConfig
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("GZIP", "gzip"),
+        ("*", None),
+        ("gzip;q=0", None),
+        ("deflate", None),
+        ("", None),
+    ],
+)
+def test_negotiate_default_encodings(accept_encoding: str, expected: str):
+    # GIVEN the default compression config
+    compression_config = CompressionConfig()
+
+    # WHEN negotiating the encoding with the client
+    # THEN only gzip is supported
+    assert compression_config.negotiate(accept_encoding) == expected
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [("*", "gzip"), ("deflate, *;q=0.5", "gzip"), ("*, gzip;q=0", None)],
+)
+def test_negotiate_accept_wildcard(accept_encoding: str, expected: str):
+    # GIVEN a config accepting the Accept-Encoding wildcard
+    compression_config = CompressionConfig(accept_wildcard=True)
+
+    # WHEN negotiating the encoding with a client accepting any encoding
+    # THEN gzip is used, unless the client explicitly refuses it
+    assert compression_config.negotiate(accept_encoding) == expected
+
+
+def test_negotiate_prefers_client_quality_over_server_order():
+    # GIVEN a config preferring gzip over zstd
+    pytest.importorskip("zstandard")
+    compression_config = CompressionConfig(encodings=["gzip", "zstd"])
+
+    # WHEN the client prefers zstd
+    encoding = compression_config.negotiate("gzip;q=0.5, zstd")
+
+    # THEN zstd is used
+    assert encoding == "zstd"
+
+
+def test_negotiate_uses_server_order_on_quality_ties():
+    # GIVEN a config preferring br over gzip
+    pytest.importorskip("brotli")
+    compression_config = CompressionConfig(encodings=["br", "gzip"])
+
+    # WHEN the client accepts both equally
+    encoding = compression_config.negotiate("gzip, deflate, br")
+
+    # THEN the server preference wins
+    assert encoding == "br"
+
+
+def test_invalid_encoding():
+    # GIVEN an unsupported encoding
+    # WHEN creating the compression config
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError, match="Unsupported compression encoding"):
+        CompressionConfig(encodings=["deflate"])
+
+
+@pytest.mark.parametrize(
+    "encodings,level",
+    [(["br", "gzip"], 11), (["gzip"], 10), (["gzip"], -2), (["br"], -1), (["zstd"], 0), (["zstd"], 23)],
+)
+def test_level_unsupported_by_encoding(encodings: list, level: int):
+    # GIVEN a compression level not supported by one of the encodings
+    # WHEN creating the compression config
+    # THEN a ValueError is raised, rather than failing requests negotiating that encoding
+    with pytest.raises(ValueError, match=f"Compression level {level} is not supported"):
+        CompressionConfig(encodings=encodings, level=level)
+
+
+def test_level_supported_by_every_encoding():
+    # GIVEN a compression level supported by every encoding
+    # WHEN creating the compression config
+    compression_config = CompressionConfig(encodings=["br", "gzip", "zstd"], level=9)
+
+    # THEN it's applied to any negotiated encoding
+    assert compression_config.level == 9
+
+
+def test_should_compress_minimum_size():
+    # GIVEN a config with a minimum body size
+    compression_config = CompressionConfig(minimum_size=10)
+
+    # WHEN checking bodies below and above the minimum size
+    # THEN only the larger body is compressed
+    assert compression_config.should_compress(b"small", "application/json") is False
+    assert compression_config.should_compress(b"large enough body", "application/json") is True
+
+
+def test_should_compress_content_types():
+    # GIVEN a config with a content type allowlist
+    compression_config = CompressionConfig(content_types=["application/json", "text/"])
+
+    # WHEN checking different content types
+    # THEN only allowed content types are compressed
+    assert compression_config.should_compress(b"body", "application/json; charset=utf-8") is True
+    assert compression_config.should_compress(b"body", "text/html") is True
+    assert compression_config.should_compress(b"body", "Application/JSON") is True
+    assert compression_config.should_compress(b"body", "TEXT/plain;charset=UTF-8") is True
+    assert compression_config.should_compress(b"body", "image/png") is False
+    assert compression_config.should_compress(b"body", None) is False
+    assert compression_config.should_compress(b"body", "") is False
+
+
+def test_compress_gzip_with_level():
+    # GIVEN a config with a custom compression level
+    compression_config = CompressionConfig(level=1)
+    body = b"hello world" * 100
+
+    # WHEN compressing a body
+    compressed = compression_config.compress(body, "gzip")
+
+    # THEN it's a valid gzip payload
+    assert zlib.decompress(compressed, wbits=zlib.MAX_WBITS | 16) == body
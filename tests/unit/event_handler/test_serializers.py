@@ -0,0 +1,122 @@
+import datetime
+import json
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel
+
+from aws_lambda_powertools.event_handler.serializers import JSONSerializer
+
+
+class Order(BaseModel):
+    id: str
+    total: Decimal
+
+
+@dataclass
+class Customer:
+    id: str
+    name: str
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_serializer_backends_support_default_encoder_types(backend: str):
+    # GIVEN an installed serializer backend
+    pytest.importorskip(backend)
+    serializer = JSONSerializer(backend=backend)
+    payload = {
+        "order": Order(id="1", total=Decimal("10.5")),
+        "customer": Customer(id="2", name="John"),
+        "discount": Decimal("0.25"),
+        "items": [1, "two", None, True, 3.5],
+    }
+
+    # WHEN serializing Pydantic models, Dataclasses and Decimals
+    body = serializer(payload)
+
+    # THEN every backend produces the same compact JSON as the default serializer
+    assert serializer.backend == backend
+    assert isinstance(body, str)
+    assert json.loads(body) == {
+        "order": {"id": "1", "total": "10.5"},
+        "customer": {"id": "2", "name": "John"},
+        "discount": "0.25",
+        "items": [1, "two", None, True, 3.5],
+    }
+    assert body == JSONSerializer(backend="json")(payload)
+
+
+def test_serializer_auto_prefers_installed_third_party_backend():
+    # GIVEN orjson is installed
+    pytest.importorskip("orjson")
+
+    # WHEN using the auto backend
+    serializer = JSONSerializer()
+
+    # THEN orjson is picked
+    assert serializer.backend == "orjson"
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec", "json"])
+def test_serializer_backends_raise_type_error_on_unsupported_types(backend: str):
+    # GIVEN an installed serializer backend
+    pytest.importorskip(backend)
+    serializer = JSONSerializer(backend=backend)
+
+    # WHEN serializing a type none of the backends support
+    # THEN a TypeError is raised, like json.dumps does
+    with pytest.raises(TypeError):
+        serializer({"value": object()})
+
+
+def test_serializer_unsupported_backend():
+    # GIVEN an unknown backend
+    # WHEN creating the serializer
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError, match="Unsupported JSON serializer backend"):
+        JSONSerializer(backend="simplejson")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "msgspec"])
+@pytest.mark.parametrize(
+    "value",
+    [
+        Decimal("10.50"),
+        Decimal("NaN"),
+        Decimal("-Infinity"),
+        2**64,
+        -(2**70),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=5, minutes=30))),
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2024, 1, 2),
+        datetime.time(1, 2, 3, tzinfo=datetime.timezone.utc),
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    ],
+)
+def test_serializer_backends_output_matches_json_backend(backend: str, value):
+    # GIVEN an installed third-party serializer backend
+    pytest.importorskip(backend)
+    payload = {"value": value, "items": [value]}
+
+    # WHEN serializing Decimals, integers wider than 64 bits, datetimes and UUIDs
+    body = JSONSerializer(backend=backend)(payload)
+
+    # THEN the output is byte for byte the same as the standard library backend
+    assert body == JSONSerializer(backend="json")(payload)
+
+
+def test_serializer_datetimes_in_utc_use_z_suffix():
+    # GIVEN datetimes in UTC
+    payload = [
+        datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        datetime.time(1, 2, 3, tzinfo=datetime.timezone.utc),
+    ]
+
+    # WHEN serializing them with the standard library backend
+    body = JSONSerializer(backend="json")(payload)
+
+    # THEN they're formatted like msgspec and Pydantic do
+    assert body == '["2024-01-02T03:04:05Z","01:02:03Z"]'
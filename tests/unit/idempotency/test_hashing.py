@@ -0,0 +1,91 @@
+import decimal
+import hashlib
+import json
+
+import pytest
+
+from aws_lambda_powertools.shared.json_encoder import Encoder
+from aws_lambda_powertools.utilities.idempotency.hashing import (
+    CHUNK_SIZE,
+    canonical_hash,
+    get_hash_function,
+    iter_canonical_json,
+)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "order-1",
+        {"id": 1, "amount": decimal.Decimal("10.50"), "tags": ("a", "b")},
+        {"Records": [{"messageId": f"{i}", "body": "é" * i} for i in range(CHUNK_SIZE * 3 + 1)]},
+        {"a": {1: {"b": list(range(CHUNK_SIZE * 2))}, 2: None}, "c": [{"d": list(range(CHUNK_SIZE))}, "e"]},
+        {f"key-{i}": {"nested": [i] * 3} for i in range(CHUNK_SIZE * 2)},
+        {i: {"nested": [i] * 3} for i in range(CHUNK_SIZE * 2 + 1)},
+    ],
+)
+def test_iter_canonical_json_matches_json_dumps(data):
+    # GIVEN data small enough to be encoded at once, or large enough to be encoded in chunks
+    # WHEN encoding it as canonical JSON
+    encoded = "".join(iter_canonical_json(data))
+
+    # THEN it's the same as json.dumps, so hashes of existing idempotency records don't change
+    assert encoded == json.dumps(data, cls=Encoder, sort_keys=True)
+
+
+def test_iter_canonical_json_encodes_large_payloads_in_chunks():
+    # GIVEN a batch of records too large to be encoded at once
+    data = {"Records": [{"messageId": f"{i}"} for i in range(CHUNK_SIZE * 4)]}
+
+    # WHEN encoding it as canonical JSON
+    chunks = list(iter_canonical_json(data))
+
+    # THEN records are encoded a chunk at a time
+    assert len(chunks) > 4
+    assert max(len(chunk) for chunk in chunks) < len(json.dumps(data)) / 2
+
+
+@pytest.mark.parametrize("hash_function", ["md5", "sha256", "blake2b"])
+def test_canonical_hash_with_hashlib_functions(hash_function: str):
+    # GIVEN a payload
+    data = {"Records": [{"messageId": f"{i}"} for i in range(CHUNK_SIZE * 2)]}
+
+    # WHEN hashing it incrementally
+    result = canonical_hash(data, get_hash_function(hash_function))
+
+    # THEN it matches hashing the whole JSON document at once
+    expected = getattr(hashlib, hash_function)(json.dumps(data, cls=Encoder, sort_keys=True).encode()).hexdigest()
+    assert result == expected
+
+
+def test_get_hash_function_xxhash():
+    # GIVEN the optional xxhash package
+    xxhash = pytest.importorskip("xxhash")
+
+    # WHEN getting a xxhash function by name
+    hash_function = get_hash_function("xxh3_128")
+
+    # THEN it's the one from the xxhash package
+    assert hash_function is xxhash.xxh3_128
+
+
+@pytest.mark.parametrize("name", ["not_a_hash", "new", "pbkdf2_hmac", "file_digest", "shake_128", "shake_256"])
+def test_get_hash_function_unknown(name: str):
+    # GIVEN a name that isn't a hash function usable with hexdigest(), even if hashlib has an attribute with it
+    # WHEN getting the hash function
+    # THEN a ValueError is raised
+    with pytest.raises(ValueError, match="Unsupported hash function"):
+        get_hash_function(name)
+
+
+def test_get_hash_function_openssl_only_algorithm():
+    # GIVEN an algorithm hashlib only provides through hashlib.new, e.g. from OpenSSL
+    name = next((name for name in ("sha512_256", "sha512_224", "sm3") if name in hashlib.algorithms_available), None)
+    if name is None:
+        pytest.skip("No algorithm only provided through hashlib.new")
+
+    # WHEN getting the hash function
+    hash_function = get_hash_function(name)
+
+    # THEN it hashes like hashlib.new
+    assert hash_function(b"data").hexdigest() == hashlib.new(name, b"data").hexdigest()
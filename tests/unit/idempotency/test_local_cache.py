@@ -0,0 +1,102 @@
+import datetime
+
+from aws_lambda_powertools.utilities.idempotency import DynamoDBPersistenceLayer, IdempotencyConfig, LocalCache
+from aws_lambda_powertools.utilities.idempotency.persistence.datarecord import DataRecord
+
+
+def build_data_record(idempotency_key: str, response_size: int = 10, expires_in_seconds: int = 3600) -> DataRecord:
+    expiry_timestamp = int(datetime.datetime.now().timestamp()) + expires_in_seconds
+    return DataRecord(
+        idempotency_key=idempotency_key,
+        status="COMPLETED",
+        expiry_timestamp=expiry_timestamp,
+        response_data="x" * response_size,
+    )
+
+
+def test_local_cache_evicts_least_recently_used_records():
+    # GIVEN a full cache
+    cache = LocalCache(max_items=2)
+    cache.put(build_data_record("a"))
+    cache.put(build_data_record("b"))
+
+    # WHEN using the oldest record, and adding a new one
+    cache.get("a")
+    cache.put(build_data_record("c"))
+
+    # THEN the least recently used record is evicted
+    assert "b" not in cache
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_local_cache_evicts_records_by_size():
+    # GIVEN a cache bounded in size, holding small records
+    cache = LocalCache(max_items=100, max_bytes=12_000)
+    for key in range(5):
+        cache.put(build_data_record(f"small-{key}"))
+
+    # WHEN adding a large record
+    cache.put(build_data_record("large", response_size=10_000))
+
+    # THEN small records are evicted until records fit
+    assert cache.get("large") is not None
+    assert len(cache) < 6
+    assert cache.size_in_bytes <= 12_000
+
+
+def test_local_cache_skips_records_larger_than_max_bytes():
+    # GIVEN a cache bounded in size
+    cache = LocalCache(max_bytes=1_000)
+    cache.put(build_data_record("small"))
+
+    # WHEN adding a record larger than the cache on its own
+    cache.put(build_data_record("huge", response_size=2_000))
+
+    # THEN it isn't cached, and doesn't evict other records
+    assert "huge" not in cache
+    assert cache.get("small") is not None
+
+
+def test_local_cache_evicts_expired_records():
+    # GIVEN a cache with a record already expired
+    cache = LocalCache()
+    cache.put(build_data_record("expired", expires_in_seconds=-10))
+
+    # WHEN adding another record
+    cache.put(build_data_record("valid"))
+
+    # THEN the expired record is evicted, freeing its memory
+    assert len(cache) == 1
+    assert cache.get("expired") is None
+    assert cache.size_in_bytes == LocalCache._get_size(cache.get("valid"))
+
+
+def test_local_cache_keeps_replaced_records():
+    # GIVEN a cached record, replaced by one expiring later
+    cache = LocalCache()
+    cache.put(build_data_record("key", expires_in_seconds=-10))
+    cache.put(build_data_record("key"))
+
+    # WHEN evicting expired records
+    cache.put(build_data_record("other"))
+
+    # THEN the record replacing the expired one is kept
+    assert cache.get("key") is not None
+
+
+def test_local_cache_shared_between_persistence_layers():
+    # GIVEN two persistence layers for the same table, configured with the same local cache
+    local_cache = LocalCache(max_bytes=1024 * 1024)
+    config = IdempotencyConfig(use_local_cache=True, local_cache=local_cache)
+    orders = DynamoDBPersistenceLayer(table_name="IdempotencyTable", boto3_client=object())
+    payments = DynamoDBPersistenceLayer(table_name="IdempotencyTable", boto3_client=object())
+
+    # WHEN configuring them
+    orders.configure(config, "orders")
+    payments.configure(config, "payments")
+
+    # THEN records cached by one count towards the memory budget of both
+    orders._save_to_cache(build_data_record("orders#key"))
+    assert payments._cache is orders._cache
+    assert local_cache.size_in_bytes > 0
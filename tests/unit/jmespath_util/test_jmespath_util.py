@@ -1,6 +1,12 @@
 import pytest
 
-from aws_lambda_powertools.utilities.jmespath_utils import extract_data_from_envelope
+from aws_lambda_powertools.exceptions import InvalidEnvelopeExpressionError
+from aws_lambda_powertools.utilities.jmespath_utils import (
+    PowertoolsFunctions,
+    compile_expression,
+    extract_data_from_envelope,
+    query,
+)
 from aws_lambda_powertools.warnings import PowertoolsDeprecationWarning
 
 
@@ -10,3 +16,50 @@ def test_extract_data_from_envelope():
 
     with pytest.warns(PowertoolsDeprecationWarning, match="The extract_data_from_envelope method is deprecated in V3*"):
         assert extract_data_from_envelope(data=data, envelope=envelope) == {"foo": "bar"}
+
+
+def test_compile_expression_reuses_compiled_expressions():
+    # GIVEN an expression compiled before with the same options
+    options = {"custom_functions": PowertoolsFunctions()}
+    compiled_expression = compile_expression("powertools_json(body).id", options)
+
+    # WHEN compiling it again
+    # THEN it's reused
+    assert compile_expression("powertools_json(body).id", {"custom_functions": options["custom_functions"]}) is (
+        compiled_expression
+    )
+    assert compiled_expression.search({"body": '{"id": 1}'}) == 1
+
+
+def test_compile_expression_with_different_options():
+    # GIVEN an expression compiled with the default options
+    compiled_expression = compile_expression("powertools_json(body)")
+
+    # WHEN compiling it with other options
+    # THEN it's compiled again
+    assert compile_expression("powertools_json(body)", {"custom_functions": PowertoolsFunctions()}) is not (
+        compiled_expression
+    )
+
+
+def test_compile_expression_with_unhashable_options():
+    # GIVEN custom functions that can't be used as a cache key
+    class UnhashableFunctions(PowertoolsFunctions):
+        __hash__ = None  # type: ignore[assignment]
+
+    options = {"custom_functions": UnhashableFunctions()}
+
+    # WHEN compiling an expression with them
+    compiled_expression = compile_expression("powertools_json(body)", options)
+
+    # THEN it's compiled every time, and still works
+    assert compile_expression("powertools_json(body)", options) is not compiled_expression
+    assert compiled_expression.search({"body": "[]"}) == []
+
+
+def test_query_invalid_expression():
+    # GIVEN an invalid expression
+    # WHEN querying data with it
+    # THEN an InvalidEnvelopeExpressionError is raised
+    with pytest.raises(InvalidEnvelopeExpressionError):
+        query(data={"data": "foo"}, envelope="data.`")
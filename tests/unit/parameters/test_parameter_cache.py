@@ -0,0 +1,236 @@
+import time
+
+import pytest
+
+from aws_lambda_powertools.utilities.parameters import cache as cache_module
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider
+from aws_lambda_powertools.utilities.parameters.cache import ExpirableValue, ParameterCache
+
+
+class DummyProvider(BaseProvider):
+    def __init__(self):
+        self.calls = 0
+        super().__init__()
+
+    def _get(self, name: str, **sdk_options) -> str:
+        self.calls += 1
+        return f"value-{name}"
+
+    def _get_multiple(self, path: str, **sdk_options):
+        raise NotImplementedError()
+
+
+def fresh(value) -> ExpirableValue:
+    return ExpirableValue(value, time.monotonic() + 60)
+
+
+def expired(value) -> ExpirableValue:
+    return ExpirableValue(value, time.monotonic() - 60)
+
+
+def test_cache_evicts_least_recently_used_item_over_max_items():
+    # GIVEN a cache bounded to two items
+    cache = ParameterCache(max_items=2)
+    cache[("a",)] = fresh("a")
+    cache[("b",)] = fresh("b")
+
+    # WHEN the oldest item is accessed and a third item is added
+    assert cache.get_valid(("a",)) is not None
+    cache[("c",)] = fresh("c")
+
+    # THEN the least recently used item is evicted
+    assert list(cache) == [("a",), ("c",)]
+    assert cache.stats.evictions == 1
+
+
+def test_cache_evicts_over_max_bytes():
+    # GIVEN a cache bounded to 10 bytes
+    cache = ParameterCache(max_bytes=10)
+    cache[("a",)] = fresh("x" * 6)
+
+    # WHEN adding another value exceeding the remaining bytes
+    cache[("b",)] = fresh("y" * 6)
+
+    # THEN older values are evicted to make room
+    assert list(cache) == [("b",)]
+    assert cache.stats.bytes == 6
+
+
+def test_cache_skips_values_larger_than_max_bytes():
+    # GIVEN a cache bounded to 10 bytes
+    cache = ParameterCache(max_bytes=10)
+    cache[("a",)] = fresh("x")
+
+    # WHEN adding a value larger than the whole cache
+    cache[("a",)] = fresh({"key": "y" * 20})
+
+    # THEN it isn't cached, and doesn't leave a stale value behind
+    assert ("a",) not in cache
+    assert cache.stats.bytes == 0
+
+
+def test_cache_evicts_expired_item_on_access():
+    # GIVEN a cache with an expired item
+    cache = ParameterCache()
+    cache[("a",)] = expired("a")
+
+    # WHEN reading it
+    # THEN it's a miss, and the item is evicted
+    assert cache.get_valid(("a",)) is None
+    assert len(cache) == 0
+    assert cache.stats.misses == 1
+    assert cache.stats.evictions == 1
+
+
+def test_cache_sweeps_expired_items_periodically(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a cache with expired items, and a sweep interval that has elapsed
+    monkeypatch.setattr(cache_module, "SWEEP_INTERVAL_SECS", 0)
+    cache = ParameterCache()
+    cache[("a",)] = expired("a")
+    cache[("b",)] = expired("b")
+
+    # WHEN adding a new item
+    cache[("c",)] = fresh("c")
+
+    # THEN expired items are swept
+    assert list(cache) == [("c",)]
+
+
+def test_provider_cache_hits_and_misses():
+    # GIVEN a provider
+    provider = DummyProvider()
+
+    # WHEN getting the same parameter twice
+    provider.get("name")
+    provider.get("name")
+
+    # THEN the second call is served from cache
+    assert provider.calls == 1
+    assert provider.store.stats.hits == 1
+    assert provider.store.stats.misses == 1
+
+
+def test_provider_cache_bounded_by_env(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a provider cache bounded to two items via environment variable
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_CACHE_MAX_ITEMS", "2")
+    provider = DummyProvider()
+
+    # WHEN getting three parameters
+    for name in ("a", "b", "c"):
+        provider.get(name)
+
+    # THEN only the two most recently used are kept
+    assert len(provider.store) == 2
+    assert provider.store.stats.evictions == 1
+
+
+def test_provider_cache_unbounded_when_disabled(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN cache limits disabled via environment variables
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_CACHE_MAX_ITEMS", "0")
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_CACHE_MAX_BYTES", "0")
+
+    # WHEN creating a provider
+    provider = DummyProvider()
+
+    # THEN its cache has no limits
+    assert provider.store.max_items is None
+    assert provider.store.max_bytes is None
+
+
+class FailingProvider(DummyProvider):
+    def _get(self, name: str, **sdk_options) -> str:
+        self.calls += 1
+        raise ValueError("service unavailable")
+
+
+def wait_for_revalidation(provider: BaseProvider, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while provider._revalidating and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_provider_serves_stale_value_while_revalidating():
+    # GIVEN a provider with an expired value that can still be served for 60 seconds
+    provider = DummyProvider()
+    provider.store[("name", None, False)] = ExpirableValue("stale", time.monotonic() - 1, time.monotonic() + 60)
+
+    # WHEN getting the parameter with stale_while_revalidate
+    value = provider.get("name", stale_while_revalidate=60)
+
+    # THEN the stale value is returned right away, and refreshed in the background
+    assert value == "stale"
+    wait_for_revalidation(provider)
+    assert provider.calls == 1
+    assert provider.get("name", stale_while_revalidate=60) == "value-name"
+    assert provider.calls == 1
+
+
+def test_provider_does_not_serve_values_past_max_staleness():
+    # GIVEN a provider with a value past its max staleness
+    provider = DummyProvider()
+    provider.store[("name", None, False)] = ExpirableValue("stale", time.monotonic() - 61, time.monotonic() - 1)
+
+    # WHEN getting the parameter with stale_while_revalidate
+    value = provider.get("name", stale_while_revalidate=60)
+
+    # THEN the value is fetched synchronously
+    assert value == "value-name"
+    assert provider.calls == 1
+
+
+def test_provider_does_not_serve_stale_values_by_default():
+    # GIVEN a provider with an expired value cached with stale_while_revalidate
+    provider = DummyProvider()
+    provider.store[("name", None, False)] = ExpirableValue("stale", time.monotonic() - 1, time.monotonic() + 60)
+
+    # WHEN getting the parameter without stale_while_revalidate
+    value = provider.get("name")
+
+    # THEN the value is fetched synchronously
+    assert value == "value-name"
+
+
+def test_provider_stale_while_revalidate_from_env(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN stale_while_revalidate set via environment variable
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_STALE_WHILE_REVALIDATE", "60")
+    provider = DummyProvider()
+
+    # WHEN getting a parameter
+    provider.get("name", max_age=10)
+
+    # THEN it's cached with a stale deadline 60 seconds past its expiry
+    item = provider.store[("name", None, False)]
+    assert item.stale_ttl == pytest.approx(item.ttl + 60)
+
+
+def test_provider_backs_off_failed_revalidations():
+    # GIVEN a provider failing to refresh an expired value
+    provider = FailingProvider()
+    provider.store[("name", None, False)] = ExpirableValue("stale", time.monotonic() - 1, time.monotonic() + 60)
+
+    # WHEN getting the parameter repeatedly while the refresh fails
+    assert provider.get("name", stale_while_revalidate=60) == "stale"
+    wait_for_revalidation(provider)
+    assert provider.get("name", stale_while_revalidate=60) == "stale"
+    wait_for_revalidation(provider)
+
+    # THEN the stale value keeps being served, without retrying the refresh until the backoff elapses
+    assert provider.calls == 1
+    assert provider._revalidation_failures[("name", None, False)].attempts == 1
+
+
+def test_cache_does_not_sweep_on_every_insert_when_full(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN a full cache bounded to two items, whose sweep interval hasn't elapsed
+    cache = ParameterCache(max_items=2)
+    cache[("a",)] = fresh("a")
+    cache[("b",)] = fresh("b")
+    sweeps = []
+    monkeypatch.setattr(cache, "sweep_expired", lambda: sweeps.append(True))
+
+    # WHEN adding more items
+    cache[("c",)] = fresh("c")
+    cache[("d",)] = fresh("d")
+
+    # THEN least recently used items are evicted, without sweeping expired items
+    assert list(cache) == [("c",), ("d",)]
+    assert sweeps == []
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import base64
+import os
+import time
+
+import boto3
+import pytest
+
+from aws_lambda_powertools.utilities.parameters.base import BaseProvider
+from aws_lambda_powertools.utilities.parameters.cache import ExpirableValue, ParameterCache
+from aws_lambda_powertools.utilities.parameters.persistent_cache import HEADER, PersistentCache
+from aws_lambda_powertools.utilities.parameters.ssm import SSMProvider
+
+KEY = os.urandom(32)
+
+
+class DummyProvider(BaseProvider):
+    def __init__(self):
+        self.calls = 0
+        super().__init__()
+
+    def _get(self, name: str, **sdk_options) -> str:
+        self.calls += 1
+        return f"value-{name}"
+
+    def _get_multiple(self, path: str, **sdk_options):
+        raise NotImplementedError()
+
+
+@pytest.fixture
+def persistent_cache_env(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_PERSISTENT_CACHE", "true")
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_PERSISTENT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_PERSISTENT_CACHE_KEY", base64.b64encode(KEY).decode())
+    return tmp_path
+
+
+def fresh(value) -> ExpirableValue:
+    return ExpirableValue(value, time.monotonic() + 60)
+
+
+def test_persistent_cache_roundtrip(tmp_path):
+    # GIVEN a persistent cache
+    cache = PersistentCache(tmp_path, key=KEY)
+    value = {"text": "value", "binary": b"\x00\x01", "nested": {"list": [1, 2]}}
+
+    # WHEN persisting a value, and reading it from another instance with the same key
+    cache.set(("name", None, False), ExpirableValue(value, time.monotonic() + 60, time.monotonic() + 120))
+    item = PersistentCache(tmp_path, key=KEY).get(("name", None, False))
+
+    # THEN the value and its deadlines are restored
+    assert item is not None
+    assert item.value == value
+    assert item.ttl == pytest.approx(time.monotonic() + 60, abs=1)
+    assert item.stale_ttl == pytest.approx(time.monotonic() + 120, abs=1)
+
+
+def test_persistent_cache_encrypts_values(tmp_path):
+    # GIVEN a persistent cache
+    cache = PersistentCache(tmp_path, key=KEY)
+
+    # WHEN persisting a value
+    cache.set(("name",), fresh("super-secret"))
+
+    # THEN it isn't readable from disk
+    (path,) = cache.directory.glob("*.cache")
+    assert b"super-secret" not in path.read_bytes()
+
+
+def test_persistent_cache_ignores_values_from_another_key(tmp_path):
+    # GIVEN a value persisted with another key
+    PersistentCache(tmp_path, key=os.urandom(32)).set(("name",), fresh("value"))
+
+    # WHEN reading it
+    cache = PersistentCache(tmp_path, key=KEY)
+
+    # THEN it's a miss, and the unreadable file is removed
+    assert cache.get(("name",)) is None
+    assert list(cache.directory.glob("*.cache")) == []
+
+
+def test_persistent_cache_rejects_tampered_expiry(tmp_path):
+    # GIVEN a persisted value whose expiry was extended on disk
+    cache = PersistentCache(tmp_path, key=KEY)
+    cache.set(("name",), fresh("value"))
+    (path,) = cache.directory.glob("*.cache")
+    data = bytearray(path.read_bytes())
+    magic, version, expires_at, stale_until, nonce = HEADER.unpack_from(data)
+    HEADER.pack_into(data, 0, magic, version, expires_at + 3600, stale_until, nonce)
+    path.write_bytes(bytes(data))
+
+    # WHEN reading it
+    # THEN it's a miss
+    assert cache.get(("name",)) is None
+
+
+def test_persistent_cache_namespaces_are_isolated(tmp_path):
+    # GIVEN values persisted for two namespaces
+    ssm = PersistentCache(tmp_path, namespace="SSMProvider:us-east-1", key=KEY)
+    secrets = PersistentCache(tmp_path, namespace="SecretsProvider:us-east-1", key=KEY)
+    ssm.set(("name",), fresh("ssm"))
+    secrets.set(("name",), fresh("secrets"))
+
+    # WHEN clearing one of them
+    ssm.clear()
+
+    # THEN the other is kept
+    assert ssm.get(("name",)) is None
+    assert secrets.get(("name",)).value == "secrets"
+
+
+def test_persistent_cache_sweeps_expired_values(tmp_path):
+    # GIVEN an expired and a fresh persisted value
+    cache = PersistentCache(tmp_path, key=KEY)
+    cache.set(("expired",), ExpirableValue("value", time.monotonic() - 1))
+    cache.set(("fresh",), fresh("value"))
+
+    # WHEN sweeping expired values
+    cache.sweep_expired()
+
+    # THEN only the fresh value is kept
+    assert len(list(cache.directory.glob("*.cache"))) == 1
+    assert cache.get(("fresh",)) is not None
+
+
+def test_persistent_cache_sweep_removes_least_recently_written_values_over_max_bytes(tmp_path):
+    # GIVEN a persistent cache bounded to about two values, holding three written one after another
+    cache = PersistentCache(tmp_path, key=KEY)
+    for index, name in enumerate(("oldest", "older", "newest")):
+        cache.set((name,), fresh("value"))
+        os.utime(cache._path((name,))[0], (index, index))
+    file_size = cache._path(("newest",))[0].stat().st_size
+    cache.max_bytes = file_size * 2
+
+    # WHEN sweeping expired values
+    cache.sweep_expired()
+
+    # THEN only the oldest value is removed to fit within max_bytes
+    assert len(list(cache.directory.glob("*.cache"))) == 2
+    assert cache.get(("oldest",)) is None
+    assert cache.get(("older",)) is not None
+    assert cache.get(("newest",)) is not None
+
+
+def test_persistent_cache_skips_values_not_serializable(tmp_path):
+    # GIVEN a persistent cache
+    cache = PersistentCache(tmp_path, key=KEY)
+
+    # WHEN persisting a value that isn't JSON serializable
+    cache.set(("name",), fresh({"value": object()}))
+
+    # THEN it isn't persisted
+    assert cache.get(("name",)) is None
+
+
+def test_parameter_cache_loads_from_persistent_cache_after_clear(tmp_path):
+    # GIVEN a cache backed by a persistent cache
+    cache = ParameterCache(persistent=PersistentCache(tmp_path, key=KEY))
+    cache[("name",)] = fresh("value")
+
+    # WHEN clearing the in-memory cache
+    cache.clear()
+
+    # THEN the value is loaded from the persistent cache on the next read
+    assert len(cache) == 0
+    assert cache.get_valid(("name",)).value == "value"
+    assert ("name",) in cache
+
+
+def test_provider_served_from_persistent_cache_when_reinitialized(persistent_cache_env):
+    # GIVEN a provider that fetched a parameter, with the persistent cache enabled
+    DummyProvider().get("name")
+
+    # WHEN getting the same parameter from a new provider
+    provider = DummyProvider()
+    value = provider.get("name")
+
+    # THEN it's served from the persistent cache, without fetching it
+    assert value == "value-name"
+    assert provider.calls == 0
+
+
+def test_provider_served_from_persistent_cache_after_clear_cache(persistent_cache_env):
+    # GIVEN a provider that fetched a parameter, with the persistent cache enabled
+    provider = DummyProvider()
+    provider.get("name")
+
+    # WHEN clearing its cache and getting the parameter again
+    provider.clear_cache()
+    value = provider.get("name")
+
+    # THEN it's served from the persistent cache, without fetching it again
+    assert value == "value-name"
+    assert provider.calls == 1
+
+
+def test_provider_force_fetch_bypasses_persistent_cache(persistent_cache_env):
+    # GIVEN a provider that fetched a parameter, with the persistent cache enabled
+    provider = DummyProvider()
+    provider.get("name")
+
+    # WHEN forcing a fetch
+    provider.get("name", force_fetch=True)
+
+    # THEN the parameter is fetched again
+    assert provider.calls == 2
+
+
+def test_provider_persistent_cache_disabled_by_default():
+    # GIVEN a provider with default settings
+    # WHEN creating it
+    provider = DummyProvider()
+
+    # THEN it has no persistent cache
+    assert provider.store.persistent is None
+
+
+def ssm_client(access_key: str = "AKIAEXAMPLE", endpoint_url: str | None = None):
+    return boto3.client(
+        "ssm",
+        region_name="us-east-1",
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key="secret",
+    )
+
+
+def test_provider_persistent_cache_shared_by_same_client_identity(persistent_cache_env):
+    # GIVEN two SSM providers with clients for the same region, endpoint and credentials
+    first = SSMProvider(boto3_client=ssm_client())
+    second = SSMProvider(boto3_client=ssm_client())
+
+    # WHEN comparing their persistent caches
+    # THEN they share the same namespace
+    assert first.store.persistent.namespace == second.store.persistent.namespace
+
+
+@pytest.mark.parametrize(
+    "client_options",
+    [{"access_key": "AKIAOTHERACCOUNT"}, {"endpoint_url": "https://ssm.vpce.example.com"}],
+)
+def test_provider_persistent_cache_isolated_by_client_identity(persistent_cache_env, client_options):
+    # GIVEN two SSM providers with clients for different credentials or endpoints in the same region
+    first = SSMProvider(boto3_client=ssm_client())
+    second = SSMProvider(boto3_client=ssm_client(**client_options))
+
+    # WHEN comparing their persistent caches
+    # THEN they don't share values
+    assert first.store.persistent.namespace != second.store.persistent.namespace
+
+
+def test_provider_persistent_cache_namespace_does_not_leak_access_key(persistent_cache_env):
+    # GIVEN an SSM provider with the persistent cache enabled
+    provider = SSMProvider(boto3_client=ssm_client(access_key="AKIASECRETKEY"))
+
+    # WHEN inspecting its persistent cache namespace
+    # THEN the access key is only included as a hash
+    assert "AKIASECRETKEY" not in provider.store.persistent.namespace
+
+
+def test_parameter_cache_serves_persisted_value_larger_than_max_bytes(tmp_path):
+    # GIVEN a persisted value larger than the in-memory cache size limit, e.g. written by another process
+    persistent = PersistentCache(tmp_path, key=KEY)
+    persistent.set(("name",), fresh("x" * 20))
+    cache = ParameterCache(max_bytes=10, persistent=persistent)
+
+    # WHEN reading it
+    item = cache.get_valid(("name",))
+
+    # THEN it's served from the persistent cache, without being kept in memory
+    assert item.value == "x" * 20
+    assert ("name",) not in cache
+
+
+def test_parameter_cache_ignores_expired_persisted_value_larger_than_max_bytes():
+    # GIVEN a persistent cache returning a value larger than the in-memory cache size limit, which expired since
+    class ExpiredPersistentCache:
+        def get(self, key):
+            return ExpirableValue("x" * 20, time.monotonic() - 60)
+
+    cache = ParameterCache(max_bytes=10, persistent=ExpiredPersistentCache())
+
+    # WHEN reading it
+    # THEN it's a miss, rather than failing to evict a value that isn't in memory
+    assert cache.get_valid(("name",)) is None
+
+
+def test_provider_serves_persisted_value_larger_than_max_bytes(persistent_cache_env, monkeypatch):
+    # GIVEN a provider whose in-memory cache is smaller than a value another provider persisted
+    DummyProvider().get("name")
+    monkeypatch.setenv("POWERTOOLS_PARAMETERS_CACHE_MAX_BYTES", "1")
+    provider = DummyProvider()
+
+    # WHEN getting the parameter
+    value = provider.get("name")
+
+    # THEN the persisted value is returned, without fetching it
+    assert value == "value-name"
+    assert provider.calls == 0
@@ -14,8 +14,10 @@ from aws_lambda_powertools.shared.functions import (
     powertools_dev_is_set,
     resolve_env_var_choice,
     resolve_max_age,
+    resolve_max_concurrency,
     resolve_truthy_env_var_choice,
     sanitize_xray_segment_name,
+    slice_dictionary,
     strtobool,
 )
 from aws_lambda_powertools.utilities.data_classes.common import DictWrapper
@@ -148,6 +150,42 @@ def test_resolve_max_age_env_var_wins_over_default_value(monkeypatch: pytest.Mon
     assert max_age == 20
 
 
+def test_resolve_max_concurrency_env_var_wins_over_default_value(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN POWERTOOLS_PARAMETERS_SSM_MAX_CONCURRENCY environment variable is set
+    monkeypatch.setenv(constants.PARAMETERS_SSM_MAX_CONCURRENCY_ENV, "5")
+
+    # WHEN the choice is set to None
+    max_concurrency = resolve_max_concurrency(
+        env=os.getenv(constants.PARAMETERS_SSM_MAX_CONCURRENCY_ENV, "1"),
+        choice=None,
+    )
+
+    # THEN the result must be the environment variable value
+    assert max_concurrency == 5
+
+
+def test_resolve_max_concurrency_invalid_env_var(monkeypatch: pytest.MonkeyPatch):
+    # GIVEN POWERTOOLS_PARAMETERS_SSM_MAX_CONCURRENCY environment variable is not an integer
+    monkeypatch.setenv(constants.PARAMETERS_SSM_MAX_CONCURRENCY_ENV, "ten")
+
+    # WHEN the choice is set to None
+    # THEN a ValueError naming max_concurrency is raised
+    with pytest.raises(ValueError, match="Invalid max_concurrency value 'ten'"):
+        resolve_max_concurrency(env=os.getenv(constants.PARAMETERS_SSM_MAX_CONCURRENCY_ENV, "1"), choice=None)
+
+
+def test_slice_dictionary():
+    # GIVEN a dictionary with 25 items
+    data = {f"key_{i}": i for i in range(25)}
+
+    # WHEN it's sliced in chunks of 10
+    chunks = list(slice_dictionary(data=data, chunk_size=10))
+
+    # THEN every item should be in exactly one chunk, in order
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert {key: value for chunk in chunks for key, value in chunk.items()} == data
+
+
 def test_abs_lambda_path_empty():
     # Given Env is not set
     os.environ["LAMBDA_TASK_ROOT"] = ""